@@ -1,20 +1,23 @@
+import asyncio
 import contextlib
 import functools
 import logging
 import os
 import signal
+import threading
 import time
 import warnings
 from pathlib import Path
-from typing import Optional, List, Callable, Union, Literal, Tuple, Type
+from typing import Optional, List, Callable, Union, Literal, Tuple, Type, Set, Dict
 
 from confluent_kafka import TopicPartition
 from pydantic import Field, AliasGenerator
 from pydantic_settings import PydanticBaseSettingsSource, SettingsConfigDict
 from typing_extensions import Self
 
-from .context import set_message_context, copy_context
+from .context import set_message_context, copy_context, message_context
 from .dataframe import StreamingDataFrame, DataframeRegistry
+from .core.stream import BatchingExecutor
 from .error_callbacks import (
     ConsumerErrorCallback,
     ProcessingErrorCallback,
@@ -31,6 +34,7 @@ from .models import (
     SerializerType,
     DeserializerType,
     TimestampExtractor,
+    Row,
 )
 from .platforms.quix import (
     QuixKafkaConfigsBuilder,
@@ -39,13 +43,23 @@ from .platforms.quix import (
     QuixTopicManager,
 )
 from .processing import ProcessingContext, PausingManager
+from .processing.workers import WorkerChannel, WorkerConsumer, WorkerManager
 from .rowconsumer import RowConsumer
-from .rowproducer import RowProducer
+from .rowproducer import RowProducer, DeliveryReports
 from .sinks import SinkManager
 from .sources import SourceManager, BaseSource, SourceException
 from .state import StateStoreManager
+from .state.manager import StoreTypes
+from .state.memory import MemoryStoreOptions
 from .state.recovery import RecoveryManager
-from .state.rocksdb import RocksDBOptionsType
+from .state.standby import StandbyManager
+from .state.rocksdb import (
+    RocksDBOptionsType,
+    RocksDBStore,
+    SnapshotManager,
+    SnapshotStorage,
+)
+from .utils import aio
 from .utils.settings import BaseSettings
 
 __all__ = ("Application", "ApplicationConfig")
@@ -59,6 +73,11 @@ _default_producer_extra_config = {"enable.idempotence": True}
 
 _default_max_poll_interval_ms = 300000
 
+# The main process consumes the messages for the workers in larger batches
+# and doesn't block for long to serve the workers requests in time
+_WORKERS_BATCH_SIZE = 500
+_WORKERS_POLL_TIMEOUT = 0.01
+
 
 class Application:
     """
@@ -111,12 +130,15 @@ class Application:
         producer_extra_config: Optional[dict] = None,
         state_dir: Union[str, Path] = Path("state"),
         rocksdb_options: Optional[RocksDBOptionsType] = None,
+        default_store_type: StoreTypes = RocksDBStore,
+        memory_store_options: Optional[MemoryStoreOptions] = None,
         on_consumer_error: Optional[ConsumerErrorCallback] = None,
         on_processing_error: Optional[ProcessingErrorCallback] = None,
         on_producer_error: Optional[ProducerErrorCallback] = None,
         on_message_processed: Optional[MessageProcessedCallback] = None,
         consumer_poll_timeout: float = 1.0,
         producer_poll_timeout: float = 0.0,
+        consumer_batch_size: int = 1,
         loglevel: Optional[Union[int, LogLevel]] = "INFO",
         auto_create_topics: bool = True,
         use_changelog_topics: bool = True,
@@ -125,6 +147,10 @@ class Application:
         request_timeout: float = 30,
         topic_create_timeout: float = 60,
         processing_guarantee: ProcessingGuarantee = "at-least-once",
+        num_standby_replicas: int = 0,
+        state_snapshot_storage: Optional[SnapshotStorage] = None,
+        state_snapshot_interval: float = 3600.0,
+        producer_delivery_reports: DeliveryReports = "all",
     ):
         """
         :param broker_address: Connection settings for Kafka.
@@ -165,8 +191,26 @@ class Application:
             Default - `"state"`.
         :param rocksdb_options: RocksDB options.
             If `None`, the default options will be used.
+        :param default_store_type: the type of the state stores used by
+            the stateful operations: `RocksDBStore` or `MemoryStore`.
+            The windowed stores are always backed by RocksDB.
+            Default - `RocksDBStore`.
+        :param memory_store_options: `MemoryStore` options.
+            If `None`, the default options will be used.
         :param consumer_poll_timeout: timeout for `RowConsumer.poll()`. Default - `1.0`s
         :param producer_poll_timeout: timeout for `RowProducer.poll()`. Default - `0`s.
+        :param consumer_batch_size: the maximum number of messages to consume
+            from Kafka at once and process as a batch.
+            If the value is > 1, the application consumes messages in batches
+            via `RowConsumer.consume_rows()` and polls the producer, stores
+            the processed offsets and checks the checkpoint once per batch
+            instead of once per message.
+            The `consumer_poll_timeout` is used as a timeout to collect the batch.
+            If the value is <= 1, messages are polled and processed one by one.
+            Default - `1`.
+                >***NOTE:*** The checkpoint is checked only between the batches,
+                > so `commit_every` may be exceeded by up to `consumer_batch_size`
+                > messages.
         :param on_message_processed: a callback triggered when message is successfully
             processed.
         :param loglevel: a log level for "quixstreams" logger.
@@ -183,6 +227,34 @@ class Application:
         :param request_timeout: timeout (seconds) for REST-based requests
         :param topic_create_timeout: timeout (seconds) for topic create finalization
         :param processing_guarantee: Use "exactly-once" or "at-least-once" processing.
+        :param num_standby_replicas: the number of warm standby replicas of the
+            RocksDB state store partitions assigned to other consumers in the group
+            to keep per each partition assigned to this application.
+            For each assigned partition `N`, the partitions `N + 1` ...
+            `N + num_standby_replicas` are replicated.
+            The standby replicas are updated from the changelog topics
+            in the background, so the state is recovered only from the tail
+            of the changelog when the partition is assigned to this application.
+            Requires `use_changelog_topics=True`, and it cannot be used with
+            `Application.run(workers=...)`.
+            Default - `0` (standby replicas are disabled)
+        :param state_snapshot_storage: a `SnapshotStorage` to upload the periodic
+            snapshots of the RocksDB state store partitions to.
+            The partitions missing locally are restored from the latest snapshot
+            on assignment, and only the changelog messages produced after it
+            are recovered.
+            If `None`, the snapshots are disabled.
+            Default - `None`
+        :param state_snapshot_interval: how often to snapshot each RocksDB state
+            store partition, in seconds. Default - `3600.0`
+        :param producer_delivery_reports: which delivery reports the producer
+            handles.
+            With `"errors"`, the producer handles only the reports of the failed
+            messages instead of calling back into Python for each delivered one.
+            The offsets of the changelog messages are then queried from the broker
+            on checkpoint.
+            It cannot be used with `Application.run(workers=...)`.
+            Default - `"all"`
 
         <br><br>***Error Handlers***<br>
         To handle errors, `Application` accepts callbacks triggered when
@@ -277,15 +349,25 @@ class Application:
             processing_guarantee=processing_guarantee,
             consumer_poll_timeout=consumer_poll_timeout,
             producer_poll_timeout=producer_poll_timeout,
+            consumer_batch_size=consumer_batch_size,
             auto_create_topics=auto_create_topics,
             request_timeout=request_timeout,
             topic_create_timeout=topic_create_timeout,
             state_dir=state_dir,
             rocksdb_options=rocksdb_options,
+            default_store_type=default_store_type,
+            memory_store_options=memory_store_options,
             use_changelog_topics=use_changelog_topics,
+            num_standby_replicas=num_standby_replicas,
+            producer_delivery_reports=producer_delivery_reports,
         )
+        if self._config.num_standby_replicas < 0:
+            raise ValueError("num_standby_replicas must be 0 or greater")
+        if self._config.num_standby_replicas and not self._config.use_changelog_topics:
+            raise ValueError("num_standby_replicas require use_changelog_topics=True")
 
         self._on_message_processed = on_message_processed
+        self._on_consumer_error = on_consumer_error
         self._on_processing_error = on_processing_error or default_on_processing_error
 
         self._consumer = RowConsumer(
@@ -299,6 +381,10 @@ class Application:
         self._producer = self._get_rowproducer(on_error=on_producer_error)
         self._running = False
         self._failed = False
+        # Topic partitions revoked or lost while consuming the current batch
+        self._revoked_in_batch: Set[Tuple[str, int]] = set()
+        # Set when the dataframes are processed by the worker processes
+        self._worker_manager: Optional[WorkerManager] = None
 
         if not topic_manager:
             topic_manager = topic_manager_factory(
@@ -314,19 +400,49 @@ class Application:
 
         producer = None
         recovery_manager = None
+        standby_manager = None
+        # The consumer tailing the changelogs for the standby replicas
+        self._standby_consumer: Optional[Consumer] = None
         if self._config.use_changelog_topics:
             producer = self._producer
             recovery_manager = RecoveryManager(
                 consumer=self._consumer,
                 topic_manager=self._topic_manager,
             )
+            if self._config.num_standby_replicas:
+                self._standby_consumer = Consumer(
+                    broker_address=self._config.broker_address,
+                    consumer_group=self._config.consumer_group,
+                    auto_offset_reset="earliest",
+                    auto_commit_enable=False,
+                    extra_config=self._config.consumer_extra_config,
+                )
+                standby_manager = StandbyManager(
+                    consumer=self._standby_consumer,
+                    topic_manager=self._topic_manager,
+                    num_replicas=self._config.num_standby_replicas,
+                )
+
+        snapshot_manager = None
+        if state_snapshot_storage is not None:
+            state_dir = Path(self._config.state_dir) / self._config.consumer_group
+            snapshot_manager = SnapshotManager(
+                storage=state_snapshot_storage,
+                local_dir=state_dir / ".snapshots",
+                key_prefix=self._config.consumer_group,
+                interval=state_snapshot_interval,
+            )
 
         self._state_manager = StateStoreManager(
             group_id=self._config.consumer_group,
             state_dir=self._config.state_dir,
             rocksdb_options=self._config.rocksdb_options,
+            default_store_type=self._config.default_store_type,
+            memory_store_options=self._config.memory_store_options,
             producer=producer,
             recovery_manager=recovery_manager,
+            standby_manager=standby_manager,
+            snapshot_manager=snapshot_manager,
         )
 
         self._source_manager = SourceManager()
@@ -546,6 +662,7 @@ class Application:
             flush_timeout=self._config.flush_timeout,
             on_error=on_error,
             transactional=transactional,
+            delivery_reports=self._config.producer_delivery_reports,
         )
 
     def get_producer(self) -> Producer:
@@ -655,7 +772,13 @@ class Application:
         self._source_manager.register(source)
         return topic
 
-    def run(self, dataframe: Optional[StreamingDataFrame] = None):
+    def run(
+        self,
+        dataframe: Optional[StreamingDataFrame] = None,
+        *,
+        workers: int = 1,
+        app_factory: Optional[Callable[[], "Application"]] = None,
+    ):
         """
         Start processing data from Kafka using provided `StreamingDataFrame`
 
@@ -678,7 +801,33 @@ class Application:
 
         app.run()
         ```
+
+        To process the partitions in parallel, pass `workers` > 1 and
+        an `app_factory` function creating the same `Application`.
+        Each worker process calls `app_factory()` and gets its own partitions,
+        state stores and checkpoints, while the main process consumes the messages
+        from Kafka and commits the offsets.
+        The `app_factory` must be picklable (e.g. a module-level function).
+
+        :param workers: the number of worker processes. Default - `1`, the messages
+            are processed in the main process.
+        :param app_factory: a function creating the `Application` with the same
+            `StreamingDataFrame`s in the worker processes.
+            Required when `workers` > 1.
         """
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        if workers > 1 and app_factory is None:
+            raise ValueError("app_factory is required to run multiple workers")
+        if workers > 1 and self._config.num_standby_replicas:
+            raise ValueError(
+                "num_standby_replicas cannot be used with multiple workers"
+            )
+        if workers > 1 and self._config.producer_delivery_reports != "all":
+            raise ValueError(
+                'producer_delivery_reports="errors" cannot be used with multiple workers'
+            )
+
         if dataframe is not None:
             warnings.warn(
                 "Application.run() received a `dataframe` argument which is "
@@ -686,7 +835,59 @@ class Application:
                 "the argument should be removed.",
                 FutureWarning,
             )
-        self._run()
+        if workers > 1:
+            self._run_workers(workers=workers, app_factory=app_factory)
+        else:
+            self._run()
+
+    async def run_async(self):
+        """
+        Start processing data from Kafka in the running asyncio event loop.
+
+        The coroutine callbacks passed to `StreamingDataFrame.apply()`,
+        `.update()`, `.filter()` and `.apply_concurrent()` and the async sinks
+        are awaited in this event loop, so they can share the clients and
+        other resources with the rest of the async code.
+
+        The processing loop polling the broker runs in the default executor
+        of the loop, so the event loop is never blocked by it.
+        The coroutine returns when the application is stopped.
+        If it's cancelled, the application is stopped gracefully first.
+
+        Example Snippet:
+
+        ```python
+        import asyncio
+
+        from quixstreams import Application
+
+        async def enrich(value):
+            await asyncio.sleep(0.1)
+            return value
+
+        app = Application(broker_address='localhost:9092', consumer_group='group')
+        sdf = app.dataframe(app.topic('test-topic'))
+        sdf = sdf.apply(enrich)
+
+        asyncio.run(app.run_async())
+        ```
+        """
+        loop = asyncio.get_running_loop()
+        aio.set_event_loop(loop)
+        signals = self._setup_loop_signal_handlers(loop)
+        try:
+            future = loop.run_in_executor(None, self._run)
+            try:
+                await asyncio.shield(future)
+            except asyncio.CancelledError:
+                logger.debug("The application task is cancelled, stopping")
+                self.stop()
+                await future
+                raise
+        finally:
+            for sig in signals:
+                loop.remove_signal_handler(sig)
+            aio.set_event_loop(None)
 
     def _exception_handler(self, exc_type, exc_val, exc_tb):
         fail = False
@@ -708,6 +909,7 @@ class Application:
             f'auto_offset_reset="{self._config.auto_offset_reset}" '
             f"commit_interval={self._config.commit_interval}s "
             f"commit_every={self._config.commit_every} "
+            f"consumer_batch_size={self._config.consumer_batch_size} "
             f'processing_guarantee="{self._config.processing_guarantee}"'
         )
         if self.is_quix_app:
@@ -718,6 +920,8 @@ class Application:
         exit_stack = contextlib.ExitStack()
         exit_stack.enter_context(self._processing_context)
         exit_stack.enter_context(self._state_manager)
+        if self._standby_consumer is not None:
+            exit_stack.enter_context(self._standby_consumer)
         exit_stack.enter_context(self._consumer)
         exit_stack.enter_context(self._source_manager)
         exit_stack.push(self._exception_handler)
@@ -729,6 +933,111 @@ class Application:
             else:
                 self._run_sources()
 
+    def _run_workers(self, workers: int, app_factory: Callable[[], "Application"]):
+        """
+        Consume the messages from Kafka and pass them to the worker processes.
+
+        The main process owns the consumer group membership and commits
+        the offsets on behalf of the workers.
+        The sources run in the main process.
+        """
+        self._setup_signal_handlers()
+
+        logger.info(
+            f"Starting the Application with {workers} workers and the config: "
+            f'broker_address="{self._config.broker_address}" '
+            f'consumer_group="{self._config.consumer_group}" '
+            f'auto_offset_reset="{self._config.auto_offset_reset}" '
+            f"commit_interval={self._config.commit_interval}s "
+            f"commit_every={self._config.commit_every} "
+            f'processing_guarantee="{self._config.processing_guarantee}"'
+        )
+        if self.is_quix_app:
+            self._quix_runtime_init()
+
+        self.setup_topics()
+
+        worker_manager = WorkerManager(
+            app_factory=app_factory, workers=workers, consumer=self._consumer
+        )
+        self._worker_manager = worker_manager
+
+        exit_stack = contextlib.ExitStack()
+        # The workers are stopped last, after their partitions are revoked
+        # by closing the consumer
+        exit_stack.callback(lambda: worker_manager.stop_workers(fail=self._failed))
+        exit_stack.enter_context(self._consumer)
+        exit_stack.enter_context(self._source_manager)
+        exit_stack.push(self._exception_handler)
+
+        with exit_stack:
+            worker_manager.start_workers()
+            self._consumer.subscribe(
+                self._dataframe_registry.consumer_topics,
+                on_assign=self._on_workers_assign,
+                on_revoke=self._on_workers_revoke,
+                on_lost=self._on_workers_lost,
+            )
+            logger.info("Waiting for incoming messages")
+            self._running = True
+            batch_size = max(self._config.consumer_batch_size, _WORKERS_BATCH_SIZE)
+            while self._running:
+                messages = self._consumer.consume_messages(
+                    num_messages=batch_size, timeout=_WORKERS_POLL_TIMEOUT
+                )
+                if messages:
+                    worker_manager.dispatch(messages)
+                worker_manager.handle_requests()
+                worker_manager.raise_for_error()
+                self._source_manager.raise_for_error()
+
+        logger.info("Stop processing of StreamingDataFrame")
+
+    def _run_worker(self, channel: WorkerChannel):
+        """
+        Run the `StreamingDataFrame`s in a worker process started by
+        `Application.run(workers=...)`.
+
+        The worker gets the messages and the partition assignments from the main
+        process instead of Kafka, and processes them with its own state stores,
+        checkpoints and producer.
+        The Kafka consumer is still used to recover the state from the changelogs.
+        """
+        if self._config.num_standby_replicas:
+            raise ValueError(
+                "num_standby_replicas cannot be used with multiple workers"
+            )
+        if self._config.producer_delivery_reports != "all":
+            raise ValueError(
+                'producer_delivery_reports="errors" cannot be used with multiple workers'
+            )
+        consumer = WorkerConsumer(
+            channel=channel,
+            on_stop=lambda fail: self.stop(fail=fail),
+            broker_address=self._config.broker_address,
+            consumer_group=self._config.consumer_group,
+            auto_offset_reset=self._config.auto_offset_reset,
+            extra_config=self._config.consumer_extra_config,
+            on_error=self._on_consumer_error,
+        )
+        changelog_consumer = self._consumer
+        self._consumer = consumer
+        self._pausing_manager = PausingManager(consumer=consumer)
+        self._processing_context.consumer = consumer
+        self._processing_context.pausing_manager = self._pausing_manager
+        # The sources run in the main process only
+        self._source_manager = SourceManager()
+
+        exit_stack = contextlib.ExitStack()
+        exit_stack.enter_context(self._processing_context)
+        exit_stack.enter_context(self._state_manager)
+        exit_stack.enter_context(changelog_consumer)
+        exit_stack.enter_context(consumer)
+        exit_stack.push(self._exception_handler)
+
+        with exit_stack:
+            self._run_dataframe()
+
     def _run_dataframe(self):
         self._consumer.subscribe(
             self._dataframe_registry.consumer_topics,
@@ -745,14 +1054,27 @@ class Application:
 
         dataframes_composed = self._dataframe_registry.compose_all()
 
-        while self._running:
-            if self._state_manager.recovery_required:
-                self._state_manager.do_recovery()
-            else:
-                self._process_message(dataframes_composed)
-                self._processing_context.commit_checkpoint()
-                self._processing_context.resume_ready_partitions()
-                self._source_manager.raise_for_error()
+        if self._config.consumer_batch_size > 1:
+            process_messages = self._process_messages_batch
+        else:
+            process_messages = self._process_message
+
+        try:
+            while self._running:
+                if self._state_manager.recovery_required:
+                    self._state_manager.do_recovery()
+                else:
+                    process_messages(dataframes_composed)
+                    self._processing_context.commit_checkpoint()
+                    self._processing_context.resume_ready_partitions()
+                    self._state_manager.snapshot_stores()
+                    self._state_manager.update_standby_replicas()
+                    self._source_manager.raise_for_error()
+        finally:
+            # Shut down the thread pools of the batch functions
+            for dataframe_composed in dataframes_composed.values():
+                if isinstance(dataframe_composed, BatchingExecutor):
+                    dataframe_composed.close()
 
         logger.info("Stop processing of StreamingDataFrame")
 
@@ -829,6 +1151,9 @@ class Application:
                 if not to_suppress:
                     raise
 
+        # Process the records buffered by the batch functions, if any
+        self._flush_dataframe(dataframe_composed[topic_name])
+
         # Store the message offset after it's successfully processed
         self._processing_context.store_offset(
             topic=topic_name, partition=partition, offset=offset
@@ -837,6 +1162,132 @@ class Application:
         if self._on_message_processed is not None:
             self._on_message_processed(topic_name, partition, offset)
 
+    def _process_messages_batch(self, dataframe_composed):
+        # Serve producer callbacks once per batch
+        self._producer.poll(self._config.producer_poll_timeout)
+
+        self._revoked_in_batch.clear()
+        rows = self._consumer.consume_rows(
+            num_messages=self._config.consumer_batch_size,
+            timeout=self._config.consumer_poll_timeout,
+        )
+        if not rows:
+            return
+
+        revoked_tps = self._revoked_in_batch
+        on_message_processed = self._on_message_processed
+        # A mapping of {(topic, partition): [first_offset, last_offset, count]}
+        # for the messages processed in this batch
+        tp_offsets: Dict[Tuple[str, int], List[int]] = {}
+        processed_messages = []
+        # Records buffered by the batch functions are flushed every time
+        # the topic partition changes to keep the batches partition-local
+        # and the processing order intact
+        batch_tp = None
+
+        for row in rows:
+            row_context = row.context
+            topic_name, partition, offset = (
+                row_context.topic,
+                row_context.partition,
+                row_context.offset,
+            )
+            tp = (topic_name, partition)
+            if revoked_tps and tp in revoked_tps:
+                # The partition was revoked during the rebalance while the batch
+                # was consumed, and its messages must not be processed anymore
+                continue
+
+            if tp != batch_tp:
+                if batch_tp is not None:
+                    self._flush_dataframe(dataframe_composed[batch_tp[0]])
+                batch_tp = tp
+
+            context = copy_context()
+            context.run(set_message_context, row_context)
+            try:
+                # Execute StreamingDataFrame in a context
+                context.run(
+                    dataframe_composed[topic_name],
+                    row.value,
+                    row.key,
+                    row.timestamp,
+                    row.headers,
+                )
+            except Exception as exc:
+                to_suppress = self._on_processing_error(exc, row, logger)
+                if not to_suppress:
+                    raise
+
+            # Deserializer may return multiple rows for a single message,
+            # count only the distinct offsets
+            offsets = tp_offsets.get(tp)
+            if offsets is None:
+                tp_offsets[tp] = [offset, offset, 1]
+            elif offsets[1] != offset:
+                offsets[1] = offset
+                offsets[2] += 1
+            else:
+                continue
+
+            if on_message_processed is not None:
+                processed_messages.append((topic_name, partition, offset))
+
+        if batch_tp is not None:
+            self._flush_dataframe(dataframe_composed[batch_tp[0]])
+
+        # Store the offsets after the whole batch is successfully processed
+        for (topic_name, partition), (first, last, count) in tp_offsets.items():
+            self._processing_context.store_offset_range(
+                topic=topic_name,
+                partition=partition,
+                first_offset=first,
+                last_offset=last,
+                count=count,
+            )
+
+        if on_message_processed is not None:
+            for topic_name, partition, offset in processed_messages:
+                on_message_processed(topic_name, partition, offset)
+
+    def _flush_dataframe(self, dataframe_composed):
+        """
+        Process the records buffered by the batch functions
+        of the composed StreamingDataFrame.
+
+        Errors raised for individual records are passed to the `on_processing_error`
+        callback with the corresponding row.
+        Errors raised by the batch functions themselves are passed to it with
+        `row=None` because they cannot be attributed to a single record.
+        """
+        if not isinstance(dataframe_composed, BatchingExecutor):
+            return
+
+        unsuppressed = None
+
+        def on_record_error(exc, value, key, timestamp, headers) -> bool:
+            nonlocal unsuppressed
+            row = Row(
+                value=value,
+                key=key,
+                timestamp=timestamp,
+                context=message_context(),
+                headers=headers,
+            )
+            to_suppress = self._on_processing_error(exc, row, logger)
+            if not to_suppress:
+                unsuppressed = exc
+            return to_suppress
+
+        try:
+            dataframe_composed.flush(on_error=on_record_error)
+        except Exception as exc:
+            if exc is unsuppressed:
+                raise
+            to_suppress = self._on_processing_error(exc, None, logger)
+            if not to_suppress:
+                raise
+
     def _on_assign(self, _, topic_partitions: List[TopicPartition]):
         """
         Assign new topic partitions to consumer and state.
@@ -863,16 +1314,16 @@ class Application:
         self._consumer.incremental_assign(topic_partitions)
 
         if self._state_manager.stores:
-            for tp in topic_partitions:
-                # Get the latest committed offset for the assigned topic partition
-                tp_committed = self._consumer.committed([tp], timeout=30)[0]
-                # Assign store partitions
-                store_partitions = self._state_manager.on_partition_assign(
-                    topic=tp.topic,
-                    partition=tp.partition,
-                    committed_offset=tp_committed.offset,
-                )
+            # Get the latest committed offsets for all assigned partitions at once
+            committed_tps = self._consumer.committed(topic_partitions, timeout=30)
+            # Assign store partitions
+            assigned = self._state_manager.on_partitions_assign(
+                [(tp.topic, tp.partition, tp.offset) for tp in committed_tps]
+            )
 
+            for tp_committed in committed_tps:
+                tp_key = (tp_committed.topic, tp_committed.partition)
+                store_partitions = assigned[tp_key]
                 # Check if the latest committed offset >= stored offset
                 # Otherwise, the re-processed messages might use already updated
                 # state, which can lead to inconsistent outputs
@@ -915,6 +1366,7 @@ class Application:
 
         self._consumer.incremental_unassign(topic_partitions)
         for tp in topic_partitions:
+            self._revoked_in_batch.add((tp.topic, tp.partition))
             if self._state_manager.stores:
                 self._state_manager.on_partition_revoke(
                     topic=tp.topic, partition=tp.partition
@@ -929,6 +1381,7 @@ class Application:
         """
         logger.debug("Rebalancing: dropping lost partitions")
         for tp in topic_partitions:
+            self._revoked_in_batch.add((tp.topic, tp.partition))
             if self._state_manager.stores:
                 self._state_manager.on_partition_revoke(
                     topic=tp.topic, partition=tp.partition
@@ -937,10 +1390,76 @@ class Application:
                 topic=tp.topic, partition=tp.partition
             )
 
+    def _on_workers_assign(self, _, topic_partitions: List[TopicPartition]):
+        """
+        Assign new topic partitions to the consumer and the workers
+        """
+        if not topic_partitions:
+            return
+        logger.debug("Rebalancing: assigning partitions to workers")
+
+        self._source_manager.start_sources()
+        self._consumer.incremental_assign(topic_partitions)
+        committed = self._consumer.committed(topic_partitions, timeout=30)
+        self._worker_manager.assign(committed)
+
+    def _on_workers_revoke(self, _, topic_partitions: List[TopicPartition]):
+        """
+        Revoke partitions from the workers and the consumer.
+
+        The workers commit their checkpoints before releasing the partitions
+        unless the application is closing because of the unhandled exception.
+        """
+        logger.debug("Rebalancing: revoking partitions from workers")
+        if self._failed:
+            logger.warning(
+                "Application is stopping due to failure, "
+                "latest checkpoints of the workers will not be committed."
+            )
+        self._worker_manager.revoke(topic_partitions, lost=self._failed)
+        self._consumer.incremental_unassign(topic_partitions)
+
+    def _on_workers_lost(self, _, topic_partitions: List[TopicPartition]):
+        """
+        Dropping lost partitions from the workers
+        """
+        logger.debug("Rebalancing: dropping lost partitions from workers")
+        self._worker_manager.revoke(topic_partitions, lost=True)
+
     def _setup_signal_handlers(self):
+        if threading.current_thread() is not threading.main_thread():
+            # Signal handlers can be set only in the main thread.
+            # The app running in another thread (e.g. with `run_async()`)
+            # is stopped by the caller.
+            return
         signal.signal(signal.SIGINT, self._on_sigint)
         signal.signal(signal.SIGTERM, self._on_sigterm)
 
+    def _setup_loop_signal_handlers(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> List[signal.Signals]:
+        """
+        Stop the application on SIGINT and SIGTERM received by the event loop.
+
+        :return: the signals the handlers are set for
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return []
+
+        signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self._on_loop_signal, sig)
+            except NotImplementedError:
+                # Not supported by the loops on Windows
+                break
+            signals.append(sig)
+        return signals
+
+    def _on_loop_signal(self, sig: signal.Signals):
+        logger.debug(f"Received {sig.name}, stopping the processing loop")
+        self.stop()
+
     def _on_sigint(self, *_):
         # Re-install the default SIGINT handler so doing Ctrl+C twice
         # raises KeyboardInterrupt
@@ -980,12 +1499,17 @@ class ApplicationConfig(BaseSettings):
     processing_guarantee: ProcessingGuarantee = "at-least-once"
     consumer_poll_timeout: float = 1.0
     producer_poll_timeout: float = 0.0
+    consumer_batch_size: int = 1
     auto_create_topics: bool = True
     request_timeout: float = 30
     topic_create_timeout: float = 60
     state_dir: Path = Path("state")
     rocksdb_options: Optional[RocksDBOptionsType] = None
+    default_store_type: StoreTypes = RocksDBStore
+    memory_store_options: Optional[MemoryStoreOptions] = None
     use_changelog_topics: bool = True
+    num_standby_replicas: int = 0
+    producer_delivery_reports: DeliveryReports = "all"
 
     @classmethod
     def settings_customise_sources(
@@ -1,21 +1,28 @@
+import asyncio
 import logging
 import time
 from abc import abstractmethod
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
-from confluent_kafka import TopicPartition, KafkaException
+from confluent_kafka import OFFSET_END, TopicPartition, KafkaException
 
 from quixstreams.kafka import Consumer
+from quixstreams.kafka.exceptions import KafkaConsumerException
 from quixstreams.processing.pausing import PausingManager
 from quixstreams.rowproducer import RowProducer
 from quixstreams.sinks import SinkManager
-from quixstreams.sinks.base import SinkBackpressureError
+from quixstreams.sinks.base import (
+    AsyncBatchingSink,
+    BaseSink,
+    SinkBackpressureError,
+)
 from quixstreams.state import (
     StateStoreManager,
     PartitionTransaction,
     DEFAULT_STATE_STORE_NAME,
 )
 from quixstreams.state.exceptions import StoreTransactionFailed
+from quixstreams.utils.aio import run_coroutine
 from .exceptions import (
     InvalidStoredOffset,
     CheckpointProducerTimeout,
@@ -79,23 +86,49 @@ class BaseCheckpoint:
         :param partition: partition number
         :param offset: message offset
         """
+        self.store_offset_range(
+            topic=topic,
+            partition=partition,
+            first_offset=offset,
+            last_offset=offset,
+            count=1,
+        )
+
+    def store_offset_range(
+        self,
+        topic: str,
+        partition: int,
+        first_offset: int,
+        last_offset: int,
+        count: int,
+    ):
+        """
+        Store the offsets of a batch of processed messages from the same
+        topic partition to the checkpoint.
+
+        :param topic: topic name
+        :param partition: partition number
+        :param first_offset: the first processed message offset in the batch
+        :param last_offset: the last processed message offset in the batch
+        :param count: the number of processed messages in the batch
+        """
         tp = (topic, partition)
         stored_offset = self._tp_offsets.get(tp, -1)
         # A paranoid check to ensure that processed offsets always increase within the
         # same checkpoint.
         # It shouldn't normally happen, but a lot of logic relies on it,
         # and it's better to be safe.
-        if offset <= stored_offset:
+        if first_offset <= stored_offset:
             raise InvalidStoredOffset(
                 f"Cannot store offset smaller or equal than already processed"
-                f" one: {offset} <= {stored_offset}"
+                f" one: {first_offset} <= {stored_offset}"
             )
-        self._tp_offsets[tp] = offset
+        self._tp_offsets[tp] = last_offset
         # Track the first processed offset in the transaction to rewind back to it
         # in case of sink backpressure
         if tp not in self._starting_tp_offsets:
-            self._starting_tp_offsets[tp] = offset
-        self._total_offsets_processed += 1
+            self._starting_tp_offsets[tp] = first_offset
+        self._total_offsets_processed += count
 
     @abstractmethod
     def close(self):
@@ -212,6 +245,8 @@ class Checkpoint(BaseCheckpoint):
 
         logger.debug("Checkpoint: flushing sinks")
         sinks = self._sink_manager.sinks
+        # Async sinks are flushed concurrently for all partitions after the others
+        async_flushes: List[Tuple[AsyncBatchingSink, str, int, int]] = []
         # Step 3. Flush sinks
         for (topic, partition), offset in self._tp_offsets.items():
             for sink in sinks:
@@ -223,27 +258,34 @@ class Checkpoint(BaseCheckpoint):
                     sink.on_paused(topic=topic, partition=partition)
                     continue
 
+                if isinstance(sink, AsyncBatchingSink):
+                    async_flushes.append((sink, topic, partition, offset))
+                    continue
+
                 try:
                     sink.flush(topic=topic, partition=partition)
                 except SinkBackpressureError as exc:
-                    logger.warning(
-                        f'Backpressure for sink "{sink}" is detected, '
-                        f"the partition will be paused and resumed again "
-                        f"in {exc.retry_after}s; "
-                        f'partition="{topic}[{partition}]" '
-                        f"processed_offset={offset}"
+                    self._pause_backpressured(
+                        sink=sink,
+                        topic=topic,
+                        partition=partition,
+                        offset=offset,
+                        exc=exc,
                     )
-                    # The backpressure is detected from the sink
-                    # Pause the partition to let it cool down and seek it back to
-                    # the first processed offset of this Checkpoint (it must be equal
-                    # to the last committed offset).
-                    offset_to_seek = self._starting_tp_offsets[(topic, partition)]
-                    self._pausing_manager.pause(
+
+        if async_flushes:
+            results = run_coroutine(_flush_async_sinks(async_flushes))
+            for (sink, topic, partition, offset), result in zip(async_flushes, results):
+                if isinstance(result, SinkBackpressureError):
+                    self._pause_backpressured(
+                        sink=sink,
                         topic=topic,
                         partition=partition,
-                        resume_after=exc.retry_after,
-                        offset_to_seek=offset_to_seek,
+                        offset=offset,
+                        exc=result,
                     )
+                elif isinstance(result, BaseException):
+                    raise result
 
         # Step 4. Commit offsets to Kafka
         # First, filter out offsets of the paused topic partitions.
@@ -279,7 +321,7 @@ class Checkpoint(BaseCheckpoint):
         # Step 5. Flush state store partitions to the disk together with changelog
         # offsets.
         # Get produced offsets after flushing the producer
-        produced_offsets = self._producer.offsets
+        produced_offsets = self._get_produced_offsets()
         for (
             topic,
             partition,
@@ -301,3 +343,78 @@ class Checkpoint(BaseCheckpoint):
             transaction.flush(
                 processed_offset=offset, changelog_offset=changelog_offset
             )
+
+    def _get_produced_offsets(self) -> Dict[Tuple[str, int], int]:
+        """
+        Get the offsets of the last produced changelog messages.
+
+        If the producer doesn't handle the successful delivery reports,
+        the end offsets of the changelog partitions produced during this
+        checkpoint are queried from the broker in a single batched request.
+        The producer is already flushed here, and the partitions are produced
+        only by this application, so the last offset is the end offset - 1.
+        """
+        if self._producer.delivery_reports == "all":
+            return self._producer.offsets
+
+        changelog_tps = {
+            transaction.changelog_topic_partition
+            for transaction in self._store_transactions.values()
+        }
+        produced_tps = [
+            TopicPartition(topic=topic, partition=partition, offset=OFFSET_END)
+            for topic, partition in self._producer.pop_produced_partitions()
+            if (topic, partition) in changelog_tps
+        ]
+        if not produced_tps:
+            return {}
+
+        produced_offsets = {}
+        for tp in self._consumer.offsets_for_times(produced_tps, timeout=10):
+            if tp.error:
+                raise KafkaConsumerException(tp.error)
+            produced_offsets[(tp.topic, tp.partition)] = tp.offset - 1
+        return produced_offsets
+
+    def _pause_backpressured(
+        self,
+        sink: BaseSink,
+        topic: str,
+        partition: int,
+        offset: int,
+        exc: SinkBackpressureError,
+    ):
+        logger.warning(
+            f'Backpressure for sink "{sink}" is detected, '
+            f"the partition will be paused and resumed again "
+            f"in {exc.retry_after}s; "
+            f'partition="{topic}[{partition}]" '
+            f"processed_offset={offset}"
+        )
+        # The backpressure is detected from the sink
+        # Pause the partition to let it cool down and seek it back to
+        # the first processed offset of this Checkpoint (it must be equal
+        # to the last committed offset).
+        offset_to_seek = self._starting_tp_offsets[(topic, partition)]
+        self._pausing_manager.pause(
+            topic=topic,
+            partition=partition,
+            resume_after=exc.retry_after,
+            offset_to_seek=offset_to_seek,
+        )
+
+
+async def _flush_async_sinks(
+    flushes: List[Tuple[AsyncBatchingSink, str, int, int]],
+) -> list:
+    """
+    Flush the async sinks concurrently and return the results
+    including the exceptions in the order of the flushes.
+    """
+    return await asyncio.gather(
+        *(
+            sink.flush_async(topic=topic, partition=partition)
+            for sink, topic, partition, _ in flushes
+        ),
+        return_exceptions=True,
+    )
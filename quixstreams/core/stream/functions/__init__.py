@@ -5,3 +5,6 @@ from .apply import *
 from .update import *
 from .filter import *
 from .transform import *
+from .batch import *
+from .concurrent import *
+from .fused import *
@@ -18,8 +18,9 @@ class ApplyFunction(StreamFunction):
         self,
         func: ApplyCallback,
         expand: bool = False,
+        mutates_value: bool = True,
     ):
-        super().__init__(func)
+        super().__init__(func, mutates_value=mutates_value)
         self.expand = expand
 
     def get_executor(self, *child_executors: VoidExecutor) -> VoidExecutor:
@@ -61,8 +62,9 @@ class ApplyWithMetadataFunction(StreamFunction):
         self,
         func: ApplyWithMetadataCallback,
         expand: bool = False,
+        mutates_value: bool = True,
     ):
-        super().__init__(func)
+        super().__init__(func, mutates_value=mutates_value)
         self.expand = expand
 
     def get_executor(self, *child_executors: VoidExecutor) -> VoidExecutor:
@@ -4,7 +4,18 @@ from typing import Any
 from .types import StreamCallback, VoidExecutor
 from .utils import pickle_copier
 
-__all__ = ("StreamFunction",)
+__all__ = ("StreamFunction", "mark_read_only")
+
+
+def mark_read_only(executor: VoidExecutor) -> VoidExecutor:
+    """
+    Mark the executor of a branch which doesn't mutate the value in-place.
+
+    The read-only branches may share the same value with the other branches
+    instead of receiving its copy.
+    """
+    executor.read_only = True
+    return executor
 
 
 class StreamFunction(abc.ABC):
@@ -16,9 +27,13 @@ class StreamFunction(abc.ABC):
     """
 
     expand: bool = False
+    # Whether the function may mutate the value in-place.
+    # The user callbacks are expected to mutate it unless told otherwise.
+    mutates_value: bool = True
 
-    def __init__(self, func: StreamCallback):
+    def __init__(self, func: StreamCallback, mutates_value: bool = True):
         self.func = func
+        self.mutates_value = mutates_value
 
     @abc.abstractmethod
     def get_executor(self, *child_executors: VoidExecutor) -> VoidExecutor:
@@ -34,11 +49,15 @@ class StreamFunction(abc.ABC):
         If there's more than one executor - it's a branching point in the data flow,
         and we need to copy the value for the downstream branches
         in case they mutate it.
+        The read-only branches (see `mark_read_only()`) share the original value,
+        and only the branches which may mutate it receive the copies.
 
         If there's only one executor - copying is not neccessary, and the executor
         is returned as is.
         """
         if len(child_executors) > 1:
+            if any(getattr(e, "read_only", False) for e in child_executors):
+                return self._copy_on_write(*child_executors)
 
             def wrapper(
                 value: Any,
@@ -59,3 +78,28 @@ class StreamFunction(abc.ABC):
 
         else:
             return child_executors[0]
+
+    def _copy_on_write(self, *child_executors: VoidExecutor) -> VoidExecutor:
+        branches = [
+            (executor, not getattr(executor, "read_only", False))
+            for executor in child_executors
+        ]
+
+        def wrapper(
+            value: Any,
+            key: Any,
+            timestamp: int,
+            headers: Any,
+        ):
+            # The original value is never mutated by the branches, so the copier
+            # is created lazily only when the first mutating branch is executed
+            copier = None
+            for branch_executor, mutates in branches:
+                if not mutates:
+                    branch_executor(value, key, timestamp, headers)
+                    continue
+                if copier is None:
+                    copier = pickle_copier(value)
+                branch_executor(copier(), key, timestamp, headers)
+
+        return wrapper
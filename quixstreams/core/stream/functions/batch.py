@@ -0,0 +1,228 @@
+import abc
+import contextvars
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from .base import StreamFunction
+from .types import (
+    ApplyBatchCallback,
+    ApplyBatchWithMetadataCallback,
+    FilterBatchCallback,
+    FilterBatchWithMetadataCallback,
+    VoidExecutor,
+)
+
+__all__ = (
+    "BatchStreamFunction",
+    "ApplyBatchFunction",
+    "FilterBatchFunction",
+    "BatchExecutor",
+    "BatchErrorCallback",
+    "BatchRecordError",
+)
+
+BatchErrorCallback = Callable[[Exception, Any, Any, int, Any], bool]
+
+
+class BatchRecordError:
+    """
+    A result of the batch function for a record which failed to process.
+
+    The record is not passed downstream, and the exception is handled by
+    the `on_error` callback of `BatchExecutor.flush()` as if it was raised
+    for this record.
+    """
+
+    __slots__ = ("value", "exception")
+
+    def __init__(self, value: Any, exception: Exception):
+        self.value = value
+        self.exception = exception
+
+
+class BatchExecutor:
+    """
+    An executor returned by the batch functions.
+
+    Instead of executing the function on each incoming record, it buffers
+    the records together with a snapshot of the current `contextvars` context
+    (e.g. the `MessageContext` of the record).
+
+    The buffered records are processed only when `.flush()` is called.
+    The function is called once with all the buffered values, and the results are
+    forwarded downstream one by one, each within the context of the original record.
+    This way, the keys, timestamps, headers and message contexts (offsets)
+    of the individual records are preserved.
+    """
+
+    __slots__ = ("_buffer", "_process", "_close", "_child_executor", "read_only")
+
+    def __init__(
+        self,
+        process: Callable[
+            [List[Tuple[Any, Any, int, Any, contextvars.Context]]],
+            List[Tuple[Any, Any, int, Any, contextvars.Context]],
+        ],
+        child_executor: VoidExecutor,
+        close: Optional[Callable[[], None]] = None,
+    ):
+        self._buffer: List[Tuple[Any, Any, int, Any, contextvars.Context]] = []
+        self._process = process
+        self._close = close
+        self._child_executor = child_executor
+        self.read_only = False
+
+    def __call__(self, value: Any, key: Any, timestamp: int, headers: Any):
+        self._buffer.append(
+            (value, key, timestamp, headers, contextvars.copy_context())
+        )
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def flush(self, on_error: Optional[BatchErrorCallback] = None):
+        """
+        Process the buffered records and pass the results downstream.
+
+        If the batch function itself fails, the buffered records are dropped,
+        and the exception is propagated.
+
+        :param on_error: a callback to handle the exceptions raised downstream for
+            individual records, or returned as `BatchRecordError` by the function.
+            It is called with the exception, value, key, timestamp and headers
+            within the context of the failed record.
+            If it returns `True`, the exception is suppressed, and the rest of the
+            records are processed.
+            Otherwise, the exception is propagated.
+        """
+        if not self._buffer:
+            return
+
+        batch, self._buffer = self._buffer, []
+        child_executor = self._child_executor
+        for value, key, timestamp, headers, context in self._process(batch):
+            try:
+                if value.__class__ is BatchRecordError:
+                    value, exc = value.value, value.exception
+                    raise exc
+                context.run(child_executor, value, key, timestamp, headers)
+            except Exception as exc:
+                if on_error is None or not context.run(
+                    on_error, exc, value, key, timestamp, headers
+                ):
+                    raise
+
+    def close(self):
+        """
+        Release the resources held by the batch function, if any.
+
+        The buffered records are not processed.
+        """
+        if self._close is not None:
+            self._close()
+
+
+class BatchStreamFunction(StreamFunction):
+    """
+    A base class for the functions processing the values in batches.
+
+    Its executor buffers the incoming records, and the function is called
+    once per batch when the executor is flushed.
+    """
+
+    def __init__(self, func: Callable, metadata: bool = False):
+        super().__init__(func)
+        self.metadata = metadata
+
+    def get_executor(self, *child_executors: VoidExecutor) -> BatchExecutor:
+        child_executor = self._resolve_branching(*child_executors)
+        return BatchExecutor(
+            process=self._process, child_executor=child_executor, close=self.close
+        )
+
+    def close(self):
+        """
+        Release the resources held by the function, if any.
+
+        It's called when the application stops processing.
+        """
+
+    def _call(self, batch: List[Tuple[Any, Any, int, Any, Any]]) -> Any:
+        values = [item[0] for item in batch]
+        if self.metadata:
+            return self.func(
+                values,
+                [item[1] for item in batch],
+                [item[2] for item in batch],
+                [item[3] for item in batch],
+            )
+        return self.func(values)
+
+    @abc.abstractmethod
+    def _process(
+        self, batch: List[Tuple[Any, Any, int, Any, Any]]
+    ) -> List[Tuple[Any, Any, int, Any, Any]]:
+        """
+        Process a batch of buffered records and return the records
+        to be passed downstream.
+        """
+
+
+class ApplyBatchFunction(BatchStreamFunction):
+    """
+    Wrap a function into a batch "Apply" function.
+
+    The provided callback receives a list of values and is expected to return
+    a sequence of new values of the same length (e.g. a list or a NumPy array).
+    Each new value is passed downstream with the key, timestamp and headers of the
+    corresponding input record.
+    """
+
+    def __init__(
+        self,
+        func: Union[ApplyBatchCallback, ApplyBatchWithMetadataCallback],
+        metadata: bool = False,
+    ):
+        super().__init__(func, metadata=metadata)
+
+    def _process(
+        self, batch: List[Tuple[Any, Any, int, Any, Any]]
+    ) -> List[Tuple[Any, Any, int, Any, Any]]:
+        results = self._call(batch)
+        if len(results) != len(batch):
+            raise ValueError(
+                f"Batch function must return the same number of values as it "
+                f"received; expected {len(batch)}, got {len(results)}"
+            )
+        return [
+            (result, key, timestamp, headers, context)
+            for result, (_, key, timestamp, headers, context) in zip(results, batch)
+        ]
+
+
+class FilterBatchFunction(BatchStreamFunction):
+    """
+    Wrap a function into a batch "Filter" function.
+
+    The provided callback receives a list of values and is expected to return
+    a sequence of boolean-like results of the same length (e.g. a list of bools
+    or a boolean NumPy array).
+    The records with `True`-like results are passed downstream unchanged.
+    """
+
+    def __init__(
+        self,
+        func: Union[FilterBatchCallback, FilterBatchWithMetadataCallback],
+        metadata: bool = False,
+    ):
+        super().__init__(func, metadata=metadata)
+
+    def _process(
+        self, batch: List[Tuple[Any, Any, int, Any, Any]]
+    ) -> List[Tuple[Any, Any, int, Any, Any]]:
+        mask = self._call(batch)
+        if len(mask) != len(batch):
+            raise ValueError(
+                f"Batch filter function must return the same number of results as "
+                f"it received values; expected {len(batch)}, got {len(mask)}"
+            )
+        return [item for item, passed in zip(batch, mask) if passed]
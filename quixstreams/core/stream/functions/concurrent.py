@@ -0,0 +1,138 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from quixstreams.utils.aio import run_coroutine
+from .batch import BatchRecordError, BatchStreamFunction
+from .types import ApplyCallback, ApplyWithMetadataCallback
+
+__all__ = ("ConcurrentApplyFunction",)
+
+_Record = Tuple[Any, Any, int, Any, Any]
+
+
+class ConcurrentApplyFunction(BatchStreamFunction):
+    """
+    Wrap a function into a concurrent "Apply" function.
+
+    The function is called for each value like a regular "Apply" function,
+    but the calls for the buffered records run concurrently
+    in a thread pool, or in the application event loop if the function
+    is a coroutine function (see `quixstreams.utils.aio`).
+    It's meant for the functions blocking on I/O (e.g. HTTP or database lookups).
+
+    The records with the same key are processed sequentially in their order,
+    and the results are passed downstream in the order of the input records
+    when the executor is flushed.
+    Only the records buffered until the flush run concurrently, and
+    the application flushes the executor every time the topic partition
+    of the processed messages changes.
+
+    The thread pool is shut down by `.close()` and started again if the function
+    is called after that.
+
+    :param func: a function or a coroutine function to generate a new value
+    :param metadata: if True, the callback will receive the key, timestamp
+        and headers along with the value.
+    :param max_concurrency: the maximum number of calls running at the same time.
+    """
+
+    def __init__(
+        self,
+        func: Union[ApplyCallback, ApplyWithMetadataCallback],
+        metadata: bool = False,
+        max_concurrency: int = 10,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        super().__init__(func, metadata=metadata)
+        self.max_concurrency = max_concurrency
+        self._is_coroutine = asyncio.iscoroutinefunction(func)
+        # The pool is started on the first batch
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _process(self, batch: List[_Record]) -> List[_Record]:
+        results: List[Any] = [None] * len(batch)
+        chains = self._chains_by_key(batch)
+
+        if self._is_coroutine:
+            run_coroutine(self._run_async(batch, chains, results))
+        elif len(chains) == 1:
+            # Nothing to run concurrently
+            self._run_chain(batch, chains[0], results)
+        else:
+            pool = self._get_pool()
+            futures = [
+                pool.submit(self._run_chain, batch, chain, results) for chain in chains
+            ]
+            for future in futures:
+                future.result()
+
+        return [
+            (result, key, timestamp, headers, context)
+            for result, (_, key, timestamp, headers, context) in zip(results, batch)
+        ]
+
+    @staticmethod
+    def _chains_by_key(batch: List[_Record]) -> List[List[int]]:
+        """
+        Group the indices of the records by their keys preserving their order.
+        """
+        chains: Dict[Any, List[int]] = {}
+        for i, (_, key, _, _, _) in enumerate(batch):
+            try:
+                chain = chains.setdefault(key, [])
+            except TypeError:
+                # Unhashable keys are grouped by their representation
+                chain = chains.setdefault(repr(key), [])
+            chain.append(i)
+        return list(chains.values())
+
+    def _call_one(self, record: _Record) -> Any:
+        value, key, timestamp, headers, _ = record
+        if self.metadata:
+            return self.func(value, key, timestamp, headers)
+        return self.func(value)
+
+    def _run_chain(self, batch: List[_Record], chain: List[int], results: List[Any]):
+        for i in chain:
+            record = batch[i]
+            try:
+                # Run the function in the context of the record,
+                # so it can access the message context
+                results[i] = record[4].run(self._call_one, record)
+            except Exception as exc:
+                results[i] = BatchRecordError(value=record[0], exception=exc)
+
+    async def _run_async(
+        self, batch: List[_Record], chains: List[List[int]], results: List[Any]
+    ):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_chain(chain: List[int]):
+            for i in chain:
+                record = batch[i]
+                async with semaphore:
+                    try:
+                        # The task copies the context of the record
+                        task = record[4].run(
+                            asyncio.ensure_future, self._call_one(record)
+                        )
+                        results[i] = await task
+                    except Exception as exc:
+                        results[i] = BatchRecordError(value=record[0], exception=exc)
+
+        await asyncio.gather(*(run_chain(chain) for chain in chains))
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="apply_concurrent",
+            )
+        return self._pool
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
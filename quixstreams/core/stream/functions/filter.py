@@ -15,8 +15,8 @@ class FilterFunction(StreamFunction):
     value is filtered out.
     """
 
-    def __init__(self, func: FilterCallback):
-        super().__init__(func)
+    def __init__(self, func: FilterCallback, mutates_value: bool = True):
+        super().__init__(func, mutates_value=mutates_value)
 
     def get_executor(self, *child_executors: VoidExecutor) -> VoidExecutor:
         child_executor = self._resolve_branching(*child_executors)
@@ -40,8 +40,8 @@ class FilterWithMetadataFunction(StreamFunction):
     Otherwise, the value will be filtered out.
     """
 
-    def __init__(self, func: FilterWithMetadataCallback):
-        super().__init__(func)
+    def __init__(self, func: FilterWithMetadataCallback, mutates_value: bool = True):
+        super().__init__(func, mutates_value=mutates_value)
 
     def get_executor(self, *child_executors: VoidExecutor) -> VoidExecutor:
         child_executor = self._resolve_branching(*child_executors)
@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Type
+
+from .apply import ApplyFunction, ApplyWithMetadataFunction
+from .base import StreamFunction
+from .filter import FilterFunction, FilterWithMetadataFunction
+from .types import VoidExecutor
+from .update import UpdateFunction, UpdateWithMetadataFunction
+
+__all__ = ("FusedFunction",)
+
+# The code executing each type of the fusable functions.
+# The "{func}" placeholder is replaced with the name of the callback.
+_STEPS: Dict[Type[StreamFunction], str] = {
+    ApplyFunction: "value = {func}(value)",
+    ApplyWithMetadataFunction: "value = {func}(value, key, timestamp, headers)",
+    UpdateFunction: "{func}(value)",
+    UpdateWithMetadataFunction: "{func}(value, key, timestamp, headers)",
+    FilterFunction: "if not {func}(value):\n        return",
+    FilterWithMetadataFunction: (
+        "if not {func}(value, key, timestamp, headers):\n        return"
+    ),
+}
+
+
+class FusedFunction(StreamFunction):
+    """
+    A sequence of the "Apply", "Update" and "Filter" functions executed
+    as one function.
+
+    Instead of nesting an executor per function, it generates a single executor
+    calling the callbacks one after another, which saves a function call per
+    each fused function.
+    It's created by `Stream.compose()` and is not supposed to be used directly.
+    """
+
+    def __init__(self, functions: List[StreamFunction]):
+        if not all(self.can_fuse(f) for f in functions):
+            raise ValueError(
+                "Only non-expanding Apply, Update and Filter functions can be fused"
+            )
+        super().__init__(
+            func=None, mutates_value=any(f.mutates_value for f in functions)
+        )
+        self.functions = functions
+
+    @staticmethod
+    def can_fuse(func: StreamFunction) -> bool:
+        """
+        Check whether the function can be fused with the others.
+        """
+        return type(func) in _STEPS and not func.expand
+
+    def get_executor(self, *child_executors: VoidExecutor) -> VoidExecutor:
+        child_executor = self._resolve_branching(*child_executors)
+
+        namespace: Dict[str, Any] = {"_child_executor": child_executor}
+        lines = []
+        for i, func in enumerate(self.functions):
+            name = f"_func{i}"
+            namespace[name] = func.func
+            lines.append("    " + _STEPS[type(func)].format(func=name))
+        lines.append("    _child_executor(value, key, timestamp, headers)")
+
+        # Bind the callbacks as the default arguments to make them fast locals
+        defaults = ", ".join(f"{name}={name}" for name in namespace)
+        source = (
+            f"def wrapper(value, key, timestamp, headers, {defaults}):\n"
+            + "\n".join(lines)
+        )
+        exec(compile(source, "<fused>", "exec"), namespace)  # noqa: S102
+        return namespace["wrapper"]
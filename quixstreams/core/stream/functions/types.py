@@ -1,4 +1,4 @@
-from typing import Callable, Any, Iterable, Protocol, Tuple, Union
+from typing import Callable, Any, Iterable, List, Protocol, Sequence, Tuple, Union
 
 __all__ = (
     "StreamCallback",
@@ -14,6 +14,10 @@ __all__ = (
     "FilterWithMetadataCallback",
     "TransformCallback",
     "TransformExpandedCallback",
+    "ApplyBatchCallback",
+    "ApplyBatchWithMetadataCallback",
+    "FilterBatchCallback",
+    "FilterBatchWithMetadataCallback",
 )
 
 
@@ -36,6 +40,15 @@ TransformExpandedCallback = Callable[
     [Any, Any, int, Any], Iterable[Tuple[Any, Any, int, Any]]
 ]
 
+ApplyBatchCallback = Callable[[List[Any]], Sequence[Any]]
+ApplyBatchWithMetadataCallback = Callable[
+    [List[Any], List[Any], List[int], List[Any]], Sequence[Any]
+]
+FilterBatchCallback = Callable[[List[Any]], Sequence[SupportsBool]]
+FilterBatchWithMetadataCallback = Callable[
+    [List[Any], List[Any], List[int], List[Any]], Sequence[SupportsBool]
+]
+
 StreamCallback = Union[
     ApplyCallback,
     ApplyExpandedCallback,
@@ -47,6 +60,10 @@ StreamCallback = Union[
     FilterWithMetadataCallback,
     TransformCallback,
     TransformExpandedCallback,
+    ApplyBatchCallback,
+    ApplyBatchWithMetadataCallback,
+    FilterBatchCallback,
+    FilterBatchWithMetadataCallback,
 ]
 
 
@@ -17,8 +17,8 @@ class UpdateFunction(StreamFunction):
     downstream.
     """
 
-    def __init__(self, func: UpdateCallback):
-        super().__init__(func)
+    def __init__(self, func: UpdateCallback, mutates_value: bool = True):
+        super().__init__(func, mutates_value=mutates_value)
 
     def get_executor(self, *child_executors: VoidExecutor) -> VoidExecutor:
         child_executor = self._resolve_branching(*child_executors)
@@ -42,8 +42,8 @@ class UpdateWithMetadataFunction(StreamFunction):
     downstream.
     """
 
-    def __init__(self, func: UpdateWithMetadataCallback):
-        super().__init__(func)
+    def __init__(self, func: UpdateWithMetadataCallback, mutates_value: bool = True):
+        super().__init__(func, mutates_value=mutates_value)
 
     def get_executor(self, *child_executors: VoidExecutor) -> VoidExecutor:
         child_executor = self._resolve_branching(*child_executors)
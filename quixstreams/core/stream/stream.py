@@ -30,9 +30,66 @@ from .functions import (
     TransformExpandedCallback,
     ApplyWithMetadataExpandedCallback,
     ApplyExpandedCallback,
+    ApplyBatchCallback,
+    ApplyBatchWithMetadataCallback,
+    ApplyBatchFunction,
+    FilterBatchCallback,
+    FilterBatchWithMetadataCallback,
+    FilterBatchFunction,
+    BatchStreamFunction,
+    BatchExecutor,
+    BatchErrorCallback,
+    ConcurrentApplyFunction,
+    FusedFunction,
+    mark_read_only,
 )
 
-__all__ = ("Stream",)
+__all__ = ("Stream", "BatchingExecutor")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class BatchingExecutor:
+    """
+    A composed executor of the `Stream` containing batch functions.
+
+    It's called with a value, key, timestamp, and headers like a regular executor,
+    but the batch functions only buffer the incoming records.
+    Call `.flush()` to process the buffered records and pass them downstream.
+    """
+
+    __slots__ = ("_executor", "_batch_executors")
+
+    def __init__(
+        self, executor: VoidExecutor, batch_executors: List[BatchExecutor]
+    ) -> None:
+        self._executor = executor
+        # Batch executors are created from the bottom of the tree to the top,
+        # reverse them to flush the upstream buffers first
+        self._batch_executors = list(reversed(batch_executors))
+
+    def __call__(self, value: Any, key: Any, timestamp: int, headers: Any) -> None:
+        self._executor(value, key, timestamp, headers)
+
+    def flush(self, on_error: Optional[BatchErrorCallback] = None):
+        """
+        Flush all the batch functions in the stream in the order of execution.
+
+        :param on_error: a callback to handle exceptions raised for individual records
+            after the batch functions. See `BatchExecutor.flush()` for details.
+        """
+        for batch_executor in self._batch_executors:
+            batch_executor.flush(on_error=on_error)
+
+    def close(self):
+        """
+        Release the resources held by the batch functions in the stream
+        (e.g. the thread pools of the concurrent "Apply" functions).
+        """
+        for batch_executor in self._batch_executors:
+            batch_executor.close()
 
 
 class Stream:
@@ -68,6 +125,12 @@ class Stream:
             functions.
             If "expand=True" is passed and the function returns an `Iterable`,
             each item of it will be treated as a separate value downstream.
+        - "ApplyBatch" and "FilterBatch" - batch versions of "Apply" and "Filter"
+            functions.
+            They are called once with a list of buffered values when the composed
+            executor is flushed.
+        - "ConcurrentApply" - a version of "Apply" function called concurrently
+            for the values buffered until the composed executor is flushed.
 
         To execute the functions on the `Stream`, call `.compose()` method, and
         it will return a closure to execute all the functions accumulated in the Stream
@@ -76,13 +139,15 @@ class Stream:
         :param func: a function to be called on the stream.
             It is expected to be wrapped into one of "Apply", "Filter", "Update" or
             "Trasform" from `quixstreams.core.stream.functions` package.
-            Default - "ApplyFunction(lambda value: value)".
+            Default - an "ApplyFunction" returning the value as is.
         :param parent: a parent `Stream`
         """
         if func is not None and not isinstance(func, StreamFunction):
             raise ValueError("Provided function must be a subclass of StreamFunction")
 
-        self.func = func if func is not None else ApplyFunction(lambda value: value)
+        self.func = (
+            func if func is not None else ApplyFunction(_identity, mutates_value=False)
+        )
         self.parent = parent
         self.children = set()
         self.generated = monotonic_ns()
@@ -106,6 +171,7 @@ class Stream:
         func: Union[FilterCallback, FilterWithMetadataCallback],
         *,
         metadata: bool = False,
+        mutates_value: bool = True,
     ) -> Self:
         """
         Add a function to filter values from the Stream.
@@ -118,12 +184,16 @@ class Stream:
         :param metadata: if True, the callback will receive key and timestamp along with
             the value.
             Default - `False`.
+        :param mutates_value: if False, the function only reads the value
+            without mutating it, and the value doesn't need to be copied
+            for it at the branching points.
+            Default - `True`.
         :return: a new `Stream` derived from the current one
         """
         if metadata:
-            filter_func = FilterWithMetadataFunction(func)
+            filter_func = FilterWithMetadataFunction(func, mutates_value=mutates_value)
         else:
-            filter_func = FilterFunction(func)
+            filter_func = FilterFunction(func, mutates_value=mutates_value)
         return self._add(filter_func)
 
     def add_apply(
@@ -137,6 +207,7 @@ class Stream:
         *,
         expand: bool = False,
         metadata: bool = False,
+        mutates_value: bool = True,
     ) -> Self:
         """
         Add an "apply" function to the Stream.
@@ -151,12 +222,18 @@ class Stream:
         :param metadata: if True, the callback will receive key and timestamp along with
             the value.
             Default - `False`.
+        :param mutates_value: if False, the function only reads the input value
+            without mutating it, and the value doesn't need to be copied
+            for it at the branching points.
+            Default - `True`.
         :return: a new `Stream` derived from the current one
         """
         if metadata:
-            apply_func = ApplyWithMetadataFunction(func, expand=expand)
+            apply_func = ApplyWithMetadataFunction(
+                func, expand=expand, mutates_value=mutates_value
+            )
         else:
-            apply_func = ApplyFunction(func, expand=expand)
+            apply_func = ApplyFunction(func, expand=expand, mutates_value=mutates_value)
         return self._add(apply_func)
 
     def add_update(
@@ -164,6 +241,7 @@ class Stream:
         func: Union[UpdateCallback, UpdateWithMetadataCallback],
         *,
         metadata: bool = False,
+        mutates_value: bool = True,
     ) -> Self:
         """
         Add an "update" function to the Stream, that will mutate the input value.
@@ -175,12 +253,16 @@ class Stream:
         :param metadata: if True, the callback will receive key and timestamp along with
             the value.
             Default - `False`.
+        :param mutates_value: if False, the function only performs a side effect
+            without mutating the value, and the value doesn't need to be copied
+            for it at the branching points.
+            Default - `True`.
         :return: a new Stream derived from the current one
         """
         if metadata:
-            update_func = UpdateWithMetadataFunction(func)
+            update_func = UpdateWithMetadataFunction(func, mutates_value=mutates_value)
         else:
-            update_func = UpdateFunction(func)
+            update_func = UpdateFunction(func, mutates_value=mutates_value)
         return self._add(update_func)
 
     def add_transform(
@@ -208,6 +290,86 @@ class Stream:
 
         return self._add(TransformFunction(func, expand=expand))
 
+    def add_apply_batch(
+        self,
+        func: Union[ApplyBatchCallback, ApplyBatchWithMetadataCallback],
+        *,
+        metadata: bool = False,
+    ) -> Self:
+        """
+        Add a batch "apply" function to the Stream.
+
+        The function receives a list of values and is supposed to return a sequence
+        of new values of the same length.
+        The new values are passed downstream with the keys, timestamps and headers
+        of the original records.
+
+        Batch functions buffer the records until the composed executor is flushed.
+
+        :param func: a function to generate new values from a batch of values
+        :param metadata: if True, the callback will receive lists of keys, timestamps
+            and headers along with the values.
+            Default - `False`.
+        :return: a new `Stream` derived from the current one
+        """
+        return self._add(ApplyBatchFunction(func, metadata=metadata))
+
+    def add_filter_batch(
+        self,
+        func: Union[FilterBatchCallback, FilterBatchWithMetadataCallback],
+        *,
+        metadata: bool = False,
+    ) -> Self:
+        """
+        Add a batch function to filter values from the Stream.
+
+        The function receives a list of values and is supposed to return a sequence
+        of boolean-like results of the same length.
+        The records with `False`-like results are filtered from the stream.
+
+        Batch functions buffer the records until the composed executor is flushed.
+
+        :param func: a function to filter a batch of values
+        :param metadata: if True, the callback will receive lists of keys, timestamps
+            and headers along with the values.
+            Default - `False`.
+        :return: a new `Stream` derived from the current one
+        """
+        return self._add(FilterBatchFunction(func, metadata=metadata))
+
+    def add_apply_concurrent(
+        self,
+        func: Union[ApplyCallback, ApplyWithMetadataCallback],
+        *,
+        metadata: bool = False,
+        max_concurrency: int = 10,
+    ) -> Self:
+        """
+        Add an "apply" function to the Stream, which is called concurrently for
+        the buffered records.
+
+        The function is called in a thread pool, or in an asyncio event loop
+        if it's a coroutine function.
+        The records with the same key are processed sequentially, and the results
+        are passed downstream in the order of the input records.
+
+        Like batch functions, it buffers the records until the composed executor
+        is flushed.
+
+        :param func: a function or a coroutine function to generate a new value
+        :param metadata: if True, the callback will receive the key, timestamp
+            and headers along with the value.
+            Default - `False`.
+        :param max_concurrency: the maximum number of calls running at the same time.
+            Default - `10`.
+        :return: a new `Stream` derived from the current one
+        """
+        return self._add(
+            ConcurrentApplyFunction(
+                func, metadata=metadata, max_concurrency=max_concurrency
+            )
+        )
+
     def diff(self, other: "Stream") -> Self:
         """
         Takes the difference between Streams `self` and `other` based on their last
@@ -290,6 +452,34 @@ class Stream:
 
         return tree_
 
+    def preserves_value(self) -> bool:
+        """
+        Check whether the functions from the root to this `Stream` pass
+        the original values downstream as is.
+
+        Only the filters and the updates not mutating the values, and the default
+        identity function preserve the values.
+
+        :return: True if the values are never replaced or mutated on the way
+        """
+        for node in self.root_path():
+            func = node.func
+            if func.mutates_value:
+                return False
+            elif isinstance(func, ApplyFunction) and func.func is _identity:
+                continue
+            elif not isinstance(
+                func,
+                (
+                    FilterFunction,
+                    FilterWithMetadataFunction,
+                    UpdateFunction,
+                    UpdateWithMetadataFunction,
+                ),
+            ):
+                return False
+        return True
+
     def full_tree(self) -> List[Self]:
         """
         Starts at tree root and finds every Stream in the tree (including splits).
@@ -303,8 +493,9 @@ class Stream:
         allow_expands=True,
         allow_updates=True,
         allow_transforms=True,
+        allow_batches=True,
         sink: Optional[Callable[[Any, Any, int, Any], None]] = None,
-    ) -> VoidExecutor:
+    ) -> Union[VoidExecutor, BatchingExecutor]:
         """
         Generate an "executor" closure by mapping all relatives of this `Stream` and
         composing their functions together.
@@ -315,6 +506,10 @@ class Stream:
         By default, executor doesn't return the result of the execution.
         To accumulate the results, pass the `sink` parameter.
 
+        If the stream contains batch functions, the executor is returned as
+        a `BatchingExecutor`, and its `.flush()` method must be called to process
+        the buffered records.
+
         :param allow_filters: If False, this function will fail with `ValueError` if
             the stream has filter functions in the tree. Default - True.
         :param allow_updates: If False, this function will fail with `ValueError` if
@@ -323,17 +518,22 @@ class Stream:
             the stream has functions with "expand=True" in the tree. Default - True.
         :param allow_transforms: If False, this function will fail with `ValueError` if
             the stream has transform functions in the tree. Default - True.
+        :param allow_batches: If False, this function will fail with `ValueError` if
+            the stream has batch functions in the tree. Default - True.
         :param sink: callable to accumulate the results of the execution, optional.
 
         """
 
         composed = sink or self._default_sink
+        batch_executors: List[BatchExecutor] = []
         composer = functools.partial(
             self._compose,
             allow_filters=allow_filters,
             allow_expands=allow_expands,
             allow_updates=allow_updates,
             allow_transforms=allow_transforms,
+            allow_batches=allow_batches,
+            batch_executors=batch_executors,
         )
 
         def _split_compose(pending_composes, composed, node):
@@ -348,11 +548,20 @@ class Stream:
             composed = composer(tree, pending_composes.pop(node, composed))
 
             if split := tree[0].parent:
+                # Let the branches that never mutate the value share it
+                # with the other branches instead of copying it
+                if not any(
+                    n.func.mutates_value for n in self._collect_nodes([], tree[0])
+                ):
+                    composed = mark_read_only(composed)
                 pending_composes.setdefault(split, []).append(composed)
             else:
                 return composed
 
-        return _split_compose({}, composed, self.full_tree()[0])
+        composed = _split_compose({}, composed, self.full_tree()[0])
+        if batch_executors:
+            return BatchingExecutor(composed, batch_executors)
+        return composed
 
     def compose_returning(self) -> ReturningExecutor:
         """
@@ -375,6 +584,7 @@ class Stream:
             allow_expands=False,
             allow_updates=False,
             allow_transforms=False,
+            allow_batches=False,
             sink=lambda value, key, timestamp, headers: buffer.appendleft(
                 (value, key, timestamp, headers)
             ),
@@ -399,10 +609,12 @@ class Stream:
         allow_updates: bool,
         allow_expands: bool,
         allow_transforms: bool,
+        allow_batches: bool = True,
+        batch_executors: Optional[List[BatchExecutor]] = None,
     ) -> VoidExecutor:
         functions = [node.func for node in tree]
 
-        # Iterate over a reversed list of functions
+        # Validate the functions in a reversed order
         for func in reversed(functions):
             # Validate that only allowed functions are passed
             if not allow_updates and isinstance(
@@ -417,13 +629,73 @@ class Stream:
                 raise ValueError("Transform functions are not allowed")
             elif not allow_expands and func.expand:
                 raise ValueError("Expand functions are not allowed")
+            elif not allow_batches and isinstance(func, BatchStreamFunction):
+                raise ValueError("Batch functions are not allowed")
+
+        functions = self._optimize(functions, branching=isinstance(composed, list))
+        if not functions:
+            # The tree consists of the identity functions only
+            return composed
 
+        # Iterate over a reversed list of functions
+        for func in reversed(functions):
             composed = func.get_executor(
                 *composed if isinstance(composed, list) else [composed]
             )
+            if batch_executors is not None and isinstance(composed, BatchExecutor):
+                batch_executors.append(composed)
 
         return composed
 
+    @staticmethod
+    def _optimize(
+        functions: List[StreamFunction], branching: bool
+    ) -> List[StreamFunction]:
+        """
+        Optimize a linear sequence of functions before composing them.
+
+        - The identity functions created by `Stream()` by default are dropped
+          unless they are needed to resolve the branching.
+        - The consecutive "Apply", "Update" and "Filter" functions are fused
+          into a single function to reduce the number of nested calls.
+
+        The order of the functions is always preserved.
+        Moving the filters ahead of the preceding functions (filter pushdown)
+        is deferred rather than impossible: `mutates_value=False` only tells
+        that a function doesn't change its input in place.
+        It doesn't tell whether the filter reads the fields produced by
+        the previous function or whether the skipped callbacks have side effects.
+        The pushdown needs the functions to declare which fields they read
+        and write, e.g. the column expressions of `StreamingDataFrame`.
+
+        :param functions: a list of functions in the order of execution
+        :param branching: whether the last function is followed by the branches
+        :return: an optimized list of functions
+        """
+        optimized = [
+            func
+            for func in functions
+            if not (isinstance(func, ApplyFunction) and func.func is _identity)
+        ]
+        if not optimized and branching:
+            # Keep one function to copy the values for the branches
+            optimized = functions[-1:]
+
+        fused: List[StreamFunction] = []
+        group: List[StreamFunction] = []
+        for func in optimized + [None]:
+            if func is not None and FusedFunction.can_fuse(func):
+                group.append(func)
+                continue
+            if len(group) > 1:
+                fused.append(FusedFunction(group))
+            else:
+                fused.extend(group)
+            group = []
+            if func is not None:
+                fused.append(func)
+        return fused
+
     def _diff_from_last_common_parent(self, other: Self) -> List[Self]:
         nodes_self = self.root_path()
         nodes_other = other.root_path()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import contextvars
 import functools
 import operator
@@ -34,6 +35,11 @@ from quixstreams.core.stream import (
     ApplyWithMetadataCallback,
     FilterWithMetadataCallback,
     UpdateWithMetadataCallback,
+    ApplyBatchCallback,
+    ApplyBatchWithMetadataCallback,
+    FilterBatchCallback,
+    FilterBatchWithMetadataCallback,
+    BatchingExecutor,
 )
 from quixstreams.models import (
     Topic,
@@ -46,12 +52,19 @@ from quixstreams.models.serializers import SerializerType, DeserializerType
 from quixstreams.processing import ProcessingContext
 from quixstreams.sinks import BaseSink
 from quixstreams.state.base import State
+from quixstreams.utils.aio import to_sync
 from .base import BaseStreaming
 from .exceptions import InvalidOperation
 from .registry import DataframeRegistry
 from .series import StreamingSeries
+from .expressions import compile_expression
 from .utils import ensure_milliseconds
-from .windows import TumblingWindowDefinition, HoppingWindowDefinition
+from .windows import (
+    TumblingWindowDefinition,
+    HoppingWindowDefinition,
+    SessionWindowDefinition,
+    SlidingWindowDefinition,
+)
 
 ApplyCallbackStateful = Callable[[Any, State], Any]
 ApplyWithMetadataCallbackStateful = Callable[[Any, Any, int, Any, State], Any]
@@ -137,7 +150,9 @@ class StreamingDataFrame(BaseStreaming):
         return self._topic
 
     @overload
-    def apply(self, func: ApplyCallback, *, expand: bool = ...) -> Self: ...
+    def apply(
+        self, func: ApplyCallback, *, expand: bool = ..., mutates_value: bool = ...
+    ) -> Self: ...
 
     @overload
     def apply(
@@ -146,6 +161,7 @@ class StreamingDataFrame(BaseStreaming):
         *,
         metadata: Literal[True],
         expand: bool = ...,
+        mutates_value: bool = ...,
     ) -> Self: ...
 
     @overload
@@ -155,6 +171,7 @@ class StreamingDataFrame(BaseStreaming):
         *,
         stateful: Literal[True],
         expand: bool = ...,
+        mutates_value: bool = ...,
     ) -> Self: ...
 
     @overload
@@ -165,6 +182,7 @@ class StreamingDataFrame(BaseStreaming):
         stateful: Literal[True],
         metadata: Literal[True],
         expand: bool = ...,
+        mutates_value: bool = ...,
     ) -> Self: ...
 
     def apply(
@@ -179,6 +197,7 @@ class StreamingDataFrame(BaseStreaming):
         stateful: bool = False,
         expand: bool = False,
         metadata: bool = False,
+        mutates_value: bool = True,
     ) -> Self:
         """
         Apply a function to transform the value and return a new value.
@@ -203,7 +222,9 @@ class StreamingDataFrame(BaseStreaming):
 
         ```
 
-        :param func: a function to apply
+        :param func: a function to apply.
+            It may be a coroutine function, then it's awaited
+            in the application event loop.
         :param stateful: if `True`, the function will be provided with a second argument
             of type `State` to perform stateful operations.
         :param expand: if True, expand the returned iterable into individual values
@@ -212,7 +233,13 @@ class StreamingDataFrame(BaseStreaming):
         :param metadata: if True, the callback will receive key, timestamp and headers
             along with the value.
             Default - `False`.
+        :param mutates_value: pass False if the function never mutates
+            the input value in-place.
+            Then the value can be shared with the other branches
+            instead of being copied for this one.
+            Default - `True`.
         """
+        func = _as_sync(func)
         if stateful:
             self._register_store()
             # Force the callback to accept metadata
@@ -225,12 +252,18 @@ class StreamingDataFrame(BaseStreaming):
                 func=with_metadata_func,
                 processing_context=self._processing_context,
             )
-            stream = self.stream.add_apply(stateful_func, expand=expand, metadata=True)
+            stream = self.stream.add_apply(
+                stateful_func,
+                expand=expand,
+                metadata=True,
+                mutates_value=mutates_value,
+            )
         else:
             stream = self.stream.add_apply(
                 cast(Union[ApplyCallback, ApplyWithMetadataCallback], func),
                 expand=expand,
                 metadata=metadata,
+                mutates_value=mutates_value,
             )
         return self.__dataframe_clone__(stream=stream)
 
@@ -297,7 +330,9 @@ class StreamingDataFrame(BaseStreaming):
         sdf.update(lambda v: v.append(1))
         ```
 
-        :param func: function to update value
+        :param func: function to update value.
+            It may be a coroutine function, then it's awaited
+            in the application event loop.
         :param stateful: if `True`, the function will be provided with a second argument
             of type `State` to perform stateful operations.
         :param metadata: if True, the callback will receive key, timestamp and headers
@@ -305,6 +340,7 @@ class StreamingDataFrame(BaseStreaming):
             Default - `False`.
         :return: the updated StreamingDataFrame instance (reassignment NOT required).
         """
+        func = _as_sync(func)
         if stateful:
             self._register_store()
             # Force the callback to accept metadata
@@ -327,16 +363,24 @@ class StreamingDataFrame(BaseStreaming):
             )
 
     @overload
-    def filter(self, func: FilterCallback) -> Self: ...
+    def filter(self, func: FilterCallback, *, mutates_value: bool = ...) -> Self: ...
 
     @overload
     def filter(
-        self, func: FilterWithMetadataCallback, *, metadata: Literal[True]
+        self,
+        func: FilterWithMetadataCallback,
+        *,
+        metadata: Literal[True],
+        mutates_value: bool = ...,
     ) -> Self: ...
 
     @overload
     def filter(
-        self, func: FilterCallbackStateful, *, stateful: Literal[True]
+        self,
+        func: FilterCallbackStateful,
+        *,
+        stateful: Literal[True],
+        mutates_value: bool = ...,
     ) -> Self: ...
 
     @overload
@@ -346,6 +390,7 @@ class StreamingDataFrame(BaseStreaming):
         *,
         stateful: Literal[True],
         metadata: Literal[True],
+        mutates_value: bool = ...,
     ) -> Self: ...
 
     def filter(
@@ -359,6 +404,7 @@ class StreamingDataFrame(BaseStreaming):
         *,
         stateful: bool = False,
         metadata: bool = False,
+        mutates_value: bool = True,
     ) -> Self:
         """
         Filter value using provided function.
@@ -384,14 +430,21 @@ class StreamingDataFrame(BaseStreaming):
         ```
 
 
-        :param func: function to filter value
+        :param func: function to filter value.
+            It may be a coroutine function, then it's awaited
+            in the application event loop.
         :param stateful: if `True`, the function will be provided with second argument
             of type `State` to perform stateful operations.
         :param metadata: if True, the callback will receive key, timestamp and headers
             along with the value.
             Default - `False`.
+        :param mutates_value: pass False if the function never mutates
+            the input value in-place.
+            Then the value can be shared with the other branches
+            instead of being copied for this one.
+            Default - `True`.
         """
-
+        func = _as_sync(func)
         if stateful:
             self._register_store()
             # Force the callback to accept metadata
@@ -404,14 +457,154 @@ class StreamingDataFrame(BaseStreaming):
                 func=cast(FilterWithMetadataCallbackStateful, with_metadata_func),
                 processing_context=self._processing_context,
             )
-            stream = self.stream.add_filter(stateful_func, metadata=True)
+            stream = self.stream.add_filter(
+                stateful_func, metadata=True, mutates_value=mutates_value
+            )
         else:
             stream = self.stream.add_filter(
                 cast(Union[FilterCallback, FilterWithMetadataCallback], func),
                 metadata=metadata,
+                mutates_value=mutates_value,
             )
         return self.__dataframe_clone__(stream=stream)
 
+    def apply_batch(
+        self,
+        func: Union[ApplyBatchCallback, ApplyBatchWithMetadataCallback],
+        *,
+        metadata: bool = False,
+    ) -> Self:
+        """
+        Apply a function to a batch of values and return a sequence of new values.
+
+        The function is called once per batch of records from the same partition
+        with a list of values, and it must return a sequence of the same length
+        (e.g. a list or a NumPy array).
+        Each new value is passed downstream with the key, timestamp, headers and
+        message context of the corresponding input record.
+
+        Batch operators let you vectorize the computations (e.g. with NumPy)
+        instead of calling a Python function for each record.
+        The batches are as large as the batches consumed from Kafka, so they're most
+        efficient when `Application(consumer_batch_size=...)` is greater than 1.
+        Otherwise, each batch contains the records of a single message.
+
+
+        Example Snippet:
+
+        ```python
+        import numpy as np
+
+        def to_fahrenheit(values: list):
+            celsius = np.asarray([value["temperature"] for value in values])
+            return (celsius * 9 / 5 + 32).tolist()
+
+        sdf = StreamingDataFrame()
+        sdf = sdf.apply_batch(to_fahrenheit)
+        ```
+
+        :param func: a function accepting a list of values and returning a sequence
+            of new values of the same length.
+        :param metadata: if True, the callback will receive lists of keys, timestamps
+            and headers along with the values.
+            Default - `False`.
+        """
+        stream = self.stream.add_apply_batch(func, metadata=metadata)
+        return self.__dataframe_clone__(stream=stream)
+
+    def apply_concurrent(
+        self,
+        func: Union[ApplyCallback, ApplyWithMetadataCallback],
+        *,
+        metadata: bool = False,
+        max_concurrency: int = 10,
+    ) -> Self:
+        """
+        Apply a function blocking on I/O (e.g. an HTTP or a database lookup)
+        concurrently to the values and return new values.
+
+        The function is called for each value like with `.apply()`,
+        but the calls for the records of the same batch run concurrently
+        in a thread pool.
+        Coroutine functions (`async def`) run concurrently in an asyncio event loop.
+
+        The records with the same message key are processed sequentially in their
+        order, and the results are passed downstream in the order of the input
+        records.
+        All calls complete before the offsets of the batch are committed.
+
+        The batches are as large as the batches consumed from Kafka, so the calls run
+        concurrently only when `Application(consumer_batch_size=...)` is
+        greater than 1.
+        The buffered records are also flushed every time the topic partition
+        changes within a consumed batch, so only the calls for one partition's
+        consecutive run of messages run concurrently.
+        The thread pool is shut down when the application stops.
+
+
+        Example Snippet:
+
+        ```python
+        import requests
+
+        def enrich(value: dict) -> dict:
+            response = requests.get(f"https://api.example.com/users/{value['user_id']}")
+            return {**value, "user": response.json()}
+
+        sdf = StreamingDataFrame()
+        sdf = sdf.apply_concurrent(enrich, max_concurrency=20)
+        ```
+
+        :param func: a function or a coroutine function accepting a value
+            and returning a new value.
+        :param metadata: if True, the callback will receive key, timestamp and headers
+            along with the value.
+            Default - `False`.
+        :param max_concurrency: the maximum number of calls running at the same time.
+            Default - `10`.
+        """
+        stream = self.stream.add_apply_concurrent(
+            func, metadata=metadata, max_concurrency=max_concurrency
+        )
+        return self.__dataframe_clone__(stream=stream)
+
+    def filter_batch(
+        self,
+        func: Union[FilterBatchCallback, FilterBatchWithMetadataCallback],
+        *,
+        metadata: bool = False,
+    ) -> Self:
+        """
+        Filter a batch of values using provided function.
+
+        The function is called once per batch of records from the same partition
+        with a list of values, and it must return a sequence of boolean-like results
+        of the same length (e.g. a list of bools or a boolean NumPy array).
+        The records with True-like results are passed downstream unchanged.
+
+        See `StreamingDataFrame.apply_batch()` for more details about the batches.
+
+
+        Example Snippet:
+
+        ```python
+        import numpy as np
+
+        sdf = StreamingDataFrame()
+        sdf = sdf.filter_batch(
+            lambda values: np.asarray([v["rpm"] for v in values]) > 1000
+        )
+        ```
+
+        :param func: a function accepting a list of values and returning a sequence
+            of boolean-like results of the same length.
+        :param metadata: if True, the callback will receive lists of keys, timestamps
+            and headers along with the values.
+            Default - `False`.
+        """
+        stream = self.stream.add_filter_batch(func, metadata=metadata)
+        return self.__dataframe_clone__(stream=stream)
+
     @overload
     def group_by(
         self,
@@ -533,7 +726,10 @@ class StreamingDataFrame(BaseStreaming):
         )
 
     def to_topic(
-        self, topic: Topic, key: Optional[Callable[[Any], Any]] = None
+        self,
+        topic: Topic,
+        key: Optional[Callable[[Any], Any]] = None,
+        passthrough: bool = False,
     ) -> Self:
         """
         Produce current value to a topic. You can optionally specify a new key.
@@ -564,8 +760,21 @@ class StreamingDataFrame(BaseStreaming):
             If passed, the return type of this callable must be serializable
             by `key_serializer` defined for this Topic object.
             By default, the current message key will be used.
+        :param passthrough: if True, produce the original key and value bytes
+            of the consumed message without serializing them again
+            when the message is not changed.
+            It's the case when the message was only filtered by the column
+            expressions or the filters with `mutates_value=False`,
+            and no new key is passed.
+            Otherwise, the value is serialized as usual.
+            Use it only when the output topic has the same serialization format
+            as the input one.
+            Default - `False`.
         :return: the updated StreamingDataFrame instance (reassignment NOT required).
         """
+        # The values can be passed through only if they're never replaced
+        # or mutated before producing
+        passthrough = passthrough and key is None and self._stream.preserves_value()
         return self._add_update(
             lambda value, orig_key, timestamp, headers: self._produce(
                 topic=topic,
@@ -573,8 +782,10 @@ class StreamingDataFrame(BaseStreaming):
                 key=orig_key if key is None else key(value),
                 timestamp=timestamp,
                 headers=headers,
+                passthrough=passthrough,
             ),
             metadata=True,
+            mutates_value=False,
         )
 
     def set_timestamp(self, func: Callable[[Any, Any, int, Any], int]) -> Self:
@@ -709,6 +920,7 @@ class StreamingDataFrame(BaseStreaming):
         return self._add_update(
             lambda *args: printer({print_args[i]: args[i] for i in range(len(args))}),
             metadata=metadata,
+            mutates_value=False,
         )
 
     def compose(
@@ -779,7 +991,10 @@ class StreamingDataFrame(BaseStreaming):
                 (value_, key_, timestamp_, headers_)
             )
         )
-        context.run(composed[topic.name], value, key, timestamp, headers)
+        executor = composed[topic.name]
+        context.run(executor, value, key, timestamp, headers)
+        if isinstance(executor, BatchingExecutor):
+            executor.flush()
         return result
 
     def tumbling_window(
@@ -864,6 +1079,7 @@ class StreamingDataFrame(BaseStreaming):
         step_ms: Union[int, timedelta],
         grace_ms: Union[int, timedelta] = 0,
         name: Optional[str] = None,
+        panes: bool = False,
     ) -> HoppingWindowDefinition:
         """
         Create a hopping window transformation on this StreamingDataFrame.
@@ -932,6 +1148,14 @@ class StreamingDataFrame(BaseStreaming):
         :param name: The unique identifier for the window. If not provided, it will be
             automatically generated based on the window's properties.
 
+        :param panes: If `True`, the `sum`, `count`, `mean`, `min`, and `max`
+            aggregations update a single non-overlapping "pane" per message
+            and compute the windows by combining the panes,
+            instead of updating every overlapping window.
+            It makes the per-message cost independent of `duration_ms / step_ms`.
+            The panes are kept in a separate state store.
+            Default - `False`.
+
         :return: `HoppingWindowDefinition` instance representing the hopping
             window configuration.
             This object can be further configured with aggregation functions
@@ -948,6 +1172,165 @@ class StreamingDataFrame(BaseStreaming):
             step_ms=step_ms,
             dataframe=self,
             name=name,
+            panes=panes,
+        )
+
+    def sliding_window(
+        self,
+        duration_ms: Union[int, timedelta],
+        grace_ms: Union[int, timedelta] = 0,
+        name: Optional[str] = None,
+    ) -> SlidingWindowDefinition:
+        """
+        Create a sliding window transformation on this StreamingDataFrame.
+        Sliding windows are defined relative to each message:
+        every message gets a window covering the `duration_ms` milliseconds
+        before its timestamp, inclusive.
+
+        They allow performing stateful aggregations like `sum`, `mean`, etc.
+        over "the last N seconds" of data for each key on every message.
+
+        Notes:
+
+        - The timestamp of the aggregation result is set to the window start timestamp.
+        - Every window is grouped by the current Kafka message key.
+        - Messages with `None` key will be ignored.
+        - The time windows always use the current event time.
+        - Only `sum`, `count`, `mean`, `min` and `max` aggregations are supported.
+        - The results are emitted for each message with `.current()`.
+
+
+        Example Snippet:
+
+        ```python
+        app = Application()
+        sdf = app.dataframe(...)
+
+        sdf = (
+            # Define a sliding window of 60s with a grace period of 10s
+            sdf.sliding_window(
+                duration_ms=timedelta(seconds=60),
+                grace_ms=timedelta(seconds=10)
+            )
+
+            # Specify the aggregation function
+            .sum()
+
+            # Emit the window of each incoming message
+            .current()
+        )
+        ```
+
+        :param duration_ms: The length of each window.
+            Can be specified as either an `int` representing milliseconds or a
+            `timedelta` object.
+            >***NOTE:*** `timedelta` objects will be rounded to the closest millisecond
+            value.
+
+        :param grace_ms: The grace period for data arrival.
+            It allows late-arriving data (data arriving after the latest observed
+            timestamp) to be included in the windows.
+            Can be specified as either an `int` representing milliseconds
+            or as a `timedelta` object.
+            >***NOTE:*** `timedelta` objects will be rounded to the closest millisecond
+            value.
+
+        :param name: The unique identifier for the window. If not provided, it will be
+            automatically generated based on the window's properties.
+
+        :return: `SlidingWindowDefinition` instance representing the sliding window
+            configuration.
+            This object can be further configured with aggregation functions
+            like `sum`, `count`, etc. applied to the StreamingDataFrame.
+        """
+
+        duration_ms = ensure_milliseconds(duration_ms)
+        grace_ms = ensure_milliseconds(grace_ms)
+
+        return SlidingWindowDefinition(
+            duration_ms=duration_ms, grace_ms=grace_ms, dataframe=self, name=name
+        )
+
+    def session_window(
+        self,
+        inactivity_gap_ms: Union[int, timedelta],
+        grace_ms: Union[int, timedelta] = 0,
+        name: Optional[str] = None,
+    ) -> SessionWindowDefinition:
+        """
+        Create a session window transformation on this StreamingDataFrame.
+        Session windows group the messages of the same key into the periods
+        of activity separated by the gaps of inactivity.
+
+        The session starts with the first message of the key and is extended
+        by every message arriving within `inactivity_gap_ms` after the previous one.
+        When a message fills the gap between two sessions, they are merged into one.
+
+        Notes:
+
+        - The timestamp of the aggregation result is set to the window start timestamp.
+        - The window end is the timestamp of the last message in the session
+            plus the inactivity gap.
+        - Every window is grouped by the current Kafka message key.
+        - Messages with `None` key will be ignored.
+        - The time windows always use the current event time.
+        - Only `sum`, `count`, `mean`, `min` and `max` aggregations are supported.
+
+
+        Example Snippet:
+
+        ```python
+        app = Application()
+        sdf = app.dataframe(...)
+
+        sdf = (
+            # Define a session window with a 30s inactivity gap
+            # and a grace period of 10s
+            sdf.session_window(
+                inactivity_gap_ms=timedelta(seconds=30),
+                grace_ms=timedelta(seconds=10)
+            )
+
+            # Specify the aggregation function
+            .count()
+
+            # Emit the sessions only when they are closed
+            .final()
+        )
+        ```
+
+        :param inactivity_gap_ms: The maximum time between two messages
+            of the same session.
+            Can be specified as either an `int` representing milliseconds or a
+            `timedelta` object.
+            >***NOTE:*** `timedelta` objects will be rounded to the closest millisecond
+            value.
+
+        :param grace_ms: The grace period for data arrival.
+            It allows late-arriving data (data arriving after the latest observed
+            timestamp) to be included in the sessions.
+            Can be specified as either an `int` representing milliseconds
+            or as a `timedelta` object.
+            >***NOTE:*** `timedelta` objects will be rounded to the closest millisecond
+            value.
+
+        :param name: The unique identifier for the window. If not provided, it will be
+            automatically generated based on the window's properties.
+
+        :return: `SessionWindowDefinition` instance representing the session window
+            configuration.
+            This object can be further configured with aggregation functions
+            like `sum`, `count`, etc. applied to the StreamingDataFrame.
+        """
+
+        inactivity_gap_ms = ensure_milliseconds(inactivity_gap_ms)
+        grace_ms = ensure_milliseconds(grace_ms)
+
+        return SessionWindowDefinition(
+            inactivity_gap_ms=inactivity_gap_ms,
+            grace_ms=grace_ms,
+            dataframe=self,
+            name=name,
         )
 
     def drop(
@@ -1039,19 +1422,25 @@ class StreamingDataFrame(BaseStreaming):
         key: Any,
         timestamp: int,
         headers: Any,
+        passthrough: bool = False,
     ):
         ctx = message_context()
         row = Row(
             value=value, key=key, timestamp=timestamp, context=ctx, headers=headers
         )
-        self._producer.produce_row(row=row, topic=topic, key=key, timestamp=timestamp)
+        self._producer.produce_row(
+            row=row, topic=topic, key=key, timestamp=timestamp, passthrough=passthrough
+        )
 
     def _add_update(
         self,
         func: Union[UpdateCallback, UpdateWithMetadataCallback],
         metadata: bool = False,
+        mutates_value: bool = True,
     ):
-        self._stream = self._stream.add_update(func, metadata=metadata)
+        self._stream = self._stream.add_update(
+            func, metadata=metadata, mutates_value=mutates_value
+        )
         return self
 
     def _register_store(self):
@@ -1117,11 +1506,10 @@ class StreamingDataFrame(BaseStreaming):
                     'ex: `sdf1["x"] = sdf1["y"] + 1`, NOT `sdf1["x"] = sdf2["y"] + 1` '
                 )
 
-            series_composed = item.compose_returning()
+            # Compile the whole series expression together with the assignment
+            # into one function
             self._add_update(
-                lambda value, key, timestamp, headers: operator.setitem(
-                    value, item_key, series_composed(value, key, timestamp, headers)[0]
-                ),
+                compile_expression(item.expression, assign_to=item_key),
                 metadata=True,
             )
         else:
@@ -1138,13 +1526,12 @@ class StreamingDataFrame(BaseStreaming):
         self, item: Union[str, List[str], StreamingSeries, Self]
     ) -> Union[Self, StreamingSeries]:
         if isinstance(item, StreamingSeries):
-            # Filter SDF based on StreamingSeries
-            series_composed = item.compose_returning()
+            # Filter SDF based on StreamingSeries.
+            # The expressions calling no user functions never mutate the value
             return self.filter(
-                lambda value, key, timestamp, headers: series_composed(
-                    value, key, timestamp, headers
-                )[0],
+                item.compile(),
                 metadata=True,
+                mutates_value=item.expression.calls_functions(),
             )
         elif isinstance(item, self.__class__):
             diff = self.stream.diff(item.stream)
@@ -1157,7 +1544,9 @@ class StreamingDataFrame(BaseStreaming):
             )
         elif isinstance(item, list):
             # Make a projection and filter keys from the dict
-            return self.apply(lambda value: {k: value[k] for k in item})
+            return self.apply(
+                lambda value: {k: value[k] for k in item}, mutates_value=False
+            )
         elif isinstance(item, str):
             # Create a StreamingSeries based on a column name
             return StreamingSeries(name=item, sdf_id=id(self))
@@ -1187,6 +1576,17 @@ def _drop(value: Dict, columns: List[str], ignore_missing: bool = False):
                 raise
 
 
+def _as_sync(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a coroutine function to run it in the application event loop
+    and wait for its result.
+    Regular functions are returned as is.
+    """
+    if asyncio.iscoroutinefunction(func):
+        return to_sync(func)
+    return func
+
+
 def _as_metadata_func(
     func: Union[ApplyCallbackStateful, FilterCallbackStateful, UpdateCallbackStateful],
 ) -> Union[
@@ -0,0 +1,328 @@
+"""
+Expression trees of `StreamingSeries` and their compiler.
+
+Each `StreamingSeries` operation builds a new expression node instead of
+a closure calling the composed parents.
+The whole tree is then compiled into a single generated Python function,
+so evaluating `sdf["a"] * 2 + sdf["b"]` takes one function call per record
+instead of a call per operation.
+"""
+
+import abc
+import operator
+from typing import Any, Callable, Dict, List, Mapping, Union
+
+from quixstreams.core.stream.functions import ApplyWithMetadataCallback
+from quixstreams.core.stream.stream import Stream
+from .exceptions import ColumnDoesNotExist, InvalidColumnReference
+
+__all__ = (
+    "Expression",
+    "Column",
+    "Constant",
+    "Call",
+    "MetadataCall",
+    "StreamCall",
+    "BinaryOperation",
+    "And",
+    "Or",
+    "Not",
+    "compile_expression",
+)
+
+# Operators generated as the Python syntax instead of function calls
+_BINARY_OPERATORS: Dict[Callable, str] = {
+    operator.add: "+",
+    operator.sub: "-",
+    operator.mul: "*",
+    operator.truediv: "/",
+    operator.mod: "%",
+    operator.eq: "==",
+    operator.ne: "!=",
+    operator.lt: "<",
+    operator.le: "<=",
+    operator.gt: ">",
+    operator.ge: ">=",
+    operator.is_: "is",
+    operator.is_not: "is not",
+}
+
+_NO_TARGET = object()
+
+
+def _getitem(d: Mapping, column_name: Union[str, int]) -> object:
+    """
+    Special error handling around column referencing with SDF.
+
+    :param d: a dict-like object (usually just a dict).
+    :param column_name: the column name.
+
+    :return: Nested data from column name.
+    """
+    try:
+        return d[column_name]
+    except KeyError:
+        raise ColumnDoesNotExist(
+            f"Column '{column_name}' does not exist in the message value"
+        )
+    except TypeError:
+        raise InvalidColumnReference(
+            f"Cannot access column '{column_name}'; "
+            f"column referencing expects message value type 'dict', "
+            f"not '{d.__class__.__name__}'"
+        )
+
+
+class _CodeGenerator:
+    """
+    Generates the body of the compiled function.
+
+    Every expression node is assigned to a new local variable, so the deeply
+    nested expressions don't hit the limits of the Python compiler.
+    The constants and the functions are passed to the generated code
+    as closure variables.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.bindings: Dict[str, Any] = {}
+        self._indent = 1
+        self._counter = 0
+
+    def bind(self, obj: Any) -> str:
+        name = f"_b{len(self.bindings)}"
+        self.bindings[name] = obj
+        return name
+
+    def new_var(self) -> str:
+        name = f"_v{self._counter}"
+        self._counter += 1
+        return name
+
+    def emit(self, line: str):
+        self.lines.append("    " * self._indent + line)
+
+    def indent(self):
+        self._indent += 1
+
+    def dedent(self):
+        self._indent -= 1
+
+
+class Expression(abc.ABC):
+    """
+    A node of the `StreamingSeries` expression tree.
+    """
+
+    @abc.abstractmethod
+    def generate(self, gen: _CodeGenerator) -> str:
+        """
+        Emit the code evaluating this node and return the name of the variable
+        or the Python expression holding the result.
+        """
+
+    def calls_functions(self) -> bool:
+        """
+        Check whether the expression calls any functions on the record data.
+        The functions may mutate the record value, unlike the operators.
+        """
+        return False
+
+
+class Column(Expression):
+    """
+    Get a column from the record value.
+    """
+
+    def __init__(self, name: Union[str, int]):
+        self.name = name
+
+    def generate(self, gen: _CodeGenerator) -> str:
+        var = gen.new_var()
+        gen.emit(f"{var} = _getitem(value, {gen.bind(self.name)})")
+        return var
+
+
+class Constant(Expression):
+    """
+    A constant operand.
+    """
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def generate(self, gen: _CodeGenerator) -> str:
+        return gen.bind(self.value)
+
+
+class Call(Expression):
+    """
+    Call a function with the result of another expression.
+    """
+
+    def __init__(self, func: Callable[[Any], Any], arg: Expression):
+        self.func = func
+        self.arg = arg
+
+    def calls_functions(self) -> bool:
+        return True
+
+    def generate(self, gen: _CodeGenerator) -> str:
+        arg = self.arg.generate(gen)
+        var = gen.new_var()
+        gen.emit(f"{var} = {gen.bind(self.func)}({arg})")
+        return var
+
+
+class MetadataCall(Expression):
+    """
+    Call a function with the record value, key, timestamp and headers.
+    """
+
+    def __init__(self, func: ApplyWithMetadataCallback):
+        self.func = func
+
+    def calls_functions(self) -> bool:
+        return True
+
+    def generate(self, gen: _CodeGenerator) -> str:
+        var = gen.new_var()
+        gen.emit(f"{var} = {gen.bind(self.func)}(value, key, timestamp, headers)")
+        return var
+
+
+class StreamCall(Expression):
+    """
+    Execute an arbitrary `Stream` of "apply" functions.
+    """
+
+    def __init__(self, stream: Stream):
+        self.stream = stream
+
+    def calls_functions(self) -> bool:
+        return True
+
+    def generate(self, gen: _CodeGenerator) -> str:
+        composed = gen.bind(self.stream.compose_returning())
+        var = gen.new_var()
+        gen.emit(f"{var} = {composed}(value, key, timestamp, headers)[0]")
+        return var
+
+
+class BinaryOperation(Expression):
+    """
+    Apply a binary operator to the results of two expressions.
+    The left operand is always evaluated first.
+    """
+
+    def __init__(
+        self, operator_: Callable[[Any, Any], Any], left: Expression, right: Expression
+    ):
+        self.operator = operator_
+        self.left = left
+        self.right = right
+
+    def calls_functions(self) -> bool:
+        return self.left.calls_functions() or self.right.calls_functions()
+
+    def generate(self, gen: _CodeGenerator) -> str:
+        left = self.left.generate(gen)
+        right = self.right.generate(gen)
+        var = gen.new_var()
+        if self.operator is operator.getitem:
+            gen.emit(f"{var} = {left}[{right}]")
+        elif (symbol := _BINARY_OPERATORS.get(self.operator)) is not None:
+            gen.emit(f"{var} = {left} {symbol} {right}")
+        else:
+            gen.emit(f"{var} = {gen.bind(self.operator)}({left}, {right})")
+        return var
+
+
+class _BooleanOperation(Expression):
+    _short_circuit_on: bool
+
+    def __init__(self, left: Expression, right: Expression):
+        self.left = left
+        self.right = right
+
+    def calls_functions(self) -> bool:
+        return self.left.calls_functions() or self.right.calls_functions()
+
+    def generate(self, gen: _CodeGenerator) -> str:
+        # Preserve the lazy evaluation of "and" and "or":
+        # the right operand is evaluated only if the left one doesn't decide
+        # the result
+        var = gen.new_var()
+        gen.emit(f"{var} = {self.left.generate(gen)}")
+        gen.emit(f"if {'not ' if self._short_circuit_on else ''}{var}:")
+        gen.indent()
+        gen.emit(f"{var} = {self.right.generate(gen)}")
+        gen.dedent()
+        return var
+
+
+class And(_BooleanOperation):
+    """
+    Logical "and" of two expressions.
+    """
+
+    _short_circuit_on = False
+
+
+class Or(_BooleanOperation):
+    """
+    Logical "or" of two expressions.
+    """
+
+    _short_circuit_on = True
+
+
+class Not(Expression):
+    """
+    Logical "not" of the expression.
+    """
+
+    def __init__(self, arg: Expression):
+        self.arg = arg
+
+    def calls_functions(self) -> bool:
+        return self.arg.calls_functions()
+
+    def generate(self, gen: _CodeGenerator) -> str:
+        arg = self.arg.generate(gen)
+        var = gen.new_var()
+        gen.emit(f"{var} = not {arg}")
+        return var
+
+
+def compile_expression(
+    expression: Expression, assign_to: Any = _NO_TARGET
+) -> ApplyWithMetadataCallback:
+    """
+    Compile the expression tree into one Python function accepting
+    the record value, key, timestamp, and headers.
+
+    :param expression: the root `Expression` node
+    :param assign_to: if passed, the function sets the result to the record value
+        under this key and returns `None` instead of returning the result.
+    :return: a compiled function
+    """
+    gen = _CodeGenerator()
+    result = expression.generate(gen)
+    if assign_to is _NO_TARGET:
+        gen.emit(f"return {result}")
+    else:
+        gen.emit(f"value[{gen.bind(assign_to)}] = {result}")
+
+    bindings = {"_getitem": _getitem, **gen.bindings}
+    args = ", ".join(bindings)
+    body = "\n".join(gen.lines)
+    source = (
+        f"def _make({args}):\n"
+        f"    def _compiled(value, key, timestamp, headers):\n"
+        f"    {body.replace(chr(10), chr(10) + '    ')}\n"
+        f"    return _compiled\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<StreamingSeries>", "exec"), namespace)  # noqa: S102
+    return namespace["_make"](**bindings)
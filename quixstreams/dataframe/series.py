@@ -8,7 +8,6 @@ from typing_extensions import Self, ParamSpec
 from quixstreams.context import set_message_context
 from quixstreams.core.stream.functions import (
     ApplyCallback,
-    ApplyFunction,
     VoidExecutor,
     ReturningExecutor,
     ApplyWithMetadataCallback,
@@ -17,7 +16,20 @@ from quixstreams.core.stream.functions import (
 from quixstreams.core.stream.stream import Stream
 from quixstreams.models.messagecontext import MessageContext
 from .base import BaseStreaming
-from .exceptions import InvalidOperation, ColumnDoesNotExist, InvalidColumnReference
+from .exceptions import InvalidOperation
+from .expressions import (
+    Expression,
+    Column,
+    Constant,
+    Call,
+    MetadataCall,
+    StreamCall,
+    BinaryOperation,
+    And,
+    Or,
+    Not,
+    compile_expression,
+)
 
 __all__ = ("StreamingSeries",)
 
@@ -25,29 +37,6 @@ _T = TypeVar("_T")
 _P = ParamSpec("_P")
 
 
-def _getitem(d: Mapping, column_name: Union[str, int]) -> object:
-    """
-    Special error handling around column referencing with SDF.
-
-    :param d: a dict-like object (usually just a dict).
-    :param column_name: the column name.
-
-    :return: Nested data from column name.
-    """
-    try:
-        return d[column_name]
-    except KeyError:
-        raise ColumnDoesNotExist(
-            f"Column '{column_name}' does not exist in the message value"
-        )
-    except TypeError:
-        raise InvalidColumnReference(
-            f"Cannot access column '{column_name}'; "
-            f"column referencing expects message value type 'dict', "
-            f"not '{d.__class__.__name__}'"
-        )
-
-
 def _validate_operation(func: Callable[_P, _T]) -> Callable[_P, _T]:
     """
     Ensure `StreamingSeries` involved in operations originate from the same SDF.
@@ -121,11 +110,16 @@ class StreamingSeries(BaseStreaming):
         name: Optional[str] = None,
         stream: Optional[Stream] = None,
         sdf_id: Optional[int] = None,
+        expression: Optional[Expression] = None,
     ):
-        if not (name or stream):
-            raise ValueError('Either "name" or "stream" must be passed')
-        self._stream = stream or Stream(func=ApplyFunction(lambda v: _getitem(v, name)))
+        if not (name or stream or expression):
+            raise ValueError('Either "name", "stream" or "expression" must be passed')
+        if expression is None:
+            expression = StreamCall(stream) if stream is not None else Column(name)
+        self._expression = expression
+        self._stream = stream
         self._sdf_id = sdf_id
+        self._compiled: Optional[ApplyWithMetadataCallback] = None
 
     @classmethod
     def from_apply_callback(cls, func: ApplyWithMetadataCallback, sdf_id: int) -> Self:
@@ -137,20 +131,40 @@ class StreamingSeries(BaseStreaming):
         :param sdf_id: the id of the calling `SDF`.
         :return: instance of `StreamingSeries`
         """
-        return cls(stream=Stream(ApplyWithMetadataFunction(func)), sdf_id=sdf_id)
+        return cls(expression=MetadataCall(func), sdf_id=sdf_id)
 
-    def _from_apply_callback(self, func: ApplyWithMetadataCallback):
-        # TODO - maybe there's a better patten for this? (_method calling classmethod)
-        return self.from_apply_callback(func, self._sdf_id)
+    def _from_expression(self, expression: Expression) -> Self:
+        return self.__class__(expression=expression, sdf_id=self._sdf_id)
 
     @property
     def stream(self) -> Stream:
+        if self._stream is None:
+            self._stream = Stream(ApplyWithMetadataFunction(self.compile()))
         return self._stream
 
     @property
     def sdf_id(self) -> Optional[int]:
         return self._sdf_id
 
+    @property
+    def expression(self) -> Expression:
+        return self._expression
+
+    def compile(self) -> ApplyWithMetadataCallback:
+        """
+        Compile the operations of this StreamingSeries and its parents
+        into a single function.
+
+        Unlike the composed `Stream`, the compiled function evaluates the whole
+        expression (e.g. `sdf["a"] * 2 + sdf["b"]`) in one call.
+
+        :return: a callable accepting value, key, timestamp and headers and
+            returning the result of the expression
+        """
+        if self._compiled is None:
+            self._compiled = compile_expression(self._expression)
+        return self._compiled
+
     def apply(self, func: ApplyCallback) -> Self:
         """
         Add a callable to the execution list for this series.
@@ -182,8 +196,7 @@ class StreamingSeries(BaseStreaming):
         :param func: a callable with one argument and one output
         :return: a new `StreamingSeries` with the new callable added
         """
-        child = self._stream.add_apply(func)
-        return self.__class__(stream=child, sdf_id=self._sdf_id)
+        return self._from_expression(Call(func, self._expression))
 
     def compose_returning(self) -> ReturningExecutor:
         """
@@ -198,7 +211,7 @@ class StreamingSeries(BaseStreaming):
         :return: a callable accepting value, key and timestamp and
             returning a tuple "(value, key, timestamp)
         """
-        return self._stream.compose_returning()
+        return self.stream.compose_returning()
 
     def compose(
         self,
@@ -236,7 +249,7 @@ class StreamingSeries(BaseStreaming):
             returning None
         """
 
-        return self._stream.compose(
+        return self.stream.compose(
             allow_filters=False,
             allow_updates=False,
             allow_transforms=False,
@@ -283,22 +296,14 @@ class StreamingSeries(BaseStreaming):
             Union[bool, object],
         ],
     ) -> Self:
-        self_composed = self.compose_returning()
-        if isinstance(other, self.__class__):
-            other_composed = other.compose_returning()
+        return self._from_expression(
+            BinaryOperation(operator_, self._expression, self._as_expression(other))
+        )
 
-            return self._from_apply_callback(
-                func=lambda value, key, timestamp, headers, op=operator_: op(
-                    self_composed(value, key, timestamp, headers)[0],
-                    other_composed(value, key, timestamp, headers)[0],
-                )
-            )
-        else:
-            return self._from_apply_callback(
-                func=lambda value, key, timestamp, headers, op=operator_: op(
-                    self_composed(value, key, timestamp, headers)[0], other
-                )
-            )
+    def _as_expression(self, other: Union[Self, object]) -> Expression:
+        if isinstance(other, self.__class__):
+            return other.expression
+        return Constant(other)
 
     def isin(self, other: Container) -> Self:
         """
@@ -464,7 +469,7 @@ class StreamingSeries(BaseStreaming):
 
         :return: new StreamingSeries
         """
-        return self.apply(func=lambda v: abs(v))
+        return self.apply(func=abs)
 
     def __bool__(self):
         raise InvalidOperation(
@@ -519,28 +524,12 @@ class StreamingSeries(BaseStreaming):
             This function always does a logical "and" instead.
         """
 
-        # Do the "and" check manually instead of calling `self._operation`
+        # Do the "and" check with the `And` expression instead of an operator
         # to preserve Python's lazy evaluation of `and`.
         # Otherwise, it always evaluates both left and right side of the expression
         # to compute the result which is not always desired.
         # See https://docs.python.org/3/reference/expressions.html#boolean-operations
-        self_composed = self.compose_returning()
-
-        if isinstance(other, self.__class__):
-            other_composed = other.compose_returning()
-            return self._from_apply_callback(
-                func=lambda value, key, timestamp, headers: self_composed(
-                    value, key, timestamp, headers
-                )[0]
-                and other_composed(value, key, timestamp, headers)[0]
-            )
-        else:
-            return self._from_apply_callback(
-                func=lambda value, key, timestamp, headers: self_composed(
-                    value, key, timestamp, headers
-                )[0]
-                and other
-            )
+        return self._from_expression(And(self._expression, self._as_expression(other)))
 
     @_validate_operation
     def __or__(self, other: Union[Self, object]) -> Self:
@@ -552,27 +541,12 @@ class StreamingSeries(BaseStreaming):
             This function always does a logical "or" instead.
         """
 
-        # Do the "or" check manually instead of calling `self._operation`
+        # Do the "or" check with the `Or` expression instead of an operator
         # to preserve Python's lazy evaluation of `or`.
         # Otherwise, it always evaluates both left and right side of the expression
         # to compute the result which is not always desired.
         # See https://docs.python.org/3/reference/expressions.html#boolean-operations
-        self_composed = self.compose_returning()
-        if isinstance(other, self.__class__):
-            other_composed = other.compose_returning()
-            return self._from_apply_callback(
-                func=lambda value, key, timestamp, headers: self_composed(
-                    value, key, timestamp, headers
-                )[0]
-                or other_composed(value, key, timestamp, headers)[0]
-            )
-        else:
-            return self._from_apply_callback(
-                func=lambda value, key, timestamp, headers: self_composed(
-                    value, key, timestamp, headers
-                )[0]
-                or other
-            )
+        return self._from_expression(Or(self._expression, self._as_expression(other)))
 
     def __invert__(self) -> Self:
         """
@@ -582,4 +556,4 @@ class StreamingSeries(BaseStreaming):
             a bitwise "not" if argument is a number.
             This function always does a logical "not" instead.
         """
-        return self.apply(lambda v: not v)
+        return self._from_expression(Not(self._expression))
@@ -1,8 +1,15 @@
-from .definitions import HoppingWindowDefinition, TumblingWindowDefinition
+from .definitions import (
+    HoppingWindowDefinition,
+    SessionWindowDefinition,
+    SlidingWindowDefinition,
+    TumblingWindowDefinition,
+)
 from .base import WindowResult
 
 __all__ = [
     "HoppingWindowDefinition",
+    "SessionWindowDefinition",
+    "SlidingWindowDefinition",
     "TumblingWindowDefinition",
     "WindowResult",
 ]
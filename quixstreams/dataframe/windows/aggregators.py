@@ -0,0 +1,102 @@
+from collections import deque
+from typing import Any, Deque, List, Tuple
+
+from .base import WindowCombineFunc
+
+__all__ = ("TwoStacksAggregator", "MonotonicDequeAggregator")
+
+
+class TwoStacksAggregator:
+    """
+    A FIFO queue of aggregated values which can combine all of them in O(1).
+
+    It keeps two stacks:
+     - the "back" stack receives new values and keeps their combined value.
+     - the "front" stack keeps the oldest values together with the combined
+        values of the elements from the top to the bottom of the stack.
+        When it's empty, all the values are moved to it from the "back" stack.
+
+    Each value is moved between the stacks once, so both `push()` and `pop()`
+    take amortized constant time, and the values are never "subtracted" from
+    the aggregate.
+
+    :param combine_func: a function to combine two aggregated values
+    """
+
+    __slots__ = ("_combine_func", "_front", "_back", "_back_value")
+
+    def __init__(self, combine_func: WindowCombineFunc):
+        self._combine_func = combine_func
+        self._front: List[Any] = []
+        self._back: List[Any] = []
+        self._back_value: Any = None
+
+    def push(self, value: Any):
+        if self._back:
+            self._back_value = self._combine_func(self._back_value, value)
+        else:
+            self._back_value = value
+        self._back.append(value)
+
+    def pop(self):
+        if not self._front:
+            combine, front = self._combine_func, self._front
+            for value in reversed(self._back):
+                front.append(combine(value, front[-1]) if front else value)
+            self._back.clear()
+            self._back_value = None
+        self._front.pop()
+
+    def value(self) -> Any:
+        if not self._front:
+            return self._back_value
+        if not self._back:
+            return self._front[-1]
+        return self._combine_func(self._front[-1], self._back_value)
+
+    def __len__(self) -> int:
+        return len(self._front) + len(self._back)
+
+
+class MonotonicDequeAggregator:
+    """
+    A FIFO queue of values which finds their minimum or maximum in O(1).
+
+    It keeps only the values which can still become the result
+    in a deque, where they are ordered by `select_func`.
+    A new value removes all the values it supersedes from the end of the deque,
+    and the result is always at the start of it.
+
+    Each value is added to and removed from the deque once, so both
+    `push()` and `pop()` take amortized constant time.
+
+    :param select_func: a function to select one of two values, like `min` or `max`
+    """
+
+    __slots__ = ("_select_func", "_candidates", "_pushed", "_popped")
+
+    def __init__(self, select_func: WindowCombineFunc):
+        self._select_func = select_func
+        # Values are stored together with their sequence numbers,
+        # so the oldest value can be found when it's popped from the queue
+        self._candidates: Deque[Tuple[int, Any]] = deque()
+        self._pushed = 0
+        self._popped = 0
+
+    def push(self, value: Any):
+        candidates, select = self._candidates, self._select_func
+        while candidates and select(candidates[-1][1], value) is value:
+            candidates.pop()
+        candidates.append((self._pushed, value))
+        self._pushed += 1
+
+    def pop(self):
+        if self._candidates and self._candidates[0][0] == self._popped:
+            self._candidates.popleft()
+        self._popped += 1
+
+    def value(self) -> Any:
+        return self._candidates[0][1] if self._candidates else None
+
+    def __len__(self) -> int:
+        return self._pushed - self._popped
@@ -14,6 +14,8 @@ class WindowResult(TypedDict):
 
 WindowAggregateFunc = Callable[[int, int, int, Any, WindowedState], Any]
 WindowMergeFunc = Callable[[Any], Any]
+WindowCombineFunc = Callable[[Any, Any], Any]
+WindowInitFunc = Callable[[Any], Any]
 
 
 def get_window_ranges(
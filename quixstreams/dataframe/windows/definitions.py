@@ -5,7 +5,15 @@ from typing import Any, Optional, Callable, Tuple, TYPE_CHECKING
 from quixstreams.state import (
     WindowedState,
 )
-from .base import WindowAggregateFunc, WindowMergeFunc
+from .base import (
+    WindowAggregateFunc,
+    WindowCombineFunc,
+    WindowInitFunc,
+    WindowMergeFunc,
+)
+from .panes import PanedHoppingWindow
+from .session import SessionWindow
+from .sliding import SlidingWindow
 from .time_based import FixedTimeWindow
 
 if TYPE_CHECKING:
@@ -17,6 +25,28 @@ def _mean_merge_func(state_value: Tuple[float, int]):
     return sum_ / count_
 
 
+def _identity_init_func(value: Any) -> Any:
+    return value
+
+
+def _count_init_func(_: Any) -> int:
+    return 1
+
+
+def _mean_init_func(value: Any) -> Tuple[float, int]:
+    return value, 1
+
+
+def _sum_combine_func(left: Any, right: Any) -> Any:
+    return left + right
+
+
+def _mean_combine_func(
+    left: Tuple[float, int], right: Tuple[float, int]
+) -> Tuple[float, int]:
+    return left[0] + right[0], left[1] + right[1]
+
+
 class FixedTimeWindowDefinition(abc.ABC):
     def __init__(
         self,
@@ -50,6 +80,8 @@ class FixedTimeWindowDefinition(abc.ABC):
         func_name: str,
         aggregate_func: WindowAggregateFunc,
         merge_func: Optional[WindowMergeFunc] = None,
+        combine_func: Optional[WindowCombineFunc] = None,
+        init_func: Optional[WindowInitFunc] = None,
     ) -> "FixedTimeWindow": ...
 
     @property
@@ -89,7 +121,12 @@ class FixedTimeWindowDefinition(abc.ABC):
             )
             return updated_value
 
-        return self._create_window(func_name="sum", aggregate_func=func)
+        return self._create_window(
+            func_name="sum",
+            aggregate_func=func,
+            combine_func=_sum_combine_func,
+            init_func=_identity_init_func,
+        )
 
     def count(self) -> "FixedTimeWindow":
         """
@@ -116,7 +153,12 @@ class FixedTimeWindowDefinition(abc.ABC):
             )
             return updated_value
 
-        return self._create_window(func_name="count", aggregate_func=func)
+        return self._create_window(
+            func_name="count",
+            aggregate_func=func,
+            combine_func=_sum_combine_func,
+            init_func=_count_init_func,
+        )
 
     def mean(self) -> "FixedTimeWindow":
         """
@@ -146,7 +188,11 @@ class FixedTimeWindowDefinition(abc.ABC):
             return sum_, count_
 
         return self._create_window(
-            func_name="mean", aggregate_func=func, merge_func=_mean_merge_func
+            func_name="mean",
+            aggregate_func=func,
+            merge_func=_mean_merge_func,
+            combine_func=_mean_combine_func,
+            init_func=_mean_init_func,
         )
 
     def reduce(
@@ -236,7 +282,12 @@ class FixedTimeWindowDefinition(abc.ABC):
             )
             return updated_value
 
-        return self._create_window(func_name="max", aggregate_func=func)
+        return self._create_window(
+            func_name="max",
+            aggregate_func=func,
+            combine_func=max,
+            init_func=_identity_init_func,
+        )
 
     def min(self) -> "FixedTimeWindow":
         """
@@ -265,7 +316,12 @@ class FixedTimeWindowDefinition(abc.ABC):
             )
             return updated_value
 
-        return self._create_window(func_name="min", aggregate_func=func)
+        return self._create_window(
+            func_name="min",
+            aggregate_func=func,
+            combine_func=min,
+            init_func=_identity_init_func,
+        )
 
 
 class HoppingWindowDefinition(FixedTimeWindowDefinition):
@@ -276,6 +332,7 @@ class HoppingWindowDefinition(FixedTimeWindowDefinition):
         step_ms: int,
         dataframe: "StreamingDataFrame",
         name: Optional[str] = None,
+        panes: bool = False,
     ):
         super().__init__(
             duration_ms=duration_ms,
@@ -284,17 +341,37 @@ class HoppingWindowDefinition(FixedTimeWindowDefinition):
             name=name,
             step_ms=step_ms,
         )
+        self._panes = panes
 
-    def _get_name(self, func_name: str) -> str:
+    def _get_name(self, func_name: str, panes: bool = False) -> str:
         prefix = f"{self._name}_hopping_window" if self._name else "hopping_window"
-        return f"{prefix}_{self._duration_ms}_{self._step_ms}_{func_name}"
+        # The panes are stored differently from the windows,
+        # so they must use a separate store
+        suffix = "_panes" if panes else ""
+        return f"{prefix}_{self._duration_ms}_{self._step_ms}{suffix}_{func_name}"
 
     def _create_window(
         self,
         func_name: str,
         aggregate_func: WindowAggregateFunc,
         merge_func: Optional[WindowMergeFunc] = None,
+        combine_func: Optional[WindowCombineFunc] = None,
+        init_func: Optional[WindowInitFunc] = None,
     ) -> "FixedTimeWindow":
+        # The custom "reduce()" aggregations cannot be combined,
+        # so they always update every window
+        if self._panes and combine_func is not None:
+            return PanedHoppingWindow(
+                duration_ms=self._duration_ms,
+                grace_ms=self._grace_ms,
+                step_ms=self._step_ms,
+                name=self._get_name(func_name=func_name, panes=True),
+                aggregate_func=aggregate_func,
+                combine_func=combine_func,
+                merge_func=merge_func,
+                dataframe=self._dataframe,
+            )
+
         return FixedTimeWindow(
             duration_ms=self._duration_ms,
             grace_ms=self._grace_ms,
@@ -327,6 +404,8 @@ class TumblingWindowDefinition(FixedTimeWindowDefinition):
         func_name: str,
         aggregate_func: WindowAggregateFunc,
         merge_func: Optional[WindowMergeFunc] = None,
+        combine_func: Optional[WindowCombineFunc] = None,
+        init_func: Optional[WindowInitFunc] = None,
     ) -> "FixedTimeWindow":
         return FixedTimeWindow(
             duration_ms=self._duration_ms,
@@ -336,3 +415,92 @@ class TumblingWindowDefinition(FixedTimeWindowDefinition):
             merge_func=merge_func,
             dataframe=self._dataframe,
         )
+
+
+class SlidingWindowDefinition(FixedTimeWindowDefinition):
+    def __init__(
+        self,
+        duration_ms: int,
+        grace_ms: int,
+        dataframe: "StreamingDataFrame",
+        name: Optional[str] = None,
+    ):
+        super().__init__(
+            duration_ms=duration_ms, grace_ms=grace_ms, dataframe=dataframe, name=name
+        )
+
+    def _get_name(self, func_name: str) -> str:
+        prefix = f"{self._name}_sliding_window" if self._name else "sliding_window"
+        return f"{prefix}_{self._duration_ms}_{func_name}"
+
+    def _create_window(
+        self,
+        func_name: str,
+        aggregate_func: WindowAggregateFunc,
+        merge_func: Optional[WindowMergeFunc] = None,
+        combine_func: Optional[WindowCombineFunc] = None,
+        init_func: Optional[WindowInitFunc] = None,
+    ) -> "FixedTimeWindow":
+        if combine_func is None or init_func is None:
+            raise ValueError(
+                f'Sliding windows don\'t support "{func_name}" aggregation, '
+                f"use sum(), count(), mean(), min() or max() instead"
+            )
+        return SlidingWindow(
+            duration_ms=self._duration_ms,
+            grace_ms=self._grace_ms,
+            name=self._get_name(func_name=func_name),
+            aggregate_func=aggregate_func,
+            init_func=init_func,
+            combine_func=combine_func,
+            merge_func=merge_func,
+            dataframe=self._dataframe,
+        )
+
+
+class SessionWindowDefinition(FixedTimeWindowDefinition):
+    def __init__(
+        self,
+        inactivity_gap_ms: int,
+        grace_ms: int,
+        dataframe: "StreamingDataFrame",
+        name: Optional[str] = None,
+    ):
+        super().__init__(
+            duration_ms=inactivity_gap_ms,
+            grace_ms=grace_ms,
+            dataframe=dataframe,
+            name=name,
+        )
+
+    @property
+    def inactivity_gap_ms(self) -> int:
+        return self._duration_ms
+
+    def _get_name(self, func_name: str) -> str:
+        prefix = f"{self._name}_session_window" if self._name else "session_window"
+        return f"{prefix}_{self._duration_ms}_{func_name}"
+
+    def _create_window(
+        self,
+        func_name: str,
+        aggregate_func: WindowAggregateFunc,
+        merge_func: Optional[WindowMergeFunc] = None,
+        combine_func: Optional[WindowCombineFunc] = None,
+        init_func: Optional[WindowInitFunc] = None,
+    ) -> "FixedTimeWindow":
+        if combine_func is None or init_func is None:
+            raise ValueError(
+                f'Session windows don\'t support "{func_name}" aggregation, '
+                f"use sum(), count(), mean(), min() or max() instead"
+            )
+        return SessionWindow(
+            inactivity_gap_ms=self._duration_ms,
+            grace_ms=self._grace_ms,
+            name=self._get_name(func_name=func_name),
+            aggregate_func=aggregate_func,
+            init_func=init_func,
+            combine_func=combine_func,
+            merge_func=merge_func,
+            dataframe=self._dataframe,
+        )
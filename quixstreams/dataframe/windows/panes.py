@@ -0,0 +1,245 @@
+import logging
+import math
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+
+from quixstreams.context import message_context
+from quixstreams.state import WindowedState
+from .aggregators import TwoStacksAggregator
+from .base import (
+    WindowAggregateFunc,
+    WindowCombineFunc,
+    WindowMergeFunc,
+    WindowResult,
+)
+from .time_based import FixedTimeWindow
+
+if TYPE_CHECKING:
+    from quixstreams.dataframe.dataframe import StreamingDataFrame
+
+__all__ = ("PanedHoppingWindow",)
+
+logger = logging.getLogger(__name__)
+
+
+class PanedHoppingWindow(FixedTimeWindow):
+    """
+    A hopping window which aggregates each record only once.
+
+    The time is split into the non-overlapping "panes" of
+    `gcd(duration_ms, step_ms)` milliseconds, so each window consists of
+    the whole number of panes.
+    Each record updates only the pane it belongs to, and the window values are
+    computed by combining the panes with `combine_func`.
+
+    This way, the per-record cost doesn't depend on how many windows overlap.
+
+    :param combine_func: a function to combine two aggregated pane values.
+        It must be associative and commutative.
+    """
+
+    def __init__(
+        self,
+        duration_ms: int,
+        grace_ms: int,
+        step_ms: int,
+        name: str,
+        aggregate_func: WindowAggregateFunc,
+        combine_func: WindowCombineFunc,
+        dataframe: "StreamingDataFrame",
+        merge_func: Optional[WindowMergeFunc] = None,
+    ):
+        super().__init__(
+            duration_ms=duration_ms,
+            grace_ms=grace_ms,
+            name=name,
+            aggregate_func=aggregate_func,
+            dataframe=dataframe,
+            merge_func=merge_func,
+            step_ms=step_ms,
+        )
+        self._combine_func = combine_func
+        self._pane_ms = math.gcd(duration_ms, step_ms)
+
+    def process_window(
+        self,
+        value: Any,
+        timestamp_ms: int,
+        state: WindowedState,
+    ) -> Tuple[List[WindowResult], List[WindowResult]]:
+        return self._process_pane(
+            value=value, timestamp_ms=timestamp_ms, state=state, collect_updated=True
+        )
+
+    def final(self) -> "StreamingDataFrame":
+        def window_callback(
+            value: Any, key: Any, timestamp_ms: int, _headers: Any, state: WindowedState
+        ) -> List[Tuple[WindowResult, Any, int, Any]]:
+            # Don't combine the updated windows, they're not emitted anyway
+            _, expired_windows = self._process_pane(
+                value=value,
+                timestamp_ms=timestamp_ms,
+                state=state,
+                collect_updated=False,
+            )
+            return [(window, key, window["start"], None) for window in expired_windows]
+
+        return self._apply_window(func=window_callback, name=self._name)
+
+    final.__doc__ = FixedTimeWindow.final.__doc__
+
+    def _process_pane(
+        self,
+        value: Any,
+        timestamp_ms: int,
+        state: WindowedState,
+        collect_updated: bool,
+    ) -> Tuple[List[WindowResult], List[WindowResult]]:
+        duration_ms, step_ms, pane_ms = self._duration_ms, self._step_ms, self._pane_ms
+        latest_timestamp = state.get_latest_timestamp()
+        max_expired_end = latest_timestamp - self._grace_ms
+
+        # Close the windows expired by the previous messages first,
+        # so the late message doesn't update them
+        expired_windows = self._expire_windows(state=state, max_end_ms=max_expired_end)
+
+        # Find the first and the last windows the message belongs to
+        # without listing all of them
+        last_start = timestamp_ms - timestamp_ms % step_ms
+        first_start = max(((timestamp_ms - duration_ms) // step_ms + 1) * step_ms, 0)
+        min_valid_window_end = max_expired_end + 1
+        min_valid_start = -((duration_ms - min_valid_window_end) // step_ms) * step_ms
+        if min_valid_start > first_start:
+            ctx = message_context()
+            expired_count = min(min_valid_start, last_start + step_ms) - first_start
+            logger.warning(
+                f"Skipping window processing for expired windows "
+                f"timestamp={timestamp_ms} "
+                f"windows_count={expired_count // step_ms} "
+                f"min_valid_window_end={min_valid_window_end} "
+                f"partition={ctx.topic}[{ctx.partition}] "
+                f"offset={ctx.offset}"
+            )
+            first_start = min_valid_start
+
+        updated_windows = []
+        if first_start <= last_start:
+            if state.get_last_expired_window_start() is None:
+                # It's the first pane for this key.
+                # Mark the windows closed before it as expired,
+                # so they're never emitted
+                state.set_last_expired_window_start(
+                    self._get_max_expired_start(max_end_ms=max_expired_end)
+                )
+
+            pane_start = timestamp_ms - timestamp_ms % pane_ms
+            self._aggregate_func(
+                pane_start, pane_start + pane_ms, timestamp_ms, value, state
+            )
+
+            if collect_updated:
+                panes = state.get_windows(
+                    start_from_ms=first_start - 1,
+                    start_to_ms=last_start + duration_ms - 1,
+                )
+                updated_windows = self._combine_panes(
+                    panes=panes, first_start=first_start, last_start=last_start
+                )
+
+        expired_windows += self._expire_windows(
+            state=state, max_end_ms=state.get_latest_timestamp() - self._grace_ms
+        )
+        return updated_windows, expired_windows
+
+    def _get_max_expired_start(self, max_end_ms: int) -> int:
+        step_ms = self._step_ms
+        return (max_end_ms - self._duration_ms) // step_ms * step_ms
+
+    def _expire_windows(
+        self, state: WindowedState, max_end_ms: int
+    ) -> List[WindowResult]:
+        """
+        Emit the windows ending at or before `max_end_ms` and delete the panes
+        which don't belong to any open window anymore.
+        """
+        last_expired = state.get_last_expired_window_start()
+        if last_expired is None:
+            return []
+
+        max_expired_start = self._get_max_expired_start(max_end_ms=max_end_ms)
+        if max_expired_start <= last_expired:
+            return []
+
+        panes = state.get_windows(
+            start_from_ms=last_expired,
+            start_to_ms=max_expired_start + self._duration_ms - 1,
+        )
+        expired_windows = self._combine_panes(
+            panes=panes,
+            # The windows cannot start before the epoch
+            first_start=max(last_expired + self._step_ms, 0),
+            last_start=max_expired_start,
+        )
+
+        # The pane is not needed anymore when the last window it belongs to expires
+        max_deleted_start = max_expired_start + self._step_ms
+        for (start, end), _ in panes:
+            if start >= max_deleted_start:
+                break
+            state.delete_window(start_ms=start, end_ms=end)
+        state.set_last_expired_window_start(max_expired_start)
+        return expired_windows
+
+    def _combine_panes(
+        self,
+        panes: List[Tuple[Tuple[int, int], Any]],
+        first_start: int,
+        last_start: int,
+    ) -> List[WindowResult]:
+        """
+        Combine the sorted panes into the windows starting between `first_start`
+        and `last_start`, inclusive.
+
+        The panes are added to and removed from the aggregator as the window slides
+        over them, and the empty windows are skipped.
+        """
+        duration_ms, step_ms = self._duration_ms, self._step_ms
+        merge_func = self._merge_func
+        aggregator = TwoStacksAggregator(combine_func=self._combine_func)
+        windows: List[WindowResult] = []
+        # The starts of the panes currently in the aggregator
+        pane_starts: List[int] = []
+        head = 0
+        added = 0
+        panes_count = len(panes)
+        start = first_start
+        while start <= last_start:
+            while head < len(pane_starts) and pane_starts[head] < start:
+                aggregator.pop()
+                head += 1
+            end = start + duration_ms
+            while added < panes_count and panes[added][0][0] < end:
+                (pane_start, _), pane_value = panes[added]
+                if pane_start >= start:
+                    aggregator.push(pane_value)
+                    pane_starts.append(pane_start)
+                added += 1
+
+            if aggregator:
+                windows.append(
+                    {
+                        "start": start,
+                        "end": end,
+                        "value": merge_func(aggregator.value()),
+                    }
+                )
+                start += step_ms
+            elif added < panes_count:
+                # Jump to the first window containing the next pane
+                next_pane_start = panes[added][0][0]
+                start = max(
+                    start + step_ms,
+                    ((next_pane_start - duration_ms) // step_ms + 1) * step_ms,
+                )
+            else:
+                break
+        return windows
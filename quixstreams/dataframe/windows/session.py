@@ -0,0 +1,151 @@
+import logging
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+
+from quixstreams.context import message_context
+from quixstreams.state import WindowedState
+from .base import (
+    WindowAggregateFunc,
+    WindowCombineFunc,
+    WindowInitFunc,
+    WindowMergeFunc,
+    WindowResult,
+)
+from .time_based import FixedTimeWindow
+
+if TYPE_CHECKING:
+    from quixstreams.dataframe.dataframe import StreamingDataFrame
+
+__all__ = ("SessionWindow",)
+
+logger = logging.getLogger(__name__)
+
+
+class SessionWindow(FixedTimeWindow):
+    """
+    A window which groups the messages of the same key into sessions of activity.
+
+    The session is extended by every message arriving less than `inactivity_gap_ms`
+    after the previous one, and it's closed after the event time passes
+    the timestamp of its last message + `inactivity_gap_ms` + `grace_ms`.
+
+    The sessions are stored in the state as regular windows
+    `[<first timestamp>, <last timestamp> + <inactivity gap>)`.
+    Since the sessions of a key never overlap, the sessions a message belongs to
+    are found by seeking backwards from `<timestamp> + <inactivity gap>`
+    and reading at most two windows.
+    When the message bridges two sessions, their aggregated values are combined
+    into a new session with `combine_func`, and the old sessions are deleted.
+    A late message is skipped if it would move the start of a session
+    to or before the start of the last expired session of the key.
+
+    :param inactivity_gap_ms: the maximum time between two messages
+        of the same session in milliseconds.
+    :param init_func: a function to convert a single value to the aggregated form.
+    :param combine_func: a function to combine two aggregated values.
+        It must be associative and commutative.
+    """
+
+    def __init__(
+        self,
+        inactivity_gap_ms: int,
+        grace_ms: int,
+        name: str,
+        aggregate_func: WindowAggregateFunc,
+        init_func: WindowInitFunc,
+        combine_func: WindowCombineFunc,
+        dataframe: "StreamingDataFrame",
+        merge_func: Optional[WindowMergeFunc] = None,
+    ):
+        super().__init__(
+            duration_ms=inactivity_gap_ms,
+            grace_ms=grace_ms,
+            name=name,
+            aggregate_func=aggregate_func,
+            dataframe=dataframe,
+            merge_func=merge_func,
+        )
+        self._init_func = init_func
+        self._combine_func = combine_func
+
+    def process_window(
+        self,
+        value: Any,
+        timestamp_ms: int,
+        state: WindowedState,
+    ) -> Tuple[List[WindowResult], List[WindowResult]]:
+        gap_ms, grace_ms = self._duration_ms, self._grace_ms
+
+        # Close the sessions expired by the previous messages first,
+        # so the late message doesn't extend them
+        expired_windows = self._expire_windows(state=state)
+
+        # The message can only belong to the sessions starting before
+        # timestamp + gap, and only the last two of them can be close enough
+        sessions = state.get_windows(
+            start_from_ms=-1,
+            start_to_ms=timestamp_ms + gap_ms - 1,
+            backwards=True,
+            limit=2,
+        )
+        merged: List[Tuple[Tuple[int, int], Any]] = [
+            session for session in sessions if timestamp_ms < session[0][1]
+        ]
+
+        if not merged:
+            min_valid_window_end = state.get_latest_timestamp() - grace_ms + 1
+            if timestamp_ms + gap_ms < min_valid_window_end:
+                ctx = message_context()
+                logger.warning(
+                    f"Skipping window processing for expired window "
+                    f"timestamp={timestamp_ms} "
+                    f"window=[{timestamp_ms},{timestamp_ms + gap_ms}) "
+                    f"min_valid_window_end={min_valid_window_end} "
+                    f"partition={ctx.topic}[{ctx.partition}] "
+                    f"offset={ctx.offset}"
+                )
+                return [], expired_windows
+
+        start, end = timestamp_ms, timestamp_ms + gap_ms
+        aggregated = self._init_func(value)
+        combine_func = self._combine_func
+        for (session_start, session_end), session_value in merged:
+            start, end = min(start, session_start), max(end, session_end)
+            aggregated = combine_func(session_value, aggregated)
+
+        if merged and start == timestamp_ms:
+            # The late message moves the start of an open session back.
+            # The sessions are expired by their starts, so the session cannot
+            # start at or before the last expired one, or it would never expire
+            # and would be skipped when the windows are read from the store
+            last_expired_start = state.get_last_expired_window_start()
+            if last_expired_start is not None and start <= last_expired_start:
+                ctx = message_context()
+                logger.warning(
+                    f"Skipping window processing for expired window "
+                    f"timestamp={timestamp_ms} "
+                    f"window=[{start},{end}) "
+                    f"last_expired_window_start={last_expired_start} "
+                    f"partition={ctx.topic}[{ctx.partition}] "
+                    f"offset={ctx.offset}"
+                )
+                return [], expired_windows
+
+        for (session_start, session_end), _ in merged:
+            if (session_start, session_end) != (start, end):
+                state.delete_window(start_ms=session_start, end_ms=session_end)
+        state.update_window(start, end, value=aggregated, timestamp_ms=timestamp_ms)
+
+        updated_windows: List[WindowResult] = [
+            {"start": start, "end": end, "value": self._merge_func(aggregated)}
+        ]
+        expired_windows += self._expire_windows(state=state)
+        return updated_windows, expired_windows
+
+    def _expire_windows(self, state: WindowedState) -> List[WindowResult]:
+        merge_func = self._merge_func
+        return [
+            {"start": start, "end": end, "value": merge_func(aggregated)}
+            for (start, end), aggregated in state.expire_windows(
+                duration_ms=self._duration_ms, grace_ms=self._grace_ms
+            )
+        ]
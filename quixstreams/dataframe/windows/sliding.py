@@ -0,0 +1,202 @@
+import functools
+import logging
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple, TYPE_CHECKING, Union
+
+from quixstreams.context import message_context
+from quixstreams.dataframe.exceptions import InvalidOperation
+from quixstreams.state import WindowedState
+from .aggregators import MonotonicDequeAggregator, TwoStacksAggregator
+from .base import (
+    WindowAggregateFunc,
+    WindowCombineFunc,
+    WindowInitFunc,
+    WindowMergeFunc,
+    WindowResult,
+)
+from .time_based import FixedTimeWindow
+
+if TYPE_CHECKING:
+    from quixstreams.dataframe.dataframe import StreamingDataFrame
+
+__all__ = ("SlidingWindow",)
+
+logger = logging.getLogger(__name__)
+
+
+class SlidingWindowIndex:
+    """
+    An in-memory index of the values within the sliding window of a message key.
+
+    It keeps the timestamps of the values in the order they were added,
+    and the aggregator combines the values incrementally as the window slides.
+
+    :param aggregator: an aggregator to combine the values
+    """
+
+    __slots__ = ("_timestamps", "_aggregator")
+
+    def __init__(
+        self, aggregator: Union[TwoStacksAggregator, MonotonicDequeAggregator]
+    ):
+        self._timestamps: Deque[int] = deque()
+        self._aggregator = aggregator
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return self._timestamps[-1] if self._timestamps else None
+
+    def push(self, timestamp_ms: int, value: Any):
+        self._timestamps.append(timestamp_ms)
+        self._aggregator.push(value)
+
+    def expire(self, min_timestamp_ms: int):
+        """
+        Remove the values with timestamps smaller than `min_timestamp_ms`.
+        """
+        timestamps, aggregator = self._timestamps, self._aggregator
+        while timestamps and timestamps[0] < min_timestamp_ms:
+            timestamps.popleft()
+            aggregator.pop()
+
+    def value(self) -> Any:
+        return self._aggregator.value()
+
+
+class SlidingWindow(FixedTimeWindow):
+    """
+    A window which ends at the timestamp of each message and covers
+    the previous `duration_ms` milliseconds of the same message key.
+
+    The values are aggregated in the state per millisecond, so the windows
+    can be restored after restarts and the late messages can be added to them.
+    The aggregated values of each millisecond are deleted after the last window
+    they belong to is closed.
+
+    On top of the state, each message key gets an in-memory `SlidingWindowIndex`,
+    which is updated by every message, and computes the window value without
+    reading the state.
+    The `min` and `max` aggregations use monotonic deques for that,
+    and the other ones use "two stacks".
+    The index is rebuilt from the state when it's not cached yet,
+    or when an out-of-order message arrives.
+
+    :param init_func: a function to convert a single value to the aggregated form.
+    :param combine_func: a function to combine two aggregated values.
+        It must be associative and commutative.
+    """
+
+    def __init__(
+        self,
+        duration_ms: int,
+        grace_ms: int,
+        name: str,
+        aggregate_func: WindowAggregateFunc,
+        init_func: WindowInitFunc,
+        combine_func: WindowCombineFunc,
+        dataframe: "StreamingDataFrame",
+        merge_func: Optional[WindowMergeFunc] = None,
+    ):
+        super().__init__(
+            duration_ms=duration_ms,
+            grace_ms=grace_ms,
+            name=name,
+            aggregate_func=aggregate_func,
+            dataframe=dataframe,
+            merge_func=merge_func,
+        )
+        self._init_func = init_func
+        self._combine_func = combine_func
+
+    def process_window(
+        self,
+        value: Any,
+        timestamp_ms: int,
+        state: WindowedState,
+    ) -> Tuple[List[WindowResult], List[WindowResult]]:
+        duration_ms = self._duration_ms
+        min_valid_timestamp = state.get_latest_timestamp() - self._grace_ms
+        if timestamp_ms < min_valid_timestamp:
+            ctx = message_context()
+            logger.warning(
+                f"Skipping window processing for expired window "
+                f"timestamp={timestamp_ms} "
+                f"min_valid_timestamp={min_valid_timestamp} "
+                f"partition={ctx.topic}[{ctx.partition}] "
+                f"offset={ctx.offset}"
+            )
+            return [], []
+
+        # Aggregate the values of each millisecond in the state.
+        # Each value belongs to the windows ending within
+        # [timestamp, timestamp + duration], so it's stored with such an interval
+        # to be expired when the last of these windows can't be updated anymore.
+        self._aggregate_func(
+            timestamp_ms, timestamp_ms + duration_ms + 1, timestamp_ms, value, state
+        )
+
+        min_timestamp = timestamp_ms - duration_ms
+        index: Optional[SlidingWindowIndex] = state.get_window_index()
+        if index is not None and index.last_timestamp <= timestamp_ms:
+            index.push(timestamp_ms, self._init_func(value))
+            index.expire(min_timestamp)
+            aggregated = index.value()
+        else:
+            aggregated = self._aggregate_from_state(
+                timestamp_ms=timestamp_ms, state=state
+            )
+
+        # Delete the values which cannot get into any new window anymore
+        state.expire_windows(duration_ms=duration_ms + 1, grace_ms=self._grace_ms)
+
+        window: WindowResult = {
+            "start": max(min_timestamp, 0),
+            "end": timestamp_ms,
+            "value": self._merge_func(aggregated),
+        }
+        return [window], []
+
+    def _aggregate_from_state(self, timestamp_ms: int, state: WindowedState) -> Any:
+        """
+        Aggregate the window from the values stored in the state.
+
+        If the message is the latest one for this key, it also builds a new index
+        for the next messages.
+        Otherwise, the index is dropped because the message doesn't go to its end.
+        """
+        values = state.get_windows(
+            start_from_ms=timestamp_ms - self._duration_ms - 1,
+            start_to_ms=state.get_latest_timestamp(),
+        )
+        if values[-1][0][0] > timestamp_ms:
+            state.set_window_index(None)
+            return functools.reduce(
+                self._combine_func,
+                (v for (start, _), v in values if start <= timestamp_ms),
+            )
+
+        index = SlidingWindowIndex(aggregator=self._create_aggregator())
+        for (start, _), aggregated in values:
+            index.push(start, aggregated)
+        state.set_window_index(index)
+        return index.value()
+
+    def _create_aggregator(
+        self,
+    ) -> Union[TwoStacksAggregator, MonotonicDequeAggregator]:
+        if self._combine_func in (min, max):
+            return MonotonicDequeAggregator(select_func=self._combine_func)
+        return TwoStacksAggregator(combine_func=self._combine_func)
+
+    def final(self) -> "StreamingDataFrame":
+        """
+        Not supported by sliding windows.
+
+        Each message gets its own window, which is emitted right away
+        by `current()`.
+
+        :raises InvalidOperation: always
+        """
+        raise InvalidOperation(
+            "Sliding windows emit a window for every message, use .current() instead"
+        )
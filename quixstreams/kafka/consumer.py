@@ -144,6 +144,35 @@ class Consumer:
         """
         return self._consumer.poll(timeout=timeout if timeout is not None else -1)
 
+    def consume(
+        self, num_messages: int = 1, timeout: Optional[float] = None
+    ) -> List[Message]:
+        """
+        Consumes a list of messages (possibly empty on timeout).
+        Callbacks may be executed as a side effect of calling this method.
+
+        The application must check the returned :py:class:`Message`
+        object's :py:func:`Message.error()` method to distinguish between proper
+        messages (error() returns None), or an event or error for each
+        :py:class:`Message` in the list.
+
+        Note: a `RebalancingCallback` may be called from this method (
+        `on_assign`, `on_revoke`, or `on_lost`).
+
+        :param int num_messages: The maximum number of messages to return.
+            Default: 1.
+        :param float timeout: The maximum time in seconds to block waiting for
+            messages, events or callbacks. None or -1 is infinite. Default: None.
+        :return: A list of `Message` objects (possibly empty on timeout)
+        :rtype: List[Message]
+        :raises RuntimeError: if called on a closed consumer
+        :raises KafkaException: in case of an internal error
+        :raises ValueError: if num_messages > 1M
+        """
+        return self._consumer.consume(
+            num_messages=num_messages, timeout=timeout if timeout is not None else -1
+        )
+
     def subscribe(
         self,
         topics: List[str],
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class MessageContext:
@@ -16,6 +16,7 @@ class MessageContext:
         "_size",
         "_headers",
         "_leader_epoch",
+        "_raw",
     )
 
     def __init__(
@@ -25,12 +26,14 @@ class MessageContext:
         offset: int,
         size: int,
         leader_epoch: Optional[int] = None,
+        raw: Optional[Tuple[Optional[bytes], Optional[bytes]]] = None,
     ):
         self._topic = topic
         self._partition = partition
         self._offset = offset
         self._size = size
         self._leader_epoch = leader_epoch
+        self._raw = raw
 
     @property
     def topic(self) -> str:
@@ -51,3 +54,12 @@ class MessageContext:
     @property
     def leader_epoch(self) -> Optional[int]:
         return self._leader_epoch
+
+    @property
+    def raw(self) -> Optional[Tuple[Optional[bytes], Optional[bytes]]]:
+        """
+        The original `(key, value)` bytes of the message.
+
+        It's `None` if the message value was split into multiple rows.
+        """
+        return self._raw
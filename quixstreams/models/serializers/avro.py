@@ -1,19 +1,24 @@
+import functools
 import json
-from typing import Union, Mapping, Optional, Any, Iterable
+import struct
+from collections import OrderedDict
+from typing import Union, Mapping, Optional, Any, Iterable, List, Sequence, Dict
 
 from io import BytesIO
 
 from confluent_kafka.serialization import SerializationError as _SerializationError
-from confluent_kafka.schema_registry import SchemaRegistryClient, SchemaRegistryError
-from confluent_kafka.schema_registry.avro import (
-    AvroDeserializer as _AvroDeserializer,
-    AvroSerializer as _AvroSerializer,
+from confluent_kafka.schema_registry import (
+    SchemaRegistryClient,
+    SchemaRegistryError,
+    Schema as _RegisteredSchema,
 )
+from confluent_kafka.schema_registry.avro import AvroSerializer as _AvroSerializer
 from fastavro import schemaless_reader, schemaless_writer, parse_schema
 from fastavro.types import Schema
 
 from .base import Serializer, Deserializer, SerializationContext
 from .exceptions import SerializationError
+from ..types import MessageHeadersTuples
 from .schema_registry import (
     SchemaRegistryClientConfig,
     SchemaRegistrySerializationConfig,
@@ -62,6 +67,8 @@ class AvroSerializer(Serializer):
         self._strict = strict
         self._strict_allow_default = strict_allow_default
         self._disable_tuple_notation = disable_tuple_notation
+        # The output buffer is reused between the calls
+        self._buffer = BytesIO()
         self._schema_registry_serializer = None
         if schema_registry_client_config:
             client_config = schema_registry_client_config.as_dict(
@@ -92,20 +99,22 @@ class AvroSerializer(Serializer):
             except (SchemaRegistryError, _SerializationError, ValueError) as exc:
                 raise SerializationError(str(exc)) from exc
 
-        with BytesIO() as data:
-            try:
-                schemaless_writer(
-                    data,
-                    self._schema,
-                    value,
-                    strict=self._strict,
-                    strict_allow_default=self._strict_allow_default,
-                    disable_tuple_notation=self._disable_tuple_notation,
-                )
-            except (ValueError, TypeError) as exc:
-                raise SerializationError(str(exc)) from exc
+        data = self._buffer
+        data.seek(0)
+        data.truncate()
+        try:
+            schemaless_writer(
+                data,
+                self._schema,
+                value,
+                strict=self._strict,
+                strict_allow_default=self._strict_allow_default,
+                disable_tuple_notation=self._disable_tuple_notation,
+            )
+        except (ValueError, TypeError) as exc:
+            raise SerializationError(str(exc)) from exc
 
-            return data.getvalue()
+        return data.getvalue()
 
 
 class AvroDeserializer(Deserializer):
@@ -119,6 +128,7 @@ class AvroDeserializer(Deserializer):
         return_named_type_override: bool = False,
         handle_unicode_errors: str = "strict",
         schema_registry_client_config: Optional[SchemaRegistryClientConfig] = None,
+        schema_cache_size: int = 1000,
     ):
         """
         Deserializer that parses data from Avro.
@@ -138,8 +148,11 @@ class AvroDeserializer(Deserializer):
             Default - `False`
         :param handle_unicode_errors: Should be set to a valid string that can be used in the errors argument of the string decode() function.
             Default - `"strict"`
-        :param schema_registry_client_config: If provided, deserialization is offloaded to Confluent's AvroDeserializer.
+        :param schema_registry_client_config: If provided, the messages are expected in the Confluent Schema Registry format, and their writer schemas are fetched from the Schema Registry.
+            The `schema` is then used as a reader schema.
             Default - `None`
+        :param schema_cache_size: the maximum number of parsed writer schemas to keep in memory per schema id when `schema_registry_client_config` is provided.
+            Default - `1000`
         """
         if not schema and not schema_registry_client_config:
             raise ValueError(
@@ -154,30 +167,23 @@ class AvroDeserializer(Deserializer):
         self._return_named_type = return_named_type
         self._return_named_type_override = return_named_type_override
         self._handle_unicode_errors = handle_unicode_errors
-        self._schema_registry_deserializer = None
+        self._schema_registry_reader = None
         if schema_registry_client_config:
             client_config = schema_registry_client_config.as_dict(
                 plaintext_secrets=True,
             )
-            self._schema_registry_deserializer = _AvroDeserializer(
+            self._schema_registry_reader = _SchemaRegistryAvroReader(
                 schema_registry_client=SchemaRegistryClient(client_config),
-                schema_str=json.dumps(schema) if schema else None,
+                reader_schema=self._schema,
                 return_record_name=return_record_name,
+                cache_size=schema_cache_size,
             )
-
-    def __call__(
-        self, value: bytes, ctx: SerializationContext
-    ) -> Union[Iterable[Mapping], Mapping]:
-        if self._schema_registry_deserializer is not None:
-            try:
-                return self._schema_registry_deserializer(value, ctx)
-            except (SchemaRegistryError, _SerializationError, EOFError) as exc:
-                raise SerializationError(str(exc)) from exc
-
-        try:
-            return schemaless_reader(
-                BytesIO(value),
-                self._schema,
+            self._read = self._schema_registry_reader.read
+        else:
+            # Resolve the reader options once instead of on every call
+            self._read = functools.partial(
+                _read_avro,
+                writer_schema=self._schema,
                 reader_schema=self._reader_schema,
                 return_record_name=self._return_record_name,
                 return_record_name_override=self._return_record_name_override,
@@ -185,5 +191,115 @@ class AvroDeserializer(Deserializer):
                 return_named_type_override=self._return_named_type_override,
                 handle_unicode_errors=self._handle_unicode_errors,
             )
-        except EOFError as exc:
+
+    def __call__(
+        self, value: bytes, ctx: SerializationContext
+    ) -> Union[Iterable[Mapping], Mapping]:
+        try:
+            return self._read(value)
+        except (SchemaRegistryError, _SerializationError, EOFError) as exc:
+            raise SerializationError(str(exc)) from exc
+
+    def deserialize_many(
+        self,
+        values: Sequence[bytes],
+        ctx: SerializationContext,
+        headers: Sequence[Optional[MessageHeadersTuples]],
+    ) -> List[Any]:
+        read = self._read
+        try:
+            return [read(value) for value in values]
+        except (SchemaRegistryError, _SerializationError, EOFError) as exc:
             raise SerializationError(str(exc)) from exc
+
+
+def _read_avro(value: bytes, writer_schema: Schema, **kwargs) -> Any:
+    return schemaless_reader(BytesIO(value), writer_schema, **kwargs)
+
+
+# Confluent Schema Registry wire format: a magic byte and a 4-byte schema id
+_SCHEMA_REGISTRY_HEADER = struct.Struct(">bI")
+_SCHEMA_REGISTRY_MAGIC_BYTE = 0
+
+
+class _SchemaRegistryAvroReader:
+    """
+    Reads Avro messages in the Confluent Schema Registry format.
+
+    The parsed writer schemas are kept in a bounded LRU cache per schema id,
+    so the Schema Registry is queried and the schemas are parsed only
+    for the schema ids not seen recently.
+    """
+
+    def __init__(
+        self,
+        schema_registry_client: SchemaRegistryClient,
+        reader_schema: Optional[Schema],
+        return_record_name: bool,
+        cache_size: int,
+    ):
+        if cache_size < 1:
+            raise ValueError("`schema_cache_size` must be greater than 0")
+        self._client = schema_registry_client
+        self._reader_schema = reader_schema
+        self._return_record_name = return_record_name
+        self._cache_size = cache_size
+        self._writer_schemas: OrderedDict[int, Schema] = OrderedDict()
+
+    def read(self, value: bytes) -> Any:
+        if len(value) <= _SCHEMA_REGISTRY_HEADER.size:
+            raise SerializationError(
+                f"Expecting data framing of length 6 bytes or more but total data "
+                f"size is {len(value)} bytes. This message was not produced with "
+                f"a Confluent Schema Registry serializer"
+            )
+        magic, schema_id = _SCHEMA_REGISTRY_HEADER.unpack_from(value)
+        if magic != _SCHEMA_REGISTRY_MAGIC_BYTE:
+            raise SerializationError(
+                f"Unexpected magic byte {magic}. This message was not produced with "
+                f"a Confluent Schema Registry serializer"
+            )
+
+        payload = BytesIO(value)
+        payload.seek(_SCHEMA_REGISTRY_HEADER.size)
+        return schemaless_reader(
+            payload,
+            self._get_writer_schema(schema_id),
+            self._reader_schema,
+            self._return_record_name,
+        )
+
+    def _get_writer_schema(self, schema_id: int) -> Schema:
+        writer_schemas = self._writer_schemas
+        try:
+            writer_schema = writer_schemas[schema_id]
+        except KeyError:
+            registered_schema = self._client.get_schema(schema_id)
+            named_schemas = self._resolve_named_schemas(registered_schema)
+            writer_schema = parse_schema(
+                json.loads(registered_schema.schema_str),
+                named_schemas=named_schemas,
+            )
+            writer_schemas[schema_id] = writer_schema
+            if len(writer_schemas) > self._cache_size:
+                writer_schemas.popitem(last=False)
+            return writer_schema
+
+        writer_schemas.move_to_end(schema_id)
+        return writer_schema
+
+    def _resolve_named_schemas(
+        self,
+        schema: _RegisteredSchema,
+        named_schemas: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        # Parse the schemas referenced by the schema recursively
+        if named_schemas is None:
+            named_schemas = {}
+        for reference in schema.references or ():
+            referenced = self._client.get_version(reference.subject, reference.version)
+            self._resolve_named_schemas(referenced.schema, named_schemas)
+            parse_schema(
+                json.loads(referenced.schema.schema_str), named_schemas=named_schemas
+            )
+        return named_schemas
@@ -1,5 +1,5 @@
 import abc
-from typing import Optional, Any, Union
+from typing import Optional, Any, Union, List, Sequence
 from typing_extensions import TypeAlias, Literal
 
 from confluent_kafka.serialization import (
@@ -56,6 +56,34 @@ class Deserializer(abc.ABC):
     @abc.abstractmethod
     def __call__(self, *args, **kwargs) -> Any: ...
 
+    def deserialize_many(
+        self,
+        values: Sequence[bytes],
+        ctx: SerializationContext,
+        headers: Sequence[Optional[MessageHeadersTuples]],
+    ) -> List[Any]:
+        """
+        Deserialize a batch of values of the same topic and message field.
+
+        The `ctx` is shared by all values, and its `headers` are set to the headers
+        of each message before deserializing its value.
+
+        The default implementation calls the deserializer for each value.
+        Override it to deserialize the batch in a more efficient way.
+        If any value fails to deserialize, the exception is raised
+        for the whole batch.
+
+        :param values: a sequence of message keys or values (not `None`)
+        :param ctx: a serialization context shared by the values
+        :param headers: a sequence of message headers for each value
+        :return: a list of deserialized values in the same order
+        """
+        result = []
+        for value, value_headers in zip(values, headers):
+            ctx.headers = value_headers
+            result.append(self(value=value, ctx=ctx))
+        return result
+
 
 class Serializer(abc.ABC):
     """
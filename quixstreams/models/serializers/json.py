@@ -1,5 +1,5 @@
 import json
-from typing import Callable, Union, Mapping, Optional, Any, Iterable
+from typing import Callable, Union, Mapping, Optional, Any, Iterable, List, Sequence
 
 from confluent_kafka.schema_registry import SchemaRegistryClient, SchemaRegistryError
 from confluent_kafka.schema_registry.json_schema import (
@@ -16,6 +16,7 @@ from quixstreams.utils.json import (
 )
 from .base import Serializer, Deserializer, SerializationContext
 from .exceptions import SerializationError
+from ..types import MessageHeadersTuples
 from .schema_registry import (
     SchemaRegistryClientConfig,
     SchemaRegistrySerializationConfig,
@@ -179,3 +180,28 @@ class JSONDeserializer(Deserializer):
                 raise SerializationError(str(exc)) from exc
 
         return data
+
+    def deserialize_many(
+        self,
+        values: Sequence[bytes],
+        ctx: SerializationContext,
+        headers: Sequence[Optional[MessageHeadersTuples]],
+    ) -> List[Any]:
+        if self._schema_registry_deserializer is not None:
+            return super().deserialize_many(values=values, ctx=ctx, headers=headers)
+
+        loads = self._loads
+        try:
+            data = [loads(value) for value in values]
+        except (ValueError, TypeError) as exc:
+            raise SerializationError(str(exc)) from exc
+
+        if self._validator:
+            validate = self._validator.validate
+            try:
+                for item in data:
+                    validate(item)
+            except ValidationError as exc:
+                raise SerializationError(str(exc)) from exc
+
+        return data
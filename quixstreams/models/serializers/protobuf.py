@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, Mapping, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
 
 from confluent_kafka.schema_registry import SchemaRegistryClient, SchemaRegistryError
 from confluent_kafka.schema_registry.protobuf import (
@@ -11,6 +11,7 @@ from google.protobuf.message import DecodeError, EncodeError, Message
 
 from .base import Deserializer, SerializationContext, Serializer
 from .exceptions import SerializationError
+from ..types import MessageHeadersTuples
 from .schema_registry import (
     SchemaRegistryClientConfig,
     SchemaRegistrySerializationConfig,
@@ -141,6 +142,9 @@ class ProtobufDeserializer(Deserializer):
         super().__init__()
         self._msg_type = msg_type
         self._to_dict = to_dict
+        # When the messages are converted to dicts, a single message object
+        # is reused to parse all of them
+        self._msg = msg_type() if to_dict else None
 
         self._use_integers_for_enums = use_integers_for_enums
         self._preserving_proto_field_name = preserving_proto_field_name
@@ -175,7 +179,8 @@ class ProtobufDeserializer(Deserializer):
             except (_SerializationError, DecodeError) as exc:
                 raise SerializationError(str(exc)) from exc
         else:
-            msg = self._msg_type()
+            # ParseFromString() clears the message before parsing
+            msg = self._msg if self._to_dict else self._msg_type()
             try:
                 msg.ParseFromString(value)
             except DecodeError as exc:
@@ -184,6 +189,35 @@ class ProtobufDeserializer(Deserializer):
         if not self._to_dict:
             return msg
 
+        return self._message_to_dict(msg)
+
+    def deserialize_many(
+        self,
+        values: Sequence[bytes],
+        ctx: SerializationContext,
+        headers: Sequence[Optional[MessageHeadersTuples]],
+    ) -> List[Any]:
+        if self._schema_registry_deserializer is not None:
+            return super().deserialize_many(values=values, ctx=ctx, headers=headers)
+
+        result = []
+        msg_type = self._msg_type
+        to_dict = self._message_to_dict if self._to_dict else None
+        msg = self._msg
+        try:
+            for value in values:
+                if to_dict is None:
+                    msg = msg_type()
+                    msg.ParseFromString(value)
+                    result.append(msg)
+                else:
+                    msg.ParseFromString(value)
+                    result.append(to_dict(msg))
+        except DecodeError as exc:
+            raise SerializationError(str(exc)) from exc
+        return result
+
+    def _message_to_dict(self, msg: Message) -> Dict:
         return MessageToDict(
             msg,
             always_print_fields_with_no_presence=True,
@@ -1,11 +1,22 @@
 import base64
 import gzip
-from typing import List, Mapping, Iterable, Optional, Union, Tuple, Any, Callable, Dict
+from typing import (
+    List,
+    Mapping,
+    Iterable,
+    Optional,
+    Union,
+    Tuple,
+    Any,
+    Callable,
+    Dict,
+    Sequence,
+)
 
 from .base import SerializationContext
 from .exceptions import SerializationError, IgnoreMessage
 from .json import JSONDeserializer, JSONSerializer
-from quixstreams.models.types import MessageHeadersMapping
+from quixstreams.models.types import MessageHeadersMapping, MessageHeadersTuples
 from quixstreams.utils.json import (
     dumps as default_dumps,
     loads as default_loads,
@@ -80,15 +91,26 @@ class QuixDeserializer(JSONDeserializer):
     def __init__(
         self,
         loads: Callable[[Union[bytes, bytearray]], Any] = default_loads,
+        columnar: bool = False,
     ):
         """
         :param loads: function to parse json from bytes.
             Default - :py:func:`quixstreams.utils.json.loads`.
+        :param columnar: if True, each `TimeseriesData` message is deserialized
+            to a single dict of columns (lists of values per parameter)
+            instead of a dict per timestamp.
+            `EventData` messages are not affected.
+            Default - `False`.
         """
         super().__init__(loads=loads)
+        deserialize_timeseries = (
+            self.deserialize_timeseries_columns
+            if columnar
+            else self.deserialize_timeseries
+        )
         self._deserializers = {
-            QModelKey.TIMESERIESDATA: self.deserialize_timeseries,
-            QModelKey.PARAMETERDATA: self.deserialize_timeseries,
+            QModelKey.TIMESERIESDATA: deserialize_timeseries,
+            QModelKey.PARAMETERDATA: deserialize_timeseries,
             QModelKey.EVENTDATA: self.deserialize_event_data,
             QModelKey.EVENTDATA_LIST: self.deserialize_event_data_list,
         }
@@ -147,6 +169,47 @@ class QuixDeserializer(JSONDeserializer):
             row_value[Q_TIMESTAMP_KEY] = timestamp_ns
             yield row_value
 
+    def deserialize_timeseries_columns(
+        self, value: Union[List[Mapping], Mapping]
+    ) -> Iterable[Mapping]:
+        """
+        Deserialize a `TimeseriesData` message to a single dict of columns.
+
+        The parameter values are kept as lists aligned with the "Timestamp" list,
+        and the tags are kept as a dict of lists under the "Tags" key.
+        Binary values are decoded from base64.
+
+        Example:
+        ```python
+        {
+            "a": [1, 2],
+            "b": ["x", None],
+            "Tags": {"tag1": ["v1", "v2"]},
+            "Timestamp": [1234567890, 1234567891],
+        }
+        ```
+        """
+        if not isinstance(value, Mapping):
+            raise SerializationError(f'Expected mapping, got type "{type(value)}"')
+
+        timestamps = value["Timestamps"]
+        if not timestamps:
+            return
+
+        row_value = {
+            param_name: (
+                [_b64_decode_or_none(v) for v in param_values]
+                if param_type == "BinaryValues"
+                else param_values
+            )
+            for param_type in ("NumericValues", "StringValues", "BinaryValues")
+            for param_name, param_values in value.get(param_type, {}).items()
+            if self._timestamp_key_check(param_name, param_type)
+        }
+        row_value["Tags"] = dict(value.get("TagValues", {}))
+        row_value[Q_TIMESTAMP_KEY] = timestamps
+        yield row_value
+
     def deserialize(
         self, model_key: str, value: Union[List[Mapping], Mapping]
     ) -> Iterable[Mapping]:
@@ -247,6 +310,28 @@ class QuixDeserializer(JSONDeserializer):
         # Pass deserialized value to the `deserialize` function
         yield from self._deserializers[model_key](value=deserialized)
 
+    def deserialize_many(
+        self,
+        values: Sequence[bytes],
+        ctx: SerializationContext,
+        headers: Sequence[Optional[MessageHeadersTuples]],
+    ) -> List[List[dict]]:
+        """
+        Deserialize a batch of messages from Quix formats.
+
+        Unlike `__call__()`, the rows of each message are returned as a list,
+        and the ignored messages are returned as empty lists instead of raising
+        `IgnoreMessage`.
+        """
+        result = []
+        for value, value_headers in zip(values, headers):
+            ctx.headers = value_headers
+            try:
+                result.append(list(self(value=value, ctx=ctx)))
+            except IgnoreMessage:
+                result.append([])
+        return result
+
     def _is_legacy_format(self, value: bytes):
         try:
             if value.startswith(b"<"):
@@ -339,6 +424,27 @@ class QuixTimeseriesSerializer(QuixSerializer):
     }
     ```
 
+    If the "Timestamp" of the value is a list, the value is treated as columnar,
+    and all its rows are packed into one multi-timestamp message.
+    Each parameter must then be a sequence (e.g. a list or a NumPy array)
+    of the same length, and the "Tags" must be a dict of such sequences.
+    This is the format produced by `QuixDeserializer(columnar=True)`.
+
+    Input:
+    ```python
+    {'a': [1, 2], 'c': ['x', None], 'Tags': {'tag1': ['t', 't']}, 'Timestamp': [1, 2]}
+    ```
+
+    Output:
+    ```json
+    {
+        "Timestamps": [1, 2],
+        "NumericValues": {"a": [1, 2]},
+        "StringValues": {"c": ["x", null]},
+        "BinaryValues": {},
+        "TagValues": {"tag1": ["t", "t"]}
+    }
+    ```
     """
 
     _legacy = {
@@ -353,6 +459,9 @@ class QuixTimeseriesSerializer(QuixSerializer):
     def __call__(self, value: Mapping, ctx: SerializationContext) -> Union[str, bytes]:
         if not isinstance(value, Mapping):
             raise SerializationError(f"Expected Mapping, got {type(value)}")
+        if _is_column(value.get(Q_TIMESTAMP_KEY)):
+            return self._to_json(self._serialize_columns(value))
+
         result = {
             "BinaryValues": {},
             "StringValues": {},
@@ -402,6 +511,89 @@ class QuixTimeseriesSerializer(QuixSerializer):
 
         return self._to_json(result)
 
+    def _serialize_columns(self, value: Mapping) -> dict:
+        timestamps = _column_to_list(Q_TIMESTAMP_KEY, value[Q_TIMESTAMP_KEY])
+        size = len(timestamps)
+        result = {
+            "BinaryValues": {},
+            "StringValues": {},
+            "NumericValues": {},
+            "Timestamps": timestamps,
+            "TagValues": {},
+        }
+
+        for key, column in value.items():
+            if column is None or key == Q_TIMESTAMP_KEY:
+                continue
+            if key == "Tags":
+                if not isinstance(column, Mapping):
+                    raise SerializationError(
+                        f'"Tags" must be a Mapping, got type "{type(column)}"'
+                    )
+                tags = result["TagValues"]
+                for tag_key, tag_values in column.items():
+                    tags[tag_key] = _column_to_list(tag_key, tag_values, size=size)
+                continue
+
+            column = _column_to_list(key, column, size=size)
+            # The column type is defined by its first non-None item,
+            # and the columns with None values only are omitted
+            first = next((item for item in column if item is not None), None)
+            if first is None:
+                continue
+            if isinstance(first, (int, float)) and not isinstance(first, bool):
+                param_type, expected_type = "NumericValues", (int, float)
+            elif isinstance(first, str):
+                param_type, expected_type = "StringValues", str
+            elif isinstance(first, (bytes, bytearray)):
+                param_type, expected_type = "BinaryValues", (bytes, bytearray)
+            else:
+                raise SerializationError(
+                    f'Item with key "{key}" has unsupported type "{type(first)}"'
+                )
+
+            for item in column:
+                if item is not None and (
+                    not isinstance(item, expected_type) or isinstance(item, bool)
+                ):
+                    raise SerializationError(
+                        f'Items with key "{key}" have mixed types '
+                        f'"{type(first)}" and "{type(item)}"'
+                    )
+            if param_type == "BinaryValues":
+                column = [
+                    base64.b64encode(item).decode("ascii") if item is not None else None
+                    for item in column
+                ]
+            result[param_type][key] = column
+
+        return result
+
+
+def _is_column(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) or (
+        hasattr(value, "tolist") and hasattr(value, "__len__")
+    )
+
+
+def _column_to_list(key: str, values: Any, size: Optional[int] = None) -> list:
+    # NumPy arrays and similar objects are converted to lists of Python objects
+    if hasattr(values, "tolist") and hasattr(values, "__len__"):
+        values = values.tolist()
+    if isinstance(values, tuple):
+        values = list(values)
+    elif not isinstance(values, list):
+        raise SerializationError(
+            f'Item with key "{key}" must be a sequence in columnar value, '
+            f'got type "{type(values)}"'
+        )
+    if size is not None and len(values) != size:
+        raise SerializationError(
+            f'Item with key "{key}" has {len(values)} values, '
+            f"expected {size} (the number of timestamps)"
+        )
+    return values
+
 
 class QuixEventsSerializer(QuixSerializer):
     """
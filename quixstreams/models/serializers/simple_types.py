@@ -1,5 +1,5 @@
 import functools
-from typing import Union, Mapping
+from typing import Union, Mapping, List, Sequence, Optional
 
 from confluent_kafka.serialization import (
     StringDeserializer as _StringDeserializer,
@@ -13,6 +13,7 @@ from confluent_kafka.serialization import (
 
 from .base import Deserializer, SerializationContext, Serializer
 from .exceptions import SerializationError
+from ..types import MessageHeadersTuples
 
 __all__ = (
     "BytesDeserializer",
@@ -49,6 +50,14 @@ class BytesDeserializer(Deserializer):
     def __call__(self, value: bytes, ctx: SerializationContext) -> bytes:
         return value
 
+    def deserialize_many(
+        self,
+        values: Sequence[bytes],
+        ctx: SerializationContext,
+        headers: Sequence[Optional[MessageHeadersTuples]],
+    ) -> List[bytes]:
+        return list(values)
+
 
 class BytesSerializer(Serializer):
     """
@@ -77,6 +86,16 @@ class StringDeserializer(Deserializer):
     ) -> Union[str, Mapping[str, str]]:
         return self._deserializer(value=value)
 
+    @_wrap_serialization_error
+    def deserialize_many(
+        self,
+        values: Sequence[bytes],
+        ctx: SerializationContext,
+        headers: Sequence[Optional[MessageHeadersTuples]],
+    ) -> List[str]:
+        codec = self._codec
+        return [value.decode(codec) for value in values]
+
 
 class IntegerDeserializer(Deserializer):
     """
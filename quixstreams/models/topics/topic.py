@@ -1,6 +1,6 @@
 import dataclasses
 import logging
-from typing import List, Any, Callable, Union
+from typing import List, Any, Callable, Union, Sequence
 from typing import Optional
 
 from quixstreams.models.messagecontext import MessageContext
@@ -207,15 +207,18 @@ class Topic:
                 return
 
         timestamp_type, timestamp_ms = message.timestamp()
+        split_values = self._value_deserializer.split_values
         message_context = MessageContext(
             topic=message.topic(),
             partition=message.partition(),
             offset=message.offset(),
             size=len(message),
             leader_epoch=message.leader_epoch(),
+            # Keep the original bytes to produce them as is if the value is unchanged
+            raw=None if split_values else (key_bytes, value_bytes),
         )
 
-        if self._value_deserializer.split_values:
+        if split_values:
             # The expected value from this serializer is Iterable and each item
             # should be processed as a separate message
             rows = []
@@ -248,6 +251,128 @@ class Topic:
             context=message_context,
         )
 
+    def rows_deserialize(
+        self, messages: Sequence[ConfluentKafkaMessageProto]
+    ) -> List[Row]:
+        """
+        Deserialize a batch of incoming Kafka messages of this topic to Rows.
+
+        Keys and values are deserialized with `Deserializer.deserialize_many()`,
+        and the `SerializationContext` objects are shared by the whole batch.
+
+        Messages ignored by the value deserializer are skipped, and the messages
+        producing multiple values (e.g. Quix formats) are flattened.
+        If any message fails to deserialize, the exception is raised
+        for the whole batch.
+
+        :param messages: a sequence of objects with interface
+            of `confluent_kafka.Message`
+        :return: a list of Rows in the order of messages
+        """
+        if self._key_deserializer is None:
+            raise DeserializerIsNotProvidedError(
+                f'Key deserializer is not provided for topic "{self.name}"'
+            )
+        if self._value_deserializer is None:
+            raise DeserializerIsNotProvidedError(
+                f'Value deserializer is not provided for topic "{self.name}"'
+            )
+        if not messages:
+            return []
+
+        headers = [message.headers() for message in messages]
+        keys = self._deserialize_many(
+            deserializer=self._key_deserializer,
+            field=MessageField.KEY,
+            values=[message.key() for message in messages],
+            headers=headers,
+        )
+        try:
+            values = self._deserialize_many(
+                deserializer=self._value_deserializer,
+                field=MessageField.VALUE,
+                values=[message.value() for message in messages],
+                headers=headers,
+            )
+        except IgnoreMessage:
+            # The deserializer doesn't support ignoring separate messages
+            # in a batch, fall back to deserializing them one by one
+            rows = []
+            for message in messages:
+                row_or_rows = self.row_deserialize(message=message)
+                if row_or_rows is None:
+                    continue
+                elif isinstance(row_or_rows, list):
+                    rows.extend(row_or_rows)
+                else:
+                    rows.append(row_or_rows)
+            return rows
+
+        split_values = self._value_deserializer.split_values
+        timestamp_extractor = self._timestamp_extractor
+        rows = []
+        for message, key, value, message_headers in zip(
+            messages, keys, values, headers
+        ):
+            timestamp_type, timestamp_ms = message.timestamp()
+            message_context = MessageContext(
+                topic=message.topic(),
+                partition=message.partition(),
+                offset=message.offset(),
+                size=len(message),
+                leader_epoch=message.leader_epoch(),
+                raw=None if split_values else (message.key(), message.value()),
+            )
+            items = value if split_values and value is not None else (value,)
+            for item in items:
+                item_timestamp_ms = timestamp_ms
+                if timestamp_extractor:
+                    item_timestamp_ms = timestamp_extractor(
+                        item,
+                        message_headers,
+                        timestamp_ms,
+                        TimestampType(timestamp_type),
+                    )
+                rows.append(
+                    Row(
+                        value=item,
+                        key=key,
+                        timestamp=item_timestamp_ms,
+                        headers=message_headers,
+                        context=message_context,
+                    )
+                )
+        return rows
+
+    def _deserialize_many(
+        self,
+        deserializer: Deserializer,
+        field: MessageField,
+        values: List[Optional[bytes]],
+        headers: List[Optional[MessageHeadersTuples]],
+    ) -> List[Any]:
+        # Only non-empty values are passed to the deserializer,
+        # the `None`s are kept as is
+        not_none = [i for i, value in enumerate(values) if value is not None]
+        if not not_none:
+            return values
+
+        ctx = SerializationContext(topic=self.name, field=field)
+        if len(not_none) == len(values):
+            return deserializer.deserialize_many(
+                values=values, ctx=ctx, headers=headers
+            )
+
+        deserialized = deserializer.deserialize_many(
+            values=[values[i] for i in not_none],
+            ctx=ctx,
+            headers=[headers[i] for i in not_none],
+        )
+        result = list(values)
+        for i, value in zip(not_none, deserialized):
+            result[i] = value
+        return result
+
     def serialize(
         self,
         key: Optional[object] = None,
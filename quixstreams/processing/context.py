@@ -54,6 +54,32 @@ class ProcessingContext:
         """
         self._checkpoint.store_offset(topic=topic, partition=partition, offset=offset)
 
+    def store_offset_range(
+        self,
+        topic: str,
+        partition: int,
+        first_offset: int,
+        last_offset: int,
+        count: int,
+    ):
+        """
+        Store the offsets of a batch of processed messages from the same
+        topic partition to the checkpoint.
+
+        :param topic: topic name
+        :param partition: partition number
+        :param first_offset: the first processed message offset in the batch
+        :param last_offset: the last processed message offset in the batch
+        :param count: the number of processed messages in the batch
+        """
+        self._checkpoint.store_offset_range(
+            topic=topic,
+            partition=partition,
+            first_offset=first_offset,
+            last_offset=last_offset,
+            count=count,
+        )
+
     def init_checkpoint(self):
         """
         Initialize a new checkpoint
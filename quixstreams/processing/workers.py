@@ -0,0 +1,800 @@
+import dataclasses
+import logging
+import queue
+import signal
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from pickle import PicklingError
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from confluent_kafka import KafkaError, KafkaException, TopicPartition
+
+from quixstreams.error_callbacks import ConsumerErrorCallback
+from quixstreams.exceptions import QuixException
+from quixstreams.kafka import AutoOffsetReset, ConnectionConfig, Consumer
+from quixstreams.kafka.consumer import RebalancingCallback, _wrap_assignment_errors
+from quixstreams.logging import LOGGER_NAME, configure_logging
+from quixstreams.models import Topic
+from quixstreams.models.types import ConfluentKafkaMessageProto, MessageHeadersTuples
+from quixstreams.rowconsumer import RowConsumer
+from quixstreams.sources.base.multiprocessing import multiprocessing
+
+if TYPE_CHECKING:
+    from quixstreams.app import Application
+
+__all__ = (
+    "WorkerConsumer",
+    "WorkerException",
+    "WorkerManager",
+    "WorkerMessage",
+    "WorkerProcess",
+)
+
+logger = logging.getLogger(__name__)
+
+_TP = Tuple[str, int]
+
+# Items sent by the main process to the worker inbox
+_MESSAGES = "messages"
+_ASSIGN = "assign"
+_REVOKE = "revoke"
+_LOST = "lost"
+_SEEKED = "seeked"
+_STOP = "stop"
+
+# Requests sent by the worker to the main process
+_PROCESSED = "processed"
+_COMMIT = "commit"
+_GROUP_METADATA = "group_metadata"
+_PAUSE = "pause"
+_RESUME = "resume"
+_SEEK = "seek"
+_REVOKED = "revoked"
+_ERROR = "error"
+
+
+class WorkerException(QuixException):
+    """
+    Raised in the main process when a worker process fails
+    """
+
+    def __init__(self, process: "WorkerProcess") -> None:
+        self.pid: Optional[int] = process.pid
+        self.process: WorkerProcess = process
+        self.exitcode = process.exitcode
+
+    def __str__(self) -> str:
+        msg = f"{self.process.name} with PID {self.pid} failed"
+        if self.exitcode == 0:
+            return msg
+        return f"{msg} with exitcode {self.exitcode}"
+
+
+class WorkerMessage:
+    """
+    A picklable copy of the Kafka message passed from the main process
+    to a worker process.
+
+    It implements `ConfluentKafkaMessageProto`, so the worker deserializes it
+    the same way as the messages consumed from Kafka.
+    """
+
+    __slots__ = (
+        "_topic",
+        "_partition",
+        "_offset",
+        "_timestamp",
+        "_key",
+        "_value",
+        "_headers",
+        "_leader_epoch",
+    )
+
+    def __init__(
+        self,
+        topic: str,
+        partition: int,
+        offset: int,
+        timestamp: Tuple[int, int],
+        key: Optional[bytes],
+        value: Optional[bytes],
+        headers: Optional[MessageHeadersTuples] = None,
+        leader_epoch: Optional[int] = None,
+    ):
+        self._topic = topic
+        self._partition = partition
+        self._offset = offset
+        self._timestamp = timestamp
+        self._key = key
+        self._value = value
+        self._headers = headers
+        self._leader_epoch = leader_epoch
+
+    @classmethod
+    def from_message(cls, message: ConfluentKafkaMessageProto) -> "WorkerMessage":
+        return cls(
+            topic=message.topic(),
+            partition=message.partition(),
+            offset=message.offset(),
+            timestamp=message.timestamp(),
+            key=message.key(),
+            value=message.value(),
+            headers=message.headers(),
+            leader_epoch=message.leader_epoch(),
+        )
+
+    def __reduce__(self):
+        return self.__class__, (
+            self._topic,
+            self._partition,
+            self._offset,
+            self._timestamp,
+            self._key,
+            self._value,
+            self._headers,
+            self._leader_epoch,
+        )
+
+    def headers(self, *args, **kwargs) -> Optional[MessageHeadersTuples]:
+        return self._headers
+
+    def key(self, *args, **kwargs) -> Optional[bytes]:
+        return self._key
+
+    def offset(self, *args, **kwargs) -> int:
+        return self._offset
+
+    def partition(self, *args, **kwargs) -> int:
+        return self._partition
+
+    def timestamp(self, *args, **kwargs) -> Tuple[int, int]:
+        return self._timestamp
+
+    def topic(self, *args, **kwargs) -> str:
+        return self._topic
+
+    def value(self, *args, **kwargs) -> Optional[bytes]:
+        return self._value
+
+    def latency(self, *args, **kwargs) -> Optional[float]:
+        return None
+
+    def leader_epoch(self, *args, **kwargs) -> Optional[int]:
+        return self._leader_epoch
+
+    def error(self) -> None:
+        return None
+
+    def __len__(self) -> int:
+        return len(self._value) if self._value is not None else 0
+
+
+@dataclasses.dataclass(frozen=True)
+class WorkerChannel:
+    """
+    The child ends of the queue and the pipe connecting a worker
+    with the main process.
+
+    The main process puts the messages and the partition assignments to `inbox`,
+    and the worker sends its requests and gets the replies via `connection`.
+    """
+
+    inbox: Any
+    connection: Connection
+
+
+class WorkerConsumer(RowConsumer):
+    """
+    A consumer of the worker process, which gets the messages from the main process
+    instead of Kafka.
+
+    The main process polls Kafka and passes the messages and the partition
+    assignments to the worker owning the partitions, so the worker processes them
+    with the same code as a regular `Application`.
+    The offsets are committed by the main process on behalf of the worker,
+    and the partitions are paused and seeked in the main process too.
+
+    The rebalancing callbacks are triggered from `poll()` and `consume()`
+    similarly to `confluent_kafka.Consumer`.
+    """
+
+    def __init__(
+        self,
+        channel: WorkerChannel,
+        on_stop: Callable[[bool], None],
+        broker_address: Union[str, ConnectionConfig],
+        consumer_group: str,
+        auto_offset_reset: AutoOffsetReset,
+        extra_config: Optional[dict] = None,
+        on_error: Optional[ConsumerErrorCallback] = None,
+    ):
+        """
+        :param channel: a `WorkerChannel` connecting the worker with the main process
+        :param on_stop: a callback to stop the worker when the main process
+            asks it to.
+            It accepts the "fail" flag like `Application.stop()`.
+        :param broker_address: Connection settings for Kafka.
+        :param consumer_group: Kafka consumer group.
+        :param auto_offset_reset: Consumer `auto.offset.reset` setting.
+        :param extra_config: A dictionary with additional consumer options.
+        :param on_error: a callback triggered when the message fails to deserialize.
+        """
+        super().__init__(
+            broker_address=broker_address,
+            consumer_group=consumer_group,
+            auto_offset_reset=auto_offset_reset,
+            auto_commit_enable=False,
+            extra_config=extra_config,
+            on_error=on_error,
+        )
+        self._inbox = channel.inbox
+        self._connection = channel.connection
+        self._on_stop = on_stop
+        self._buffer: Deque[WorkerMessage] = deque()
+        # The number of messages handed out since the last report
+        # to the main process
+        self._unacked = 0
+        # Assigned partitions with their committed offsets
+        self._assignment: Dict[_TP, int] = {}
+        # Partitions seeked by the worker; their messages are dropped
+        # until the main process confirms the seek
+        self._seeking: Set[_TP] = set()
+        self._on_assign: Optional[RebalancingCallback] = None
+        self._on_revoke: Optional[RebalancingCallback] = None
+        self._on_lost: Optional[RebalancingCallback] = None
+
+    def subscribe(
+        self,
+        topics: List[Topic],
+        on_assign: Optional[RebalancingCallback] = None,
+        on_revoke: Optional[RebalancingCallback] = None,
+        on_lost: Optional[RebalancingCallback] = None,
+    ):
+        """
+        Set the topics and the rebalancing callbacks.
+
+        The partitions are assigned to the worker by the main process.
+        """
+        self._topics = {t.name: t for t in topics}
+        self._on_assign = on_assign and _wrap_assignment_errors(on_assign)
+        self._on_revoke = on_revoke and _wrap_assignment_errors(on_revoke)
+        self._on_lost = on_lost and _wrap_assignment_errors(on_lost)
+
+    def poll(self, timeout: Optional[float] = None) -> Optional[WorkerMessage]:
+        if not self._buffer:
+            self._receive(timeout=timeout)
+        if self._buffer:
+            self._unacked += 1
+            return self._buffer.popleft()
+        return None
+
+    def consume(
+        self, num_messages: int = 1, timeout: Optional[float] = None
+    ) -> List[WorkerMessage]:
+        if not self._buffer:
+            self._receive(timeout=timeout)
+
+        buffer = self._buffer
+        if len(buffer) <= num_messages:
+            messages = list(buffer)
+            buffer.clear()
+        else:
+            messages = [buffer.popleft() for _ in range(num_messages)]
+        self._unacked += len(messages)
+        return messages
+
+    def commit(
+        self,
+        message=None,
+        offsets: Optional[List[TopicPartition]] = None,
+        asynchronous: bool = True,
+    ) -> Optional[List[TopicPartition]]:
+        """
+        Commit the offsets via the main process.
+
+        The worker only commits the offsets of its checkpoints,
+        so only the `offsets` argument is supported.
+
+        :raises KafkaException: if the commit fails
+        """
+        if message is not None or offsets is None:
+            raise ValueError("Worker consumer commits only the explicit offsets")
+
+        error, partitions = self._request(
+            _COMMIT, [(tp.topic, tp.partition, tp.offset) for tp in offsets]
+        )
+        if error is not None:
+            raise KafkaException(KafkaError(*error))
+
+        committed = []
+        for topic, partition, offset, partition_error in partitions:
+            if partition_error is not None:
+                raise KafkaException(KafkaError(*partition_error))
+            committed.append(TopicPartition(topic, partition, offset))
+        return committed
+
+    def committed(
+        self, partitions: List[TopicPartition], timeout: Optional[float] = None
+    ) -> List[TopicPartition]:
+        """
+        Get the committed offsets of the assigned partitions.
+
+        They are fetched by the main process before the partitions are assigned.
+        """
+        assignment = self._assignment
+        return [
+            TopicPartition(tp.topic, tp.partition, assignment[(tp.topic, tp.partition)])
+            for tp in partitions
+        ]
+
+    def consumer_group_metadata(self) -> bytes:
+        return self._request(_GROUP_METADATA, None)
+
+    def pause(self, partitions: List[TopicPartition]):
+        self._connection.send((_PAUSE, [(tp.topic, tp.partition) for tp in partitions]))
+
+    def resume(self, partitions: List[TopicPartition]):
+        self._connection.send(
+            (_RESUME, [(tp.topic, tp.partition) for tp in partitions])
+        )
+
+    def seek(self, partition: TopicPartition):
+        tp = (partition.topic, partition.partition)
+        self._seeking.add(tp)
+        # Drop the buffered messages, they will be consumed again after the seek
+        buffered = len(self._buffer)
+        self._buffer = deque(
+            m for m in self._buffer if (m.topic(), m.partition()) != tp
+        )
+        self._unacked += buffered - len(self._buffer)
+        self._connection.send((_SEEK, (*tp, partition.offset)))
+
+    def position(self, partitions: List[TopicPartition]) -> List[TopicPartition]:
+        # The positions are known only to the main process
+        return partitions
+
+    def assignment(self) -> List[TopicPartition]:
+        return [
+            TopicPartition(topic, partition) for topic, partition in self._assignment
+        ]
+
+    def incremental_assign(self, partitions: List[TopicPartition]):
+        # The partitions are assigned by the main process
+        pass
+
+    def incremental_unassign(self, partitions: List[TopicPartition]):
+        for tp in partitions:
+            self._assignment.pop((tp.topic, tp.partition), None)
+
+    def close(self):
+        """
+        Revoke the remaining partitions like `confluent_kafka.Consumer.close()` does.
+        """
+        if self._assignment and self._on_revoke is not None:
+            self._on_revoke(self, self.assignment())
+        self._assignment.clear()
+
+    def _request(self, kind: str, payload: Any) -> Any:
+        self._connection.send((kind, payload))
+        return self._connection.recv()
+
+    def _receive(self, timeout: Optional[float]):
+        """
+        Get the next item from the main process and handle it.
+
+        The assignment changes are handled only between the batches of messages,
+        and the processed messages are reported back to the main process
+        before waiting for more.
+        """
+        if self._unacked:
+            self._connection.send((_PROCESSED, self._unacked))
+            self._unacked = 0
+
+        try:
+            kind, payload = self._inbox.get(timeout=timeout)
+        except queue.Empty:
+            parent = multiprocessing.parent_process()
+            if parent is not None and not parent.is_alive():
+                logger.error("The main process has exited, stopping the worker")
+                self._on_stop(True)
+            return
+
+        if kind == _MESSAGES:
+            if self._seeking:
+                seeking = self._seeking
+                messages = [
+                    m for m in payload if (m.topic(), m.partition()) not in seeking
+                ]
+                self._unacked += len(payload) - len(messages)
+                payload = messages
+            self._buffer.extend(payload)
+        elif kind == _ASSIGN:
+            partitions = []
+            for topic, partition, committed_offset in payload:
+                self._assignment[(topic, partition)] = committed_offset
+                partitions.append(TopicPartition(topic, partition))
+            if self._on_assign is not None:
+                self._on_assign(self, partitions)
+        elif kind in (_REVOKE, _LOST):
+            partitions = [
+                TopicPartition(topic, partition) for topic, partition in payload
+            ]
+            callback = self._on_revoke if kind == _REVOKE else self._on_lost
+            if callback is not None:
+                callback(self, partitions)
+            self.incremental_unassign(partitions)
+            self._connection.send((_REVOKED, None))
+        elif kind == _SEEKED:
+            self._seeking.discard(payload)
+        elif kind == _STOP:
+            self._on_stop(payload)
+
+
+class WorkerProcess(multiprocessing.Process):
+    """
+    A worker process running the `StreamingDataFrame`s of the `Application`
+    created by `app_factory`.
+
+    Some methods are designed to be used from the parent process, and others
+    from the child process.
+    """
+
+    def __init__(
+        self, worker_id: int, app_factory: Callable[[], "Application"]
+    ) -> None:
+        super().__init__(name=f"Worker-{worker_id}", daemon=True)
+        self.worker_id = worker_id
+        self._app_factory = app_factory
+        # copy parent process log level to the child process
+        self._loglevel = logging.getLogger(LOGGER_NAME).level
+
+        self._inbox = multiprocessing.Queue()
+        self._connection, self._child_connection = multiprocessing.Pipe()
+
+        # The state of the worker tracked by the parent process
+        self.partitions: Set[_TP] = set()
+        # Partitions paused by the worker itself
+        self.paused_partitions: Set[_TP] = set()
+        # The number of messages passed to the worker and not processed yet
+        self.pending = 0
+        # Whether the worker partitions are paused because it's falling behind
+        self.backpressured = False
+        self.revoking = False
+        self.connected = True
+        self._exceptions: List[BaseException] = []
+        self._stopping = False
+
+    # --- CHILD PROCESS METHODS --- #
+
+    def run(self) -> None:
+        """
+        An entrypoint of the child process.
+
+        The signals are handled by the parent process, which stops the workers
+        when it's stopped itself.
+        """
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        try:
+            app = self._app_factory()
+            configure_logging(self._loglevel, self.name, pid=True)
+            logger.info("Worker started")
+            app._run_worker(  # noqa: SLF001
+                channel=WorkerChannel(
+                    inbox=self._inbox, connection=self._child_connection
+                )
+            )
+        except BaseException as err:
+            logger.exception("Error in worker")
+            self._report_exception(err)
+        logger.info("Worker stopped")
+
+    def _report_exception(self, err: BaseException) -> None:
+        """
+        Send an exception to the parent process.
+        If the exception can't be pickled (for example confluent-kafka C exceptions)
+        send a RuntimeError.
+        """
+        try:
+            self._child_connection.send((_ERROR, err))
+        except (PicklingError, TypeError):
+            self._child_connection.send((_ERROR, RuntimeError(str(err))))
+
+    # --- PARENT PROCESS METHODS --- #
+
+    @property
+    def connection(self) -> Connection:
+        return self._connection
+
+    def send(self, kind: str, payload: Any) -> None:
+        self._inbox.put((kind, payload))
+
+    def add_exception(self, err: BaseException) -> None:
+        self._exceptions.append(err)
+
+    def raise_for_error(self) -> None:
+        """
+        Raise a `WorkerException` if the worker process has exited.
+        The workers run until the parent process stops them.
+        """
+        if self.pid is None or self.is_alive():
+            # The worker is not started yet or still running
+            return
+
+        if not self._exceptions:
+            while self.connected and self._connection.poll():
+                try:
+                    kind, payload = self._connection.recv()
+                except EOFError:
+                    break
+                if kind == _ERROR:
+                    self._exceptions.append(payload)
+
+        if self._exceptions:
+            raise WorkerException(self) from self._exceptions[-1]
+
+        if not self._stopping:
+            raise WorkerException(self)
+
+    def stop(self, fail: bool = False) -> None:
+        if self.is_alive():
+            logger.info(f"Stopping {self.name}")
+            self._stopping = True
+            self.send(_STOP, fail)
+
+
+class WorkerManager:
+    """
+    Runs the `StreamingDataFrame`s in several worker processes.
+
+    The main process owns the Kafka consumer: it polls the messages,
+    passes them to the workers owning their partitions, and commits the offsets
+    on behalf of the workers.
+    All topic partitions with the same number are assigned to the same worker,
+    and each worker has its own state stores, checkpoints and producer.
+
+    When a worker falls behind by more than `max_pending_messages`,
+    its partitions are paused until it catches up.
+    """
+
+    def __init__(
+        self,
+        app_factory: Callable[[], "Application"],
+        workers: int,
+        consumer: Consumer,
+        max_pending_messages: int = 10000,
+        shutdown_timeout: float = 30,
+    ):
+        """
+        :param app_factory: a picklable function creating the `Application`
+            in the worker processes.
+        :param workers: the number of worker processes.
+        :param consumer: the consumer of the main process.
+        :param max_pending_messages: the maximum number of messages passed
+            to a worker and not processed yet.
+        :param shutdown_timeout: the time to wait for the workers to stop
+            before killing them.
+        """
+        self._consumer = consumer
+        self._max_pending = max_pending_messages
+        self._shutdown_timeout = shutdown_timeout
+        self.processes: List[WorkerProcess] = [
+            WorkerProcess(worker_id=i, app_factory=app_factory) for i in range(workers)
+        ]
+        self._assignment: Dict[_TP, WorkerProcess] = {}
+
+    def start_workers(self) -> None:
+        for process in self.processes:
+            logger.info(f"Starting {process.name}")
+            process.start()
+
+    def assign(self, partitions: List[TopicPartition]) -> None:
+        """
+        Assign the partitions to the workers.
+
+        :param partitions: the assigned partitions with their committed offsets
+        """
+        assignments: Dict[WorkerProcess, List[Tuple[str, int, int]]] = {}
+        for tp in partitions:
+            process = self._select_worker(tp.partition)
+            self._assignment[(tp.topic, tp.partition)] = process
+            process.partitions.add((tp.topic, tp.partition))
+            assignments.setdefault(process, []).append(
+                (tp.topic, tp.partition, tp.offset)
+            )
+
+        for process, process_partitions in assignments.items():
+            logger.debug(f"Assigning {len(process_partitions)} partitions to {process}")
+            if process.backpressured:
+                self._consumer.pause(
+                    [TopicPartition(t, p) for t, p, _ in process_partitions]
+                )
+            process.send(_ASSIGN, process_partitions)
+
+    def revoke(self, partitions: List[TopicPartition], lost: bool = False) -> None:
+        """
+        Revoke the partitions from the workers and wait until they are released.
+
+        The workers commit their checkpoints unless the partitions are lost,
+        and their requests are served meanwhile.
+        """
+        revoked: Dict[WorkerProcess, List[_TP]] = {}
+        for tp in partitions:
+            key = (tp.topic, tp.partition)
+            process = self._assignment.pop(key, None)
+            if process is None:
+                continue
+            process.partitions.discard(key)
+            process.paused_partitions.discard(key)
+            revoked.setdefault(process, []).append(key)
+
+        for process, process_partitions in revoked.items():
+            process.revoking = True
+            process.send(_LOST if lost else _REVOKE, process_partitions)
+
+        while any(p.revoking and p.connected and p.is_alive() for p in revoked):
+            self.handle_requests(timeout=0.1)
+
+    def dispatch(self, messages: List[ConfluentKafkaMessageProto]) -> None:
+        """
+        Pass the messages to the workers owning their partitions.
+
+        The messages of the partitions which are not assigned anymore are dropped.
+        """
+        assignment = self._assignment
+        batches: Dict[WorkerProcess, List[WorkerMessage]] = {}
+        for message in messages:
+            process = assignment.get((message.topic(), message.partition()))
+            if process is None:
+                continue
+            batch = batches.get(process)
+            if batch is None:
+                batch = batches[process] = []
+            batch.append(WorkerMessage.from_message(message))
+
+        for process, batch in batches.items():
+            process.send(_MESSAGES, batch)
+            process.pending += len(batch)
+            if not process.backpressured and process.pending > self._max_pending:
+                logger.debug(f"{process.name} is falling behind, pausing")
+                process.backpressured = True
+                self._consumer.pause(self._unpaused_partitions(process))
+
+    def handle_requests(self, timeout: float = 0.0) -> None:
+        """
+        Serve the requests of the workers.
+
+        :param timeout: the time to wait for the requests in seconds
+        """
+        connections = {p.connection: p for p in self.processes if p.connected}
+        if not connections:
+            return
+
+        for connection in wait(list(connections), timeout=timeout):
+            process = connections[connection]
+            try:
+                while connection.poll():
+                    kind, payload = connection.recv()
+                    self._handle_request(process, kind, payload)
+            except EOFError:
+                process.connected = False
+
+    def raise_for_error(self) -> None:
+        """
+        Raise an exception if any worker has exited
+        """
+        for process in self.processes:
+            process.raise_for_error()
+
+    def stop_workers(self, fail: bool = False) -> None:
+        """
+        Stop the workers and wait until they exit, serving their requests meanwhile.
+        The workers which don't stop within the `shutdown_timeout` are killed.
+        """
+        for process in self.processes:
+            process.stop(fail=fail)
+
+        deadline = self._shutdown_timeout
+        while deadline > 0 and any(p.is_alive() for p in self.processes):
+            self.handle_requests(timeout=0.1)
+            deadline -= 0.1
+
+        for process in self.processes:
+            if process.pid is None:
+                continue
+            if process.is_alive():
+                logger.error(
+                    f"Shutdown timeout ({self._shutdown_timeout}s) reached. "
+                    f"Force stopping {process.name}"
+                )
+                process.kill()
+            process.join(self._shutdown_timeout)
+
+        try:
+            self.raise_for_error()
+        finally:
+            for process in self.processes:
+                process.close()
+
+    def _select_worker(self, partition: int) -> WorkerProcess:
+        # Keep the partitions with the same number together,
+        # so the co-partitioned topics are processed by the same worker
+        for (_, assigned_partition), process in self._assignment.items():
+            if assigned_partition == partition:
+                return process
+        return min(self.processes, key=lambda p: len(p.partitions))
+
+    def _unpaused_partitions(self, process: WorkerProcess) -> List[TopicPartition]:
+        return [
+            TopicPartition(topic, partition)
+            for topic, partition in process.partitions - process.paused_partitions
+        ]
+
+    def _handle_request(self, process: WorkerProcess, kind: str, payload: Any):
+        if kind == _PROCESSED:
+            process.pending -= payload
+            if process.backpressured and process.pending <= self._max_pending // 2:
+                logger.debug(f"{process.name} has caught up, resuming")
+                process.backpressured = False
+                self._consumer.resume(self._unpaused_partitions(process))
+        elif kind == _COMMIT:
+            process.connection.send(self._commit(payload))
+        elif kind == _GROUP_METADATA:
+            process.connection.send(self._consumer.consumer_group_metadata())
+        elif kind == _PAUSE:
+            process.paused_partitions.update(payload)
+            self._consumer.pause([TopicPartition(t, p) for t, p in payload])
+        elif kind == _RESUME:
+            process.paused_partitions.difference_update(payload)
+            if not process.backpressured:
+                self._consumer.resume([TopicPartition(t, p) for t, p in payload])
+        elif kind == _SEEK:
+            topic, partition, offset = payload
+            self._consumer.seek(TopicPartition(topic, partition, offset))
+            process.send(_SEEKED, (topic, partition))
+        elif kind == _REVOKED:
+            process.revoking = False
+        elif kind == _ERROR:
+            process.add_exception(payload)
+
+    def _commit(
+        self, offsets: List[Tuple[str, int, int]]
+    ) -> Tuple[
+        Optional[Tuple[int, str]],
+        List[Tuple[str, int, int, Optional[Tuple[int, str]]]],
+    ]:
+        """
+        Commit the offsets of a worker.
+
+        The Kafka errors cannot be pickled, so they are passed back to the worker
+        as `(code, reason)` tuples.
+        """
+        try:
+            partitions = self._consumer.commit(
+                offsets=[TopicPartition(t, p, o) for t, p, o in offsets],
+                asynchronous=False,
+            )
+        except KafkaException as exc:
+            error: KafkaError = exc.args[0]
+            return (error.code(), error.str()), []
+
+        return None, [
+            (
+                tp.topic,
+                tp.partition,
+                tp.offset,
+                (tp.error.code(), tp.error.str()) if tp.error else None,
+            )
+            for tp in partitions
+        ]
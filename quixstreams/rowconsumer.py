@@ -1,7 +1,7 @@
 import logging
 from typing import Optional, Callable, List, Union, Mapping
 
-from confluent_kafka import KafkaError, TopicPartition
+from confluent_kafka import KafkaError, Message, TopicPartition
 
 from .error_callbacks import ConsumerErrorCallback, default_on_consumer_error
 from .exceptions import PartitionAssignmentError
@@ -145,3 +145,98 @@ class RowConsumer(Consumer):
             if to_suppress:
                 return
             raise
+
+    def consume_messages(
+        self, num_messages: int, timeout: float = None
+    ) -> List[Message]:
+        """
+        Consumes a batch of messages without deserializing them.
+
+        If Kafka returns an error for a message, the `on_error` callback is called
+        for this message, and the message is skipped if the error is suppressed.
+
+        :param num_messages: the maximum number of messages to consume
+        :param timeout: consume timeout seconds
+        :return: a list of messages (possibly empty)
+        """
+        try:
+            messages = self.consume(num_messages=num_messages, timeout=timeout)
+        except PartitionAssignmentError:
+            # Always propagate errors happened during assignment
+            raise
+        except Exception as exc:
+            to_suppress = self._on_error(exc, None, logger)
+            if to_suppress:
+                return []
+            raise
+
+        valid_messages = []
+        for msg in messages:
+            if msg.error():
+                exc = KafkaConsumerException(error=msg.error())
+                to_suppress = self._on_error(exc, msg, logger)
+                if to_suppress:
+                    continue
+                raise exc
+            valid_messages.append(msg)
+        return valid_messages
+
+    def consume_rows(self, num_messages: int, timeout: float = None) -> List[Row]:
+        """
+        Consumes a batch of messages and deserializes them to a flat list of Rows.
+
+        Each message is deserialized according to the corresponding Topic.
+        Messages ignored by deserializers (`IgnoreMessage`) are skipped.
+        If Kafka returns an error or a message fails to deserialize, the `on_error`
+        callback is called for this message, and the message is skipped
+        if the error is suppressed.
+
+        The Rows are returned in the order their messages were consumed.
+
+        :param num_messages: the maximum number of messages to consume
+        :param timeout: consume timeout seconds
+        :return: a list of Rows (possibly empty)
+        """
+        messages = self.consume_messages(num_messages=num_messages, timeout=timeout)
+
+        # Deserialize the consecutive messages of the same topic in one batch
+        rows = []
+        topics = self._topics
+        start = 0
+        for end in range(1, len(messages) + 1):
+            if end < len(messages) and (
+                messages[end].topic() == messages[start].topic()
+            ):
+                continue
+            chunk = messages[start:end]
+            start = end
+            try:
+                rows.extend(topics[chunk[0].topic()].rows_deserialize(chunk))
+            except Exception:
+                # The batch failed, deserialize the messages one by one
+                # to pass the failed ones to the error callback
+                rows.extend(self._deserialize_rows(chunk))
+        return rows
+
+    def _deserialize_rows(self, messages: List[Message]) -> List[Row]:
+        rows = []
+        topics = self._topics
+        for msg in messages:
+            try:
+                row_or_rows = topics[msg.topic()].row_deserialize(message=msg)
+            except IgnoreMessage:
+                # Deserializer decided to ignore the message
+                continue
+            except Exception as exc:
+                to_suppress = self._on_error(exc, msg, logger)
+                if to_suppress:
+                    continue
+                raise
+
+            if row_or_rows is None:
+                continue
+            elif isinstance(row_or_rows, list):
+                rows.extend(row_or_rows)
+            else:
+                rows.append(row_or_rows)
+        return rows
@@ -1,7 +1,7 @@
 import logging
 from functools import wraps
 from time import sleep
-from typing import Optional, Any, Union, Dict, Tuple, List, Callable
+from typing import Optional, Any, Union, Dict, Tuple, List, Callable, Literal, Set
 
 from confluent_kafka import TopicPartition, KafkaException, KafkaError, Message
 from confluent_kafka.admin import GroupMetadata
@@ -18,6 +18,8 @@ logger = logging.getLogger(__name__)
 
 _KEY_UNSET = object()
 
+DeliveryReports = Literal["all", "errors"]
+
 
 def _retriable_transaction_op(attempts: int, backoff_seconds: float):
     """
@@ -87,6 +89,17 @@ class RowProducer:
     :param flush_timeout: The time the producer is waiting for all messages to be delivered.
     :param transactional: whether to use Kafka transactions or not.
         Note this changes which underlying `Producer` class is used.
+    :param delivery_reports: which delivery reports to handle.
+        - "all" - handle the report of each produced message and keep
+            the offsets of the delivered messages in `RowProducer.offsets`.
+        - "errors" - handle only the reports of the failed messages.
+            It saves a Python callback per delivered message, but the offsets
+            are not tracked. Instead, the partitions produced with an explicit
+            partition number are collected, and their offsets should be queried
+            from the broker after `flush()`
+            (see `RowProducer.pop_produced_partitions()`).
+        The delivery errors are raised in both modes.
+        Default - "all".
     """
 
     def __init__(
@@ -96,7 +109,17 @@ class RowProducer:
         on_error: Optional[ProducerErrorCallback] = None,
         flush_timeout: Optional[float] = None,
         transactional: bool = False,
+        delivery_reports: DeliveryReports = "all",
     ):
+        if delivery_reports not in ("all", "errors"):
+            raise ValueError(f'Invalid delivery_reports value "{delivery_reports}"')
+        if delivery_reports == "errors":
+            # Make librdkafka trigger the delivery callbacks only on failure
+            extra_config = {
+                **(extra_config or {}),
+                "delivery.report.only.error": True,
+            }
+
         if transactional:
             self._producer = TransactionalProducer(
                 broker_address=broker_address,
@@ -114,6 +137,8 @@ class RowProducer:
             on_error or default_on_producer_error
         )
         self._tp_offsets: Dict[Tuple[str, int], int] = {}
+        self._delivery_reports = delivery_reports
+        self._produced_partitions: Set[Tuple[str, int]] = set()
         self._error: Optional[KafkaError] = None
         self._active_transaction = False
 
@@ -124,6 +149,7 @@ class RowProducer:
         key: Optional[Any] = _KEY_UNSET,
         partition: Optional[int] = None,
         timestamp: Optional[int] = None,
+        passthrough: bool = False,
     ):
         """
         Serialize Row to bytes according to the Topic serialization settings
@@ -136,18 +162,30 @@ class RowProducer:
         :param key: message key, optional
         :param partition: partition number, optional
         :param timestamp: timestamp in milliseconds, optional
+        :param passthrough: if True, produce the original key and value bytes
+            of the consumed message instead of serializing the Row, when they are
+            available.
+            The caller must ensure that the key and the value are not changed.
+            Default - `False`.
         """
 
         try:
-            # Use existing key only if no other key is provided.
-            # If key is provided - use it, even if it's None
-            key = row.key if key is _KEY_UNSET else key
-            message = topic.row_serialize(row=row, key=key)
+            raw = row.context.raw if passthrough and row.context is not None else None
+            if raw is not None:
+                key_bytes, value_bytes = raw
+                headers = row.headers
+            else:
+                # Use existing key only if no other key is provided.
+                # If key is provided - use it, even if it's None
+                key = row.key if key is _KEY_UNSET else key
+                message = topic.row_serialize(row=row, key=key)
+                key_bytes, value_bytes = message.key, message.value
+                headers = message.headers
             self.produce(
                 topic=topic.name,
-                key=message.key,
-                value=message.value,
-                headers=message.headers,
+                key=key_bytes,
+                value=value_bytes,
+                headers=headers,
                 partition=partition,
                 timestamp=timestamp,
             )
@@ -185,6 +223,8 @@ class RowProducer:
         buffer_error_max_tries: int = 3,
     ):
         self._raise_for_error()
+        if self._delivery_reports == "errors" and partition is not None:
+            self._produced_partitions.add((topic, partition))
 
         return self._producer.produce(
             topic=topic,
@@ -224,6 +264,21 @@ class RowProducer:
     def offsets(self) -> Dict[Tuple[str, int], int]:
         return self._tp_offsets
 
+    @property
+    def delivery_reports(self) -> DeliveryReports:
+        return self._delivery_reports
+
+    def pop_produced_partitions(self) -> Set[Tuple[str, int]]:
+        """
+        Get the partitions produced with an explicit partition number
+        since the previous call, and reset them.
+
+        It's used when `delivery_reports="errors"` to know which partitions
+        need their offsets to be queried after `flush()`.
+        """
+        produced, self._produced_partitions = self._produced_partitions, set()
+        return produced
+
     def begin_transaction(self):
         self._producer.begin_transaction()
         self._active_transaction = True
@@ -247,6 +302,7 @@ class RowProducer:
                 # Only log here to avoid polluting logging with empty checkpoint aborts
                 logger.debug("Aborting Kafka transaction and clearing producer offsets")
                 self._tp_offsets = {}
+            self._produced_partitions = set()
             self._producer.abort_transaction(timeout)
             self._active_transaction = False
         else:
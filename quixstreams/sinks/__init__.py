@@ -1,6 +1,14 @@
-from .base import BatchingSink, SinkBatch, BaseSink, SinkBackpressureError, SinkManager
+from .base import (
+    AsyncBatchingSink,
+    BatchingSink,
+    SinkBatch,
+    BaseSink,
+    SinkBackpressureError,
+    SinkManager,
+)
 
 __all__ = [
+    "AsyncBatchingSink",
     "BaseSink",
     "BatchingSink",
     "SinkBackpressureError",
@@ -1,12 +1,13 @@
 from .batch import SinkBatch
 from .exceptions import SinkBackpressureError
 from .manager import SinkManager
-from .sink import BatchingSink, BaseSink
+from .sink import AsyncBatchingSink, BatchingSink, BaseSink
 
 __all__ = (
     "SinkBatch",
     "SinkBackpressureError",
     "SinkManager",
+    "AsyncBatchingSink",
     "BatchingSink",
     "BaseSink",
 )
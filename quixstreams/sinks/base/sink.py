@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Tuple
 
 from quixstreams.models import HeaderValue
 from quixstreams.sinks.base.batch import SinkBatch
+from quixstreams.utils.aio import run_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -137,3 +138,53 @@ class BatchingSink(BaseSink):
         When the destination is already backpressure, drop the accumulated batch.
         """
         self._batches.pop((topic, partition), None)
+
+
+class AsyncBatchingSink(BatchingSink):
+    """
+    A base class for batching sinks writing the data with asyncio.
+
+    Override the `write()` coroutine to implement a custom async sink.
+
+    When the checkpoint is committed, the batches of all partitions are written
+    concurrently in the application event loop, so many writes can be in flight
+    at the same time.
+    """
+
+    def __repr__(self):
+        return f"<AsyncBatchingSink: {self.__class__.__name__}>"
+
+    @abc.abstractmethod
+    async def write(self, batch: SinkBatch):
+        """
+        This coroutine implements actual writing to the external destination.
+
+        It may also raise `SinkBackpressureError` if the destination cannot accept new
+        writes at the moment.
+        When this happens, the accumulated batch is dropped and the app pauses the
+        corresponding topic partition.
+        """
+
+    def flush(self, topic: str, partition: int):
+        """
+        Flush an accumulated batch to the destination and wait until it's written.
+        """
+        run_coroutine(self.flush_async(topic=topic, partition=partition))
+
+    async def flush_async(self, topic: str, partition: int):
+        """
+        Flush an accumulated batch to the destination and drop it afterward.
+        """
+        batch = self._batches.get((topic, partition))
+        if batch is None:
+            return
+
+        logger.debug(
+            f'Flushing sink "{self}" for partition "{topic}[{partition}]; '
+            f'total_records={batch.size}"'
+        )
+        try:
+            await self.write(batch)
+        finally:
+            # Always drop the batch after flushing it
+            self._batches.pop((topic, partition), None)
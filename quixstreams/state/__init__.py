@@ -1,5 +1,6 @@
 # ruff: noqa: F403
 from .manager import *
 from .recovery import *
+from .standby import *
 from .types import *
 from .base import *
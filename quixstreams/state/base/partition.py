@@ -1,15 +1,16 @@
 import logging
 
 from abc import ABC, abstractmethod
-from typing import Optional, Union, Any, TYPE_CHECKING
+from typing import Optional, Union, Any, TYPE_CHECKING, List, Tuple
 
 from quixstreams.models import ConfluentKafkaMessageProto
 from quixstreams.state.exceptions import ColumnFamilyHeaderMissing
 from quixstreams.state.metadata import (
     CHANGELOG_CF_MESSAGE_HEADER,
     CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER,
+    UNDEFINED,
 )
-from quixstreams.state.serialization import DumpsFunc, LoadsFunc
+from quixstreams.state.serialization import DumpsFunc, LoadsFunc, deserialize
 from quixstreams.utils.json import loads as json_loads
 
 from .transaction import PartitionTransaction, PartitionTransactionCache
@@ -97,6 +98,25 @@ class StorePartition(ABC):
         :return: a value if the key is present in the store. Otherwise, `default`
         """
 
+    def get_value(
+        self, key: bytes, default: Any = None, cf_name: str = "default"
+    ) -> Any:
+        """
+        Get a key from the store and deserialize its value.
+
+        Subclasses may override it to avoid deserializing the same values repeatedly.
+
+        :param key: a key encoded to `bytes`
+        :param default: a default value to return if the key is not found.
+        :param cf_name: rocksdb column family name. Default - "default"
+        :return: a deserialized value if the key is present in the store.
+            Otherwise, `default`
+        """
+        stored = self.get(key, UNDEFINED, cf_name)
+        if stored is UNDEFINED:
+            return default
+        return deserialize(stored, loads=self._loads)
+
     @abstractmethod
     def exists(self, key: bytes, cf_name: str = "default") -> bool:
         """
@@ -120,6 +140,26 @@ class StorePartition(ABC):
             changelog_producer=self._changelog_producer,
         )
 
+    def _recover_from_changelog_messages(
+        self,
+        changelog_messages: List[Tuple[ConfluentKafkaMessageProto, str, Optional[int]]],
+        committed_offset: int,
+    ):
+        """
+        Updates state from a batch of changelog messages.
+
+        By default, messages are applied one by one.
+        Subclasses may override it to apply the whole batch at once.
+
+        :param changelog_messages: a list of tuples with the changelog message,
+            its column family name and its processed offset.
+        :param committed_offset: latest committed offset for the partition
+        """
+        for changelog_message, cf_name, processed_offset in changelog_messages:
+            self._recover_from_changelog_message(
+                changelog_message, cf_name, processed_offset, committed_offset
+            )
+
     def recover_from_changelog_message(
         self, changelog_message: ConfluentKafkaMessageProto, committed_offset: int
     ):
@@ -129,6 +169,56 @@ class StorePartition(ABC):
         :param changelog_message: A raw Confluent message read from a changelog topic.
         :param committed_offset: latest committed offset for the partition
         """
+        cf_name, processed_offset = self._parse_changelog_headers(changelog_message)
+        self._recover_from_changelog_message(
+            changelog_message,
+            cf_name,
+            processed_offset,
+            committed_offset,
+        )
+
+    def recover_from_changelog_messages(
+        self,
+        changelog_messages: List[ConfluentKafkaMessageProto],
+        committed_offset: int,
+    ):
+        """
+        Updates state from a batch of changelog messages read from the same
+        changelog topic partition.
+
+        :param changelog_messages: A list of raw Confluent messages read from
+            a changelog topic, ordered by offset.
+        :param committed_offset: latest committed offset for the partition
+        """
+        if not changelog_messages:
+            return
+
+        self._recover_from_changelog_messages(
+            [
+                (message, *self._parse_changelog_headers(message))
+                for message in changelog_messages
+            ],
+            committed_offset,
+        )
+
+    def complete_recovery(self):
+        """
+        Called once the partition is fully recovered from the changelog.
+
+        Subclasses may override it to persist the recovered data
+        (e.g. if the recovery writes bypassed the durability guarantees).
+        """
+
+    def _parse_changelog_headers(
+        self, changelog_message: ConfluentKafkaMessageProto
+    ) -> Tuple[str, Optional[int]]:
+        """
+        Parse the column family name and the processed offset from the
+        changelog message headers.
+
+        :param changelog_message: A raw Confluent message read from a changelog topic.
+        :return: a tuple with column family name and processed offset
+        """
         headers = dict(changelog_message.headers() or ())
         # Parse the column family name from message headers
         cf_name = headers.get(CHANGELOG_CF_MESSAGE_HEADER, b"").decode()
@@ -143,13 +233,7 @@ class StorePartition(ABC):
         processed_offset = json_loads(
             headers.get(CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER, b"null")
         )
-
-        self._recover_from_changelog_message(
-            changelog_message,
-            cf_name,
-            processed_offset,
-            committed_offset,
-        )
+        return cf_name, processed_offset
 
     def _should_apply_changelog(
         self, processed_offset: Optional[int], committed_offset: int
@@ -30,8 +30,16 @@ class State(ABC):
     def set(self, key: Any, value: Any):
         """
         Set value for the key.
+
+        The value is kept as a Python object until the next checkpoint, and it is
+        serialized only once when the checkpoint is committed.
+        The changes made to the object after this call are saved too.
+
         :param key: key
         :param value: value
+        :raises StateSerializationError: if the key cannot be serialized.
+            The value serialization errors are raised when the checkpoint
+            is committed.
         """
         ...
 
@@ -83,8 +91,16 @@ class TransactionState(State):
     def set(self, key: Any, value: Any):
         """
         Set value for the key.
+
+        The value is kept as a Python object until the next checkpoint, and it is
+        serialized only once when the checkpoint is committed.
+        The changes made to the object after this call are saved too.
+
         :param key: key
         :param value: value
+        :raises StateSerializationError: if the key cannot be serialized.
+            The value serialization errors are raised when the checkpoint
+            is committed.
         """
         return self._transaction.set(key=key, value=value, prefix=self._prefix)
 
@@ -5,7 +5,11 @@ from abc import ABC
 from collections import defaultdict
 from typing import Any, Optional, Dict, Tuple, Union, TYPE_CHECKING, Set
 
-from quixstreams.state.exceptions import StateTransactionError, InvalidChangelogOffset
+from quixstreams.state.exceptions import (
+    InvalidChangelogOffset,
+    StateSerializationError,
+    StateTransactionError,
+)
 from quixstreams.state.metadata import (
     CHANGELOG_CF_MESSAGE_HEADER,
     CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER,
@@ -39,6 +43,11 @@ class PartitionTransactionCache:
 
     Internally, updates and deletes are separated into two separate structures
     to simplify the querying over them.
+
+    The updated values are kept as they were passed to it.
+    `PartitionTransaction` keeps the Python objects here while the transaction
+    is open and serializes them once before producing them to the changelog
+    and writing them to the Store.
     """
 
     def __init__(self):
@@ -46,7 +55,7 @@ class PartitionTransactionCache:
         # Note: "updates" are bucketed per prefix to speed up iterating over the
         # specific set of keys when we merge updates with data from the stores.
         # Using a prefix like that allows us to perform fewer iterations.
-        self._updated: dict[str, dict[bytes, dict[bytes, bytes]]] = defaultdict(
+        self._updated: dict[str, dict[bytes, dict[bytes, Any]]] = defaultdict(
             lambda: defaultdict(dict)
         )
         # Dict of sets with deleted keys in format {<cf>: set[<key1>, <key2>]}
@@ -60,7 +69,7 @@ class PartitionTransactionCache:
         key: bytes,
         prefix: bytes,
         cf_name: str = "default",
-    ) -> Union[bytes, Undefined]:
+    ) -> Union[Any, Undefined]:
         """
         Get a value for the key.
 
@@ -85,12 +94,12 @@ class PartitionTransactionCache:
         # UNDEFINED to signify that
         return self._updated[cf_name][prefix].get(key, UNDEFINED)
 
-    def set(self, key: bytes, value: bytes, prefix: bytes, cf_name: str = "default"):
+    def set(self, key: bytes, value: Any, prefix: bytes, cf_name: str = "default"):
         """
         Set a value for the key.
 
         :param: key: key as bytes
-        :param: value: value as bytes
+        :param: value: value
         :param: prefix: key prefix as bytes
         :param: cf_name: column family name
         """
@@ -124,7 +133,7 @@ class PartitionTransactionCache:
         """
         return set(self._updated.keys()) | set(self._deleted.keys())
 
-    def get_updates(self, cf_name: str = "default") -> Dict[bytes, Dict[bytes, bytes]]:
+    def get_updates(self, cf_name: str = "default") -> Dict[bytes, Dict[bytes, Any]]:
         """
         Get all updated keys (excluding deleted)
         in the format "{<prefix>: {<key>: <value>}}".
@@ -175,6 +184,12 @@ class PartitionTransaction(ABC):
     """
     A transaction class to perform simple key-value operations like
     "get", "set", "delete" and "exists" on a single storage partition.
+
+    The values passed to "set" are kept in the update cache as Python objects,
+    and they are serialized only once when the transaction is prepared or flushed.
+    Because of that, the changes made to the objects after "set" are saved too,
+    and the value serialization errors are raised by "prepare" or "flush"
+    with the key of the failed value.
     """
 
     def __init__(
@@ -193,6 +208,7 @@ class PartitionTransaction(ABC):
         self._partition = partition
 
         self._update_cache = PartitionTransactionCache()
+        self._updates_serialized = False
 
     @property
     def changelog_producer(self) -> Optional["ChangelogProducer"]:
@@ -304,13 +320,9 @@ class PartitionTransaction(ABC):
             return default
 
         if cached is not UNDEFINED:
-            return self._deserialize_value(cached)
+            return cached
 
-        stored = self._partition.get(key_serialized, UNDEFINED, cf_name)
-        if stored is UNDEFINED:
-            return default
-
-        return self._deserialize_value(stored)
+        return self._partition.get_value(key_serialized, default, cf_name)
 
     @validate_transaction_status(PartitionTransactionStatus.STARTED)
     def set(self, key: Any, value: Any, prefix: bytes, cf_name: str = "default"):
@@ -324,10 +336,9 @@ class PartitionTransaction(ABC):
 
         try:
             key_serialized = self._serialize_key(key, prefix=prefix)
-            value_serialized = self._serialize_value(value)
             self._update_cache.set(
                 key=key_serialized,
-                value=value_serialized,
+                value=value,
                 prefix=prefix,
                 cf_name=cf_name,
             )
@@ -391,12 +402,40 @@ class PartitionTransaction(ABC):
         """
 
         try:
+            self._serialize_updates()
             self._prepare(processed_offset=processed_offset)
             self._status = PartitionTransactionStatus.PREPARED
         except Exception:
             self._status = PartitionTransactionStatus.FAILED
             raise
 
+    def _serialize_updates(self):
+        """
+        Serialize the updated values in the update cache in place.
+
+        Each updated key is serialized only once, no matter how many times
+        it was updated during the transaction.
+
+        :raises StateSerializationError: if a value cannot be serialized.
+            The error message contains the state key of the value.
+        """
+        if self._updates_serialized:
+            return
+
+        for cf_name in self._update_cache.get_column_families():
+            updates = self._update_cache.get_updates(cf_name=cf_name)
+            for prefix_update_cache in updates.values():
+                for key, value in prefix_update_cache.items():
+                    try:
+                        prefix_update_cache[key] = self._serialize_value(value)
+                    except StateSerializationError as exc:
+                        raise StateSerializationError(
+                            f"Failed to serialize the state value "
+                            f'of the key {key!r} in the column family "{cf_name}": '
+                            f"{exc}"
+                        ) from exc
+        self._updates_serialized = True
+
     def _prepare(self, processed_offset: int):
         if self._changelog_producer is None:
             return
@@ -458,6 +497,7 @@ class PartitionTransaction(ABC):
             optional.
         """
         try:
+            self._serialize_updates()
             self._flush(processed_offset, changelog_offset)
             self._status = PartitionTransactionStatus.COMPLETE
         except Exception:
@@ -35,3 +35,9 @@ class ColumnFamilyHeaderMissing(StateError): ...
 
 
 class InvalidChangelogOffset(StateError): ...
+
+
+class ColumnFamilyDoesNotExist(StateError): ...
+
+
+class ColumnFamilyAlreadyExists(StateError): ...
@@ -1,7 +1,8 @@
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Union, Type, get_args
+from typing import List, Dict, Optional, Union, Type, Sequence, Tuple
 
 from quixstreams.rowproducer import RowProducer
 from .exceptions import (
@@ -10,9 +11,11 @@ from .exceptions import (
     WindowedStoreAlreadyRegisteredError,
 )
 from .recovery import RecoveryManager, ChangelogProducerFactory
-from .rocksdb import RocksDBStore, RocksDBOptionsType
+from .rocksdb import RocksDBStore, RocksDBOptionsType, SnapshotManager
 from .rocksdb.windowed.store import WindowedRocksDBStore
+from .memory import MemoryStore, MemoryStoreOptions
 from .base import Store, StorePartition
+from .standby import StandbyManager
 
 __all__ = ("StateStoreManager", "DEFAULT_STATE_STORE_NAME", "StoreTypes")
 
@@ -20,8 +23,8 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_STATE_STORE_NAME = "default"
 
-StoreTypes = Union[Type[RocksDBStore]]
-SUPPORTED_STORES = get_args(StoreTypes)
+StoreTypes = Union[Type[RocksDBStore], Type[MemoryStore]]
+SUPPORTED_STORES = [RocksDBStore, MemoryStore]
 
 
 class StateStoreManager:
@@ -42,13 +45,21 @@ class StateStoreManager:
         producer: Optional[RowProducer] = None,
         recovery_manager: Optional[RecoveryManager] = None,
         default_store_type: StoreTypes = RocksDBStore,
+        memory_store_options: Optional[MemoryStoreOptions] = None,
+        assign_max_workers: int = 8,
+        standby_manager: Optional[StandbyManager] = None,
+        snapshot_manager: Optional[SnapshotManager] = None,
     ):
         self._state_dir = (Path(state_dir) / group_id).absolute()
         self._rocksdb_options = rocksdb_options
+        self._memory_store_options = memory_store_options
         self._stores: Dict[str, Dict[str, Store]] = {}
         self._producer = producer
         self._recovery_manager = recovery_manager
         self._default_store_type = default_store_type
+        self._assign_max_workers = assign_max_workers
+        self._standby_manager = standby_manager
+        self._snapshot_manager = snapshot_manager
 
     def _init_state_dir(self):
         logger.info(f'Initializing state directory at "{self._state_dir}"')
@@ -105,6 +116,25 @@ class StateStoreManager:
         """
         return self._recovery_manager.stop_recovery()
 
+    def update_standby_replicas(self):
+        """
+        Apply the available changelog updates to the standby replicas
+        of the store partitions, if they are enabled.
+        """
+        if self._standby_manager and self._stores:
+            self._standby_manager.update(self._stores)
+
+    def snapshot_stores(self):
+        """
+        Take the snapshots of the assigned RocksDB store partitions
+        if they are due and the snapshots are enabled.
+        """
+        if self._snapshot_manager:
+            for topic_stores in self._stores.values():
+                for store in topic_stores.values():
+                    if isinstance(store, RocksDBStore):
+                        store.snapshot_partitions()
+
     def get_store(
         self, topic: str, store_name: str = DEFAULT_STATE_STORE_NAME
     ) -> Store:
@@ -168,6 +198,15 @@ class StateStoreManager:
                     base_dir=str(self._state_dir),
                     changelog_producer_factory=changelog_producer_factory,
                     options=self._rocksdb_options,
+                    snapshot_manager=self._snapshot_manager,
+                )
+            elif store_type == MemoryStore:
+                factory = MemoryStore(
+                    name=store_name,
+                    topic=topic_name,
+                    base_dir=str(self._state_dir),
+                    changelog_producer_factory=changelog_producer_factory,
+                    options=self._memory_store_options,
                 )
             else:
                 raise ValueError(f"invalid store type: {store_type}")
@@ -198,6 +237,7 @@ class StateStoreManager:
             base_dir=str(self._state_dir),
             changelog_producer_factory=self._setup_changelogs(topic_name, store_name),
             options=self._rocksdb_options,
+            snapshot_manager=self._snapshot_manager,
         )
 
     def clear_stores(self):
@@ -227,19 +267,71 @@ class StateStoreManager:
         :param committed_offset: latest committed offset for the partition
         :return: list of assigned `StorePartition`
         """
+        assigned = self.on_partitions_assign([(topic, partition, committed_offset)])
+        return assigned[(topic, partition)]
 
-        store_partitions = {}
-        for name, store in self._stores.get(topic, {}).items():
-            store_partition = store.assign_partition(partition)
-            store_partitions[name] = store_partition
-        if self._recovery_manager and store_partitions:
-            self._recovery_manager.assign_partition(
-                topic=topic,
-                partition=partition,
-                committed_offset=committed_offset,
-                store_partitions=store_partitions,
-            )
-        return list(store_partitions.values())
+    def on_partitions_assign(
+        self, topic_partitions: Sequence[Tuple[str, int, int]]
+    ) -> Dict[Tuple[str, int], List[StorePartition]]:
+        """
+        Assign store partitions for many topic partitions at once and return
+        the assigned `StorePartition` objects per topic partition.
+
+        The store partitions are opened concurrently in a thread pool, because
+        opening a store partition may take a while (e.g. when RocksDB
+        retries to acquire a lock).
+        The partitions are then registered for recovery one by one.
+
+        If the standby replicas are enabled, the standby store partitions are
+        closed first, and their state is reused by the assigned partitions.
+
+        :param topic_partitions: a sequence of
+            `(<topic>, <partition>, <committed offset>)` tuples
+        :return: dict in format {(topic, partition): [store_partition, ...]}
+        """
+        if self._standby_manager:
+            for topic, partition, _ in topic_partitions:
+                self._standby_manager.release(topic=topic, partition=partition)
+            self._standby_manager.request_reconcile()
+
+        to_open = [
+            (topic, partition, name, store)
+            for topic, partition, _ in topic_partitions
+            for name, store in self._stores.get(topic, {}).items()
+        ]
+        if len(to_open) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(to_open), self._assign_max_workers),
+                thread_name_prefix="quixstreams-state-assign",
+            ) as executor:
+                futures = [
+                    executor.submit(store.assign_partition, partition)
+                    for _, partition, _, store in to_open
+                ]
+            # The executor waits for all the partitions to be opened
+            # before raising the first error, if any
+            opened = [future.result() for future in futures]
+        else:
+            opened = [
+                store.assign_partition(partition) for _, partition, _, store in to_open
+            ]
+
+        store_partitions: Dict[Tuple[str, int], Dict[str, StorePartition]] = {}
+        for (topic, partition, name, _), store_partition in zip(to_open, opened):
+            store_partitions.setdefault((topic, partition), {})[name] = store_partition
+
+        result = {}
+        for topic, partition, committed_offset in topic_partitions:
+            tp_store_partitions = store_partitions.get((topic, partition), {})
+            if self._recovery_manager and tp_store_partitions:
+                self._recovery_manager.assign_partition(
+                    topic=topic,
+                    partition=partition,
+                    committed_offset=committed_offset,
+                    store_partitions=tp_store_partitions,
+                )
+            result[(topic, partition)] = list(tp_store_partitions.values())
+        return result
 
     def on_partition_revoke(self, topic: str, partition: int):
         """
@@ -253,6 +345,8 @@ class StateStoreManager:
                 self._recovery_manager.revoke_partition(partition_num=partition)
             for store in stores:
                 store.revoke_partition(partition=partition)
+            if self._standby_manager:
+                self._standby_manager.request_reconcile()
 
     def init(self):
         """
@@ -263,8 +357,12 @@ class StateStoreManager:
 
     def close(self):
         """
-        Close all registered stores
+        Close all registered stores and the standby replicas
         """
+        if self._standby_manager:
+            self._standby_manager.close()
+        if self._snapshot_manager:
+            self._snapshot_manager.close()
         for topic_stores in self._stores.values():
             for store in topic_stores.values():
                 store.close()
@@ -0,0 +1,4 @@
+# ruff: noqa: F403
+from .options import *
+from .partition import *
+from .store import *
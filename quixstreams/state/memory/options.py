@@ -0,0 +1,34 @@
+import dataclasses
+from typing import Optional
+
+from quixstreams.state.serialization import DumpsFunc, LoadsFunc
+from quixstreams.utils.json import dumps, loads
+
+__all__ = ("MemoryStoreOptions",)
+
+
+@dataclasses.dataclass(frozen=True)
+class MemoryStoreOptions:
+    """
+    In-memory state store options.
+
+    :param dumps: function to dump data to JSON
+    :param loads: function to load data from JSON
+    :param snapshot_interval: how often to save the snapshots of the store partitions
+        to the local disk, in seconds.
+        The snapshots are taken after the state is flushed, and when the partition
+        is closed.
+        The periodic snapshots are pickled and written to disk in a background
+        thread, and the processing thread only copies the references to the data,
+        which still takes time proportional to the number of keys.
+        The snapshot on close is saved synchronously.
+        On the next assignment, the partition is loaded from its snapshot,
+        and only the changelog messages produced after it need to be recovered.
+        If `None`, the snapshots are disabled, and the partitions are fully recovered
+        from the changelog topics on every assignment.
+        Default - `None`.
+    """
+
+    dumps: DumpsFunc = dumps
+    loads: LoadsFunc = loads
+    snapshot_interval: Optional[float] = None
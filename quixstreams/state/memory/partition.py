@@ -0,0 +1,320 @@
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union, cast
+
+from quixstreams.models import ConfluentKafkaMessageProto
+from quixstreams.state.base import StorePartition, PartitionTransactionCache
+from quixstreams.state.exceptions import (
+    ColumnFamilyAlreadyExists,
+    ColumnFamilyDoesNotExist,
+)
+from quixstreams.state.recovery import ChangelogProducer
+from .options import MemoryStoreOptions
+
+__all__ = ("MemoryStorePartition",)
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_VERSION = 1
+
+
+class MemoryStorePartition(StorePartition):
+    """
+    A class to access state kept in memory.
+
+    The data is stored in Python dictionaries in the format
+    `{<cf_name>: {<key>: <value>}}`, where keys and values are serialized bytes,
+    so the state can be produced to and recovered from the changelog topics
+    the same way as the persistent stores do it.
+
+    If `snapshot_interval` is set in the options, the partition periodically saves
+    a compact snapshot of its data and offsets to `snapshot_path`, and loads
+    the snapshot back on `__init__`.
+    The periodic snapshots are saved in a background thread: only the references
+    to the stored values are copied on the processing thread, and the copy
+    is pickled and written to disk in the background.
+
+    :param snapshot_path: an absolute path to the snapshot file, optional.
+    :param options: in-memory store options.
+        If `None`, the default options will be used.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Optional[str] = None,
+        options: Optional[MemoryStoreOptions] = None,
+        changelog_producer: Optional[ChangelogProducer] = None,
+    ):
+        if not options:
+            options = MemoryStoreOptions()
+
+        super().__init__(options.dumps, options.loads, changelog_producer)
+        self._options = options
+        self._snapshot_path = snapshot_path
+        self._snapshot_interval = options.snapshot_interval
+        self._state: Dict[str, Dict[bytes, bytes]] = {"default": {}}
+        self._processed_offset: Optional[int] = None
+        self._changelog_offset: Optional[int] = None
+        self._last_snapshot_at = time.monotonic()
+        self._snapshot_dirty = False
+        self._snapshot_thread: Optional[threading.Thread] = None
+        if self._snapshots_enabled:
+            self._load_snapshot()
+
+    @property
+    def _snapshots_enabled(self) -> bool:
+        return self._snapshot_interval is not None and self._snapshot_path is not None
+
+    def _recover_from_changelog_message(
+        self,
+        changelog_message: ConfluentKafkaMessageProto,
+        cf_name: str,
+        processed_offset: Optional[int],
+        committed_offset: int,
+    ):
+        """
+        Updates state from a given changelog message.
+
+        The update is skipped if the changelog message belongs to the source topic
+        offset which is not committed yet.
+
+        :param changelog_message: A raw Confluent message read from a changelog topic.
+        :param cf_name: column family name
+        :param processed_offset: changelog message processed offset.
+        :param committed_offset: latest committed offset for the partition
+        """
+        if self._should_apply_changelog(processed_offset, committed_offset):
+            cf = self._state.setdefault(cf_name, {})
+            key = changelog_message.key()
+            if value := changelog_message.value():
+                cf[key] = value
+            else:
+                cf.pop(key, None)
+
+        self._changelog_offset = changelog_message.offset()
+        self._snapshot_dirty = True
+
+    def write(
+        self,
+        cache: PartitionTransactionCache,
+        processed_offset: Optional[int],
+        changelog_offset: Optional[int],
+    ):
+        """
+        Apply the updates from the transaction cache to the in-memory state.
+
+        :param cache: The modified data
+        :param processed_offset: The offset processed to generate the data.
+        :param changelog_offset: The changelog message offset of the data.
+        """
+        for cf_name in cache.get_column_families():
+            cf = self._state.setdefault(cf_name, {})
+
+            updates = cache.get_updates(cf_name=cf_name)
+            for prefix_update_cache in updates.values():
+                cf.update(prefix_update_cache)
+
+            deletes = cache.get_deletes(cf_name=cf_name)
+            for key in deletes:
+                cf.pop(key, None)
+
+        if processed_offset is not None:
+            self._processed_offset = processed_offset
+        if changelog_offset is not None:
+            self._changelog_offset = changelog_offset
+        self._snapshot_dirty = True
+
+        if (
+            self._snapshots_enabled
+            and time.monotonic() - self._last_snapshot_at >= self._snapshot_interval
+        ):
+            self._snapshot_in_background()
+
+    def get(
+        self, key: bytes, default: Any = None, cf_name: str = "default"
+    ) -> Union[None, bytes, Any]:
+        """
+        Get a key from the store.
+
+        :param key: a key encoded to `bytes`
+        :param default: a default value to return if the key is not found.
+        :param cf_name: column family name. Default - "default"
+        :return: a value if the key is present in the store. Otherwise, `default`
+        """
+        cf = self._state.get(cf_name)
+        if cf is None:
+            return default
+        return cf.get(key, default)
+
+    def exists(self, key: bytes, cf_name: str = "default") -> bool:
+        """
+        Check if a key is present in the store.
+
+        :param key: a key encoded to `bytes`.
+        :param cf_name: column family name. Default - "default"
+        :return: `True` if the key is present, `False` otherwise.
+        """
+        cf = self._state.get(cf_name)
+        return cf is not None and key in cf
+
+    def get_processed_offset(self) -> Optional[int]:
+        """
+        Get last processed offset for the given partition
+        :return: offset or `None` if there's no processed offset yet
+        """
+        return self._processed_offset
+
+    def get_changelog_offset(self) -> Optional[int]:
+        """
+        Get offset that the changelog is up-to-date with.
+        :return: offset or `None` if there's no processed offset yet
+        """
+        return self._changelog_offset
+
+    def create_column_family(self, cf_name: str):
+        if cf_name in self._state:
+            raise ColumnFamilyAlreadyExists(
+                f'Column family already exists: "{cf_name}"'
+            )
+        self._state[cf_name] = {}
+
+    def drop_column_family(self, cf_name: str):
+        try:
+            del self._state[cf_name]
+        except KeyError:
+            raise ColumnFamilyDoesNotExist(f'Column family does not exist: "{cf_name}"')
+        self._snapshot_dirty = True
+
+    def list_column_families(self) -> List[str]:
+        return list(self._state)
+
+    def snapshot(self):
+        """
+        Save a snapshot of the partition data and offsets to `snapshot_path`.
+
+        It waits for the snapshot being saved in the background to complete first.
+        The snapshot is first written to a temporary file, which then atomically
+        replaces the previous snapshot.
+        """
+        if self._snapshot_path is None:
+            return
+
+        self._wait_for_snapshot()
+        snapshot = self._copy_snapshot()
+        self._snapshot_dirty = False
+        self._save_snapshot(snapshot)
+
+    def _snapshot_in_background(self):
+        """
+        Copy the partition data and save it to `snapshot_path` in a background
+        thread, so the processing is not paused while the data is pickled.
+
+        If the previous snapshot is still being saved, the new one is skipped
+        until the next write.
+        """
+        if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+            return
+
+        snapshot = self._copy_snapshot()
+        self._snapshot_dirty = False
+        self._last_snapshot_at = time.monotonic()
+        self._snapshot_thread = threading.Thread(
+            target=self._save_snapshot_in_background,
+            args=(snapshot,),
+            name=f"quixstreams-memory-snapshot-{self._snapshot_path}",
+            daemon=True,
+        )
+        self._snapshot_thread.start()
+
+    def _save_snapshot_in_background(self, snapshot: dict):
+        try:
+            self._save_snapshot(snapshot)
+        except Exception:
+            logger.exception(
+                f'Failed to save in-memory state snapshot path="{self._snapshot_path}"'
+            )
+            # Retry on the next interval or on close
+            self._snapshot_dirty = True
+
+    def _wait_for_snapshot(self):
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+            self._snapshot_thread = None
+
+    def _copy_snapshot(self) -> dict:
+        """
+        Copy the references to the partition data and offsets.
+
+        The keys and values are immutable bytes, so only the column family
+        dicts are copied.
+        """
+        return {
+            "version": _SNAPSHOT_VERSION,
+            "processed_offset": self._processed_offset,
+            "changelog_offset": self._changelog_offset,
+            "state": {cf_name: cf.copy() for cf_name, cf in self._state.items()},
+        }
+
+    def _save_snapshot(self, snapshot: dict):
+        path = Path(cast(str, self._snapshot_path))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        start = time.monotonic()
+        with open(tmp_path, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        self._last_snapshot_at = time.monotonic()
+        logger.debug(
+            f'Saved in-memory state snapshot path="{path}" '
+            f'processed_offset={snapshot["processed_offset"]} '
+            f'changelog_offset={snapshot["changelog_offset"]} '
+            f"time_elapsed={round(self._last_snapshot_at - start, 2)}s"
+        )
+
+    def _load_snapshot(self):
+        path = Path(self._snapshot_path)
+        if not path.exists():
+            return
+
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)  # noqa: S301
+
+        if snapshot.get("version") != _SNAPSHOT_VERSION:
+            logger.warning(
+                f'Ignoring in-memory state snapshot path="{path}" '
+                f'with unsupported version {snapshot.get("version")}'
+            )
+            return
+
+        self._state = snapshot["state"]
+        self._processed_offset = snapshot["processed_offset"]
+        self._changelog_offset = snapshot["changelog_offset"]
+        logger.debug(
+            f'Loaded in-memory state snapshot path="{path}" '
+            f"processed_offset={self._processed_offset} "
+            f"changelog_offset={self._changelog_offset}"
+        )
+
+    def close(self):
+        """
+        Save the final snapshot if snapshots are enabled and drop the data.
+        """
+        self._wait_for_snapshot()
+        if self._snapshots_enabled and self._snapshot_dirty:
+            self.snapshot()
+        self._state = {"default": {}}
+
+    @property
+    def path(self) -> Optional[str]:
+        """
+        Absolute path to the snapshot file
+        :return: file path
+        """
+        return self._snapshot_path
@@ -1,9 +1,10 @@
 import logging
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from confluent_kafka import TopicPartition as ConfluentPartition
 
 from quixstreams.kafka import Consumer
+from quixstreams.kafka.exceptions import KafkaConsumerException
 from quixstreams.models import ConfluentKafkaMessageProto, Topic
 from quixstreams.models.topics import TopicManager
 from quixstreams.models.types import MessageHeadersMapping
@@ -111,6 +112,27 @@ class RecoveryPartition:
             changelog_message=changelog_message, committed_offset=self._committed_offset
         )
 
+    def recover_from_changelog_messages(
+        self, changelog_messages: List[ConfluentKafkaMessageProto]
+    ):
+        """
+        Recover the StorePartition using a batch of messages read from its respective
+        changelog.
+
+        :param changelog_messages: A list of confluent kafka messages
+            (everything as bytes) ordered by offset
+        """
+        self._store_partition.recover_from_changelog_messages(
+            changelog_messages=changelog_messages,
+            committed_offset=self._committed_offset,
+        )
+
+    def complete_recovery(self):
+        """
+        Finalize the recovery of the underlying StorePartition.
+        """
+        self._store_partition.complete_recovery()
+
     def set_watermarks(self, lowwater: int, highwater: int):
         """
         Set the changelog watermarks as gathered from Consumer.get_watermark_offsets()
@@ -226,12 +248,27 @@ class RecoveryManager:
     recovery for that changelog partition is required.
 
     Recovery is attempted from the `Application` after any new partition assignment.
+
+    Changelog messages are consumed in batches of up to `batch_size` messages,
+    and each batch is applied to the `StorePartition` at once.
     """
 
-    def __init__(self, consumer: Consumer, topic_manager: TopicManager):
+    def __init__(
+        self,
+        consumer: Consumer,
+        topic_manager: TopicManager,
+        batch_size: int = 10000,
+    ):
+        """
+        :param consumer: a Consumer instance
+        :param topic_manager: a TopicManager instance
+        :param batch_size: the maximum number of changelog messages to consume
+            and apply to the state at once. Default - `10000`.
+        """
         self._running = False
         self._consumer = consumer
         self._topic_manager = topic_manager
+        self._batch_size = batch_size
         self._recovery_partitions: Dict[int, Dict[str, RecoveryPartition]] = {}
 
     @property
@@ -422,6 +459,7 @@ class RecoveryManager:
             rp.set_recovery_consume_position(position)
             if rp.finished_recovery_check:
                 rp_revokes.append(rp)
+                rp.complete_recovery()
                 if rp.had_recovery_changes:
                     logger.info(f"Recovery successful for {rp}")
                 else:
@@ -436,11 +474,25 @@ class RecoveryManager:
         A RecoveryPartition is unassigned immediately once fully updated.
         """
         while self.recovering:
-            if (msg := self._consumer.poll(1)) is None:
+            msgs = self._consumer.consume(num_messages=self._batch_size, timeout=1)
+            if not msgs:
                 self._update_recovery_status()
-            else:
-                rp = self._recovery_partitions[msg.partition()][msg.topic()]
-                rp.recover_from_changelog_message(changelog_message=msg)
+                continue
+
+            # Group the messages by changelog partition preserving their order
+            # to apply each group at once
+            msgs_by_tp: Dict[Tuple[str, int], List[ConfluentKafkaMessageProto]] = {}
+            for msg in msgs:
+                if (err := msg.error()) is not None:
+                    raise KafkaConsumerException(error=err)
+                msgs_by_tp.setdefault((msg.topic(), msg.partition()), []).append(msg)
+
+            for (topic, partition), tp_msgs in msgs_by_tp.items():
+                rp = self._recovery_partitions.get(partition, {}).get(topic)
+                if rp is None:
+                    # The partition was revoked by a rebalance during consume()
+                    continue
+                rp.recover_from_changelog_messages(changelog_messages=tp_msgs)
 
     def stop_recovery(self):
         self._running = False
@@ -2,5 +2,6 @@
 from .exceptions import *
 from .options import *
 from .partition import *
+from .snapshots import *
 from .store import *
 from .types import *
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from typing import Any, Tuple
+
+from quixstreams.state.metadata import UNDEFINED
+
+__all__ = ("LRUValueCache",)
+
+
+class LRUValueCache:
+    """
+    A bounded cache of the deserialized state values.
+
+    It keeps up to `maxsize` values in memory and evicts the least recently
+    used ones first.
+    The values are stored per `(<cf_name>, <key>)`, where keys are serialized
+    state keys in bytes.
+
+    :param maxsize: maximum number of values to keep in the cache.
+    """
+
+    __slots__ = ("_maxsize", "_data")
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: OrderedDict[Tuple[str, bytes], Any] = OrderedDict()
+
+    def get(self, key: bytes, cf_name: str = "default") -> Any:
+        """
+        Get a cached value and mark it as the most recently used one.
+
+        :param key: a key encoded to `bytes`
+        :param cf_name: rocksdb column family name. Default - "default"
+        :return: the cached value or `UNDEFINED` sentinel if it's not cached
+        """
+        cache_key = (cf_name, key)
+        try:
+            value = self._data[cache_key]
+        except KeyError:
+            return UNDEFINED
+        self._data.move_to_end(cache_key)
+        return value
+
+    def set(self, key: bytes, value: Any, cf_name: str = "default"):
+        """
+        Cache the value and evict the least recently used one if the cache is full.
+
+        :param key: a key encoded to `bytes`
+        :param value: a deserialized value
+        :param cf_name: rocksdb column family name. Default - "default"
+        """
+        cache_key = (cf_name, key)
+        self._data[cache_key] = value
+        self._data.move_to_end(cache_key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: bytes, cf_name: str = "default") -> Any:
+        """
+        Remove the key from the cache and return its value.
+
+        :param key: a key encoded to `bytes`
+        :param cf_name: rocksdb column family name. Default - "default"
+        :return: the cached value or `UNDEFINED` sentinel if it's not cached
+        """
+        return self._data.pop((cf_name, key), UNDEFINED)
+
+    def invalidate(self, key: bytes, cf_name: str = "default"):
+        """
+        Remove the key from the cache if it's present.
+
+        :param key: a key encoded to `bytes`
+        :param cf_name: rocksdb column family name. Default - "default"
+        """
+        self._data.pop((cf_name, key), None)
+
+    def invalidate_column_family(self, cf_name: str):
+        """
+        Remove all the keys of the column family from the cache.
+
+        :param cf_name: rocksdb column family name
+        """
+        for cache_key in [k for k in self._data if k[0] == cf_name]:
+            del self._data[cache_key]
+
+    def clear(self):
+        self._data.clear()
+
+    def __contains__(self, item: Tuple[str, bytes]) -> bool:
+        return item in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
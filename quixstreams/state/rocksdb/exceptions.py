@@ -1,12 +1,9 @@
-from quixstreams.state.exceptions import StateError
+from quixstreams.state.exceptions import (
+    ColumnFamilyAlreadyExists,
+    ColumnFamilyDoesNotExist,
+)
 
 __all__ = (
     "ColumnFamilyDoesNotExist",
     "ColumnFamilyAlreadyExists",
 )
-
-
-class ColumnFamilyDoesNotExist(StateError): ...
-
-
-class ColumnFamilyAlreadyExists(StateError): ...
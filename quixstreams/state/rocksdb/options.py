@@ -31,6 +31,32 @@ class RocksDBOptions(RocksDBOptionsType):
     :param open_max_retries: number of times to retry opening the database
             if it's locked by another process. To disable retrying, pass 0
     :param open_retry_backoff: number of seconds to wait between each retry.
+    :param disable_wal_on_recovery: if `True`, the changelog updates are written
+            to the database without the write-ahead log during recovery.
+            It speeds up recovering the large stores, and the recovered data is
+            flushed to disk once the recovery is complete.
+            If the application crashes during recovery, the non-flushed updates
+            are lost and will be recovered from the changelog again.
+    :param value_cache_size: maximum number of deserialized values to keep in memory
+            per store partition.
+            The frequently read keys are served from this cache instead of being
+            read from the database and deserialized on every access.
+            The cache is kept between checkpoints and dropped when the partition
+            is revoked. Pass 0 to disable it.
+            Note: the cached values are shared between reads, so they must not be
+            mutated in place without being saved to the state with `State.set()`.
+    :param open_windows_cache_size: maximum number of message keys per windowed
+            store partition to keep the open windows for in memory.
+            The cached windows are aggregated and expired in memory, and they are
+            persisted to the database on checkpoint.
+            Pass 0 to read and expire the windows in the database on every update.
+            Default - `10000`.
+    :param window_index_cache_size: maximum number of message keys per windowed
+            store partition to keep the in-memory window indexes for
+            (e.g. the values within the sliding window of each key).
+            The keys without a cached index get it rebuilt from the state.
+            Pass 0 to aggregate the windows from the state on every update.
+            Default - `10000`.
 
     Please see `rocksdict.Options` for a complete description of other options.
     """
@@ -49,6 +75,10 @@ class RocksDBOptions(RocksDBOptionsType):
     loads: LoadsFunc = loads
     open_max_retries: int = 10
     open_retry_backoff: float = 3.0
+    disable_wal_on_recovery: bool = False
+    value_cache_size: int = 0
+    open_windows_cache_size: int = 10000
+    window_index_cache_size: int = 10000
 
     def to_options(self) -> rocksdict.Options:
         """
@@ -1,16 +1,30 @@
 import logging
 import time
-from typing import Any, Union, Optional, List, Dict
-
-from rocksdict import WriteBatch, Rdict, ColumnFamily, AccessType
+from typing import Any, Union, Optional, List, Dict, Set, Tuple, cast
+
+from rocksdict import (
+    WriteBatch,
+    Rdict,
+    ColumnFamily,
+    AccessType,
+    WriteOptions,
+    Checkpoint,
+)
 
 from quixstreams.models import ConfluentKafkaMessageProto
 from quixstreams.state.recovery import ChangelogProducer
-from quixstreams.state.base import StorePartition, PartitionTransactionCache
+from quixstreams.state.base import (
+    PartitionTransaction,
+    PartitionTransactionCache,
+    StorePartition,
+)
+from quixstreams.state.metadata import UNDEFINED
 from quixstreams.state.serialization import (
+    deserialize,
     int_from_int64_bytes,
     int_to_int64_bytes,
 )
+from .cache import LRUValueCache
 from .exceptions import (
     ColumnFamilyAlreadyExists,
     ColumnFamilyDoesNotExist,
@@ -41,6 +55,15 @@ class RocksDBStorePartition(StorePartition):
     It opens the RocksDB on `__init__`. If the db is locked by another process,
     it will retry according to `open_max_retries` and `open_retry_backoff` options.
 
+    If `value_cache_size` option is greater than 0, it keeps up to this number of
+    the deserialized values in memory, so the frequently read keys are not
+    fetched from the DB and deserialized on every read.
+    The cache outlives the transactions, and it is dropped when the partition
+    is closed.
+    The cached values read by a transaction are dropped from the cache if this
+    transaction is not flushed (e.g. when it's discarded because of the sink
+    backpressure), because they may have been changed in place.
+
     :param path: an absolute path to the RocksDB folder
     :param options: RocksDB options. If `None`, the default options will be used.
     """
@@ -63,17 +86,70 @@ class RocksDBStorePartition(StorePartition):
         self._db = self._init_rocksdb()
         self._cf_cache: Dict[str, Rdict] = {}
         self._cf_handle_cache: Dict[str, ColumnFamily] = {}
+        self._recovery_write_options: Optional[WriteOptions] = None
+        if self._options.disable_wal_on_recovery:
+            self._recovery_write_options = WriteOptions()
+            self._recovery_write_options.disable_wal = True
+        self._recovered_without_wal = False
+        value_cache_size = self._options.value_cache_size
+        self._value_cache: Optional[LRUValueCache] = (
+            LRUValueCache(maxsize=value_cache_size) if value_cache_size > 0 else None
+        )
+        # The keys of the cached values read since the last transaction started
+        self._value_cache_reads: Set[Tuple[str, bytes]] = set()
+        self._last_transaction: Optional[PartitionTransaction] = None
 
     def _changelog_recover_flush(self, changelog_offset: int, batch: WriteBatch):
         """
         Update the changelog offset and flush outstanding writes.
         """
+        if self._value_cache is not None:
+            self._value_cache.clear()
         batch.put(
             CHANGELOG_OFFSET_KEY,
             int_to_int64_bytes(changelog_offset),
             self.get_column_family_handle(METADATA_CF_NAME),
         )
-        self._write(batch)
+        if self._recovery_write_options is not None:
+            self._db.write(batch, write_opt=self._recovery_write_options)
+            self._recovered_without_wal = True
+        else:
+            self._write(batch)
+
+    def _apply_changelog_message(
+        self,
+        batch: WriteBatch,
+        changelog_message: ConfluentKafkaMessageProto,
+        cf_name: str,
+        processed_offset: Optional[int],
+        committed_offset: int,
+    ):
+        """
+        Add the changelog message update to the `WriteBatch` unless it should
+        be skipped based on the latest committed offset and the processed offset
+        from the changelog message header.
+        """
+        if self._should_apply_changelog(processed_offset, committed_offset):
+            self._apply_changelog_update(
+                batch, cf_name, changelog_message.key(), changelog_message.value()
+            )
+
+    def _apply_changelog_update(
+        self,
+        batch: WriteBatch,
+        cf_name: str,
+        key: bytes,
+        value: Optional[bytes],
+    ):
+        """
+        Add a changelog update to the `WriteBatch`.
+        Empty values are the tombstones, and they delete the key.
+        """
+        cf_handle = self.get_column_family_handle(cf_name)
+        if value:
+            batch.put(key, value, cf_handle)
+        else:
+            batch.delete(key, cf_handle)
 
     def _recover_from_changelog_message(
         self,
@@ -98,18 +174,66 @@ class RocksDBStorePartition(StorePartition):
         :param committed_offset: latest committed offset for the partition
         """
         batch = WriteBatch(raw_mode=True)
-        if self._should_apply_changelog(processed_offset, committed_offset):
-            cf_handle = self.get_column_family_handle(cf_name)
-            # Determine whether the update should be applied or skipped based on the
-            # latest committed offset and processed offset from the changelog message header
-            key = changelog_message.key()
-            if value := changelog_message.value():
-                batch.put(key, value, cf_handle)
-            else:
-                batch.delete(key, cf_handle)
-
+        self._apply_changelog_message(
+            batch, changelog_message, cf_name, processed_offset, committed_offset
+        )
         self._changelog_recover_flush(changelog_message.offset(), batch)
 
+    def _recover_from_changelog_messages(
+        self,
+        changelog_messages: List[Tuple[ConfluentKafkaMessageProto, str, Optional[int]]],
+        committed_offset: int,
+    ):
+        """
+        Updates state from a batch of changelog messages.
+
+        All the updates are grouped into a single `WriteBatch` together with
+        the offset of the last changelog message, so the batch is applied atomically.
+
+        Only the latest update of each key in the batch is written, so the keys
+        updated many times in the non-compacted part of the changelog are
+        written once.
+        The updates skipped based on the processed offset don't replace
+        the previous updates of the same key.
+
+        :param changelog_messages: a list of tuples with the changelog message,
+            its column family name and its processed offset.
+        :param committed_offset: latest committed offset for the partition
+        """
+        updates: Dict[Tuple[str, bytes], Optional[bytes]] = {}
+        for changelog_message, cf_name, processed_offset in changelog_messages:
+            if self._should_apply_changelog(processed_offset, committed_offset):
+                updates[(cf_name, changelog_message.key())] = changelog_message.value()
+
+        batch = WriteBatch(raw_mode=True)
+        for (cf_name, key), value in updates.items():
+            self._apply_changelog_update(batch, cf_name, key, value)
+        self._changelog_recover_flush(changelog_messages[-1][0].offset(), batch)
+
+    def complete_recovery(self):
+        """
+        Flush the memtables to disk if the changelog updates were written
+        with WAL disabled.
+
+        Otherwise, the recovered data could be lost after a crash while the
+        data written after the recovery would survive it.
+        The metadata column family is flushed last to not persist the changelog
+        offset ahead of the data.
+        """
+        if not self._recovered_without_wal:
+            return
+
+        logger.debug(f'Flushing the recovered state to the disk path="{self.path}"')
+        cf_names = [
+            cf_name
+            for cf_name in self.list_column_families()
+            if cf_name != METADATA_CF_NAME
+        ]
+        for cf_name in cf_names:
+            self.get_column_family(cf_name).flush()
+        self.get_column_family(METADATA_CF_NAME).flush()
+        self._recovered_without_wal = False
+
     def write(
         self,
         cache: PartitionTransactionCache,
@@ -168,6 +292,32 @@ class RocksDBStorePartition(StorePartition):
 
         self._write(batch)
 
+        if self._value_cache is not None:
+            self._refresh_value_cache(cache)
+
+    def _refresh_value_cache(self, cache: PartitionTransactionCache):
+        """
+        Update the value cache after the transaction data is written to the DB.
+
+        The cached keys which were updated get the new values, so the next reads
+        don't need to fetch them from the DB again.
+        The new values are deserialized from the written bytes, and the cache
+        doesn't share the objects passed to `State.set()`.
+        The deleted keys are removed from the cache.
+
+        :param cache: The modified data
+        """
+        value_cache = cast(LRUValueCache, self._value_cache)
+        for cf_name in cache.get_column_families():
+            for prefix_update_cache in cache.get_updates(cf_name=cf_name).values():
+                for key, value in prefix_update_cache.items():
+                    if (cf_name, key) in value_cache:
+                        value_cache.set(
+                            key, deserialize(value, loads=self._loads), cf_name
+                        )
+            for key in cache.get_deletes(cf_name=cf_name):
+                value_cache.invalidate(key, cf_name)
+
     def _write(self, batch: WriteBatch):
         """
         Write `WriteBatch` to RocksDB
@@ -189,6 +339,75 @@ class RocksDBStorePartition(StorePartition):
         cf_dict = self.get_column_family(cf_name)
         return cf_dict.get(key, default)
 
+    def get_value(
+        self, key: bytes, default: Any = None, cf_name: str = "default"
+    ) -> Any:
+        """
+        Get a key from RocksDB and deserialize its value.
+
+        If the value cache is enabled, the deserialized values are served from it
+        and the missing ones are added to it.
+
+        >***NOTE:*** The cached values are shared between the reads.
+            Mutating them in place without calling `State.set()` after that will
+            change the cached value too.
+            If the transaction which read the values is not flushed, they are
+            dropped from the cache when the next transaction begins.
+
+        :param key: a key encoded to `bytes`
+        :param default: a default value to return if the key is not found.
+        :param cf_name: rocksdb column family name. Default - "default"
+        :return: a deserialized value if the key is present in the DB.
+            Otherwise, `default`
+        """
+        if self._value_cache is None:
+            return super().get_value(key, default, cf_name)
+
+        value = self._value_cache.get(key, cf_name)
+        if value is not UNDEFINED:
+            self._value_cache_reads.add((cf_name, key))
+            return value
+
+        stored = self.get(key, UNDEFINED, cf_name)
+        if stored is UNDEFINED:
+            return default
+
+        value = deserialize(stored, loads=self._loads)
+        self._value_cache.set(key, value, cf_name)
+        self._value_cache_reads.add((cf_name, key))
+        return value
+
+    def begin(self) -> PartitionTransaction:
+        """
+        Start a new `PartitionTransaction`.
+
+        If the previous transaction was not flushed, the cached values
+        it has read are dropped first.
+        """
+        self._drop_incomplete_transaction_reads()
+        transaction = super().begin()
+        self._last_transaction = transaction
+        return transaction
+
+    def _drop_incomplete_transaction_reads(self):
+        """
+        Drop the cached values read by the previous transaction
+        if it was not flushed.
+
+        The cached values are shared with the transactions, and the previous
+        transaction may have changed them in place before calling `set()`.
+        If it was discarded, these changes must not be visible to the next ones.
+        """
+        last_transaction = self._last_transaction
+        if (
+            self._value_cache is not None
+            and last_transaction is not None
+            and not last_transaction.completed
+        ):
+            for cf_name, key in self._value_cache_reads:
+                self._value_cache.invalidate(key, cf_name)
+        self._value_cache_reads.clear()
+
     def exists(self, key: bytes, cf_name: str = "default") -> bool:
         """
         Check if a key is present in the DB.
@@ -197,6 +416,8 @@ class RocksDBStorePartition(StorePartition):
         :param cf_name: rocksdb column family name. Default - "default"
         :return: `True` if the key is present, `False` otherwise.
         """
+        if self._value_cache is not None and (cf_name, key) in self._value_cache:
+            return True
         cf_dict = self.get_column_family(cf_name)
         return key in cf_dict
 
@@ -222,6 +443,17 @@ class RocksDBStorePartition(StorePartition):
         if offset_bytes is not None:
             return int_from_int64_bytes(offset_bytes)
 
+    def create_checkpoint(self, path: str):
+        """
+        Create a consistent copy of the RocksDB at the given path.
+
+        The checkpoint hard-links the database files when the path is on the same
+        file system, so it is cheap to create.
+
+        :param path: path to the new checkpoint directory, it must not exist
+        """
+        Checkpoint(self._db).create_checkpoint(path)
+
     def close(self):
         """
         Close the underlying RocksDB
@@ -231,6 +463,8 @@ class RocksDBStorePartition(StorePartition):
         # Otherwise the Rocksdb won't close properly
         self._cf_handle_cache = {}
         self._cf_cache = {}
+        if self._value_cache is not None:
+            self._value_cache.clear()
         self._db.close()
         logger.debug(f'Closed rocksdb partition on "{self._path}"')
 
@@ -309,6 +543,8 @@ class RocksDBStorePartition(StorePartition):
     def drop_column_family(self, cf_name: str):
         self._cf_cache.pop(cf_name, None)
         self._cf_handle_cache.pop(cf_name, None)
+        if self._value_cache is not None:
+            self._value_cache.invalidate_column_family(cf_name)
         try:
             self._db.drop_column_family(cf_name)
         except Exception as exc:
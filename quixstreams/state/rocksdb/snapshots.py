@@ -0,0 +1,334 @@
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from .partition import RocksDBStorePartition
+
+__all__ = (
+    "SnapshotStorage",
+    "FileSystemSnapshotStorage",
+    "SnapshotManager",
+)
+
+logger = logging.getLogger(__name__)
+
+# The snapshot manifest is uploaded last, so only the complete snapshots have it
+_MANIFEST_NAME = "_SNAPSHOT"
+
+
+class SnapshotStorage(ABC):
+    """
+    Abstract blob storage for the state store snapshots.
+
+    The blobs are identified by the "/"-separated keys.
+    Implement it to keep the snapshots in the object storage (e.g. S3).
+    """
+
+    @abstractmethod
+    def upload(self, key: str, path: str):
+        """
+        Upload a local file to the storage.
+
+        :param key: blob key
+        :param path: path to the local file
+        """
+
+    @abstractmethod
+    def download(self, key: str, path: str):
+        """
+        Download a blob to the local file.
+
+        :param key: blob key
+        :param path: path to the local file
+        """
+
+    @abstractmethod
+    def list_keys(self, prefix: str) -> List[str]:
+        """
+        List the keys of the blobs starting with the prefix.
+
+        :param prefix: key prefix
+        :return: a list of keys
+        """
+
+    @abstractmethod
+    def delete(self, key: str):
+        """
+        Delete a blob. It must not fail if the blob does not exist.
+
+        :param key: blob key
+        """
+
+
+class FileSystemSnapshotStorage(SnapshotStorage):
+    """
+    Snapshot storage keeping the blobs as files in the local directory.
+
+    It can be used with a shared network file system, and for testing.
+    """
+
+    def __init__(self, base_dir: Union[str, Path]):
+        """
+        :param base_dir: path to a directory with the blobs
+        """
+        self._base_dir = Path(base_dir).absolute()
+
+    def upload(self, key: str, path: str):
+        target = self._base_dir / key
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_target = target.with_name(target.name + ".tmp")
+        shutil.copyfile(path, tmp_target)
+        os.replace(tmp_target, target)
+
+    def download(self, key: str, path: str):
+        shutil.copyfile(self._base_dir / key, path)
+
+    def list_keys(self, prefix: str) -> List[str]:
+        root = (self._base_dir / prefix).parent
+        if not root.is_dir():
+            return []
+        keys = []
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith(".tmp"):
+                    continue
+                key = (Path(dirpath) / filename).relative_to(self._base_dir).as_posix()
+                if key.startswith(prefix):
+                    keys.append(key)
+        return keys
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._base_dir / key)
+        except FileNotFoundError:
+            pass
+
+
+class SnapshotManager:
+    """
+    Takes periodic snapshots of the RocksDB store partitions, uploads them to
+    the `SnapshotStorage`, and restores the partitions from them.
+
+    The snapshots are RocksDB checkpoints, which hard-link the database files
+    and are cheap to create.
+    They are created in the processing thread after the state is flushed,
+    and uploaded in the background.
+
+    Each snapshot is identified by the changelog offset of the partition.
+    After the partition is restored from the snapshot, only the changelog messages
+    produced after this offset need to be recovered.
+    """
+
+    def __init__(
+        self,
+        storage: SnapshotStorage,
+        local_dir: Union[str, Path],
+        key_prefix: str,
+        interval: float = 3600.0,
+        keep_snapshots: int = 2,
+    ):
+        """
+        :param storage: a `SnapshotStorage` instance
+        :param local_dir: a directory for the checkpoints being uploaded.
+            It must be on the same file system as the state stores.
+        :param key_prefix: a prefix for the snapshot keys in the storage
+            (e.g. consumer group).
+        :param interval: how often to snapshot each store partition, in seconds.
+            Default - `3600.0`.
+        :param keep_snapshots: how many latest snapshots to keep in the storage
+            for each store partition. Default - `2`.
+        """
+        if keep_snapshots < 1:
+            raise ValueError("keep_snapshots must be at least 1")
+
+        self._storage = storage
+        self._local_dir = Path(local_dir).absolute()
+        self._key_prefix = key_prefix
+        self._interval = interval
+        self._keep_snapshots = keep_snapshots
+        self._last_snapshot_at: Dict[str, float] = {}
+        self._last_snapshot_offsets: Dict[str, int] = {}
+        self._uploading: Set[str] = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def snapshot_key(self, topic: str, store_name: str, partition: int) -> str:
+        """
+        Get the key prefix of the snapshots for the store partition.
+        """
+        return f"{self._key_prefix}/{topic}/{store_name}/{partition}"
+
+    def maybe_snapshot(
+        self,
+        topic: str,
+        store_name: str,
+        partition: int,
+        store_partition: RocksDBStorePartition,
+    ):
+        """
+        Snapshot the store partition if the snapshot interval has passed since
+        the previous snapshot (or the partition assignment), and the partition
+        was updated since then.
+
+        :param topic: topic name
+        :param store_name: store name
+        :param partition: partition number
+        :param store_partition: an assigned `RocksDBStorePartition`
+        """
+        key = self.snapshot_key(topic, store_name, partition)
+        now = time.monotonic()
+        last_snapshot_at = self._last_snapshot_at.setdefault(key, now)
+        if now - last_snapshot_at < self._interval:
+            return
+        self._last_snapshot_at[key] = now
+
+        changelog_offset = store_partition.get_changelog_offset()
+        if (
+            changelog_offset is None
+            or changelog_offset == self._last_snapshot_offsets.get(key)
+        ):
+            return
+        with self._lock:
+            if key in self._uploading:
+                return
+            self._uploading.add(key)
+
+        checkpoint_dir = (
+            self._local_dir / f"{key.replace('/', '--')}--{changelog_offset}"
+        )
+        try:
+            if checkpoint_dir.exists():
+                shutil.rmtree(checkpoint_dir)
+            checkpoint_dir.parent.mkdir(parents=True, exist_ok=True)
+            store_partition.create_checkpoint(str(checkpoint_dir))
+        except Exception:
+            with self._lock:
+                self._uploading.discard(key)
+            raise
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="quixstreams-state-snapshot"
+            )
+        self._executor.submit(self._upload, key, changelog_offset, checkpoint_dir)
+
+    def restore(
+        self, topic: str, store_name: str, partition: int, path: str
+    ) -> Optional[int]:
+        """
+        Restore the store partition from the latest complete snapshot, if any.
+
+        The partition must not exist locally.
+
+        :param topic: topic name
+        :param store_name: store name
+        :param partition: partition number
+        :param path: path to the store partition
+        :return: the changelog offset of the restored snapshot or `None`
+        """
+        key = self.snapshot_key(topic, store_name, partition)
+        snapshots = self._list_snapshots(key)
+        complete = [
+            offset for offset, names in snapshots.items() if _MANIFEST_NAME in names
+        ]
+        if not complete:
+            return None
+
+        changelog_offset = max(complete)
+        snapshot_key = f"{key}/{changelog_offset:020d}"
+        logger.info(
+            f'Restoring the state store partition from the snapshot "{snapshot_key}" '
+            f'path="{path}"'
+        )
+        start = time.monotonic()
+        restore_dir = Path(path + ".restore")
+        if restore_dir.exists():
+            shutil.rmtree(restore_dir)
+        restore_dir.mkdir(parents=True)
+        manifest_path = restore_dir / _MANIFEST_NAME
+        self._storage.download(f"{snapshot_key}/{_MANIFEST_NAME}", str(manifest_path))
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest_path.unlink()
+        for name in manifest["files"]:
+            self._storage.download(f"{snapshot_key}/{name}", str(restore_dir / name))
+        os.replace(restore_dir, path)
+
+        logger.info(
+            f'Restored the state store partition from the snapshot "{snapshot_key}" '
+            f"changelog_offset={changelog_offset} "
+            f"time_elapsed={round(time.monotonic() - start, 2)}s"
+        )
+        return changelog_offset
+
+    def close(self):
+        """
+        Wait for the pending uploads to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _upload(self, key: str, changelog_offset: int, checkpoint_dir: Path):
+        snapshot_key = f"{key}/{changelog_offset:020d}"
+        try:
+            start = time.monotonic()
+            files = sorted(p.name for p in checkpoint_dir.iterdir() if p.is_file())
+            for name in files:
+                self._storage.upload(
+                    f"{snapshot_key}/{name}", str(checkpoint_dir / name)
+                )
+
+            manifest_path = checkpoint_dir / _MANIFEST_NAME
+            with open(manifest_path, "w") as f:
+                json.dump({"changelog_offset": changelog_offset, "files": files}, f)
+            self._storage.upload(f"{snapshot_key}/{_MANIFEST_NAME}", str(manifest_path))
+            logger.info(
+                f'Uploaded the state store snapshot "{snapshot_key}" '
+                f"time_elapsed={round(time.monotonic() - start, 2)}s"
+            )
+            self._last_snapshot_offsets[key] = changelog_offset
+            self._delete_old_snapshots(key)
+        except Exception:
+            # The snapshots are optional, the next one will be taken
+            # after the interval
+            logger.exception(f'Failed to upload the state snapshot "{snapshot_key}"')
+        finally:
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
+            with self._lock:
+                self._uploading.discard(key)
+
+    def _list_snapshots(self, key: str) -> Dict[int, List[str]]:
+        snapshots: Dict[int, List[str]] = {}
+        for blob_key in self._storage.list_keys(f"{key}/"):
+            offset, _, name = blob_key[len(key) + 1 :].partition("/")
+            if offset.isdigit() and name:
+                snapshots.setdefault(int(offset), []).append(name)
+        return snapshots
+
+    def _delete_old_snapshots(self, key: str):
+        snapshots = self._list_snapshots(key)
+        complete = sorted(
+            offset for offset, names in snapshots.items() if _MANIFEST_NAME in names
+        )
+        if len(complete) <= self._keep_snapshots:
+            return
+        oldest_kept = complete[-self._keep_snapshots]
+        to_delete: List[Tuple[int, str]] = [
+            (offset, name)
+            for offset, names in snapshots.items()
+            if offset < oldest_kept
+            for name in names
+        ]
+        # Delete the manifests first to not leave the incomplete
+        # snapshots looking like complete ones
+        to_delete.sort(key=lambda item: item[1] != _MANIFEST_NAME)
+        for offset, name in to_delete:
+            self._storage.delete(f"{key}/{offset:020d}/{name}")
@@ -1,12 +1,16 @@
+import dataclasses
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Type
 
 from quixstreams.state.recovery import ChangelogProducer, ChangelogProducerFactory
 from quixstreams.state.base import Store
+from .options import RocksDBOptions
 from .partition import (
     RocksDBStorePartition,
 )
+from .snapshots import SnapshotManager
 from .types import RocksDBOptionsType
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,7 @@ class RocksDBStore(Store):
     """
 
     options_type = RocksDBOptionsType
+    partition_type: Type[RocksDBStorePartition] = RocksDBStorePartition
 
     def __init__(
         self,
@@ -31,6 +36,7 @@ class RocksDBStore(Store):
         base_dir: str,
         changelog_producer_factory: Optional[ChangelogProducerFactory] = None,
         options: Optional[options_type] = None,
+        snapshot_manager: Optional[SnapshotManager] = None,
     ):
         """
         :param name: a unique store name
@@ -39,18 +45,21 @@ class RocksDBStore(Store):
         :param changelog_producer_factory: a ChangelogProducerFactory instance
             if using changelogs
         :param options: RocksDB options. If `None`, the default options will be used.
+        :param snapshot_manager: a SnapshotManager instance to restore the new
+            partitions from the snapshots and to take the snapshots, optional.
         """
         super().__init__(name, topic)
         self._partitions_dir = Path(base_dir).absolute() / self._name / self._topic
         self._partitions: Dict[int, RocksDBStorePartition] = {}
         self._changelog_producer_factory = changelog_producer_factory
         self._options = options
+        self._snapshot_manager = snapshot_manager
 
     def create_new_partition(
         self,
         partition: int,
     ) -> RocksDBStorePartition:
-        path = str((self._partitions_dir / str(partition)).absolute())
+        path = self._prepare_partition_path(partition)
 
         changelog_producer: Optional[ChangelogProducer] = None
         if self._changelog_producer_factory:
@@ -58,6 +67,50 @@ class RocksDBStore(Store):
                 self._changelog_producer_factory.get_partition_producer(partition)
             )
 
-        return RocksDBStorePartition(
+        return self.partition_type(
             path=path, options=self._options, changelog_producer=changelog_producer
         )
+
+    def create_standby_partition(self, partition: int) -> RocksDBStorePartition:
+        """
+        Open a store partition to keep a standby replica of it.
+
+        Unlike `assign_partition()`, the partition is not registered in the store
+        and doesn't produce changelog messages.
+        It fails right away if the partition is locked by another process
+        instead of retrying.
+
+        :param partition: partition number
+        :return: instance of `RocksDBStorePartition`
+        """
+        path = self._prepare_partition_path(partition)
+        options = dataclasses.replace(
+            self._options or RocksDBOptions(), open_max_retries=0
+        )
+        return self.partition_type(path=path, options=options)
+
+    def snapshot_partitions(self):
+        """
+        Take the snapshots of the assigned partitions if they are due.
+
+        It does nothing if the snapshots are not configured.
+        """
+        if self._snapshot_manager is None:
+            return
+        for partition, store_partition in self._partitions.items():
+            self._snapshot_manager.maybe_snapshot(
+                topic=self._topic,
+                store_name=self._name,
+                partition=partition,
+                store_partition=store_partition,
+            )
+
+    def _prepare_partition_path(self, partition: int) -> str:
+        path = str((self._partitions_dir / str(partition)).absolute())
+        # Bootstrap the partitions missing locally from the latest snapshot
+        # to recover only the tail of the changelog
+        if self._snapshot_manager is not None and not os.path.exists(path):
+            self._snapshot_manager.restore(
+                topic=self._topic, store_name=self._name, partition=partition, path=path
+            )
+        return path
@@ -22,5 +22,9 @@ class RocksDBOptionsType(Protocol):
     loads: LoadsFunc
     open_max_retries: int
     open_retry_backoff: float
+    disable_wal_on_recovery: bool
+    value_cache_size: int
+    open_windows_cache_size: int
+    window_index_cache_size: int
 
     def to_options(self) -> rocksdict.Options: ...
@@ -0,0 +1,109 @@
+import bisect
+import heapq
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+__all__ = ("OpenWindows",)
+
+_MISSING = object()
+
+
+class OpenWindows:
+    """
+    Open windows of a single message key kept in memory.
+
+    The windows are stored as `{(<start>, <end>): <value>}` together with
+    a min-heap of their ends, so the expired windows can be found without
+    iterating over the whole state, and a sorted list of `(<start>, <end>)`,
+    so the windows can be looked up by their starts with a binary search.
+
+    The deleted windows are removed from the heap lazily when they reach its top,
+    or when they make up the most of the heap.
+
+    :param windows: initial windows in the format `((<start>, <end>), <value>)`
+    """
+
+    __slots__ = ("_windows", "_ends", "_sorted")
+
+    def __init__(self, windows: Iterable[Tuple[Tuple[int, int], Any]] = ()):
+        self._windows: Dict[Tuple[int, int], Any] = dict(windows)
+        self._ends: List[Tuple[int, int]] = [
+            (end, start) for start, end in self._windows
+        ]
+        heapq.heapify(self._ends)
+        self._sorted: List[Tuple[int, int]] = sorted(self._windows)
+
+    def get(self, start_ms: int, end_ms: int, default: Any = None) -> Any:
+        return self._windows.get((start_ms, end_ms), default)
+
+    def update(self, start_ms: int, end_ms: int, value: Any):
+        window = (start_ms, end_ms)
+        if window not in self._windows:
+            heapq.heappush(self._ends, (end_ms, start_ms))
+            bisect.insort(self._sorted, window)
+        self._windows[window] = value
+
+    def delete(self, start_ms: int, end_ms: int):
+        window = (start_ms, end_ms)
+        if self._windows.pop(window, _MISSING) is not _MISSING:
+            self._remove_sorted(window)
+        # Compact the heap if the windows are deleted without being expired,
+        # so it doesn't grow indefinitely
+        if len(self._ends) > 2 * len(self._windows) + 16:
+            self._ends = [(end, start) for start, end in self._windows]
+            heapq.heapify(self._ends)
+
+    def get_range(
+        self,
+        start_from_ms: int,
+        start_to_ms: int,
+        backwards: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Tuple[int, int], Any]]:
+        """
+        Get the windows that start between `start_from_ms` and `start_to_ms`.
+
+        :param start_from_ms: the minimal window start time, exclusive.
+        :param start_to_ms: the maximum window start time, inclusive.
+        :param backwards: if True, returns the windows in reverse order.
+        :param limit: the maximum number of windows to return, optional.
+        :return: a sorted list of windows in the format `((<start>, <end>), <value>)`
+        """
+        keys = self._sorted
+        lo = bisect.bisect_right(keys, (start_from_ms, math.inf))
+        hi = bisect.bisect_right(keys, (start_to_ms, math.inf))
+        if limit is not None:
+            if backwards:
+                lo = max(lo, hi - limit)
+            else:
+                hi = min(hi, lo + limit)
+        windows = self._windows
+        result = [(window, windows[window]) for window in keys[lo:hi]]
+        if backwards:
+            result.reverse()
+        return result
+
+    def expire(self, max_end_ms: int) -> List[Tuple[Tuple[int, int], Any]]:
+        """
+        Remove the windows ending at or before `max_end_ms` and return them.
+
+        :param max_end_ms: the maximum end of the expired windows, inclusive.
+        :return: a list of expired windows in the format `((<start>, <end>), <value>)`
+            sorted by window end and start.
+        """
+        expired = []
+        ends, windows = self._ends, self._windows
+        while ends and ends[0][0] <= max_end_ms:
+            end, start = heapq.heappop(ends)
+            window = (start, end)
+            if window in windows:
+                expired.append((window, windows.pop(window)))
+                self._remove_sorted(window)
+        return expired
+
+    def _remove_sorted(self, window: Tuple[int, int]):
+        keys = self._sorted
+        del keys[bisect.bisect_left(keys, window)]
+
+    def __len__(self) -> int:
+        return len(self._windows)
@@ -1,13 +1,16 @@
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 from rocksdict import WriteBatch, ReadOptions, RdictItems  # type: ignore
 
 from quixstreams.state.base import PartitionTransactionCache
 from quixstreams.state.recovery import ChangelogProducer
+from quixstreams.state.metadata import UNDEFINED
 from quixstreams.state.serialization import int_from_int64_bytes, int_to_int64_bytes
 from .metadata import LATEST_EXPIRED_WINDOW_CF_NAME, LATEST_TIMESTAMP_KEY
+from .open_windows import OpenWindows
 from .transaction import WindowedRocksDBPartitionTransaction
+from ..cache import LRUValueCache
 from ..exceptions import ColumnFamilyDoesNotExist
 from ..metadata import METADATA_CF_NAME
 from ..partition import RocksDBStorePartition
@@ -24,6 +27,18 @@ class WindowedRocksDBStorePartition(RocksDBStorePartition):
     Besides the data, it keeps track of the latest observed timestamp and
     stores the expiration index to delete expired windows.
 
+    If `open_windows_cache_size` option is greater than 0, it also keeps the open
+    windows of up to this number of message keys in memory, so the windows
+    are aggregated and expired without reading them from RocksDB on every update.
+    The windows are still written to RocksDB on checkpoint.
+    If `window_index_cache_size` option is greater than 0, it keeps the in-memory
+    indexes built by the windows on top of the stored ones (e.g. the values
+    within the sliding window) for up to this number of message keys.
+
+    The transactions take the open windows and the indexes out of the caches
+    and put them back only when they are flushed, so the changes of
+    the discarded transactions are never cached.
+
     :param path: an absolute path to the RocksDB folder
     :param options: RocksDB options. If `None`, the default options will be used.
     """
@@ -39,21 +54,130 @@ class WindowedRocksDBStorePartition(RocksDBStorePartition):
         )
         self._latest_timestamp_ms = self._get_latest_timestamp_from_db()
         self._ensure_column_family(LATEST_EXPIRED_WINDOW_CF_NAME)
+        open_windows_cache_size = self._options.open_windows_cache_size
+        self._open_windows_cache: Optional[LRUValueCache] = (
+            LRUValueCache(maxsize=open_windows_cache_size)
+            if open_windows_cache_size > 0
+            else None
+        )
+        window_index_cache_size = self._options.window_index_cache_size
+        self._window_index_cache: Optional[LRUValueCache] = (
+            LRUValueCache(maxsize=window_index_cache_size)
+            if window_index_cache_size > 0
+            else None
+        )
+
+    def get_open_windows(self, prefix: bytes) -> Optional[OpenWindows]:
+        """
+        Get the cached open windows for the given message key.
+
+        :param prefix: a message key prefix
+        :return: an instance of `OpenWindows` or `None` if the windows of this key
+            are not cached
+        """
+        if self._open_windows_cache is None:
+            return None
+        open_windows = self._open_windows_cache.get(prefix)
+        return None if open_windows is UNDEFINED else open_windows
+
+    def pop_open_windows(self, prefix: bytes) -> Optional[OpenWindows]:
+        """
+        Remove the cached open windows of the message key and return them.
+
+        The transactions take the open windows out of the cache while they
+        update them, and return them with `set_open_windows()` once they are
+        flushed.
+
+        :param prefix: a message key prefix
+        :return: an instance of `OpenWindows` or `None` if the windows of this key
+            are not cached
+        """
+        if self._open_windows_cache is None:
+            return None
+        open_windows = self._open_windows_cache.pop(prefix)
+        return None if open_windows is UNDEFINED else open_windows
+
+    def set_open_windows(self, prefix: bytes, open_windows: OpenWindows):
+        """
+        Cache the open windows of the message key.
+
+        :param prefix: a message key prefix
+        :param open_windows: an instance of `OpenWindows`
+        """
+        if self._open_windows_cache is not None:
+            self._open_windows_cache.set(prefix, open_windows)
+
+    def pop_window_index(self, prefix: bytes) -> Optional[Any]:
+        """
+        Remove the cached in-memory index built on top of the windows
+        of the message key and return it.
+
+        The transactions take the indexes out of the cache while they update them,
+        and return them with `set_window_index()` once they are flushed.
+
+        :param prefix: a message key prefix
+        :return: the index or `None` if it is not cached
+        """
+        if self._window_index_cache is None:
+            return None
+        index = self._window_index_cache.pop(prefix)
+        return None if index is UNDEFINED else index
+
+    def set_window_index(self, prefix: bytes, index: Optional[Any]):
+        """
+        Cache the in-memory index built on top of the windows of the message key.
+
+        The index is dropped when the partition is recovered or closed.
+
+        :param prefix: a message key prefix
+        :param index: an index object or `None` to drop the cached one
+        """
+        if self._window_index_cache is None:
+            return
+        if index is None:
+            self._window_index_cache.invalidate(prefix)
+        else:
+            self._window_index_cache.set(prefix, index)
+
+    @property
+    def open_windows_cache_enabled(self) -> bool:
+        return self._open_windows_cache is not None
+
+    def _changelog_recover_flush(self, changelog_offset: int, batch: WriteBatch):
+        self._clear_window_caches()
+        super()._changelog_recover_flush(changelog_offset, batch)
+
+    def close(self):
+        self._clear_window_caches()
+        super().close()
+
+    def _clear_window_caches(self):
+        if self._open_windows_cache is not None:
+            self._open_windows_cache.clear()
+        if self._window_index_cache is not None:
+            self._window_index_cache.clear()
 
     def iter_items(
-        self, from_key: bytes, read_opt: ReadOptions, cf_name: str = "default"
+        self,
+        from_key: bytes,
+        read_opt: ReadOptions,
+        cf_name: str = "default",
+        backwards: bool = False,
     ) -> RdictItems:
         cf = self.get_column_family(cf_name=cf_name)
-        return cf.items(from_key=from_key, read_opt=read_opt)
+        return cf.items(from_key=from_key, read_opt=read_opt, backwards=backwards)
 
     def begin(self) -> "WindowedRocksDBPartitionTransaction":
-        return WindowedRocksDBPartitionTransaction(
+        self._drop_incomplete_transaction_reads()
+        transaction = WindowedRocksDBPartitionTransaction(
             partition=self,
             dumps=self._dumps,
             loads=self._loads,
             latest_timestamp_ms=self._latest_timestamp_ms,
             changelog_producer=self._changelog_producer,
         )
+        self._last_transaction = transaction
+        return transaction
 
     def set_latest_timestamp(self, timestamp_ms: int):
         self._latest_timestamp_ms = timestamp_ms
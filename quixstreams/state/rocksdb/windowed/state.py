@@ -89,7 +89,11 @@ class WindowedTransactionState(WindowedState):
         )
 
     def get_windows(
-        self, start_from_ms: int, start_to_ms: int, backwards: bool = False
+        self,
+        start_from_ms: int,
+        start_to_ms: int,
+        backwards: bool = False,
+        limit: Optional[int] = None,
     ) -> list[tuple[tuple[int, int], Any]]:
         """
         Get all windows that start between "start_from_ms" and "start_to_ms".
@@ -97,6 +101,7 @@ class WindowedTransactionState(WindowedState):
         :param start_from_ms: The minimal window start time, exclusive.
         :param start_to_ms: The maximum window start time, inclusive.
         :param backwards: If True, yields windows in reverse order.
+        :param limit: The maximum number of windows to return, optional.
         :return: A sorted list of tuples in the format `((start, end), value)`.
         """
         return self._transaction.get_windows(
@@ -104,4 +109,57 @@ class WindowedTransactionState(WindowedState):
             start_to_ms=start_to_ms,
             prefix=self._prefix,
             backwards=backwards,
+            limit=limit,
         )
+
+    def delete_window(self, start_ms: int, end_ms: int):
+        """
+        Delete the window defined by `start` and `end` timestamps from the state.
+
+        :param start_ms: start of the window in milliseconds
+        :param end_ms: end of the window in milliseconds
+        """
+        return self._transaction.delete_window(
+            start_ms=start_ms, end_ms=end_ms, prefix=self._prefix
+        )
+
+    def get_last_expired_window_start(self) -> Optional[int]:
+        """
+        Get the start of the latest expired window from the expiration index.
+
+        :return: the window start in milliseconds or `None` if no windows
+            were expired yet
+        """
+        return self._transaction.get_last_expired_window_start(prefix=self._prefix)
+
+    def set_last_expired_window_start(self, start_ms: int):
+        """
+        Save the start of the latest expired window to the expiration index.
+
+        The windows starting at or before this timestamp are not returned
+        by `expire_windows()` anymore.
+
+        :param start_ms: the window start in milliseconds
+        """
+        return self._transaction.set_last_expired_window_start(
+            start_ms=start_ms, prefix=self._prefix
+        )
+
+    def get_window_index(self) -> Optional[Any]:
+        """
+        Get the in-memory index built by the window on top of the stored windows.
+
+        The indexes are not persisted, and they are cached in memory for
+        the recently used message keys.
+
+        :return: the index or `None` if it's not cached
+        """
+        return self._transaction.get_window_index(prefix=self._prefix)
+
+    def set_window_index(self, index: Optional[Any]):
+        """
+        Keep the in-memory index built by the window on top of the stored windows.
+
+        :param index: an index object or `None` to drop the existing one
+        """
+        return self._transaction.set_window_index(index=index, prefix=self._prefix)
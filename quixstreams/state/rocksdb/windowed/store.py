@@ -2,8 +2,9 @@ from typing import Optional
 
 from .partition import WindowedRocksDBStorePartition
 from ..store import RocksDBStore
+from ..snapshots import SnapshotManager
 from ..types import RocksDBOptionsType
-from ...recovery import ChangelogProducerFactory, ChangelogProducer
+from ...recovery import ChangelogProducerFactory
 
 
 class WindowedRocksDBStore(RocksDBStore):
@@ -14,6 +15,8 @@ class WindowedRocksDBStore(RocksDBStore):
     partitions' transactions.
     """
 
+    partition_type = WindowedRocksDBStorePartition
+
     def __init__(
         self,
         name: str,
@@ -21,6 +24,7 @@ class WindowedRocksDBStore(RocksDBStore):
         base_dir: str,
         changelog_producer_factory: Optional[ChangelogProducerFactory] = None,
         options: Optional[RocksDBOptionsType] = None,
+        snapshot_manager: Optional[SnapshotManager] = None,
     ):
         """
         :param name: a unique store name
@@ -29,6 +33,8 @@ class WindowedRocksDBStore(RocksDBStore):
         :param changelog_producer_factory: a ChangelogProducerFactory instance
             if using changelogs
         :param options: RocksDB options. If `None`, the default options will be used.
+        :param snapshot_manager: a SnapshotManager instance to restore the new
+            partitions from the snapshots and to take the snapshots, optional.
         """
         super().__init__(
             name=name,
@@ -36,17 +42,5 @@ class WindowedRocksDBStore(RocksDBStore):
             base_dir=base_dir,
             changelog_producer_factory=changelog_producer_factory,
             options=options,
-        )
-
-    def create_new_partition(self, partition) -> WindowedRocksDBStorePartition:
-        path = str((self._partitions_dir / str(partition)).absolute())
-
-        changelog_producer: Optional[ChangelogProducer] = None
-        if self._changelog_producer_factory:
-            changelog_producer = (
-                self._changelog_producer_factory.get_partition_producer(partition)
-            )
-
-        return WindowedRocksDBStorePartition(
-            path=path, options=self._options, changelog_producer=changelog_producer
+            snapshot_manager=snapshot_manager,
         )
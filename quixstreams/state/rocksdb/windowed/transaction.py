@@ -1,5 +1,5 @@
 import itertools
-from typing import Any, Optional, TYPE_CHECKING, cast
+from typing import Any, Dict, Iterable, Optional, TYPE_CHECKING, cast
 
 from rocksdict import ReadOptions
 
@@ -14,15 +14,20 @@ from quixstreams.state.base.transaction import PartitionTransaction
 from quixstreams.state.exceptions import InvalidChangelogOffset
 
 from .metadata import LATEST_EXPIRED_WINDOW_TIMESTAMP_KEY, LATEST_EXPIRED_WINDOW_CF_NAME
+from .open_windows import OpenWindows
 from .serialization import encode_window_key, encode_window_prefix, parse_window_key
 from .state import WindowedTransactionState
 
 if TYPE_CHECKING:
     from .partition import WindowedRocksDBStorePartition
 
+# The largest window start which can be used as an inclusive upper bound
+# to iterate over the windows in RocksDB
+_MAX_WINDOW_START_MS = 2**63 - 2
+
 
 class WindowedRocksDBPartitionTransaction(PartitionTransaction):
-    __slots__ = ("_latest_timestamp_ms",)
+    __slots__ = ("_latest_timestamp_ms", "_open_windows", "_window_indexes")
 
     def __init__(
         self,
@@ -40,6 +45,10 @@ class WindowedRocksDBPartitionTransaction(PartitionTransaction):
         )
         self._partition = cast("WindowedRocksDBStorePartition", self._partition)
         self._latest_timestamp_ms = latest_timestamp_ms
+        # The open windows taken from the partition cache by this transaction
+        self._open_windows: Dict[bytes, OpenWindows] = {}
+        # The window indexes taken from the partition cache by this transaction
+        self._window_indexes: Dict[bytes, Optional[Any]] = {}
 
     def as_state(self, prefix: Any = DEFAULT_PREFIX) -> WindowedTransactionState:
         return WindowedTransactionState(
@@ -69,6 +78,10 @@ class WindowedRocksDBPartitionTransaction(PartitionTransaction):
         default: Any = None,
     ) -> Any:
         self._validate_duration(start_ms=start_ms, end_ms=end_ms)
+        open_windows = self._get_open_windows(prefix=prefix)
+        if open_windows is not None:
+            return open_windows.get(start_ms, end_ms, default)
+
         key = encode_window_key(start_ms, end_ms)
         return self.get(key=key, default=default, prefix=prefix)
 
@@ -81,33 +94,78 @@ class WindowedRocksDBPartitionTransaction(PartitionTransaction):
 
         key = encode_window_key(start_ms, end_ms)
         self.set(key=key, value=value, prefix=prefix)
+        open_windows = self._get_open_windows(prefix=prefix)
+        if open_windows is not None:
+            open_windows.update(start_ms, end_ms, value)
         self._latest_timestamp_ms = max(self._latest_timestamp_ms, timestamp_ms)
 
     def delete_window(self, start_ms: int, end_ms: int, prefix: bytes):
         self._validate_duration(start_ms=start_ms, end_ms=end_ms)
         key = encode_window_key(start_ms, end_ms)
         self.delete(key=key, prefix=prefix)
+        open_windows = self._get_open_windows(prefix=prefix)
+        if open_windows is not None:
+            open_windows.delete(start_ms, end_ms)
 
-    def _flush(self, processed_offset: Optional[int], changelog_offset: Optional[int]):
-        if self._update_cache.is_empty():
-            return
-
-        if changelog_offset is not None:
-            current_changelog_offset = self._partition.get_changelog_offset()
-            if (
-                current_changelog_offset is not None
-                and changelog_offset < current_changelog_offset
-            ):
-                raise InvalidChangelogOffset(
-                    "Cannot set changelog offset lower than already saved one"
+    def _get_open_windows(self, prefix: bytes) -> Optional[OpenWindows]:
+        """
+        Get the open windows of the message key.
+
+        The first time the message key is used in this transaction, its windows
+        are taken out of the partition cache, or they are read from the store
+        if they are not cached yet.
+        They are put back to the partition cache only when this transaction
+        is flushed, so the changes of a discarded transaction are not visible
+        to the next ones.
+
+        :param prefix: a message key prefix
+        :return: an instance of `OpenWindows` or `None` if the cache is disabled
+        """
+        if not self._partition.open_windows_cache_enabled:
+            return None
+
+        open_windows = self._open_windows.get(prefix)
+        if open_windows is not None:
+            return open_windows
+
+        open_windows = self._partition.pop_open_windows(prefix=prefix)
+        if open_windows is None:
+            last_expired = self.get_last_expired_window_start(prefix=prefix)
+            open_windows = OpenWindows(
+                self._get_windows_from_store(
+                    start_from_ms=-1 if last_expired is None else last_expired,
+                    start_to_ms=_MAX_WINDOW_START_MS,
+                    prefix=prefix,
                 )
+            )
+        self._open_windows[prefix] = open_windows
+        return open_windows
 
-        self._partition.write(
-            cache=self._update_cache,
-            processed_offset=processed_offset,
-            changelog_offset=changelog_offset,
-            latest_timestamp_ms=self._latest_timestamp_ms,
-        )
+    def _flush(self, processed_offset: Optional[int], changelog_offset: Optional[int]):
+        if not self._update_cache.is_empty():
+            if changelog_offset is not None:
+                current_changelog_offset = self._partition.get_changelog_offset()
+                if (
+                    current_changelog_offset is not None
+                    and changelog_offset < current_changelog_offset
+                ):
+                    raise InvalidChangelogOffset(
+                        "Cannot set changelog offset lower than already saved one"
+                    )
+
+            self._partition.write(
+                cache=self._update_cache,
+                processed_offset=processed_offset,
+                changelog_offset=changelog_offset,
+                latest_timestamp_ms=self._latest_timestamp_ms,
+            )
+
+        # The changes are persisted, put the open windows and indexes
+        # back to the caches
+        for prefix, open_windows in self._open_windows.items():
+            self._partition.set_open_windows(prefix=prefix, open_windows=open_windows)
+        for prefix, index in self._window_indexes.items():
+            self._partition.set_window_index(prefix=prefix, index=index)
 
     def expire_windows(
         self, duration_ms: int, prefix: bytes, grace_ms: int = 0
@@ -129,48 +187,123 @@ class WindowedRocksDBPartitionTransaction(PartitionTransaction):
           windows found.
 
         :param duration_ms: The duration of each window in milliseconds.
+            For the windows of variable length, it's the minimal duration.
         :param prefix: The key prefix for filtering windows.
         :param grace_ms: An optional grace period in milliseconds to delay expiration.
             Defaults to 0, meaning no grace period is applied.
         :return: A generator that yields sorted tuples in the format `((start, end), value)`.
         """
         latest_timestamp = self._latest_timestamp_ms
+        open_windows = self._get_open_windows(prefix=prefix)
+        if open_windows is not None:
+            # Pop the expired windows from the in-memory index instead of
+            # iterating over the store
+            expired_windows = open_windows.expire(
+                max_end_ms=latest_timestamp - grace_ms
+            )
+            if expired_windows:
+                self._mark_windows_expired(expired_windows, prefix=prefix)
+            return expired_windows
+
         start_to = latest_timestamp - duration_ms - grace_ms
         start_from = -1
 
         # Find the latest start timestamp of the expired windows for the given key
-        last_expired = self.get(
-            key=LATEST_EXPIRED_WINDOW_TIMESTAMP_KEY,
-            prefix=prefix,
-            cf_name=LATEST_EXPIRED_WINDOW_CF_NAME,
-        )
+        last_expired = self.get_last_expired_window_start(prefix=prefix)
         if last_expired is not None:
             start_from = max(start_from, last_expired)
 
         # Use the latest expired timestamp to limit the iteration over
         # only those windows that have not been expired before
+        # The windows may be longer than "duration_ms" (e.g. session windows),
+        # so check their ends too.
+        # The windows of a key don't outlive the later ones,
+        # so the expired windows are always the first ones
+        max_end = latest_timestamp - grace_ms
         expired_windows = list(
-            self.get_windows(
-                start_from_ms=start_from,
-                start_to_ms=start_to,
-                prefix=prefix,
+            itertools.takewhile(
+                lambda window: window[0][1] <= max_end,
+                self.get_windows(
+                    start_from_ms=start_from,
+                    start_to_ms=start_to,
+                    prefix=prefix,
+                ),
             )
         )
         if expired_windows:
-            # Save the start of the latest expired window to the expiration index
-            latest_window = expired_windows[-1]
-            last_expired__gt = latest_window[0][0]
-            self.set(
-                key=LATEST_EXPIRED_WINDOW_TIMESTAMP_KEY,
-                value=last_expired__gt,
-                prefix=prefix,
-                cf_name=LATEST_EXPIRED_WINDOW_CF_NAME,
-            )
-            # Delete expired windows from the state
-            for (start, end), _ in expired_windows:
-                self.delete_window(start, end, prefix=prefix)
+            self._mark_windows_expired(expired_windows, prefix=prefix)
         return expired_windows
 
+    def _mark_windows_expired(
+        self, expired_windows: list[tuple[tuple[int, int], Any]], prefix: bytes
+    ):
+        # Save the start of the latest expired window to the expiration index
+        latest_window = expired_windows[-1]
+        self.set_last_expired_window_start(start_ms=latest_window[0][0], prefix=prefix)
+        # Delete expired windows from the state
+        for (start, end), _ in expired_windows:
+            self.delete(key=encode_window_key(start, end), prefix=prefix)
+
+    def get_last_expired_window_start(self, prefix: bytes) -> Optional[int]:
+        """
+        Get the start of the latest expired window from the expiration index.
+
+        :param prefix: The key prefix.
+        :return: the window start in milliseconds or `None` if no windows
+            were expired for this prefix yet.
+        """
+        return self.get(
+            key=LATEST_EXPIRED_WINDOW_TIMESTAMP_KEY,
+            prefix=prefix,
+            cf_name=LATEST_EXPIRED_WINDOW_CF_NAME,
+        )
+
+    def set_last_expired_window_start(self, start_ms: int, prefix: bytes):
+        """
+        Save the start of the latest expired window to the expiration index.
+
+        The windows starting at or before this timestamp are considered expired
+        and are not returned by `expire_windows()` anymore.
+
+        :param start_ms: The window start in milliseconds.
+        :param prefix: The key prefix.
+        """
+        self.set(
+            key=LATEST_EXPIRED_WINDOW_TIMESTAMP_KEY,
+            value=start_ms,
+            prefix=prefix,
+            cf_name=LATEST_EXPIRED_WINDOW_CF_NAME,
+        )
+
+    def get_window_index(self, prefix: bytes) -> Optional[Any]:
+        """
+        Get the in-memory index built by the window on top of the stored windows.
+
+        The indexes are not persisted.
+        The first time the message key is used in this transaction, its index
+        is taken out of the partition cache, and it's put back there only
+        when this transaction is flushed.
+
+        :param prefix: The key prefix.
+        :return: the index or `None` if it's not cached
+        """
+        if prefix not in self._window_indexes:
+            self._window_indexes[prefix] = self._partition.pop_window_index(
+                prefix=prefix
+            )
+        return self._window_indexes[prefix]
+
+    def set_window_index(self, index: Optional[Any], prefix: bytes):
+        """
+        Keep the in-memory index built by the window on top of the stored windows.
+
+        The index is cached in the partition when this transaction is flushed.
+
+        :param index: an index object or `None` to drop the existing one.
+        :param prefix: The key prefix.
+        """
+        self._window_indexes[prefix] = index
+
     def _serialize_key(self, key: Any, prefix: bytes) -> bytes:
         # Allow bytes keys in WindowedStore
         key_bytes = key if isinstance(key, bytes) else serialize(key, dumps=self._dumps)
@@ -182,6 +315,7 @@ class WindowedRocksDBPartitionTransaction(PartitionTransaction):
         start_to_ms: int,
         prefix: bytes,
         backwards: bool = False,
+        limit: Optional[int] = None,
     ) -> list[tuple[tuple[int, int], Any]]:
         """
         Get all windows that start between "start_from_ms" and "start_to_ms"
@@ -189,14 +323,44 @@ class WindowedRocksDBPartitionTransaction(PartitionTransaction):
 
         This function also checks the update cache for any updates not yet
         committed to RocksDB.
+        If the open windows of the prefix are kept in memory, they are used
+        instead of iterating over the store.
 
         :param start_from_ms: The minimal window start time, exclusive.
         :param start_to_ms: The maximum window start time, inclusive.
         :param prefix: The key prefix for filtering windows.
         :param backwards: If True, yields windows in reverse order.
+        :param limit: The maximum number of windows to return, optional.
+            With `backwards=True`, the windows with the latest starts are returned,
+            and the store iterator stops as soon as it has enough of them.
         :return: A sorted list of tuples in the format `((start, end), value)`.
         """
-        seek_from = max(start_from_ms, 0)
+        open_windows = self._get_open_windows(prefix=prefix)
+        if open_windows is not None:
+            return open_windows.get_range(
+                start_from_ms=start_from_ms,
+                start_to_ms=start_to_ms,
+                backwards=backwards,
+                limit=limit,
+            )
+        return self._get_windows_from_store(
+            start_from_ms=start_from_ms,
+            start_to_ms=start_to_ms,
+            prefix=prefix,
+            backwards=backwards,
+            limit=limit,
+        )
+
+    def _get_windows_from_store(
+        self,
+        start_from_ms: int,
+        start_to_ms: int,
+        prefix: bytes,
+        backwards: bool = False,
+        limit: Optional[int] = None,
+    ) -> list[tuple[tuple[int, int], Any]]:
+        # Add +1 to make the lower bound exclusive
+        seek_from = max(start_from_ms + 1, 0)
         seek_from_key = encode_window_prefix(prefix=prefix, start_ms=seek_from)
 
         # Add +1 to make the upper bound inclusive
@@ -208,35 +372,53 @@ class WindowedRocksDBPartitionTransaction(PartitionTransaction):
         read_opt = ReadOptions()
         read_opt.set_iterate_lower_bound(seek_from_key)
         read_opt.set_iterate_upper_bound(seek_to_key)
-        db_windows = self._partition.iter_items(
-            read_opt=read_opt, from_key=seek_from_key
+        db_windows: Iterable[tuple[bytes, bytes]] = self._partition.iter_items(
+            read_opt=read_opt,
+            from_key=seek_to_key if backwards else seek_from_key,
+            backwards=backwards,
         )
+        if backwards:
+            # The reverse iterator doesn't respect the lower bound
+            db_windows = itertools.takewhile(
+                lambda kv: kv[0] >= seek_from_key, db_windows
+            )
 
-        # Get cached updates with matching keys
+        # Get cached updates with matching keys.
+        # The cached values are not serialized yet, unlike the stored ones.
         update_cache = self._update_cache
-        updated_windows = (
-            (k, v)
+        updated_windows = {
+            k: v
             for k, v in update_cache.get_updates(cf_name="default")
             .get(prefix, {})
             .items()
             if seek_from_key < k <= seek_to_key
-        )
+        }
 
-        # Iterate over stored and cached windows and merge them to a single dict
         deleted_windows = update_cache.get_deletes(cf_name="default")
-        merged_windows = {}
-        for key, value in itertools.chain(db_windows, updated_windows):
+        db_windows = (kv for kv in db_windows if kv[0] not in deleted_windows)
+        if limit is not None:
+            # The stored windows are already sorted, and the cached ones are merged
+            # with them below, so only the first "limit" stored windows are needed
+            db_windows = itertools.islice(db_windows, limit)
+
+        # Iterate over stored and cached windows and merge them to a single dict
+        merged_windows = dict(db_windows)
+        for key, value in updated_windows.items():
             if key not in deleted_windows:
                 merged_windows[key] = value
 
-        # Sort and deserialize windows merged from the cache and store
-        result = []
-        for window_key, window_value in sorted(
+        # Sort windows merged from the cache and store and deserialize the stored ones
+        sorted_windows = sorted(
             merged_windows.items(), key=lambda kv: kv[0], reverse=backwards
-        ):
+        )
+        if limit is not None:
+            sorted_windows = sorted_windows[:limit]
+
+        result = []
+        for window_key, window_value in sorted_windows:
             _, start, end = parse_window_key(window_key)
-            if start_from_ms < start <= start_to_ms:
-                value = self._deserialize_value(window_value)
-                result.append(((start, end), value))
+            if window_key not in updated_windows:
+                window_value = self._deserialize_value(window_value)
+            result.append(((start, end), window_value))
 
         return result
@@ -0,0 +1,374 @@
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from confluent_kafka import OFFSET_BEGINNING, TopicPartition as ConfluentPartition
+
+from quixstreams.kafka import Consumer
+from quixstreams.kafka.exceptions import KafkaConsumerException
+from quixstreams.models import ConfluentKafkaMessageProto
+from quixstreams.models.topics import TopicManager
+from quixstreams.utils.json import loads as json_loads
+from .base import Store
+from .metadata import CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER
+from .rocksdb import RocksDBStore, RocksDBStorePartition
+
+logger = logging.getLogger(__name__)
+
+__all__ = ("StandbyManager", "StandbyPartition")
+
+
+class StandbyPartition:
+    """
+    A changelog topic partition mapped to a `StorePartition` kept as a standby
+    replica of the store partition assigned to another consumer in the group.
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        changelog_name: str,
+        partition_num: int,
+        store_partition: RocksDBStorePartition,
+    ):
+        self._topic = topic
+        self._changelog_name = changelog_name
+        self._partition_num = partition_num
+        self._store_partition = store_partition
+        self.paused = False
+
+    def __repr__(self):
+        return f"{self.changelog_name}[{self.partition_num}]"
+
+    @property
+    def topic(self) -> str:
+        return self._topic
+
+    @property
+    def changelog_name(self) -> str:
+        return self._changelog_name
+
+    @property
+    def partition_num(self) -> int:
+        return self._partition_num
+
+    @property
+    def store_partition(self) -> RocksDBStorePartition:
+        return self._store_partition
+
+    @property
+    def consume_offset(self) -> int:
+        """
+        The changelog offset to start tailing from.
+        """
+        offset = self._store_partition.get_changelog_offset()
+        return OFFSET_BEGINNING if offset is None else offset + 1
+
+    def apply(
+        self,
+        changelog_messages: List[ConfluentKafkaMessageProto],
+        committed_offset: int,
+    ) -> Optional[int]:
+        """
+        Apply the changelog messages to the standby store partition up to the first
+        message produced for a not-yet-committed source topic offset.
+
+        :param changelog_messages: a list of changelog messages ordered by offset
+        :param committed_offset: latest committed offset of the source topic partition
+        :return: the offset of the first message that was not applied or `None`
+            if all messages were applied
+        """
+        stop_at = None
+        for i, message in enumerate(changelog_messages):
+            processed_offset = _get_processed_offset(message)
+            if processed_offset is not None and processed_offset >= committed_offset:
+                stop_at = i
+                break
+
+        to_apply = changelog_messages[:stop_at]
+        self._store_partition.recover_from_changelog_messages(
+            changelog_messages=to_apply, committed_offset=committed_offset
+        )
+        if stop_at is not None:
+            return changelog_messages[stop_at].offset()
+
+    def close(self):
+        self._store_partition.complete_recovery()
+        self._store_partition.close()
+
+
+class StandbyManager:
+    """
+    Keeps warm standby replicas of some of the state store partitions which are
+    not assigned to this application instance.
+
+    For each assigned partition `N`, the partitions `N + 1` ... `N + num_replicas`
+    (wrapping around the number of partitions) are replicated, unless they are
+    assigned to this instance too.
+    When the partitions are spread over the consumers in the group, each of them
+    gets up to `num_replicas` standby replicas on the other instances, and every
+    instance replicates at most `num_replicas` partitions per assigned one.
+
+    It tails the changelog partitions with a separate consumer that is assigned
+    the partitions manually and never joins the consumer group.
+    The changelog updates are applied to the local store partitions only up
+    to the latest committed offset of the source topic partition, the same way
+    the recovery does it.
+
+    When the partition is assigned to the application, its standby replica
+    is closed and the `RecoveryManager` replays only the tail of the changelog
+    which the standby has not caught up with yet.
+
+    Only RocksDB stores are replicated.
+    """
+
+    def __init__(
+        self,
+        consumer: Consumer,
+        topic_manager: TopicManager,
+        num_replicas: int = 1,
+        batch_size: int = 1000,
+        refresh_interval: float = 5.0,
+    ):
+        """
+        :param consumer: a Consumer instance for the changelog topics.
+            It must use the same consumer group as the application to read
+            the committed offsets, and it must not be subscribed to any topic.
+        :param topic_manager: a TopicManager instance
+        :param num_replicas: the number of partitions to replicate per each
+            partition assigned to the application. Default - `1`.
+        :param batch_size: the maximum number of changelog messages to consume
+            and apply at once.
+            It bounds the time the processing loop spends in `update()`.
+            Default - `1000`.
+        :param refresh_interval: how often to refresh the committed offsets
+            and to retry opening the store partitions locked by other
+            processes, in seconds. Default - `5.0`.
+        """
+        self._consumer = consumer
+        self._topic_manager = topic_manager
+        self._num_replicas = num_replicas
+        self._batch_size = batch_size
+        self._refresh_interval = refresh_interval
+        self._partitions: Dict[Tuple[str, int], StandbyPartition] = {}
+        self._partitions_counts: Dict[str, int] = {}
+        self._committed_offsets: Dict[Tuple[str, int], int] = {}
+        self._refresh_at = 0.0
+        self._reconcile_at: Optional[float] = 0.0
+
+    @property
+    def partitions(self) -> Dict[Tuple[str, int], StandbyPartition]:
+        """
+        Returns a mapping of the standby partitions in the following format:
+        {(<changelog name>, <partition>): <StandbyPartition>}
+        """
+        return self._partitions
+
+    def request_reconcile(self):
+        """
+        Re-evaluate the set of the standby partitions on the next `update()`.
+
+        Called when the partitions are assigned to or revoked from
+        the application, because the replicated partitions depend on
+        the assigned ones.
+        """
+        self._reconcile_at = 0.0
+
+    def release(self, topic: str, partition: int):
+        """
+        Close the standby replicas of all store partitions for the given
+        topic partition, so they can be assigned to the application.
+
+        :param topic: source topic name
+        :param partition: source topic partition
+        """
+        released = [
+            sp
+            for sp in self._partitions.values()
+            if sp.topic == topic and sp.partition_num == partition
+        ]
+        if released:
+            logger.debug(f"Releasing standby partitions {list(map(str, released))}")
+            self._close_partitions(released)
+
+    def update(self, stores: Dict[str, Dict[str, Store]]):
+        """
+        Reconcile the standby partitions if needed and apply a batch
+        of the available changelog updates.
+
+        It does not block waiting for the new changelog messages.
+
+        :param stores: registered stores in format {topic: {store_name: store}}
+        """
+        now = time.monotonic()
+        if self._reconcile_at is not None and now >= self._reconcile_at:
+            self._reconcile(stores)
+
+        if not self._partitions:
+            return
+
+        if now >= self._refresh_at:
+            self._refresh_committed_offsets()
+            self._refresh_at = now + self._refresh_interval
+
+        msgs = self._consumer.consume(num_messages=self._batch_size, timeout=0)
+        if not msgs:
+            return
+
+        # Group the messages by changelog partition preserving their order
+        # to apply each group at once
+        msgs_by_tp: Dict[Tuple[str, int], List[ConfluentKafkaMessageProto]] = {}
+        for msg in msgs:
+            if (err := msg.error()) is not None:
+                raise KafkaConsumerException(error=err)
+            msgs_by_tp.setdefault((msg.topic(), msg.partition()), []).append(msg)
+
+        for (changelog_name, partition), tp_msgs in msgs_by_tp.items():
+            standby_partition = self._partitions.get((changelog_name, partition))
+            if standby_partition is None or standby_partition.paused:
+                # The partition was released or it waits for the next commit
+                continue
+            committed_offset = self._committed_offsets[
+                (standby_partition.topic, partition)
+            ]
+            stopped_at = standby_partition.apply(tp_msgs, committed_offset)
+            if stopped_at is not None:
+                # Wait until the source topic offset is committed
+                # and rewind to the first not applied message
+                tp = ConfluentPartition(changelog_name, partition, stopped_at)
+                self._consumer.pause([tp])
+                self._consumer.seek(tp)
+                standby_partition.paused = True
+
+    def close(self):
+        """
+        Close all standby partitions.
+
+        The changelog partitions are not unassigned, because the consumer
+        may be already closed.
+        """
+        for sp in self._partitions.values():
+            sp.close()
+        self._partitions.clear()
+
+    def _reconcile(self, stores: Dict[str, Dict[str, Store]]):
+        self._reconcile_at = None
+        to_open = []
+        selected = set()
+        for topic, topic_stores in stores.items():
+            for store_name, store in topic_stores.items():
+                if not isinstance(store, RocksDBStore):
+                    continue
+                changelog_name = self._topic_manager.changelog_topics[topic][
+                    store_name
+                ].name
+                partitions = self._select_partitions(
+                    assigned=store.partitions.keys(),
+                    partitions_count=self._get_partitions_count(changelog_name),
+                )
+                for partition in partitions:
+                    selected.add((changelog_name, partition))
+                    if (changelog_name, partition) not in self._partitions:
+                        to_open.append((topic, changelog_name, partition, store))
+
+        # Close the standby partitions which are not selected anymore
+        # after the assignment has changed
+        to_close = [sp for tp, sp in self._partitions.items() if tp not in selected]
+        if to_close:
+            logger.debug(f"Stopping standby partitions {list(map(str, to_close))}")
+            self._close_partitions(to_close)
+
+        opened = []
+        for topic, changelog_name, partition, store in to_open:
+            try:
+                store_partition = store.create_standby_partition(partition)
+            except Exception as exc:
+                # The partition is likely used by another process on this host
+                logger.debug(
+                    f"Failed to open a standby partition "
+                    f"{changelog_name}[{partition}], retrying later: {exc}"
+                )
+                self._reconcile_at = time.monotonic() + self._refresh_interval
+                continue
+            standby_partition = StandbyPartition(
+                topic=topic,
+                changelog_name=changelog_name,
+                partition_num=partition,
+                store_partition=store_partition,
+            )
+            self._partitions[(changelog_name, partition)] = standby_partition
+            opened.append(standby_partition)
+
+        if opened:
+            logger.debug(f"Starting standby partitions {list(map(str, opened))}")
+            self._consumer.incremental_assign(
+                [
+                    ConfluentPartition(
+                        sp.changelog_name, sp.partition_num, sp.consume_offset
+                    )
+                    for sp in opened
+                ]
+            )
+            # Make sure the new partitions use the fresh committed offsets
+            self._refresh_at = 0.0
+
+    def _select_partitions(
+        self, assigned: Iterable[int], partitions_count: int
+    ) -> Set[int]:
+        """
+        Select the partitions to replicate based on the assigned ones.
+
+        :param assigned: the assigned partition numbers
+        :param partitions_count: the total number of partitions
+        :return: a set of partition numbers to replicate
+        """
+        assigned = set(assigned)
+        return {
+            (partition + i) % partitions_count
+            for partition in assigned
+            for i in range(1, self._num_replicas + 1)
+        } - assigned
+
+    def _refresh_committed_offsets(self):
+        source_tps = {(sp.topic, sp.partition_num) for sp in self._partitions.values()}
+        committed_tps = self._consumer.committed(
+            [ConfluentPartition(topic, partition) for topic, partition in source_tps],
+            timeout=30,
+        )
+        self._committed_offsets = {
+            (tp.topic, tp.partition): tp.offset for tp in committed_tps
+        }
+        paused = [sp for sp in self._partitions.values() if sp.paused]
+        if paused:
+            self._consumer.resume(
+                [
+                    ConfluentPartition(sp.changelog_name, sp.partition_num)
+                    for sp in paused
+                ]
+            )
+            for sp in paused:
+                sp.paused = False
+
+    def _get_partitions_count(self, changelog_name: str) -> int:
+        count = self._partitions_counts.get(changelog_name)
+        if count is None:
+            metadata = self._consumer.list_topics(topic=changelog_name, timeout=10)
+            count = len(metadata.topics[changelog_name].partitions)
+            self._partitions_counts[changelog_name] = count
+        return count
+
+    def _close_partitions(self, standby_partitions: List[StandbyPartition]):
+        self._consumer.incremental_unassign(
+            [
+                ConfluentPartition(sp.changelog_name, sp.partition_num)
+                for sp in standby_partitions
+            ]
+        )
+        for sp in standby_partitions:
+            del self._partitions[(sp.changelog_name, sp.partition_num)]
+            sp.close()
+
+
+def _get_processed_offset(message: ConfluentKafkaMessageProto) -> Optional[int]:
+    headers = dict(message.headers() or ())
+    return json_loads(headers.get(CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER, b"null"))
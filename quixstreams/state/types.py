@@ -66,7 +66,11 @@ class WindowedState(Protocol):
         ...
 
     def get_windows(
-        self, start_from_ms: int, start_to_ms: int, backwards: bool = False
+        self,
+        start_from_ms: int,
+        start_to_ms: int,
+        backwards: bool = False,
+        limit: Optional[int] = None,
     ) -> list[tuple[tuple[int, int], Any]]:
         """
         Get all windows that start between "start_from_ms" and "start_to_ms".
@@ -74,10 +78,53 @@ class WindowedState(Protocol):
         :param start_from_ms: The minimal window start time, exclusive.
         :param start_to_ms: The maximum window start time, inclusive.
         :param backwards: If True, yields windows in reverse order.
+        :param limit: The maximum number of windows to return, optional.
         :return: A sorted list of tuples in the format `((start, end), value)`.
         """
         ...
 
+    def delete_window(self, start_ms: int, end_ms: int):
+        """
+        Delete the window defined by `start` and `end` timestamps from the state.
+
+        :param start_ms: start of the window in milliseconds
+        :param end_ms: end of the window in milliseconds
+        """
+        ...
+
+    def get_last_expired_window_start(self) -> Optional[int]:
+        """
+        Get the start of the latest expired window from the expiration index.
+
+        :return: the window start in milliseconds or `None` if no windows
+            were expired yet
+        """
+        ...
+
+    def set_last_expired_window_start(self, start_ms: int):
+        """
+        Save the start of the latest expired window to the expiration index.
+
+        :param start_ms: the window start in milliseconds
+        """
+        ...
+
+    def get_window_index(self) -> Optional[Any]:
+        """
+        Get the in-memory index built by the window on top of the stored windows.
+
+        :return: the index or `None` if it's not cached
+        """
+        ...
+
+    def set_window_index(self, index: Optional[Any]):
+        """
+        Keep the in-memory index built by the window on top of the stored windows.
+
+        :param index: an index object or `None` to drop the existing one
+        """
+        ...
+
 
 class WindowedPartitionTransaction(Protocol):
     @property
@@ -198,6 +245,7 @@ class WindowedPartitionTransaction(Protocol):
         start_to_ms: int,
         prefix: bytes,
         backwards: bool = False,
+        limit: Optional[int] = None,
     ) -> list[tuple[tuple[int, int], Any]]:
         """
         Get all windows that start between "start_from_ms" and "start_to_ms"
@@ -207,10 +255,58 @@ class WindowedPartitionTransaction(Protocol):
         :param start_to_ms: The maximum window start time, inclusive.
         :param prefix: The key prefix for filtering windows.
         :param backwards: If True, yields windows in reverse order.
+        :param limit: The maximum number of windows to return, optional.
         :return: A sorted list of tuples in the format `((start, end), value)`.
         """
         ...
 
+    def delete_window(self, start_ms: int, end_ms: int, prefix: bytes):
+        """
+        Delete the window defined by `start` and `end` timestamps from the state.
+
+        :param start_ms: start of the window in milliseconds
+        :param end_ms: end of the window in milliseconds
+        :param prefix: a key prefix
+        """
+        ...
+
+    def get_last_expired_window_start(self, prefix: bytes) -> Optional[int]:
+        """
+        Get the start of the latest expired window from the expiration index.
+
+        :param prefix: a key prefix
+        :return: the window start in milliseconds or `None` if no windows
+            were expired yet
+        """
+        ...
+
+    def set_last_expired_window_start(self, start_ms: int, prefix: bytes):
+        """
+        Save the start of the latest expired window to the expiration index.
+
+        :param start_ms: the window start in milliseconds
+        :param prefix: a key prefix
+        """
+        ...
+
+    def get_window_index(self, prefix: bytes) -> Optional[Any]:
+        """
+        Get the in-memory index built by the window on top of the stored windows.
+
+        :param prefix: a key prefix
+        :return: the index or `None` if it's not cached
+        """
+        ...
+
+    def set_window_index(self, index: Optional[Any], prefix: bytes):
+        """
+        Keep the in-memory index built by the window on top of the stored windows.
+
+        :param index: an index object or `None` to drop the existing one
+        :param prefix: a key prefix
+        """
+        ...
+
     def flush(
         self,
         processed_offset: Optional[int] = None,
@@ -0,0 +1,93 @@
+import asyncio
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+
+__all__ = (
+    "get_event_loop",
+    "set_event_loop",
+    "run_coroutine",
+    "to_sync",
+)
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+# The loop of the application running with `Application.run_async()`
+_app_loop: Optional[asyncio.AbstractEventLoop] = None
+# The loop started in a background thread when the application is not running
+# in an event loop
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def set_event_loop(loop: Optional[asyncio.AbstractEventLoop]):
+    """
+    Set the event loop to run the coroutines of the application in.
+
+    It's set by `Application.run_async()` to run the async callbacks in the same
+    loop as the application.
+    Pass `None` to reset it.
+    """
+    global _app_loop
+    _app_loop = loop
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop to run the coroutines of the application in.
+
+    It's the loop of `Application.run_async()` when the application runs in it.
+    Otherwise, it's a loop running in a background daemon thread started
+    on the first call.
+    """
+    if _app_loop is not None:
+        return _app_loop
+
+    global _background_loop
+    with _lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="quixstreams-event-loop", daemon=True
+            ).start()
+            _background_loop = loop
+    return _background_loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine in the application event loop and wait for its result.
+
+    The coroutine runs in a copy of the caller's `contextvars` context,
+    so it can access the message context of the processed record.
+
+    It must not be called from the event loop thread itself because
+    it would block the loop.
+
+    :param coro: a coroutine to run
+    :return: the result of the coroutine
+    """
+    loop = get_event_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError(
+            "Cannot wait for a coroutine in the thread running its event loop"
+        )
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def to_sync(func: Callable[..., Awaitable[T]]) -> Callable[..., T]:
+    """
+    Wrap a coroutine function into a regular function which runs the coroutine
+    in the application event loop and returns its result.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        return run_coroutine(func(*args, **kwargs))
+
+    return wrapper
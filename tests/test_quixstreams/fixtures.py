@@ -45,10 +45,12 @@ from quixstreams.platforms.quix.config import (
     QuixApplicationConfig,
 )
 from quixstreams.rowconsumer import RowConsumer
-from quixstreams.rowproducer import RowProducer
+from quixstreams.rowproducer import RowProducer, DeliveryReports
 from quixstreams.state import StateStoreManager
 from quixstreams.state.manager import StoreTypes
 from quixstreams.state.recovery import RecoveryManager
+from quixstreams.state.rocksdb import RocksDBOptions
+from quixstreams.state.standby import StandbyManager
 
 
 @pytest.fixture()
@@ -227,12 +229,14 @@ def row_producer_factory(kafka_container):
         extra_config: dict = None,
         on_error: Optional[ProducerErrorCallback] = None,
         transactional: bool = False,
+        delivery_reports: DeliveryReports = "all",
     ) -> RowProducer:
         return RowProducer(
             broker_address=broker_address,
             extra_config=extra_config,
             on_error=on_error,
             transactional=transactional,
+            delivery_reports=delivery_reports,
         )
 
     return factory
@@ -264,12 +268,14 @@ def row_factory():
         headers=None,
         partition: int = 0,
         offset: int = 0,
+        raw=None,
     ) -> Row:
         context = MessageContext(
             topic=topic,
             partition=partition,
             offset=offset,
             size=0,
+            raw=raw,
         )
         return Row(
             value=value, key=key, timestamp=timestamp, context=context, headers=headers
@@ -297,6 +303,7 @@ def app_factory(kafka_container, random_consumer_group, tmp_path, store_type):
         topic_manager: Optional[TopicManager] = None,
         processing_guarantee: ProcessingGuarantee = "at-least-once",
         request_timeout: float = 30,
+        consumer_batch_size: int = 1,
         store_type: StoreTypes = store_type,
     ) -> Application:
         state_dir = state_dir or (tmp_path / "state").absolute()
@@ -318,14 +325,11 @@ def app_factory(kafka_container, random_consumer_group, tmp_path, store_type):
             topic_manager=topic_manager,
             processing_guarantee=processing_guarantee,
             request_timeout=request_timeout,
+            consumer_batch_size=consumer_batch_size,
+            default_store_type=store_type,
         )
 
-    with patch(
-        "quixstreams.state.manager.StateStoreManager.default_store_type",
-        new_callable=PropertyMock,
-    ) as m:
-        m.return_value = store_type
-        yield factory
+    return factory
 
 
 @pytest.fixture()
@@ -336,6 +340,8 @@ def state_manager_factory(store_type, tmp_path):
         producer: Optional[RowProducer] = None,
         recovery_manager: Optional[RecoveryManager] = None,
         default_store_type: StoreTypes = store_type,
+        standby_manager: Optional[StandbyManager] = None,
+        rocksdb_options: Optional[RocksDBOptions] = None,
     ) -> StateStoreManager:
         group_id = group_id or str(uuid.uuid4())
         state_dir = state_dir or str(uuid.uuid4())
@@ -345,6 +351,8 @@ def state_manager_factory(store_type, tmp_path):
             producer=producer,
             recovery_manager=recovery_manager,
             default_store_type=default_store_type,
+            standby_manager=standby_manager,
+            rocksdb_options=rocksdb_options,
         )
 
     return factory
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import logging
 import os
@@ -31,6 +32,7 @@ from quixstreams.rowproducer import RowProducer
 from quixstreams.sinks import SinkBatch, SinkBackpressureError
 from quixstreams.state import State
 from quixstreams.state.manager import SUPPORTED_STORES
+from quixstreams.state.memory import MemoryStore, MemoryStoreOptions
 from quixstreams.sources import SourceException, multiprocessing
 from tests.utils import DummySink, DummySource
 
@@ -185,6 +187,195 @@ class TestApplication:
             assert row.timestamp == timestamp_ms
             assert row.headers == headers
 
+    def test_run_success_batched(
+        self,
+        app_factory,
+        row_consumer_factory,
+        executor,
+    ):
+        """
+        Test that the app processes the messages consumed in batches
+        and commits the offsets of the last message in the batch.
+        """
+
+        def on_message_processed(topic_, partition, offset):
+            nonlocal processed_count
+
+            processed_count += 1
+            if processed_count == total_messages:
+                done.set_result(True)
+
+        app = app_factory(
+            auto_offset_reset="earliest",
+            on_message_processed=on_message_processed,
+            consumer_batch_size=10,
+        )
+
+        partition_num = 0
+        topic_in = app.topic(
+            str(uuid.uuid4()),
+            value_deserializer=JSONDeserializer(),
+        )
+        topic_out = app.topic(
+            str(uuid.uuid4()),
+            value_serializer=JSONSerializer(),
+            value_deserializer=JSONDeserializer(),
+        )
+        sdf = app.dataframe(topic_in)
+        sdf = sdf.to_topic(topic_out)
+
+        processed_count = 0
+        total_messages = 25
+        with app.get_producer() as producer:
+            for i in range(total_messages):
+                producer.produce(
+                    topic_in.name,
+                    key=b"key",
+                    value=dumps(i).encode(),
+                    partition=partition_num,
+                )
+
+        done = Future()
+
+        # Stop app when the future is resolved
+        executor.submit(_stop_app_on_future, app, done, 15.0)
+        app.run()
+
+        # Check that all messages have been processed
+        assert processed_count == total_messages
+
+        # Ensure that the right offset is committed
+        with row_consumer_factory(auto_offset_reset="latest") as row_consumer:
+            committed, *_ = row_consumer.committed(
+                [TopicPartition(topic_in.name, partition_num)]
+            )
+            assert committed.offset == total_messages
+
+        # Confirm messages were produced by the app in the original order
+        rows_out = []
+        with row_consumer_factory(auto_offset_reset="earliest") as row_consumer:
+            row_consumer.subscribe([topic_out])
+            while len(rows_out) < total_messages:
+                rows_out.append(row_consumer.poll_row(timeout=5))
+
+        assert [row.value for row in rows_out] == list(range(total_messages))
+
+    def test_run_async_success(self, app_factory, row_consumer_factory):
+        """
+        Test that the app running in the event loop awaits the async callbacks
+        in the same loop and commits the processed offsets.
+        """
+
+        def on_message_processed(topic_, partition, offset):
+            nonlocal processed_count
+
+            processed_count += 1
+            if processed_count == total_messages:
+                app.stop()
+
+        app = app_factory(
+            auto_offset_reset="earliest",
+            on_message_processed=on_message_processed,
+        )
+        topic_in = app.topic(str(uuid.uuid4()), value_deserializer=JSONDeserializer())
+
+        loops = []
+
+        async def apply(value):
+            loops.append(asyncio.get_running_loop())
+            await asyncio.sleep(0)
+            return value
+
+        sdf = app.dataframe(topic_in)
+        sdf = sdf.apply(apply)
+
+        processed_count = 0
+        total_messages = 3
+        with app.get_producer() as producer:
+            for _ in range(total_messages):
+                producer.produce(topic_in.name, key=b"key", value=b'"value"')
+
+        async def main():
+            await asyncio.wait_for(app.run_async(), timeout=15.0)
+            return asyncio.get_running_loop()
+
+        loop = asyncio.run(main())
+
+        assert processed_count == total_messages
+        assert loops == [loop] * total_messages
+        with row_consumer_factory(auto_offset_reset="latest") as row_consumer:
+            committed, *_ = row_consumer.committed([TopicPartition(topic_in.name, 0)])
+            assert committed.offset == total_messages
+
+    def test_run_batched_apply_batch(
+        self,
+        app_factory,
+        row_consumer_factory,
+        executor,
+    ):
+        """
+        Test that the batch functions process the consumed batches at once
+        and keep the keys and the order of the records.
+        """
+
+        def on_message_processed(topic_, partition, offset):
+            nonlocal processed_count
+
+            processed_count += 1
+            if processed_count == total_messages:
+                done.set_result(True)
+
+        app = app_factory(
+            auto_offset_reset="earliest",
+            on_message_processed=on_message_processed,
+            consumer_batch_size=10,
+        )
+
+        topic_in = app.topic(str(uuid.uuid4()), value_deserializer=JSONDeserializer())
+        topic_out = app.topic(
+            str(uuid.uuid4()),
+            value_serializer=JSONSerializer(),
+            value_deserializer=JSONDeserializer(),
+        )
+        batch_sizes = []
+
+        def double(values):
+            batch_sizes.append(len(values))
+            return [v * 2 for v in values]
+
+        sdf = app.dataframe(topic_in)
+        sdf = sdf.apply_batch(double)
+        sdf = sdf.filter_batch(lambda values: [v % 4 == 0 for v in values])
+        sdf = sdf.to_topic(topic_out)
+
+        processed_count = 0
+        total_messages = 20
+        with app.get_producer() as producer:
+            for i in range(total_messages):
+                producer.produce(
+                    topic_in.name, key=f"key{i}".encode(), value=dumps(i).encode()
+                )
+
+        done = Future()
+
+        # Stop app when the future is resolved
+        executor.submit(_stop_app_on_future, app, done, 15.0)
+        app.run()
+
+        assert processed_count == total_messages
+        assert sum(batch_sizes) == total_messages
+        assert len(batch_sizes) < total_messages
+
+        rows_out = []
+        with row_consumer_factory(auto_offset_reset="earliest") as row_consumer:
+            row_consumer.subscribe([topic_out])
+            while len(rows_out) < total_messages // 2:
+                rows_out.append(row_consumer.poll_row(timeout=5))
+
+        assert [(row.key, row.value) for row in rows_out] == [
+            (f"key{i}".encode(), i * 2) for i in range(0, total_messages, 2)
+        ]
+
     def test_run_fails_no_commit(
         self,
         app_factory,
@@ -239,6 +430,13 @@ class TestApplication:
             )
         assert committed.offset == -1001
 
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_run_workers_invalid(self, app_factory, workers):
+        # Multiple workers require the "app_factory"
+        app = app_factory()
+        with pytest.raises(ValueError):
+            app.run(workers=workers)
+
     def test_run_consumer_error_raised(self, app_factory, executor):
         # Set "auto_offset_reset" to "error" to simulate errors in Consumer
         app = app_factory(auto_offset_reset="error")
@@ -420,6 +618,37 @@ class TestApplication:
         sdf = app.dataframe(topic)
         assert isinstance(sdf, StreamingDataFrame)
 
+    def test_default_store_type(self, tmp_path):
+        options = MemoryStoreOptions(snapshot_interval=10.0)
+        app = Application(
+            broker_address="localhost",
+            consumer_group="test",
+            state_dir=tmp_path,
+            default_store_type=MemoryStore,
+            memory_store_options=options,
+            use_changelog_topics=False,
+        )
+        topic = app.topic(name="test-topic")
+        app.dataframe(topic).apply(lambda value, state: value, stateful=True)
+
+        store = app._state_manager.get_store(topic=topic.name, store_name="default")
+        assert isinstance(store, MemoryStore)
+        assert store._options == options
+
+    @pytest.mark.parametrize(
+        "num_standby_replicas, use_changelog_topics",
+        [(-1, True), (1, False)],
+    )
+    def test_num_standby_replicas_invalid(
+        self, num_standby_replicas, use_changelog_topics
+    ):
+        with pytest.raises(ValueError):
+            Application(
+                broker_address="localhost",
+                num_standby_replicas=num_standby_replicas,
+                use_changelog_topics=use_changelog_topics,
+            )
+
     def test_topic_auto_create_true(self, app_factory):
         """
         Topics are auto-created when auto_create_topics=True
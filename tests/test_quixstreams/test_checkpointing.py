@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 from typing import Optional
 from unittest.mock import patch, MagicMock
@@ -13,7 +14,12 @@ from quixstreams.checkpointing.exceptions import (
 from quixstreams.kafka import Consumer
 from quixstreams.processing import PausingManager
 from quixstreams.rowproducer import RowProducer
-from quixstreams.sinks import SinkManager, BatchingSink, SinkBackpressureError
+from quixstreams.sinks import (
+    SinkManager,
+    BatchingSink,
+    AsyncBatchingSink,
+    SinkBackpressureError,
+)
 from quixstreams.sinks.base import SinkBatch
 from quixstreams.state import StateStoreManager
 from quixstreams.state.manager import SUPPORTED_STORES
@@ -72,6 +78,23 @@ class FailingSink(BatchingSink):
         raise ValueError("Sink write failed")
 
 
+class AsyncDummySink(AsyncBatchingSink):
+    def __init__(self):
+        super().__init__()
+        self.results = []
+
+    async def write(self, batch: SinkBatch):
+        await asyncio.sleep(0)
+        self.results.extend(batch)
+
+
+class AsyncBackpressuredSink(AsyncBatchingSink):
+    async def write(self, batch: SinkBatch):
+        raise SinkBackpressureError(
+            retry_after=999, topic=batch.topic, partition=batch.partition
+        )
+
+
 @pytest.mark.parametrize("store_type", SUPPORTED_STORES, indirect=True)
 class TestCheckpoint:
     def test_empty_true(self, checkpoint_factory):
@@ -114,6 +137,30 @@ class TestCheckpoint:
         with pytest.raises(InvalidStoredOffset):
             checkpoint.store_offset("topic", 0, 10)
 
+    def test_store_offset_range_expired_with_commit_every(self, checkpoint_factory):
+        checkpoint = checkpoint_factory(commit_interval=999, commit_every=5)
+        checkpoint.store_offset_range(
+            "topic", 0, first_offset=0, last_offset=3, count=4
+        )
+        assert not checkpoint.expired()
+
+        checkpoint.store_offset_range(
+            "topic", 0, first_offset=4, last_offset=4, count=1
+        )
+        assert checkpoint.expired()
+
+    def test_store_offset_range_already_processed_offset_fails(
+        self, checkpoint_factory
+    ):
+        checkpoint = checkpoint_factory()
+        checkpoint.store_offset_range(
+            "topic", 0, first_offset=5, last_offset=10, count=6
+        )
+        with pytest.raises(InvalidStoredOffset):
+            checkpoint.store_offset_range(
+                "topic", 0, first_offset=10, last_offset=12, count=3
+            )
+
     @pytest.mark.parametrize("exactly_once", [False, True])
     def test_commit_no_state_success(
         self, checkpoint_factory, consumer, state_manager, topic_factory, exactly_once
@@ -216,6 +263,44 @@ class TestCheckpoint:
         assert store_partition.get_changelog_offset() == 1
         assert store_partition.get_processed_offset() == 999
 
+    def test_commit_with_state_with_changelog_errors_only_delivery_reports(
+        self,
+        checkpoint_factory,
+        row_producer_factory,
+        consumer,
+        state_manager_factory,
+        recovery_manager_factory,
+        topic_factory,
+    ):
+        topic_name, _ = topic_factory()
+        producer = row_producer_factory(delivery_reports="errors")
+        recovery_manager = recovery_manager_factory(consumer=consumer)
+        state_manager = state_manager_factory(
+            producer=producer, recovery_manager=recovery_manager
+        )
+        checkpoint = checkpoint_factory(
+            consumer_=consumer, state_manager_=state_manager, producer_=producer
+        )
+        state_manager.register_store(topic_name, "default")
+        store = state_manager.get_store(topic_name, "default")
+        store_partition = store.assign_partition(0)
+
+        tx = checkpoint.get_store_transaction(topic_name, 0)
+        tx.set(key="key1", value="value", prefix=b"__key__")
+        tx.set(key="key2", value="value", prefix=b"__key__")
+        checkpoint.store_offset(topic_name, 0, 999)
+
+        with patch.object(
+            consumer, "offsets_for_times", wraps=consumer.offsets_for_times
+        ) as offsets_for_times:
+            checkpoint.commit()
+
+        # The changelog offsets are queried in one request after the flush
+        offsets_for_times.assert_called_once()
+        assert tx.completed
+        assert store_partition.get_changelog_offset() == 1
+        assert store_partition.get_processed_offset() == 999
+
     @pytest.mark.parametrize("exactly_once", [False, True])
     def test_commit_with_state_and_changelog_no_updates_success(
         self,
@@ -534,6 +619,90 @@ class TestCheckpoint:
             assert sink_result.timestamp == timestamp
             assert sink_result.headers == headers
 
+    def test_commit_with_async_sinks_success(
+        self,
+        topic_factory,
+        consumer,
+        state_manager,
+        checkpoint_factory,
+        rowproducer_mock,
+    ):
+        topic_name, _ = topic_factory(num_partitions=2)
+        sink_manager = SinkManager()
+        checkpoint = checkpoint_factory(
+            consumer_=consumer, state_manager_=state_manager, sink_manager_=sink_manager
+        )
+
+        processed_offset = 999
+        sink = AsyncDummySink()
+        sink_manager.register(sink)
+        # Add messages for two partitions to flush them concurrently
+        for partition in (0, 1):
+            sink.add(
+                value=partition,
+                key="key",
+                timestamp=1,
+                topic=topic_name,
+                partition=partition,
+                headers=[],
+                offset=processed_offset,
+            )
+            checkpoint.store_offset(topic_name, partition, processed_offset)
+
+        checkpoint.commit()
+
+        assert sorted(item.value for item in sink.results) == [0, 1]
+        committed = consumer.committed(
+            [
+                TopicPartition(topic=topic_name, partition=0),
+                TopicPartition(topic=topic_name, partition=1),
+            ]
+        )
+        assert [tp.offset for tp in committed] == [processed_offset + 1] * 2
+
+    def test_commit_with_async_sink_backpressured(
+        self,
+        topic_factory,
+        consumer,
+        state_manager,
+        checkpoint_factory,
+        rowproducer_mock,
+    ):
+        topic_name, _ = topic_factory()
+        sink_manager = SinkManager()
+        checkpoint = checkpoint_factory(
+            consumer_=consumer,
+            state_manager_=state_manager,
+            sink_manager_=sink_manager,
+        )
+        # First get some topic partitions assigned because PausingManager will be
+        # seeking to the committed offsets
+        consumer.subscribe([topic_name])
+        while not consumer.assignment():
+            consumer.poll(0.1)
+
+        sink = AsyncBackpressuredSink()
+        sink_manager.register(sink)
+        processed_offset = 999
+        sink.add(
+            value="value",
+            key="key",
+            timestamp=1,
+            topic=topic_name,
+            partition=0,
+            headers=[],
+            offset=processed_offset,
+        )
+        checkpoint.store_offset(topic_name, 0, processed_offset)
+
+        checkpoint.commit()
+
+        # Ensure that the offset has not been committed because of a backpressure
+        committed, *_ = consumer.committed(
+            [TopicPartition(topic=topic_name, partition=0)]
+        )
+        assert committed.offset == -1001
+
     def test_commit_with_sink_fails(
         self,
         topic_factory,
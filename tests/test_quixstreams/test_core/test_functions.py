@@ -8,6 +8,7 @@ from quixstreams.core.stream.functions import (
     ApplyWithMetadataFunction,
     UpdateWithMetadataFunction,
     FilterWithMetadataFunction,
+    FusedFunction,
 )
 
 from .utils import Sink
@@ -118,3 +119,35 @@ class TestFunctions:
         result = Sink()
         func.get_executor(result.append_record)(value_, key_, timestamp_, headers_)
         assert result == expected
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (1, [([2, 1], b"key", 1, [])]),
+            (0, []),
+            (3, []),
+        ],
+    )
+    def test_fused_function(self, value, expected):
+        func = FusedFunction(
+            [
+                FilterFunction(lambda v: v > 0),
+                ApplyFunction(lambda v: [v]),
+                UpdateFunction(lambda v: v.insert(0, v[0] + 1)),
+                FilterWithMetadataFunction(
+                    lambda value_, _key, _timestamp, _headers: value_[0] < 4
+                ),
+                ApplyWithMetadataFunction(lambda value_, *_: value_),
+                UpdateWithMetadataFunction(lambda value_, *_: None),
+            ]
+        )
+        result = Sink()
+        key, timestamp, headers = b"key", 1, []
+        func.get_executor(result.append_record)(value, key, timestamp, headers)
+        assert result == expected
+
+    def test_fused_function_expand_fails(self):
+        with pytest.raises(ValueError):
+            FusedFunction(
+                [ApplyFunction(lambda v: [v], expand=True), ApplyFunction(lambda v: v)]
+            )
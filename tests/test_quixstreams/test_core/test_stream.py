@@ -1,14 +1,20 @@
+import asyncio
+import collections
+import contextvars
+import threading
+import time
 from operator import setitem
 
 import pytest
 
 from quixstreams.dataframe.exceptions import InvalidOperation
-from quixstreams.core.stream import Stream
+from quixstreams.core.stream import Stream, BatchingExecutor
 from quixstreams.core.stream.functions import (
     ApplyFunction,
     UpdateFunction,
     FilterFunction,
     TransformFunction,
+    FusedFunction,
 )
 from .utils import Sink
 
@@ -127,6 +133,47 @@ class TestStream:
         with pytest.raises(ValueError, match="Transform functions are not allowed"):
             stream.compose(allow_transforms=False)
 
+    def test_compose_fuses_functions(self):
+        stream = (
+            Stream()
+            .add_apply(lambda v: v + 1)
+            .add_filter(lambda v: v % 2 == 0)
+            .add_update(lambda v: None)
+            .add_apply(lambda v: [v], expand=True)
+            .add_apply(lambda v: v + 2)
+        )
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        executor(1, "key", 0, [])
+        executor(2, "key", 0, [])
+        assert sink == [(4, "key", 0, [])]
+
+        # The identity function is dropped,
+        # and the functions before the "expand" are fused
+        functions = Stream._optimize(
+            [node.func for node in stream.root_path()], branching=False
+        )
+        assert len(functions) == 3
+        assert isinstance(functions[0], FusedFunction)
+        assert len(functions[0].functions) == 3
+
+    def test_compose_empty_stream_returns_sink(self):
+        sink = Sink()
+        assert Stream().compose(sink=sink.append_record) == sink.append_record
+
+    def test_preserves_value(self):
+        stream = (
+            Stream()
+            .add_filter(lambda v: v, mutates_value=False)
+            .add_update(print, mutates_value=False)
+        )
+        assert stream.preserves_value()
+        assert not stream.add_filter(lambda v: v.pop()).preserves_value()
+        assert not stream.add_update(lambda v: v.append(1)).preserves_value()
+        assert not stream.add_apply(lambda v: v, mutates_value=False).preserves_value()
+        assert not stream.add_apply(lambda v: v).preserves_value()
+        assert not stream.add_transform(lambda *args: args).preserves_value()
+
     def test_repr(self):
         stream = (
             Stream()
@@ -319,6 +366,14 @@ class TestStream:
                 Stream().add_transform(lambda v, k, t, h: ...),
                 "Transform functions are not allowed",
             ),
+            (
+                Stream().add_apply_batch(lambda v: ...),
+                "Batch functions are not allowed",
+            ),
+            (
+                Stream().add_filter_batch(lambda v: ...),
+                "Batch functions are not allowed",
+            ),
         ],
     )
     def test_compose_returning_not_allowed_operations_fails(self, stream, err):
@@ -354,6 +409,260 @@ class TestStream:
         ]
 
 
+class TestStreamBatching:
+    def test_compose_without_batch_functions_not_batching(self):
+        stream = Stream().add_apply(lambda v: v + 1)
+        assert not isinstance(stream.compose(), BatchingExecutor)
+
+    def test_apply_batch_buffers_until_flush(self):
+        calls = []
+
+        def func(values):
+            calls.append(list(values))
+            return [v + 1 for v in values]
+
+        stream = Stream().add_apply_batch(func).add_apply(lambda v: v * 10)
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        assert isinstance(executor, BatchingExecutor)
+
+        executor(1, "key1", 1, [])
+        executor(2, "key2", 2, [("header", b"value")])
+        assert not sink
+        assert not calls
+
+        executor.flush()
+        assert calls == [[1, 2]]
+        assert sink == [
+            (20, "key1", 1, []),
+            (30, "key2", 2, [("header", b"value")]),
+        ]
+
+        # The buffer is empty after flushing
+        executor.flush()
+        assert len(calls) == 1
+
+    def test_filter_batch(self):
+        stream = Stream().add_filter_batch(lambda values: [v > 1 for v in values])
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        for i in range(4):
+            executor(i, f"key{i}", i, [])
+        executor.flush()
+        assert sink == [(2, "key2", 2, []), (3, "key3", 3, [])]
+
+    def test_apply_batch_with_metadata(self):
+        stream = Stream().add_apply_batch(
+            lambda values, keys, timestamps, headers: [
+                (v, k, t) for v, k, t in zip(values, keys, timestamps)
+            ],
+            metadata=True,
+        )
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        executor(1, "key1", 10, [])
+        executor(2, "key2", 20, [])
+        executor.flush()
+        assert sink == [
+            ((1, "key1", 10), "key1", 10, []),
+            ((2, "key2", 20), "key2", 20, []),
+        ]
+
+    def test_apply_batch_length_mismatch_fails(self):
+        stream = Stream().add_apply_batch(lambda values: values[:1])
+        executor = stream.compose()
+        executor(1, "key", 0, [])
+        executor(2, "key", 0, [])
+        with pytest.raises(ValueError, match="same number of values"):
+            executor.flush()
+
+    def test_chained_batch_functions_flushed_in_order(self):
+        stream = (
+            Stream()
+            .add_apply_batch(lambda values: [v + 1 for v in values])
+            .add_filter(lambda v: v % 2 == 0)
+            .add_apply_batch(lambda values: [v * 10 for v in values])
+        )
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        for i in range(4):
+            executor(i, "key", 0, [])
+        executor.flush()
+        assert [value for value, *_ in sink] == [20, 40]
+
+    def test_batch_functions_in_branches(self):
+        stream = Stream().add_apply_batch(lambda values: [v + 1 for v in values])
+        stream.add_apply_batch(lambda values: [v * 10 for v in values])
+        stream.add_filter_batch(lambda values: [v > 1 for v in values])
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        executor(0, "key", 0, [])
+        executor(1, "key", 0, [])
+        executor.flush()
+        assert sorted(value for value, *_ in sink) == [2, 10, 20]
+
+    def test_flush_preserves_context(self):
+        var = contextvars.ContextVar("var")
+        stream = (
+            Stream()
+            .add_apply_batch(lambda values: values)
+            .add_apply(lambda v: (v, var.get()))
+        )
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        for i in range(2):
+            ctx = contextvars.copy_context()
+            ctx.run(var.set, f"ctx{i}")
+            ctx.run(executor, i, "key", 0, [])
+        executor.flush()
+        assert [value for value, *_ in sink] == [(0, "ctx0"), (1, "ctx1")]
+
+    def test_flush_on_error_suppresses(self):
+        def fail_on_one(value):
+            if value == 1:
+                raise ValueError("test")
+            return value
+
+        errors = []
+
+        def on_error(exc, value, key, timestamp, headers):
+            errors.append((exc, value))
+            return True
+
+        stream = Stream().add_apply_batch(lambda values: values).add_apply(fail_on_one)
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        for i in range(3):
+            executor(i, "key", 0, [])
+        executor.flush(on_error=on_error)
+        assert [value for value, *_ in sink] == [0, 2]
+        assert len(errors) == 1
+        assert errors[0][1] == 1
+
+    def test_flush_on_error_propagates(self):
+        def fail(value):
+            raise ValueError("test")
+
+        stream = Stream().add_apply_batch(lambda values: values).add_apply(fail)
+        executor = stream.compose()
+        executor(0, "key", 0, [])
+        with pytest.raises(ValueError, match="test"):
+            executor.flush(on_error=lambda *args: False)
+
+
+class TestStreamConcurrentApply:
+    def test_apply_concurrent_runs_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def func(value):
+            # Fails unless all three calls run at the same time
+            barrier.wait()
+            return value + 1
+
+        stream = Stream().add_apply_concurrent(func, max_concurrency=3)
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        assert isinstance(executor, BatchingExecutor)
+        for i in range(3):
+            executor(i, f"key{i}", i, [])
+        executor.flush()
+        assert sink == [(1, "key0", 0, []), (2, "key1", 1, []), (3, "key2", 2, [])]
+
+    def test_apply_concurrent_keeps_key_order(self):
+        calls = collections.defaultdict(list)
+
+        def func(value, key, timestamp, headers):
+            # Let the calls of the other keys run in between
+            time.sleep(0.001 * (3 - value % 3))
+            calls[key].append(value)
+            return value
+
+        stream = Stream().add_apply_concurrent(func, metadata=True, max_concurrency=4)
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        for i in range(12):
+            executor(i, f"key{i % 3}", i, [])
+        executor.flush()
+
+        # The results are passed downstream in the order of the records
+        assert [value for value, *_ in sink] == list(range(12))
+        # The records of the same key are processed in order
+        assert calls == {f"key{k}": list(range(k, 12, 3)) for k in range(3)}
+
+    def test_apply_concurrent_coroutine(self):
+        var = contextvars.ContextVar("var")
+
+        async def func(value):
+            await asyncio.sleep(0.001)
+            return value, var.get()
+
+        stream = Stream().add_apply_concurrent(func)
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        for i in range(3):
+            ctx = contextvars.copy_context()
+            ctx.run(var.set, f"ctx{i}")
+            ctx.run(executor, i, "key", 0, [])
+        executor.flush()
+        assert [value for value, *_ in sink] == [(0, "ctx0"), (1, "ctx1"), (2, "ctx2")]
+
+    def test_apply_concurrent_errors_per_record(self):
+        def fail_on_one(value):
+            if value == 1:
+                raise ValueError("test")
+            return value
+
+        errors = []
+
+        def on_error(exc, value, key, timestamp, headers):
+            errors.append((exc, value, key))
+            return True
+
+        stream = Stream().add_apply_concurrent(fail_on_one)
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        for i in range(3):
+            executor(i, f"key{i}", 0, [])
+        executor.flush(on_error=on_error)
+        assert [value for value, *_ in sink] == [0, 2]
+        assert len(errors) == 1
+        assert isinstance(errors[0][0], ValueError)
+        assert errors[0][1:] == (1, "key1")
+
+        executor(1, "key1", 0, [])
+        with pytest.raises(ValueError, match="test"):
+            executor.flush()
+
+    def test_apply_concurrent_close_shuts_down_pool(self):
+        threads = set()
+
+        def func(value):
+            threads.add(threading.current_thread())
+            return value
+
+        stream = Stream().add_apply_concurrent(func, max_concurrency=2)
+        sink = Sink()
+        executor = stream.compose(sink=sink.append_record)
+        for i in range(4):
+            executor(i, f"key{i}", 0, [])
+        executor.flush()
+        assert threads
+
+        executor.close()
+        assert not any(thread.is_alive() for thread in threads)
+
+        # The pool is started again on the next batch
+        executor(4, "key0", 0, [])
+        executor(5, "key1", 0, [])
+        executor.flush()
+        assert [value for value, *_ in sink] == list(range(6))
+        executor.close()
+
+    def test_apply_concurrent_max_concurrency_invalid(self):
+        with pytest.raises(ValueError):
+            Stream().add_apply_concurrent(lambda v: v, max_concurrency=0)
+
+
 class TestStreamBranching:
     def test_basic_branching(self):
         calls = []
@@ -396,6 +705,61 @@ class TestStreamBranching:
 
         assert sink == expected
 
+    def test_read_only_branches_share_value(self):
+        key, timestamp, headers = "key", 0, []
+        value = {"x": 1}
+        received = []
+
+        stream = Stream()
+        stream.add_apply(lambda value_: received.append(value_), mutates_value=False)
+        stream.add_update(lambda value_: value_.update(x=2))
+        stream.add_update(lambda value_: received.append(value_), mutates_value=False)
+        stream.add_filter(lambda value_: received.append(value_), mutates_value=False)
+        stream.compose()(value, key, timestamp, headers)
+
+        # The read-only branches receive the original value,
+        # and the mutating branch receives a copy
+        assert len(received) == 3
+        assert all(r is value for r in received)
+        assert value == {"x": 1}
+
+    def test_branch_with_update_downstream_copies_value(self):
+        key, timestamp, headers = "key", 0, []
+        value = {"x": 1}
+
+        stream = Stream()
+        stream.add_apply(lambda value_: value_).add_update(
+            lambda value_: value_.update(x=2)
+        )
+        stream.add_apply(lambda value_: value_, mutates_value=False)
+        sink = Sink()
+        stream.compose(sink=sink.append_record)(value, key, timestamp, headers)
+
+        assert sink == [
+            ({"x": 2}, key, timestamp, headers),
+            ({"x": 1}, key, timestamp, headers),
+        ]
+        assert sink[1][0] is value
+
+    def test_apply_and_filter_mutating_in_place_copy_value(self):
+        key, timestamp, headers = "key", 0, []
+        value = {"x": 1, "y": 2}
+
+        # The "apply" and "filter" callbacks may mutate the value by default
+        stream = Stream()
+        stream.add_apply(lambda value_: value_.pop("x") and value_)
+        stream.add_filter(lambda value_: value_.pop("y"))
+        stream.add_apply(lambda value_: value_, mutates_value=False)
+        sink = Sink()
+        stream.compose(sink=sink.append_record)(value, key, timestamp, headers)
+
+        assert sink == [
+            ({"y": 2}, key, timestamp, headers),
+            ({"x": 1}, key, timestamp, headers),
+            ({"x": 1, "y": 2}, key, timestamp, headers),
+        ]
+        assert value == {"x": 1, "y": 2}
+
     def test_chained_branches(self):
         stream = Stream().add_apply(lambda v: v + 1)
         stream.add_apply(lambda v: v + 10).add_apply(lambda v: v + 20)
@@ -1,3 +1,4 @@
+import asyncio
 import operator
 import uuid
 from collections import namedtuple
@@ -495,6 +496,115 @@ class TestStreamingDataFrameApplyExpand:
             _ = sdf[sdf.apply(lambda v: [v, v], expand=True)]
 
 
+class TestStreamingDataFrameBatch:
+    def test_apply_batch(self, dataframe_factory):
+        key, timestamp, headers = b"key", 0, []
+        sdf = dataframe_factory()
+        sdf = sdf.apply_batch(lambda values: [v["x"] * 2 for v in values])
+        assert sdf.test(
+            value={"x": 1}, key=key, timestamp=timestamp, headers=headers
+        ) == [(2, key, timestamp, headers)]
+
+    def test_apply_batch_with_metadata(self, dataframe_factory):
+        key, timestamp, headers = b"key", 1, []
+        sdf = dataframe_factory()
+        sdf = sdf.apply_batch(
+            lambda values, keys, timestamps, _headers: [
+                (v, k, t) for v, k, t in zip(values, keys, timestamps)
+            ],
+            metadata=True,
+        )
+        assert sdf.test(value=1, key=key, timestamp=timestamp, headers=headers) == [
+            ((1, key, timestamp), key, timestamp, headers)
+        ]
+
+    @pytest.mark.parametrize("value, expected", [(1, []), (2, [2])])
+    def test_filter_batch(self, dataframe_factory, value, expected):
+        key, timestamp, headers = b"key", 0, []
+        sdf = dataframe_factory()
+        sdf = sdf.filter_batch(lambda values: [v > 1 for v in values])
+        result = sdf.test(value=value, key=key, timestamp=timestamp, headers=headers)
+        assert [value_ for value_, *_ in result] == expected
+
+    def test_apply_batch_then_apply(self, dataframe_factory):
+        key, timestamp, headers = b"key", 0, []
+        sdf = dataframe_factory()
+        sdf = sdf.apply_batch(lambda values: [{"x": v} for v in values])
+        sdf["y"] = sdf["x"] + 1
+        assert sdf.test(value=1, key=key, timestamp=timestamp, headers=headers) == [
+            ({"x": 1, "y": 2}, key, timestamp, headers)
+        ]
+
+    def test_apply_concurrent(self, dataframe_factory):
+        key, timestamp, headers = b"key", 0, []
+        sdf = dataframe_factory()
+        sdf = sdf.apply_concurrent(lambda value: value["x"] * 2)
+        assert sdf.test(
+            value={"x": 1}, key=key, timestamp=timestamp, headers=headers
+        ) == [(2, key, timestamp, headers)]
+
+    def test_apply_update_filter_async(self, dataframe_factory):
+        key, timestamp, headers = b"key", 0, []
+
+        async def apply(value):
+            await asyncio.sleep(0)
+            return {"x": value["x"] * 2}
+
+        async def update(value):
+            await asyncio.sleep(0)
+            value["y"] = 1
+
+        async def filter_(value):
+            await asyncio.sleep(0)
+            return value["x"] > 2
+
+        sdf = dataframe_factory()
+        sdf = sdf.apply(apply).update(update).filter(filter_)
+        assert sdf.test(
+            value={"x": 2}, key=key, timestamp=timestamp, headers=headers
+        ) == [({"x": 4, "y": 1}, key, timestamp, headers)]
+        assert (
+            sdf.test(value={"x": 1}, key=key, timestamp=timestamp, headers=headers)
+            == []
+        )
+
+    def test_filter_batch_as_filter_not_allowed(self, dataframe_factory):
+        sdf = dataframe_factory()
+        with pytest.raises(ValueError, match="Batch functions are not allowed"):
+            _ = sdf[sdf.filter_batch(lambda values: values)]
+
+    def test_apply_batch_then_stateful_apply(
+        self,
+        dataframe_factory,
+        state_manager,
+        topic_manager_topic_factory,
+        message_context_factory,
+    ):
+        topic = topic_manager_topic_factory()
+
+        def count(value_: int, state: State) -> int:
+            total = state.get("count", 0) + 1
+            state.set("count", total)
+            return total
+
+        sdf = dataframe_factory(topic, state_manager=state_manager)
+        sdf = sdf.apply_batch(lambda values: values)
+        sdf = sdf.apply(count, stateful=True)
+
+        state_manager.on_partition_assign(
+            topic=topic.name, partition=0, committed_offset=-1001
+        )
+        key, timestamp, headers = b"test", 0, []
+        ctx = message_context_factory(topic=topic.name)
+        results = [
+            sdf.test(value=1, key=key, timestamp=timestamp, headers=headers, ctx=ctx)[
+                0
+            ][0]
+            for _ in range(3)
+        ]
+        assert results == [1, 2, 3]
+
+
 class TestStreamingDataFrameToTopic:
     @pytest.mark.parametrize("reassign", [True, False])
     def test_to_topic(
@@ -1344,6 +1454,173 @@ class TestStreamingDataFrameHoppingWindow:
         ]
 
 
+class TestStreamingDataFrameSlidingWindow:
+    def test_sliding_window_define_from_timedelta(self, dataframe_factory):
+        sdf = dataframe_factory()
+        window_definition = sdf.sliding_window(
+            duration_ms=timedelta(seconds=10), grace_ms=timedelta(seconds=1)
+        )
+        assert window_definition.duration_ms == 10_000
+        assert window_definition.grace_ms == 1000
+
+    def test_sliding_window_current(
+        self,
+        dataframe_factory,
+        state_manager,
+        message_context_factory,
+        topic_manager_topic_factory,
+    ):
+        topic = topic_manager_topic_factory(name="test")
+
+        sdf = dataframe_factory(topic, state_manager=state_manager)
+        sdf = sdf.sliding_window(duration_ms=10, grace_ms=5).sum().current()
+
+        state_manager.on_partition_assign(
+            topic=topic.name, partition=0, committed_offset=-1001
+        )
+        records = [
+            # Window [0, 1]
+            RecordStub(1, "test", 1),
+            # Window [0, 7]
+            RecordStub(2, "test", 7),
+            # Window [2, 12] doesn't include the first message
+            RecordStub(3, "test", 12),
+            # Out-of-order message within the grace period, window [0, 8]
+            RecordStub(4, "test", 8),
+            # Window [3, 13] includes the out-of-order message
+            RecordStub(5, "test", 13),
+            # Late message, expected to be ignored
+            RecordStub(6, "test", 1),
+        ]
+        headers = [("key", b"value")]
+
+        results = []
+        for value, key, timestamp in records:
+            ctx = message_context_factory(topic=topic.name)
+            results += sdf.test(
+                value=value, key=key, timestamp=timestamp, headers=headers, ctx=ctx
+            )
+
+        assert results == [
+            (WindowResult(value=1, start=0, end=1), records[0].key, 0, None),
+            (WindowResult(value=3, start=0, end=7), records[1].key, 0, None),
+            (WindowResult(value=5, start=2, end=12), records[2].key, 2, None),
+            (WindowResult(value=7, start=0, end=8), records[3].key, 0, None),
+            (WindowResult(value=14, start=3, end=13), records[4].key, 3, None),
+        ]
+
+    def test_sliding_window_final_not_supported(self, dataframe_factory):
+        sdf = dataframe_factory()
+        with pytest.raises(NotImplementedError):
+            sdf.sliding_window(duration_ms=10).sum().final()
+
+    def test_sliding_window_reduce_not_supported(self, dataframe_factory):
+        sdf = dataframe_factory()
+        with pytest.raises(ValueError):
+            sdf.sliding_window(duration_ms=10).reduce(
+                reducer=lambda agg, current: agg + current,
+                initializer=lambda value: value,
+            )
+
+
+class TestStreamingDataFrameSessionWindow:
+    def test_session_window_define_from_timedelta(self, dataframe_factory):
+        sdf = dataframe_factory()
+        window_definition = sdf.session_window(
+            inactivity_gap_ms=timedelta(seconds=10), grace_ms=timedelta(seconds=1)
+        )
+        assert window_definition.inactivity_gap_ms == 10_000
+        assert window_definition.grace_ms == 1000
+
+    def test_session_window_current(
+        self,
+        dataframe_factory,
+        state_manager,
+        message_context_factory,
+        topic_manager_topic_factory,
+    ):
+        topic = topic_manager_topic_factory(name="test")
+
+        sdf = dataframe_factory(topic, state_manager=state_manager)
+        sdf = sdf.session_window(inactivity_gap_ms=10, grace_ms=10).sum().current()
+
+        state_manager.on_partition_assign(
+            topic=topic.name, partition=0, committed_offset=-1001
+        )
+        records = [
+            # Session [1, 11)
+            RecordStub(1, "test", 1),
+            # Session [1, 15)
+            RecordStub(2, "test", 5),
+            # New session [20, 30)
+            RecordStub(3, "test", 20),
+            # Out-of-order message bridging both sessions, session [1, 30)
+            RecordStub(4, "test", 12),
+        ]
+        headers = [("key", b"value")]
+
+        results = []
+        for value, key, timestamp in records:
+            ctx = message_context_factory(topic=topic.name)
+            results += sdf.test(
+                value=value, key=key, timestamp=timestamp, headers=headers, ctx=ctx
+            )
+
+        assert results == [
+            (WindowResult(value=1, start=1, end=11), records[0].key, 1, None),
+            (WindowResult(value=3, start=1, end=15), records[1].key, 1, None),
+            (WindowResult(value=3, start=20, end=30), records[2].key, 20, None),
+            (WindowResult(value=10, start=1, end=30), records[3].key, 1, None),
+        ]
+
+    def test_session_window_final(
+        self,
+        dataframe_factory,
+        state_manager,
+        message_context_factory,
+        topic_manager_topic_factory,
+    ):
+        topic = topic_manager_topic_factory(name="test")
+
+        sdf = dataframe_factory(topic, state_manager=state_manager)
+        sdf = sdf.session_window(inactivity_gap_ms=10).count().final()
+
+        state_manager.on_partition_assign(
+            topic=topic.name, partition=0, committed_offset=-1001
+        )
+        records = [
+            RecordStub(1, "test", 1),
+            RecordStub(2, "test", 5),
+            # Closes the session [1, 15)
+            RecordStub(3, "test", 20),
+            # Late message, expected to be ignored
+            RecordStub(4, "test", 2),
+            # Closes the session [20, 30)
+            RecordStub(5, "test", 30),
+        ]
+        headers = [("key", b"value")]
+
+        results = []
+        for value, key, timestamp in records:
+            ctx = message_context_factory(topic=topic.name)
+            results += sdf.test(
+                value=value, key=key, timestamp=timestamp, headers=headers, ctx=ctx
+            )
+
+        assert results == [
+            (WindowResult(value=2, start=1, end=15), records[0].key, 1, None),
+            (WindowResult(value=1, start=20, end=30), records[0].key, 20, None),
+        ]
+
+    def test_session_window_reduce_not_supported(self, dataframe_factory):
+        sdf = dataframe_factory()
+        with pytest.raises(ValueError):
+            sdf.session_window(inactivity_gap_ms=10).reduce(
+                reducer=lambda agg, current: agg + current,
+                initializer=lambda value: value,
+            )
+
+
 class TestStreamingDataFrameGroupBy:
     def test_group_by_column(
         self,
@@ -1701,6 +1978,22 @@ class TestStreamingDataFrameBranching:
         results = sdf.test(value=value, key=key, timestamp=timestamp, headers=headers)
         assert results == expected
 
+    def test_branch_mutating_in_apply_gets_copy(self, dataframe_factory):
+        sdf = dataframe_factory()
+        sdf.apply(lambda v: v.pop("x") and v)
+        sdf.apply(lambda v: {"total": sum(v.values())}, mutates_value=False)
+        sdf = sdf[["x"]]
+
+        key, timestamp, headers = b"key", 0, []
+        value = {"x": 1, "y": 2}
+        expected = [
+            ({"y": 2}, key, timestamp, headers),
+            ({"total": 3}, key, timestamp, headers),
+            ({"x": 1}, key, timestamp, headers),
+        ]
+        results = sdf.test(value=value, key=key, timestamp=timestamp, headers=headers)
+        assert results == expected
+
     def test_multiple_branches(self, dataframe_factory):
         """
         INPUT: 0
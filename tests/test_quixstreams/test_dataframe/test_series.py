@@ -525,3 +525,32 @@ class TestStreamingSeries:
             operation(
                 StreamingSeries(name="x", sdf_id=1), StreamingSeries(name="x", sdf_id=2)
             )
+
+    def test_compile(self):
+        value = {"x": 5, "y": 20, "z": {"n": -3}}
+        key, timestamp, headers = "key", 0, []
+        series = (
+            StreamingSeries("x") * 2 + StreamingSeries("y")
+        ) / 10 + StreamingSeries("z")["n"].abs()
+        compiled = series.compile()
+        assert compiled is series.compile()
+        assert compiled(value, key, timestamp, headers) == 6
+        assert series.test(value, key, timestamp, headers)[0] == (
+            6,
+            key,
+            timestamp,
+            headers,
+        )
+
+    def test_compile_from_stream(self):
+        value = {"x": 5}
+        key, timestamp, headers = "key", 0, []
+        series = StreamingSeries("x").apply(lambda v: v + 1)
+        series = StreamingSeries(stream=series.stream) * 2
+        assert series.compile()(value, key, timestamp, headers) == 12
+
+    def test_expression_calls_functions(self):
+        series = (StreamingSeries("x") > 1) & ~StreamingSeries("y").isnull()
+        assert not series.expression.calls_functions()
+        assert series.apply(lambda v: v).expression.calls_functions()
+        assert (series | StreamingSeries("z").abs()).expression.calls_functions()
@@ -0,0 +1,58 @@
+import pytest
+
+from quixstreams.dataframe.windows.aggregators import (
+    MonotonicDequeAggregator,
+    TwoStacksAggregator,
+)
+
+
+class TestTwoStacksAggregator:
+    def test_push_pop(self):
+        aggregator = TwoStacksAggregator(combine_func=max)
+        assert not aggregator
+        for value in [3, 1, 2]:
+            aggregator.push(value)
+        assert len(aggregator) == 3
+        assert aggregator.value() == 3
+
+        aggregator.pop()
+        assert aggregator.value() == 2
+
+        aggregator.push(0)
+        assert aggregator.value() == 2
+
+        aggregator.pop()
+        aggregator.pop()
+        assert aggregator.value() == 0
+
+        aggregator.pop()
+        assert not aggregator
+
+    def test_sliding_sum(self):
+        values = list(range(20))
+        aggregator = TwoStacksAggregator(combine_func=lambda a, b: a + b)
+        for i, value in enumerate(values):
+            aggregator.push(value)
+            if len(aggregator) > 5:
+                aggregator.pop()
+            assert aggregator.value() == sum(values[max(0, i - 4) : i + 1])
+
+
+class TestMonotonicDequeAggregator:
+    @pytest.mark.parametrize("select_func", [min, max])
+    def test_sliding_min_max(self, select_func):
+        values = [5, 1, 4, 4, 8, 2, 7, 3, 3, 9, 0, 6]
+        aggregator = MonotonicDequeAggregator(select_func=select_func)
+        for i, value in enumerate(values):
+            aggregator.push(value)
+            if len(aggregator) > 3:
+                aggregator.pop()
+            assert aggregator.value() == select_func(values[max(0, i - 2) : i + 1])
+
+    def test_empty(self):
+        aggregator = MonotonicDequeAggregator(select_func=max)
+        assert aggregator.value() is None
+        aggregator.push(1)
+        aggregator.pop()
+        assert not aggregator
+        assert aggregator.value() is None
@@ -1,16 +1,22 @@
 import pytest
 
 from quixstreams.dataframe.windows import HoppingWindowDefinition
+from quixstreams.dataframe.windows.panes import PanedHoppingWindow
+from quixstreams.dataframe.windows.time_based import FixedTimeWindow
 
 
 @pytest.fixture()
 def hopping_window_definition_factory(state_manager, dataframe_factory):
     def factory(
-        duration_ms: int, step_ms: int, grace_ms: int = 0
+        duration_ms: int, step_ms: int, grace_ms: int = 0, panes: bool = False
     ) -> HoppingWindowDefinition:
         sdf = dataframe_factory(state_manager=state_manager)
         window_def = HoppingWindowDefinition(
-            duration_ms=duration_ms, step_ms=step_ms, grace_ms=grace_ms, dataframe=sdf
+            duration_ms=duration_ms,
+            step_ms=step_ms,
+            grace_ms=grace_ms,
+            dataframe=sdf,
+            panes=panes,
         )
         return window_def
 
@@ -244,3 +250,144 @@ class TestHoppingWindow:
             assert expired[1]["value"] == 1
             assert expired[1]["start"] == 100
             assert expired[1]["end"] == 110
+
+
+class TestPanedHoppingWindow:
+    @pytest.mark.parametrize(
+        "func_name, expected_cls, expected_name",
+        [
+            ("sum", PanedHoppingWindow, "hopping_window_10_5_panes_sum"),
+            ("count", PanedHoppingWindow, "hopping_window_10_5_panes_count"),
+            ("mean", PanedHoppingWindow, "hopping_window_10_5_panes_mean"),
+            ("min", PanedHoppingWindow, "hopping_window_10_5_panes_min"),
+            ("max", PanedHoppingWindow, "hopping_window_10_5_panes_max"),
+        ],
+    )
+    def test_paned_window_created(
+        self, func_name, expected_cls, expected_name, dataframe_factory
+    ):
+        window_def = HoppingWindowDefinition(
+            duration_ms=10,
+            grace_ms=0,
+            step_ms=5,
+            dataframe=dataframe_factory(),
+            panes=True,
+        )
+        window = getattr(window_def, func_name)()
+        assert isinstance(window, expected_cls)
+        assert window.name == expected_name
+
+    def test_paned_window_reduce_not_paned(self, dataframe_factory):
+        window_def = HoppingWindowDefinition(
+            duration_ms=10,
+            grace_ms=0,
+            step_ms=5,
+            dataframe=dataframe_factory(),
+            panes=True,
+        )
+        window = window_def.reduce(
+            reducer=lambda agg, current: agg + current, initializer=lambda v: v
+        )
+        assert type(window) is FixedTimeWindow
+        assert window.name == "hopping_window_10_5_reduce"
+
+    @pytest.mark.parametrize(
+        "func_name, values, expected",
+        [
+            ("sum", [2, 1], [3, 3]),
+            ("count", [2, 1], [2, 2]),
+            ("mean", [2, 1], [1.5, 1.5]),
+            ("max", [2, 1], [2, 2]),
+            ("min", [2, 1], [1, 1]),
+        ],
+    )
+    def test_paned_window_updated(
+        self,
+        func_name,
+        values,
+        expected,
+        hopping_window_definition_factory,
+        state_manager,
+    ):
+        window_def = hopping_window_definition_factory(
+            duration_ms=10, step_ms=5, panes=True
+        )
+        window = getattr(window_def, func_name)()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            for value in values:
+                updated, expired = window.process_window(
+                    value=value, state=state, timestamp_ms=100
+                )
+        assert updated == [
+            {"start": 95, "end": 105, "value": expected[0]},
+            {"start": 100, "end": 110, "value": expected[1]},
+        ]
+        assert not expired
+
+    def test_paned_window_combines_panes(
+        self, hopping_window_definition_factory, state_manager
+    ):
+        window_def = hopping_window_definition_factory(
+            duration_ms=30, step_ms=10, panes=True
+        )
+        window = window_def.sum()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            window.process_window(value=1, state=state, timestamp_ms=100)
+            window.process_window(value=2, state=state, timestamp_ms=110)
+            updated, expired = window.process_window(
+                value=3, state=state, timestamp_ms=125
+            )
+            assert updated == [
+                {"start": 100, "end": 130, "value": 6},
+                {"start": 110, "end": 140, "value": 5},
+                {"start": 120, "end": 150, "value": 3},
+            ]
+            assert not expired
+
+            # Each message updates only a single pane
+            assert state.get_windows(start_from_ms=-1, start_to_ms=200) == [
+                ((100, 110), 1),
+                ((110, 120), 2),
+                ((120, 130), 3),
+            ]
+
+    def test_paned_window_expired(
+        self, hopping_window_definition_factory, state_manager
+    ):
+        window_def = hopping_window_definition_factory(
+            duration_ms=10, grace_ms=0, step_ms=5, panes=True
+        )
+        window = window_def.sum()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            updated, expired = window.process_window(
+                value=1, state=state, timestamp_ms=100
+            )
+            assert not expired
+
+            updated, expired = window.process_window(
+                value=2, state=state, timestamp_ms=110
+            )
+            assert updated == [
+                {"start": 105, "end": 115, "value": 2},
+                {"start": 110, "end": 120, "value": 2},
+            ]
+            assert expired == [
+                {"start": 95, "end": 105, "value": 1},
+                {"start": 100, "end": 110, "value": 1},
+            ]
+            # The pane of the expired windows is deleted
+            assert state.get_windows(start_from_ms=-1, start_to_ms=200) == [
+                ((110, 115), 2)
+            ]
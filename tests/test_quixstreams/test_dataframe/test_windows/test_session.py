@@ -0,0 +1,169 @@
+import pytest
+
+from quixstreams.dataframe.windows import SessionWindowDefinition
+from quixstreams.state.rocksdb import RocksDBOptions
+
+
+@pytest.fixture()
+def session_window_definition_factory(state_manager, dataframe_factory):
+    def factory(inactivity_gap_ms: int, grace_ms: int = 0) -> SessionWindowDefinition:
+        sdf = dataframe_factory(state_manager=state_manager)
+        window_def = SessionWindowDefinition(
+            inactivity_gap_ms=inactivity_gap_ms, grace_ms=grace_ms, dataframe=sdf
+        )
+        return window_def
+
+    return factory
+
+
+class TestSessionWindow:
+    @pytest.mark.parametrize(
+        "gap, grace, provided_name, func_name, expected_name",
+        [
+            (10, 5, "custom_window", "sum", "custom_window_session_window_10_sum"),
+            (10, 5, None, "sum", "session_window_10_sum"),
+            (15, 5, None, "count", "session_window_15_count"),
+        ],
+    )
+    def test_session_window_definition_get_name(
+        self,
+        gap,
+        grace,
+        provided_name,
+        func_name,
+        expected_name,
+        dataframe_factory,
+    ):
+        swd = SessionWindowDefinition(
+            inactivity_gap_ms=gap,
+            grace_ms=grace,
+            dataframe=dataframe_factory(),
+            name=provided_name,
+        )
+        name = swd._get_name(func_name)
+        assert name == expected_name
+
+    @pytest.mark.parametrize(
+        "func_name, expected",
+        [
+            ("sum", [1, 3, 3, 10]),
+            ("count", [1, 2, 1, 4]),
+            ("mean", [1, 1.5, 3, 2.5]),
+            ("min", [1, 1, 3, 1]),
+            ("max", [1, 2, 3, 4]),
+        ],
+    )
+    def test_session_window_aggregations(
+        self, func_name, expected, session_window_definition_factory, state_manager
+    ):
+        window_def = session_window_definition_factory(
+            inactivity_gap_ms=10, grace_ms=10
+        )
+        window = getattr(window_def, func_name)()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        results = []
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            for value, timestamp in [(1, 100), (2, 105), (3, 120), (4, 112)]:
+                updated, expired = window.process_window(
+                    value=value, state=state, timestamp_ms=timestamp
+                )
+                assert not expired
+                results.append(updated)
+
+        assert [u[0]["value"] for u in results] == pytest.approx(expected)
+        assert [(u[0]["start"], u[0]["end"]) for u in results] == [
+            (100, 110),
+            (100, 115),
+            (120, 130),
+            # The last message bridges both sessions
+            (100, 130),
+        ]
+
+    def test_session_window_merged_sessions_deleted(
+        self, session_window_definition_factory, state_manager
+    ):
+        window_def = session_window_definition_factory(
+            inactivity_gap_ms=10, grace_ms=10
+        )
+        window = window_def.sum()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            window.process_window(value=1, state=state, timestamp_ms=100)
+            window.process_window(value=2, state=state, timestamp_ms=115)
+            assert state.get_windows(start_from_ms=-1, start_to_ms=200) == [
+                ((100, 110), 1),
+                ((115, 125), 2),
+            ]
+
+            window.process_window(value=3, state=state, timestamp_ms=108)
+            assert state.get_windows(start_from_ms=-1, start_to_ms=200) == [
+                ((100, 125), 6)
+            ]
+
+    def test_session_window_expired(
+        self, session_window_definition_factory, state_manager
+    ):
+        window_def = session_window_definition_factory(inactivity_gap_ms=10)
+        window = window_def.sum()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            window.process_window(value=1, state=state, timestamp_ms=100)
+            window.process_window(value=2, state=state, timestamp_ms=109)
+            updated, expired = window.process_window(
+                value=3, state=state, timestamp_ms=119
+            )
+            assert updated == [{"start": 119, "end": 129, "value": 3}]
+            assert expired == [{"start": 100, "end": 119, "value": 3}]
+            assert state.get_windows(start_from_ms=-1, start_to_ms=200) == [
+                ((119, 129), 3)
+            ]
+
+    @pytest.mark.parametrize("open_windows_cache_size", [0, 10])
+    def test_session_window_late_message_before_expired_session(
+        self, open_windows_cache_size, state_manager_factory, dataframe_factory
+    ):
+        state_manager = state_manager_factory(
+            rocksdb_options=RocksDBOptions(
+                open_windows_cache_size=open_windows_cache_size
+            )
+        )
+        state_manager.init()
+        window = SessionWindowDefinition(
+            inactivity_gap_ms=5,
+            grace_ms=3,
+            dataframe=dataframe_factory(state_manager=state_manager),
+        ).sum()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            window.process_window(value=1, state=state, timestamp_ms=22)
+            _, expired = window.process_window(value=2, state=state, timestamp_ms=30)
+            assert expired == [{"start": 22, "end": 27, "value": 1}]
+
+            # The late message extends the open session [30, 35)
+            updated, _ = window.process_window(value=3, state=state, timestamp_ms=26)
+            assert updated == [{"start": 26, "end": 35, "value": 5}]
+
+            # This one would move the session start to the start of the expired one
+            updated, _ = window.process_window(value=4, state=state, timestamp_ms=22)
+            assert updated == []
+
+        # Reopen the partition to read the open sessions from the store again
+        store.revoke_partition(0)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            _, expired = window.process_window(value=5, state=state, timestamp_ms=100)
+            assert expired == [{"start": 26, "end": 35, "value": 5}]
+        state_manager.close()
@@ -0,0 +1,141 @@
+import pytest
+
+from quixstreams.dataframe.exceptions import InvalidOperation
+from quixstreams.dataframe.windows import SlidingWindowDefinition
+from quixstreams.dataframe.windows.aggregators import (
+    MonotonicDequeAggregator,
+    TwoStacksAggregator,
+)
+from quixstreams.dataframe.windows.sliding import SlidingWindowIndex
+
+
+@pytest.fixture()
+def sliding_window_definition_factory(state_manager, dataframe_factory):
+    def factory(duration_ms: int, grace_ms: int = 0) -> SlidingWindowDefinition:
+        sdf = dataframe_factory(state_manager=state_manager)
+        window_def = SlidingWindowDefinition(
+            duration_ms=duration_ms, grace_ms=grace_ms, dataframe=sdf
+        )
+        return window_def
+
+    return factory
+
+
+class TestSlidingWindowIndex:
+    def test_push_expire(self):
+        index = SlidingWindowIndex(
+            aggregator=TwoStacksAggregator(combine_func=lambda a, b: a + b)
+        )
+        index.push(1, 1)
+        index.push(5, 2)
+        index.push(5, 3)
+        assert index.last_timestamp == 5
+        assert index.value() == 6
+
+        index.push(12, 4)
+        index.expire(min_timestamp_ms=2)
+        assert index.value() == 9
+
+        index.expire(min_timestamp_ms=6)
+        assert index.value() == 4
+
+    def test_max(self):
+        index = SlidingWindowIndex(aggregator=MonotonicDequeAggregator(select_func=max))
+        for timestamp, value in [(1, 5), (2, 1), (3, 3)]:
+            index.push(timestamp, value)
+        assert index.value() == 5
+
+        index.expire(min_timestamp_ms=2)
+        assert index.value() == 3
+
+
+class TestSlidingWindow:
+    @pytest.mark.parametrize(
+        "duration, grace, provided_name, func_name, expected_name",
+        [
+            (10, 5, "custom_window", "sum", "custom_window_sliding_window_10_sum"),
+            (10, 5, None, "sum", "sliding_window_10_sum"),
+            (15, 5, None, "count", "sliding_window_15_count"),
+        ],
+    )
+    def test_sliding_window_definition_get_name(
+        self,
+        duration,
+        grace,
+        provided_name,
+        func_name,
+        expected_name,
+        dataframe_factory,
+    ):
+        swd = SlidingWindowDefinition(
+            duration_ms=duration,
+            grace_ms=grace,
+            dataframe=dataframe_factory(),
+            name=provided_name,
+        )
+        name = swd._get_name(func_name)
+        assert name == expected_name
+
+    @pytest.mark.parametrize(
+        "func_name, expected",
+        [
+            ("sum", [1, 3, 5, 7]),
+            ("count", [1, 2, 2, 3]),
+            ("mean", [1, 1.5, 2.5, 7 / 3]),
+            ("min", [1, 1, 2, 1]),
+            ("max", [1, 2, 3, 4]),
+        ],
+    )
+    def test_sliding_window_aggregations(
+        self, func_name, expected, sliding_window_definition_factory, state_manager
+    ):
+        window_def = sliding_window_definition_factory(duration_ms=10, grace_ms=10)
+        window = getattr(window_def, func_name)()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        results = []
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            for value, timestamp in [(1, 100), (2, 105), (3, 112), (4, 107)]:
+                updated, expired = window.process_window(
+                    value=value, state=state, timestamp_ms=timestamp
+                )
+                assert not expired
+                results.append(updated)
+
+        assert [u[0]["value"] for u in results] == pytest.approx(expected)
+        assert [(u[0]["start"], u[0]["end"]) for u in results] == [
+            (90, 100),
+            (95, 105),
+            (102, 112),
+            (97, 107),
+        ]
+
+    def test_sliding_window_values_expired(
+        self, sliding_window_definition_factory, state_manager
+    ):
+        window_def = sliding_window_definition_factory(duration_ms=10, grace_ms=0)
+        window = window_def.sum()
+        window.register_store()
+        store = state_manager.get_store(topic="test", store_name=window.name)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            state = tx.as_state(prefix=b"key")
+            window.process_window(value=1, state=state, timestamp_ms=100)
+            window.process_window(value=2, state=state, timestamp_ms=105)
+            updated, _ = window.process_window(value=3, state=state, timestamp_ms=111)
+            assert updated == [{"start": 101, "end": 111, "value": 5}]
+
+            # The value of the first message is not needed anymore
+            assert state.get_windows(start_from_ms=-1, start_to_ms=200) == [
+                ((105, 116), 2),
+                ((111, 122), 3),
+            ]
+
+    def test_sliding_window_final_not_supported(
+        self, sliding_window_definition_factory
+    ):
+        window = sliding_window_definition_factory(duration_ms=10).sum()
+        with pytest.raises(InvalidOperation):
+            window.final()
@@ -193,6 +193,56 @@ class TestQuixDeserializer:
             for key in item:
                 assert item[key] == row[key]
 
+    def test_deserialize_many_success(self, quix_timeseries_factory):
+        message = quix_timeseries_factory(
+            numeric={"param1": [1, 2]},
+            timestamps=[1234567890, 1234567891],
+        )
+        ignored = quix_timeseries_factory(model_key=QModelKey.KEYS_TO_IGNORE[0])
+
+        deserializer = QuixDeserializer()
+        result = deserializer.deserialize_many(
+            values=[message.value(), ignored.value(), message.value()],
+            ctx=SerializationContext(topic=message.topic(), field=MessageField.VALUE),
+            headers=[message.headers(), ignored.headers(), message.headers()],
+        )
+
+        assert len(result) == 3
+        assert [row["param1"] for row in result[0]] == [1, 2]
+        assert [row["Timestamp"] for row in result[0]] == [1234567890, 1234567891]
+        assert result[1] == []
+        assert result[2] == result[0]
+
+    def test_deserialize_timeseries_columnar_success(self, quix_timeseries_factory):
+        message = quix_timeseries_factory(
+            binary={"param1": [b"1", None]},
+            strings={"param2": ["a", None]},
+            numeric={"param3": [1, 1.1]},
+            tags={"tag1": ["value1", "value2"]},
+            timestamps=[1234567890, 1234567891],
+        )
+
+        deserializer = QuixDeserializer(columnar=True)
+        rows = list(
+            deserializer(
+                value=message.value(),
+                ctx=SerializationContext(
+                    topic=message.topic(),
+                    field=MessageField.VALUE,
+                    headers=message.headers(),
+                ),
+            )
+        )
+        assert rows == [
+            {
+                "param1": [b"1", None],
+                "param2": ["a", None],
+                "param3": [1, 1.1],
+                "Tags": {"tag1": ["value1", "value2"]},
+                "Timestamp": [1234567890, 1234567891],
+            }
+        ]
+
     def test_deserialize_timeseries_gzip_success(self, quix_timeseries_factory):
         message = quix_timeseries_factory(
             binary={"param1": [b"1", None], "param2": [None, b"1"]},
@@ -522,6 +572,76 @@ class TestQuixTimeseriesSerializer:
                 ctx=SerializationContext(topic="test", field=MessageField.VALUE),
             )
 
+    def test_serialize_columnar_success(self):
+        serializer = QuixTimeseriesSerializer(as_legacy=False)
+        value = {
+            "int": [1, None],
+            "float": [1.0, 2.0],
+            "str": ("abc", "def"),
+            "bytes": [b"123", None],
+            "none": [None, None],
+            "Tags": {"tag1": ["tag1", "tag2"]},
+            "Timestamp": [1234567890, 1234567891],
+        }
+        serialized = serializer(
+            value, ctx=SerializationContext(topic="test", field=MessageField.VALUE)
+        )
+
+        expected = {
+            "Timestamps": [1234567890, 1234567891],
+            "BinaryValues": {
+                "bytes": [base64.b64encode(b"123").decode("ascii"), None],
+            },
+            "StringValues": {"str": ["abc", "def"]},
+            "NumericValues": {"int": [1, None], "float": [1.0, 2.0]},
+            "TagValues": {"tag1": ["tag1", "tag2"]},
+        }
+        assert json.loads(serialized) == expected
+
+    def test_serialize_columnar_roundtrip(self):
+        value = {
+            "param1": [b"1", None],
+            "param2": ["a", "b"],
+            "Tags": {"tag1": ["value1", "value2"]},
+            "Timestamp": [1234567890, 1234567891],
+        }
+        serializer = QuixTimeseriesSerializer(as_legacy=False)
+        serialized = serializer(
+            value, ctx=SerializationContext(topic="test", field=MessageField.VALUE)
+        )
+
+        deserializer = QuixDeserializer(columnar=True)
+        rows = list(
+            deserializer(
+                value=serialized,
+                ctx=SerializationContext(
+                    topic="test",
+                    field=MessageField.VALUE,
+                    headers=[
+                        (k, v.encode()) for k, v in serializer.extra_headers.items()
+                    ],
+                ),
+            )
+        )
+        assert rows == [value]
+
+    @pytest.mark.parametrize(
+        "value, error",
+        [
+            ({"a": 1, "Timestamp": [1]}, 'Item with key "a" must be a sequence'),
+            ({"a": [1], "Timestamp": [1, 2]}, 'Item with key "a" has 1 values'),
+            ({"a": [1, "b"], "Timestamp": [1, 2]}, 'Items with key "a" have mixed'),
+            ({"a": [object()], "Timestamp": [1]}, 'Item with key "a" has unsupported'),
+            ({"Tags": {"t": ["a"]}, "Timestamp": [1, 2]}, 'Item with key "t" has 1'),
+        ],
+    )
+    def test_serialize_columnar_error(self, value, error):
+        serializer = QuixTimeseriesSerializer(as_legacy=False)
+        with pytest.raises(SerializationError, match=error):
+            serializer(
+                value, ctx=SerializationContext(topic="test", field=MessageField.VALUE)
+            )
+
 
 class TestQuixEventsSerializer:
     def test_serialize_success(self):
@@ -474,3 +474,38 @@ def test_custom_subject_name_strategies(
     assert "message Root" in root.schema.schema_str
     nested = schema_registry_client.get_latest_version(subject_name="bar")
     assert "message Nested" in nested.schema.schema_str
+
+
+def test_avro_deserializer_caches_writer_schemas(
+    schema_registry_client_config: SchemaRegistryClientConfig,
+    schema_registry_client: SchemaRegistryClient,
+):
+    schema_id = schema_registry_client.register_schema(
+        subject_name=SUBJECT,
+        schema=Schema(schema_str=json.dumps(AVRO_TEST_SCHEMA), schema_type="AVRO"),
+    )
+    deserializer = AvroDeserializer(
+        schema_registry_client_config=schema_registry_client_config,
+        schema_cache_size=1,
+    )
+    serialized = _set_magic_byte_metadata(b"\x06foo\xf6\x01\x00", schema_id)
+    expected = {"name": "foo", "id": 123, "nested": {"id": 0}}
+
+    assert deserializer(serialized, DUMMY_CONTEXT) == expected
+
+    # The schema is parsed once, and the Schema Registry is not queried again
+    # even after the subject is deleted
+    schema_registry_client.delete_subject(SUBJECT, permanent=True)
+    assert deserializer.deserialize_many(
+        values=[serialized, serialized], ctx=DUMMY_CONTEXT, headers=[None, None]
+    ) == [expected, expected]
+
+
+def test_avro_deserializer_schema_cache_size_invalid(
+    schema_registry_client_config: SchemaRegistryClientConfig,
+):
+    with pytest.raises(ValueError, match="must be greater than 0"):
+        AvroDeserializer(
+            schema_registry_client_config=schema_registry_client_config,
+            schema_cache_size=0,
+        )
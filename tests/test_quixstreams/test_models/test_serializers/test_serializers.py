@@ -15,6 +15,8 @@ from quixstreams.models import (
     Deserializer,
     DoubleDeserializer,
     StringDeserializer,
+    SerializationContext,
+    MessageField,
 )
 from quixstreams.models.serializers.protobuf import (
     ProtobufSerializer,
@@ -157,6 +159,13 @@ class TestSerializers:
                 validator=jsonschema.Draft202012Validator({"type": "invalid"})
             )
 
+    def test_avro_serializer_reuses_buffer(self):
+        serializer = AvroSerializer(AVRO_TEST_SCHEMA)
+        first = serializer({"name": "foo", "id": 123}, ctx=DUMMY_CONTEXT)
+        second = serializer({"name": "bar", "id": 0}, ctx=DUMMY_CONTEXT)
+        assert first == b"\x06foo\xf6\x01\x00"
+        assert second == b"\x06bar\x00\x00"
+
 
 class TestDeserializers:
     @pytest.mark.parametrize(
@@ -282,6 +291,78 @@ class TestDeserializers:
         with pytest.raises(SerializationError):
             deserializer(value, ctx=DUMMY_CONTEXT)
 
+    @pytest.mark.parametrize(
+        "deserializer, values, expected",
+        [
+            (IntegerDeserializer(), [int_to_bytes(1), int_to_bytes(2)], [1, 2]),
+            (StringDeserializer(), [b"abc", b"def"], ["abc", "def"]),
+            (BytesDeserializer(), [b"abc", b"def"], [b"abc", b"def"]),
+            (JSONDeserializer(), [b"123", b'{"a":"b"}'], [123, {"a": "b"}]),
+            (
+                JSONDeserializer(schema=JSONSCHEMA_TEST_SCHEMA),
+                [b'{"id":10,"name":"foo"}', b'{"id":11,"name":"bar"}'],
+                [{"id": 10, "name": "foo"}, {"id": 11, "name": "bar"}],
+            ),
+            (
+                AvroDeserializer(AVRO_TEST_SCHEMA),
+                [b"\x06foo\xf6\x01\x00", b"\x06foo\x00\x00"],
+                [
+                    {"name": "foo", "id": 123, "nested": {"id": 0}},
+                    {"name": "foo", "id": 0, "nested": {"id": 0}},
+                ],
+            ),
+            (
+                ProtobufDeserializer(Root),
+                [b"\n\x03foo\x10\x02", b"\x10\x03"],
+                [
+                    {"enum": "A", "name": "foo", "id": 2},
+                    {"enum": "A", "name": "", "id": 3},
+                ],
+            ),
+        ],
+    )
+    def test_deserialize_many_success(
+        self, deserializer: Deserializer, values, expected
+    ):
+        ctx = SerializationContext(topic="topic", field=MessageField.VALUE)
+        headers = [None] * len(values)
+        assert (
+            deserializer.deserialize_many(values=values, ctx=ctx, headers=headers)
+            == expected
+        )
+
+    @pytest.mark.parametrize(
+        "deserializer, values",
+        [
+            (IntegerDeserializer(), [int_to_bytes(1), b"abc"]),
+            (JSONDeserializer(), [b"123", b"{"]),
+            (
+                JSONDeserializer(schema=JSONSCHEMA_TEST_SCHEMA),
+                [b'{"id":10,"name":"foo"}', b'{"id":10}'],
+            ),
+            (
+                AvroDeserializer(AVRO_TEST_SCHEMA),
+                [b"\x06foo\x00\x00", b"\x26foo\x00"],
+            ),
+        ],
+    )
+    def test_deserialize_many_error(self, deserializer: Deserializer, values):
+        ctx = SerializationContext(topic="topic", field=MessageField.VALUE)
+        with pytest.raises(SerializationError):
+            deserializer.deserialize_many(
+                values=values, ctx=ctx, headers=[None] * len(values)
+            )
+
+    def test_protobuf_deserialize_many_to_dict_false(self):
+        deserializer = ProtobufDeserializer(Root, to_dict=False)
+        result = deserializer.deserialize_many(
+            values=[b"\n\x03foo\x10\x02", b"\x10\x03"],
+            ctx=SerializationContext(topic="topic", field=MessageField.VALUE),
+            headers=[None, None],
+        )
+        assert result == [Root(name="foo", id=2), Root(id=3)]
+        assert result[0] is not result[1]
+
     def test_invalid_jsonschema(self):
         with pytest.raises(jsonschema.SchemaError):
             JSONDeserializer(
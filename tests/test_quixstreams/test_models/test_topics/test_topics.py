@@ -5,6 +5,7 @@ import pytest
 
 from quixstreams.models import (
     StringSerializer,
+    StringDeserializer,
     TimestampType,
     MessageHeadersTuples,
 )
@@ -143,6 +144,7 @@ class TestTopic:
         assert row.headers == message.headers()
         assert row.timestamp == message.timestamp()[1]
         assert row.leader_epoch == message.leader_epoch()
+        assert row.context.raw == (key, value)
 
     @pytest.mark.parametrize(
         "key_deserializer, value_deserializer, key, value, expected_key, expected_value",
@@ -225,6 +227,70 @@ class TestTopic:
         assert rows[0].topic == rows[1].topic
         assert rows[0].partition == rows[1].partition
         assert rows[0].offset == rows[1].offset
+        assert rows[0].context.raw is None
+
+    def test_rows_deserialize_success(self, topic_manager_topic_factory):
+        topic = topic_manager_topic_factory(
+            key_deserializer=StringDeserializer(),
+            value_deserializer=JSONDeserializer(),
+        )
+        messages = [
+            ConfluentKafkaMessageStub(key=b"key", value=b'{"a":1}', offset=0),
+            ConfluentKafkaMessageStub(key=None, value=b'{"a":2}', offset=1),
+            ConfluentKafkaMessageStub(
+                key=b"key", value=None, offset=2, headers=[("header", b"value")]
+            ),
+        ]
+        rows = topic.rows_deserialize(messages)
+
+        assert [row.key for row in rows] == ["key", None, "key"]
+        assert [row.value for row in rows] == [{"a": 1}, {"a": 2}, None]
+        assert [row.offset for row in rows] == [0, 1, 2]
+        assert [row.headers for row in rows] == [None, None, [("header", b"value")]]
+        for row, message in zip(rows, messages):
+            assert row.topic == message.topic()
+            assert row.context.raw == (message.key(), message.value())
+            assert row.partition == message.partition()
+            assert row.timestamp == message.timestamp()[1]
+
+    def test_rows_deserialize_empty(self, topic_manager_topic_factory):
+        topic = topic_manager_topic_factory(value_deserializer=JSONDeserializer())
+        assert topic.rows_deserialize([]) == []
+
+    def test_rows_deserialize_split_values(self, topic_manager_topic_factory):
+        topic = topic_manager_topic_factory(
+            value_deserializer=JSONListDeserializer(),
+            timestamp_extractor=lambda v, *_: v["ts"],
+        )
+        messages = [
+            ConfluentKafkaMessageStub(value=b'[{"ts":1}, {"ts":2}]', offset=0),
+            ConfluentKafkaMessageStub(value=b'[{"ts":3}]', offset=1),
+        ]
+        rows = topic.rows_deserialize(messages)
+        assert [row.value for row in rows] == [{"ts": 1}, {"ts": 2}, {"ts": 3}]
+        assert [row.timestamp for row in rows] == [1, 2, 3]
+        assert [row.offset for row in rows] == [0, 0, 1]
+
+    def test_rows_deserialize_ignore_message(self, topic_manager_topic_factory):
+        topic = topic_manager_topic_factory(
+            value_deserializer=IgnoreDivisibleBy3Deserializer(),
+        )
+        messages = [
+            ConfluentKafkaMessageStub(value=int_to_bytes(i), offset=i)
+            for i in range(1, 5)
+        ]
+        rows = topic.rows_deserialize(messages)
+        assert [row.value for row in rows] == [1, 2, 4]
+        assert [row.offset for row in rows] == [1, 2, 4]
+
+    def test_rows_deserialize_error(self, topic_manager_topic_factory):
+        topic = topic_manager_topic_factory(value_deserializer=JSONDeserializer())
+        messages = [
+            ConfluentKafkaMessageStub(value=b'{"a":1}'),
+            ConfluentKafkaMessageStub(value=b"{"),
+        ]
+        with pytest.raises(SerializationError):
+            topic.rows_deserialize(messages)
 
     @pytest.mark.parametrize(
         "value_deserializer, value, headers, timestamp_extractor, expected_timestamps",
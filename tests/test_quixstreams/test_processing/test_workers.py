@@ -0,0 +1,246 @@
+import pickle
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from confluent_kafka import KafkaError, KafkaException, TopicPartition
+
+from quixstreams.kafka import Consumer
+from quixstreams.processing.workers import (
+    WorkerChannel,
+    WorkerConsumer,
+    WorkerException,
+    WorkerManager,
+    WorkerMessage,
+    WorkerProcess,
+)
+
+
+def failing_app_factory():
+    raise ValueError("test")
+
+
+def _message(topic="topic", partition=0, offset=0) -> WorkerMessage:
+    return WorkerMessage(
+        topic=topic,
+        partition=partition,
+        offset=offset,
+        timestamp=(1, 123),
+        key=b"key",
+        value=b"value",
+        headers=[("header", b"value")],
+    )
+
+
+@pytest.fixture()
+def worker_manager_factory(monkeypatch):
+    # The worker consumers run in the test process
+    monkeypatch.setattr(WorkerProcess, "is_alive", lambda self: True)
+
+    def factory(max_pending_messages: int = 100):
+        consumer = MagicMock(spec_set=Consumer)
+        manager = WorkerManager(
+            app_factory=failing_app_factory,
+            workers=1,
+            consumer=consumer,
+            max_pending_messages=max_pending_messages,
+        )
+        process = manager.processes[0]
+        worker_consumer = WorkerConsumer(
+            channel=WorkerChannel(
+                inbox=process._inbox, connection=process._child_connection
+            ),
+            on_stop=MagicMock(),
+            broker_address="localhost:9092",
+            consumer_group="group",
+            auto_offset_reset="earliest",
+        )
+        return manager, worker_consumer
+
+    return factory
+
+
+class TestWorkerMessage:
+    def test_pickle(self):
+        message = _message(offset=5)
+        unpickled = pickle.loads(pickle.dumps(message))  # noqa: S301
+        assert unpickled.topic() == "topic"
+        assert unpickled.partition() == 0
+        assert unpickled.offset() == 5
+        assert unpickled.timestamp() == (1, 123)
+        assert unpickled.key() == b"key"
+        assert unpickled.value() == b"value"
+        assert unpickled.headers() == [("header", b"value")]
+        assert unpickled.error() is None
+        assert len(unpickled) == 5
+
+
+class TestWorkerManager:
+    def test_assign_and_dispatch(self, worker_manager_factory):
+        manager, worker_consumer = worker_manager_factory()
+        on_assign = MagicMock()
+        worker_consumer.subscribe(topics=[], on_assign=on_assign)
+
+        manager.assign([TopicPartition("topic", 0, 10)])
+        assert worker_consumer.poll(timeout=1) is None
+        assert on_assign.call_count == 1
+        assert worker_consumer.committed([TopicPartition("topic", 0)]) == [
+            TopicPartition("topic", 0, 10)
+        ]
+
+        # Messages of the partitions not assigned to workers are dropped
+        manager.dispatch([_message(offset=10), _message(partition=1, offset=10)])
+        messages = worker_consumer.consume(num_messages=10, timeout=1)
+        assert [(m.partition(), m.offset()) for m in messages] == [(0, 10)]
+        assert manager.processes[0].pending == 1
+
+        # Processed messages are reported before waiting for the next ones
+        assert worker_consumer.consume(num_messages=10, timeout=0.1) == []
+        manager.handle_requests(timeout=1)
+        assert manager.processes[0].pending == 0
+
+    def test_backpressure(self, worker_manager_factory):
+        manager, worker_consumer = worker_manager_factory(max_pending_messages=2)
+        worker_consumer.subscribe(topics=[])
+        manager.assign([TopicPartition("topic", 0, 0)])
+
+        manager.dispatch([_message(offset=i) for i in range(3)])
+        manager._consumer.pause.assert_called_once_with([TopicPartition("topic", 0)])
+
+        worker_consumer.consume(num_messages=10, timeout=1)
+        assert len(worker_consumer.consume(num_messages=10, timeout=1)) == 3
+        worker_consumer.consume(num_messages=10, timeout=0.1)
+        manager.handle_requests(timeout=1)
+        manager._consumer.resume.assert_called_once_with([TopicPartition("topic", 0)])
+
+    def test_commit(self, worker_manager_factory):
+        manager, worker_consumer = worker_manager_factory()
+        manager._consumer.commit.return_value = [TopicPartition("topic", 0, 5)]
+
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.extend(
+                worker_consumer.commit(offsets=[TopicPartition("topic", 0, 5)])
+            )
+        )
+        thread.start()
+        while thread.is_alive():
+            manager.handle_requests(timeout=0.1)
+
+        assert result == [TopicPartition("topic", 0, 5)]
+        commit_call = manager._consumer.commit.call_args
+        assert commit_call.kwargs["offsets"] == [TopicPartition("topic", 0, 5)]
+
+    def test_commit_error(self, worker_manager_factory):
+        manager, worker_consumer = worker_manager_factory()
+        manager._consumer.commit.side_effect = KafkaException(
+            KafkaError(-1, "commit failed")
+        )
+
+        errors = []
+
+        def commit():
+            try:
+                worker_consumer.commit(offsets=[TopicPartition("topic", 0, 5)])
+            except KafkaException as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=commit)
+        thread.start()
+        while thread.is_alive():
+            manager.handle_requests(timeout=0.1)
+
+        assert len(errors) == 1
+        assert errors[0].args[0].code() == -1
+
+    def test_seek_drops_buffered_messages(self, worker_manager_factory):
+        manager, worker_consumer = worker_manager_factory()
+        worker_consumer.subscribe(topics=[])
+        manager.assign([TopicPartition("topic", 0, 0), TopicPartition("topic2", 0, 0)])
+        worker_consumer.consume(num_messages=10, timeout=1)
+
+        manager.dispatch([_message(offset=0), _message(offset=1)])
+        manager.dispatch([_message(offset=2), _message(topic="topic2", offset=0)])
+        assert worker_consumer.poll(timeout=1).offset() == 0
+
+        worker_consumer.pause([TopicPartition("topic", 0)])
+        worker_consumer.seek(TopicPartition("topic", 0, 0))
+        manager.handle_requests(timeout=1)
+        manager._consumer.seek.assert_called_once_with(TopicPartition("topic", 0, 0))
+        assert manager.processes[0].paused_partitions == {("topic", 0)}
+
+        # Messages passed before the seek are dropped, and the others are kept
+        manager.dispatch([_message(offset=0)])
+        messages = []
+        for _ in range(4):
+            messages += worker_consumer.consume(num_messages=10, timeout=0.5)
+        assert [(m.topic(), m.offset()) for m in messages] == [
+            ("topic2", 0),
+            ("topic", 0),
+        ]
+
+        worker_consumer.consume(num_messages=10, timeout=0.1)
+        manager.handle_requests(timeout=1)
+        assert manager.processes[0].pending == 0
+
+    def test_revoke(self, worker_manager_factory):
+        manager, worker_consumer = worker_manager_factory()
+        on_revoke, on_lost = MagicMock(), MagicMock()
+        worker_consumer.subscribe(topics=[], on_revoke=on_revoke, on_lost=on_lost)
+        manager.assign([TopicPartition("topic", 0, 0), TopicPartition("topic", 1, 0)])
+
+        stop = threading.Event()
+
+        def poll():
+            while not stop.is_set():
+                worker_consumer.poll(timeout=0.1)
+
+        thread = threading.Thread(target=poll)
+        thread.start()
+        try:
+            manager.revoke([TopicPartition("topic", 0)])
+            manager.revoke([TopicPartition("topic", 1)], lost=True)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert on_revoke.call_args[0][1] == [TopicPartition("topic", 0)]
+        assert on_lost.call_args[0][1] == [TopicPartition("topic", 1)]
+        assert worker_consumer.assignment() == []
+        assert manager.processes[0].partitions == set()
+
+    def test_assign_same_partition_numbers_to_same_worker(self):
+        manager = WorkerManager(
+            app_factory=failing_app_factory,
+            workers=2,
+            consumer=MagicMock(spec_set=Consumer),
+        )
+        manager.assign(
+            [
+                TopicPartition("topic", 0, 0),
+                TopicPartition("topic", 1, 0),
+                TopicPartition("topic2", 0, 0),
+                TopicPartition("topic2", 1, 0),
+            ]
+        )
+        worker1, worker2 = manager.processes
+        assert worker1.partitions == {("topic", 0), ("topic2", 0)}
+        assert worker2.partitions == {("topic", 1), ("topic2", 1)}
+
+    def test_worker_failed(self):
+        manager = WorkerManager(
+            app_factory=failing_app_factory,
+            workers=1,
+            consumer=MagicMock(spec_set=Consumer),
+        )
+        manager.start_workers()
+        process = manager.processes[0]
+        process.join(10)
+
+        with pytest.raises(WorkerException) as raised:
+            manager.raise_for_error()
+        assert isinstance(raised.value.__cause__, ValueError)
+
+        # Reported exceptions are raised on stop too
+        with pytest.raises(WorkerException):
+            manager.stop_workers()
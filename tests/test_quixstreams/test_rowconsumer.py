@@ -59,6 +59,69 @@ class TestRowConsumer:
                     if len(rows) == 2:
                         return
 
+    def test_consume_rows_success(
+        self, row_consumer_factory, topic_json_serdes_factory, producer
+    ):
+        topic = topic_json_serdes_factory()
+        total_messages = 3
+        with (
+            row_consumer_factory(
+                auto_offset_reset="earliest",
+            ) as consumer,
+            producer,
+        ):
+            for i in range(total_messages):
+                producer.produce(
+                    topic=topic.name, key=b"key", value=b'{"field":"%d"}' % i
+                )
+            producer.flush()
+            consumer.subscribe([topic])
+
+            rows = []
+            while Timeout():
+                rows += consumer.consume_rows(num_messages=total_messages, timeout=0.1)
+                if len(rows) == total_messages:
+                    break
+
+        assert [row.value for row in rows] == [{"field": str(i)} for i in range(3)]
+        assert [row.offset for row in rows] == [0, 1, 2]
+
+    def test_consume_rows_deserialization_error_suppress(
+        self, row_consumer_factory, topic_json_serdes_factory, producer
+    ):
+        topic = topic_json_serdes_factory()
+
+        suppressed = 0
+
+        def on_error(exc, *args):
+            assert isinstance(exc, SerializationError)
+            nonlocal suppressed
+            suppressed += 1
+            return True
+
+        with (
+            row_consumer_factory(
+                auto_offset_reset="earliest",
+                on_error=on_error,
+            ) as consumer,
+            producer,
+        ):
+            producer.produce(topic.name, key=b"key", value=b"value")
+            producer.produce(topic.name, key=b"key", value=b'{"field":"value"}')
+            producer.flush()
+            consumer.subscribe([topic])
+
+            rows = []
+            while Timeout():
+                rows += consumer.consume_rows(num_messages=2, timeout=0.1)
+                if rows:
+                    break
+
+        assert suppressed == 1
+        assert len(rows) == 1
+        assert rows[0].value == {"field": "value"}
+        assert rows[0].offset == 1
+
     def test_poll_row_kafka_error(
         self, row_consumer_factory, topic_manager_topic_factory
     ):
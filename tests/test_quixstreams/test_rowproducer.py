@@ -95,6 +95,35 @@ class TestRowProducer:
         assert row.value == value
         assert row.headers == headers
 
+    def test_produce_row_passthrough(
+        self,
+        row_consumer_factory,
+        row_producer_factory,
+        topic_json_serdes_factory,
+        row_factory,
+    ):
+        topic = topic_json_serdes_factory(num_partitions=1)
+        raw_key, raw_value = b"raw_key", b'{"field": "raw"}'
+
+        with row_producer_factory() as producer:
+            row = row_factory(
+                topic=topic.name,
+                value={"field": "value"},
+                key=b"key",
+                raw=(raw_key, raw_value),
+            )
+            # The original bytes are produced instead of the serialized row
+            producer.produce_row(topic=topic, row=row, passthrough=True)
+
+        with row_consumer_factory(auto_offset_reset="earliest") as consumer:
+            consumer.subscribe([topic])
+            row = consumer.poll_row(timeout=5.0)
+
+        assert row
+        assert row.key == raw_key
+        assert row.value == {"field": "raw"}
+        assert row.context.raw == (raw_key, raw_value)
+
     def test_produce_row_serialization_error_raise(
         self, row_producer_factory, row_factory, topic_manager_topic_factory
     ):
@@ -178,6 +207,33 @@ class TestRowProducer:
         with pytest.raises(KafkaProducerDeliveryError):
             producer.flush()
 
+    def test_produce_delivery_reports_errors_only(
+        self, row_producer_factory, topic_json_serdes_factory
+    ):
+        topic = topic_json_serdes_factory(num_partitions=1)
+        key = b"key"
+        value = b"value"
+
+        producer = row_producer_factory(delivery_reports="errors")
+        producer.produce(topic=topic.name, key=key, value=value, partition=0)
+        producer.produce(topic=topic.name, key=key, value=value)
+        producer.flush()
+
+        # The offsets are not tracked on delivery,
+        # only the partitions produced explicitly are collected
+        assert producer.offsets == {}
+        assert producer.pop_produced_partitions() == {(topic.name, 0)}
+        assert producer.pop_produced_partitions() == set()
+
+        # The delivery errors are still raised
+        producer.produce(topic=topic.name, key=key, value=value, partition=3)
+        with pytest.raises(KafkaProducerDeliveryError):
+            producer.flush()
+
+    def test_invalid_delivery_reports(self):
+        with pytest.raises(ValueError):
+            RowProducer(broker_address="localhost:9092", delivery_reports="none")
+
 
 class TestTransactionalRowProducer:
     def test_produce_and_commit(
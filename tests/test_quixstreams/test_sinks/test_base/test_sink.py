@@ -1,6 +1,28 @@
+import asyncio
+
+import pytest
+
+from quixstreams.sinks import AsyncBatchingSink, SinkBackpressureError, SinkBatch
 from tests.utils import DummySink
 
 
+class AsyncDummySink(AsyncBatchingSink):
+    def __init__(self):
+        super().__init__()
+        self.results = []
+
+    async def write(self, batch: SinkBatch):
+        await asyncio.sleep(0)
+        self.results.extend(batch)
+
+
+class AsyncBackpressuredSink(AsyncBatchingSink):
+    async def write(self, batch: SinkBatch):
+        raise SinkBackpressureError(
+            retry_after=1, topic=batch.topic, partition=batch.partition
+        )
+
+
 class TestBatchingSink:
     def test_add_and_flush(self):
         sink = DummySink()
@@ -55,3 +77,61 @@ class TestBatchingSink:
         sink.on_paused(topic="topic", partition=0)
         sink.flush(topic="topic", partition=0)
         assert sink.results == []
+
+
+class TestAsyncBatchingSink:
+    def test_add_and_flush(self):
+        sink = AsyncDummySink()
+        topic, partition = "topic", 0
+        sink.add(
+            value="value",
+            key="key",
+            topic=topic,
+            partition=partition,
+            offset=0,
+            timestamp=0,
+            headers=[],
+        )
+        # Flush the sink twice to ensure that records are flushed once
+        sink.flush(topic=topic, partition=partition)
+        sink.flush(topic=topic, partition=partition)
+        assert len(sink.results) == 1
+        assert sink.results[0].value == "value"
+
+    def test_flush_async(self):
+        sink = AsyncDummySink()
+        for partition in (0, 1):
+            sink.add(
+                value=partition,
+                key="key",
+                topic="topic",
+                partition=partition,
+                offset=0,
+                timestamp=0,
+                headers=[],
+            )
+
+        async def flush():
+            await asyncio.gather(
+                sink.flush_async(topic="topic", partition=0),
+                sink.flush_async(topic="topic", partition=1),
+            )
+
+        asyncio.run(flush())
+        assert sorted(item.value for item in sink.results) == [0, 1]
+
+    def test_flush_backpressured_drops_batch(self):
+        sink = AsyncBackpressuredSink()
+        sink.add(
+            value="value",
+            key="key",
+            topic="topic",
+            partition=0,
+            offset=0,
+            timestamp=0,
+            headers=[],
+        )
+        with pytest.raises(SinkBackpressureError):
+            sink.flush(topic="topic", partition=0)
+        # The batch is dropped after the failed write
+        sink.flush(topic="topic", partition=0)
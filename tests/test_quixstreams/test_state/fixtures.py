@@ -18,6 +18,11 @@ from quixstreams.state.rocksdb import (
     RocksDBStorePartition,
     RocksDBOptions,
 )
+from quixstreams.state.memory import (
+    MemoryStore,
+    MemoryStorePartition,
+    MemoryStoreOptions,
+)
 
 
 @pytest.fixture()
@@ -82,10 +87,29 @@ def rocksdb_store_factory(tmp_path):
     return factory
 
 
+def memory_store_factory(tmp_path):
+    def factory(
+        topic: Optional[str] = None,
+        name: str = "default",
+        changelog_producer_factory: Optional[ChangelogProducerFactory] = None,
+    ) -> MemoryStore:
+        topic = topic or str(uuid.uuid4())
+        return MemoryStore(
+            topic=topic,
+            name=name,
+            base_dir=str(tmp_path),
+            changelog_producer_factory=changelog_producer_factory,
+        )
+
+    return factory
+
+
 @pytest.fixture()
 def store_factory(store_type, tmp_path):
     if store_type == RocksDBStore:
         return rocksdb_store_factory(tmp_path)
+    elif store_type == MemoryStore:
+        return memory_store_factory(tmp_path)
     else:
         raise ValueError(f"invalid store type {store_type}")
 
@@ -114,10 +138,27 @@ def rocksdb_partition_factory(tmp_path, changelog_producer_mock):
     return factory
 
 
+def memory_partition_factory(tmp_path, changelog_producer_mock):
+    def factory(
+        name: str = "db",
+        options: Optional[MemoryStoreOptions] = None,
+        changelog_producer: Optional[ChangelogProducer] = None,
+    ) -> MemoryStorePartition:
+        return MemoryStorePartition(
+            snapshot_path=(tmp_path / f"{name}.snapshot").as_posix(),
+            options=options,
+            changelog_producer=changelog_producer or changelog_producer_mock,
+        )
+
+    return factory
+
+
 @pytest.fixture()
 def store_partition_factory(store_type, tmp_path, changelog_producer_mock):
     if store_type == RocksDBStore:
         return rocksdb_partition_factory(tmp_path, changelog_producer_mock)
+    elif store_type == MemoryStore:
+        return memory_partition_factory(tmp_path, changelog_producer_mock)
     else:
         raise ValueError(f"invalid store type {store_type}")
 
@@ -11,6 +11,7 @@ from quixstreams.state.exceptions import (
     WindowedStoreAlreadyRegisteredError,
 )
 from quixstreams.state.manager import SUPPORTED_STORES
+from quixstreams.state.standby import StandbyManager
 from tests.utils import TopicPartitionStub
 
 
@@ -86,6 +87,60 @@ class TestStateStoreManager:
         assert not state_manager.get_store("topic1", "store2").partitions
         assert not state_manager.get_store("topic2", "store1").partitions
 
+    def test_assign_partitions_many(self, state_manager):
+        state_manager.register_store("topic1", store_name="store1")
+        state_manager.register_store("topic1", store_name="store2")
+        state_manager.register_store("topic2", store_name="store1")
+
+        assigned = state_manager.on_partitions_assign(
+            [
+                ("topic1", 0, -1001),
+                ("topic1", 1, -1001),
+                ("topic2", 0, -1001),
+                ("topic3", 0, -1001),
+            ]
+        )
+
+        assert set(assigned) == {
+            ("topic1", 0),
+            ("topic1", 1),
+            ("topic2", 0),
+            ("topic3", 0),
+        }
+        assert len(assigned[("topic1", 0)]) == 2
+        assert len(assigned[("topic1", 1)]) == 2
+        assert len(assigned[("topic2", 0)]) == 1
+        assert assigned[("topic3", 0)] == []
+
+        store = state_manager.get_store("topic1", "store1")
+        assert set(store.partitions) == {0, 1}
+        assert store.partitions[1] in assigned[("topic1", 1)]
+
+        for topic, partition in assigned:
+            state_manager.on_partition_revoke(topic=topic, partition=partition)
+        assert not store.partitions
+
+    def test_assign_revoke_partitions_with_standby_replicas(
+        self, state_manager_factory
+    ):
+        standby_manager = MagicMock(spec_set=StandbyManager)
+        state_manager = state_manager_factory(standby_manager=standby_manager)
+        state_manager.init()
+        state_manager.register_store("topic1", store_name="store1")
+
+        state_manager.on_partitions_assign([("topic1", 0, -1001)])
+        standby_manager.release.assert_called_once_with(topic="topic1", partition=0)
+        standby_manager.request_reconcile.assert_called_once()
+
+        state_manager.update_standby_replicas()
+        standby_manager.update.assert_called_once_with(state_manager.stores)
+
+        state_manager.on_partition_revoke(topic="topic1", partition=0)
+        assert standby_manager.request_reconcile.call_count == 2
+
+        state_manager.close()
+        standby_manager.close.assert_called_once()
+
     def test_register_store_twice(self, state_manager):
         state_manager.register_store("topic", "store")
         state_manager.register_store("topic", "store")
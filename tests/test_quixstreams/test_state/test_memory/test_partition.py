@@ -0,0 +1,180 @@
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from quixstreams.state.memory import MemoryStore, MemoryStoreOptions
+from quixstreams.state.metadata import (
+    CHANGELOG_CF_MESSAGE_HEADER,
+    CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER,
+    PREFIX_SEPARATOR,
+)
+from quixstreams.state.exceptions import (
+    ColumnFamilyAlreadyExists,
+    ColumnFamilyDoesNotExist,
+)
+from quixstreams.utils.json import dumps
+from tests.utils import ConfluentKafkaMessageStub
+
+
+@pytest.mark.parametrize("store_type", [MemoryStore], indirect=True)
+class TestMemoryStorePartition:
+    def test_create_and_drop_column_family(self, store_partition):
+        store_partition.create_column_family("cf")
+        assert "cf" in store_partition.list_column_families()
+
+        store_partition.drop_column_family("cf")
+        assert "cf" not in store_partition.list_column_families()
+
+    def test_create_column_family_already_exists(self, store_partition):
+        store_partition.create_column_family("cf")
+        with pytest.raises(ColumnFamilyAlreadyExists):
+            store_partition.create_column_family("cf")
+
+    def test_drop_column_family_doesnt_exist(self, store_partition):
+        with pytest.raises(ColumnFamilyDoesNotExist):
+            store_partition.drop_column_family("cf")
+
+    def test_write_updates_offsets(self, store_partition):
+        tx = store_partition.begin()
+        tx.set("key", "value", prefix=b"__key__")
+        tx.prepare(processed_offset=10)
+        tx.flush(processed_offset=10, changelog_offset=5)
+
+        assert store_partition.get_processed_offset() == 10
+        assert store_partition.get_changelog_offset() == 5
+
+    def test_snapshots_disabled_by_default(self, store_partition):
+        with store_partition.begin() as tx:
+            tx.set("key", "value", prefix=b"__key__")
+
+        store_partition.close()
+        assert not os.path.exists(store_partition.path)
+
+    def test_snapshot_saved_on_close_and_loaded(self, store_partition_factory):
+        options = MemoryStoreOptions(snapshot_interval=60.0)
+        partition = store_partition_factory(options=options)
+        tx = partition.begin()
+        tx.set("key", "value", prefix=b"__key__")
+        tx.prepare(processed_offset=10)
+        tx.flush(processed_offset=10, changelog_offset=5)
+        partition.close()
+        assert os.path.exists(partition.path)
+
+        partition = store_partition_factory(options=options)
+        with partition.begin() as tx:
+            assert tx.get("key", prefix=b"__key__") == "value"
+        assert partition.get_processed_offset() == 10
+        assert partition.get_changelog_offset() == 5
+
+    def test_snapshot_saved_on_interval(self, store_partition_factory):
+        partition = store_partition_factory(
+            options=MemoryStoreOptions(snapshot_interval=0.0)
+        )
+        with patch.object(
+            partition, "_save_snapshot", wraps=partition._save_snapshot
+        ) as mock:
+            with partition.begin() as tx:
+                tx.set("key", "value", prefix=b"__key__")
+            # The snapshot is saved in a background thread
+            partition._wait_for_snapshot()
+
+        mock.assert_called_once()
+        assert os.path.exists(partition.path)
+
+    def test_snapshot_in_background_not_affected_by_next_writes(
+        self, store_partition_factory
+    ):
+        options = MemoryStoreOptions(snapshot_interval=0.0)
+        partition = store_partition_factory(options=options)
+        save_snapshot = partition._save_snapshot
+        saving_allowed = threading.Event()
+
+        def save_snapshot_later(snapshot):
+            saving_allowed.wait()
+            save_snapshot(snapshot)
+
+        with patch.object(partition, "_save_snapshot", side_effect=save_snapshot_later):
+            with partition.begin() as tx:
+                tx.set("key", "value1", prefix=b"__key__")
+            # The processing is not blocked by the snapshot being saved
+            with partition.begin() as tx:
+                tx.set("key", "value2", prefix=b"__key__")
+            saving_allowed.set()
+            partition._wait_for_snapshot()
+
+        loaded = store_partition_factory(options=options)
+        with loaded.begin() as tx:
+            assert tx.get("key", prefix=b"__key__") == "value1"
+
+    def test_snapshot_not_saved_before_interval(self, store_partition_factory):
+        partition = store_partition_factory(
+            options=MemoryStoreOptions(snapshot_interval=3600.0)
+        )
+        with partition.begin() as tx:
+            tx.set("key", "value", prefix=b"__key__")
+
+        assert not os.path.exists(partition.path)
+
+
+@pytest.mark.parametrize("store_type", [MemoryStore], indirect=True)
+class TestMemoryStorePartitionChangelog:
+    @pytest.mark.parametrize("store_value", [10, None])
+    def test_recover_from_changelog_message(self, store_partition, store_value):
+        kafka_key = b"my_key"
+        user_store_key = "count"
+        changelog_msg = ConfluentKafkaMessageStub(
+            key=kafka_key + PREFIX_SEPARATOR + dumps(user_store_key),
+            value=dumps(store_value),
+            headers=[(CHANGELOG_CF_MESSAGE_HEADER, b"default")],
+            offset=50,
+        )
+
+        store_partition.recover_from_changelog_message(
+            changelog_msg, committed_offset=-1001
+        )
+
+        with store_partition.begin() as tx:
+            assert tx.get(user_store_key, prefix=kafka_key) == store_value
+        assert store_partition.get_changelog_offset() == changelog_msg.offset()
+
+    def test_recover_from_changelog_message_processed_offset_ahead_committed(
+        self, store_partition
+    ):
+        kafka_key = b"my_key"
+        user_store_key = "count"
+        changelog_msg = ConfluentKafkaMessageStub(
+            key=kafka_key + PREFIX_SEPARATOR + dumps(user_store_key),
+            value=dumps(10),
+            headers=[
+                (CHANGELOG_CF_MESSAGE_HEADER, b"default"),
+                (CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER, dumps(2)),
+            ],
+            offset=50,
+        )
+
+        store_partition.recover_from_changelog_message(
+            changelog_msg, committed_offset=1
+        )
+
+        with store_partition.begin() as tx:
+            assert tx.get(user_store_key, prefix=kafka_key) is None
+        assert store_partition.get_changelog_offset() == changelog_msg.offset()
+
+    def test_recover_resumes_from_snapshot(self, store_partition_factory):
+        options = MemoryStoreOptions(snapshot_interval=60.0)
+        partition = store_partition_factory(options=options)
+        changelog_msg = ConfluentKafkaMessageStub(
+            key=b"my_key" + PREFIX_SEPARATOR + dumps("count"),
+            value=dumps(10),
+            headers=[(CHANGELOG_CF_MESSAGE_HEADER, b"default")],
+            offset=50,
+        )
+        partition.recover_from_changelog_message(changelog_msg, committed_offset=-1001)
+        partition.close()
+
+        partition = store_partition_factory(options=options)
+        assert partition.get_changelog_offset() == 50
+        with partition.begin() as tx:
+            assert tx.get("count", prefix=b"my_key") == 10
@@ -285,3 +285,249 @@ class TestRocksDBStorePartitionChangelog:
         with store_partition.begin() as tx:
             assert tx.get(user_store_key, prefix=kafka_key) is None
         assert store_partition.get_changelog_offset() == changelog_msg.offset()
+
+    def test_recover_from_changelog_messages_batch(self, store_partition):
+        """
+        Test that a batch of changelog messages is applied at once,
+        skipping the changes not committed yet, and the changelog offset is set to
+        the offset of the last message.
+        """
+        kafka_key = b"my_key"
+        committed_offset = 2
+
+        def changelog_msg(user_key, value, offset, processed_offset):
+            return ConfluentKafkaMessageStub(
+                key=kafka_key + PREFIX_SEPARATOR + dumps(user_key),
+                value=dumps(value) if value is not None else None,
+                headers=[
+                    (CHANGELOG_CF_MESSAGE_HEADER, b"default"),
+                    (
+                        CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER,
+                        dumps(processed_offset),
+                    ),
+                ],
+                offset=offset,
+            )
+
+        changelog_msgs = [
+            changelog_msg("a", 1, offset=10, processed_offset=0),
+            changelog_msg("b", 2, offset=11, processed_offset=0),
+            changelog_msg("a", None, offset=12, processed_offset=1),
+            # Not committed yet, must be skipped
+            changelog_msg("c", 3, offset=13, processed_offset=2),
+        ]
+
+        store_partition.recover_from_changelog_messages(
+            changelog_msgs, committed_offset=committed_offset
+        )
+
+        with store_partition.begin() as tx:
+            assert tx.get("a", prefix=kafka_key) is None
+            assert tx.get("b", prefix=kafka_key) == 2
+            assert tx.get("c", prefix=kafka_key) is None
+        assert store_partition.get_changelog_offset() == 13
+
+    def test_recover_from_changelog_messages_superseded_keys(self, store_partition):
+        """
+        Test that only the latest applicable update of each key in the batch
+        is written to the DB.
+        """
+        kafka_key = b"my_key"
+
+        def changelog_msg(user_key, value, offset, processed_offset):
+            return ConfluentKafkaMessageStub(
+                key=kafka_key + PREFIX_SEPARATOR + dumps(user_key),
+                value=dumps(value) if value is not None else None,
+                headers=[
+                    (CHANGELOG_CF_MESSAGE_HEADER, b"default"),
+                    (
+                        CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER,
+                        dumps(processed_offset),
+                    ),
+                ],
+                offset=offset,
+            )
+
+        changelog_msgs = [
+            changelog_msg("count", 1, offset=0, processed_offset=0),
+            changelog_msg("count", 2, offset=1, processed_offset=1),
+            changelog_msg("deleted", 1, offset=2, processed_offset=1),
+            changelog_msg("count", 3, offset=3, processed_offset=2),
+            changelog_msg("deleted", None, offset=4, processed_offset=2),
+            # Not committed yet, must not replace the previous update
+            changelog_msg("count", 4, offset=5, processed_offset=3),
+        ]
+
+        with patch.object(
+            store_partition,
+            "_apply_changelog_update",
+            wraps=store_partition._apply_changelog_update,
+        ) as apply_update:
+            store_partition.recover_from_changelog_messages(
+                changelog_msgs, committed_offset=3
+            )
+
+        assert apply_update.call_count == 2
+        with store_partition.begin() as tx:
+            assert tx.get("count", prefix=kafka_key) == 3
+            assert tx.get("deleted", prefix=kafka_key) is None
+        assert store_partition.get_changelog_offset() == 5
+
+    def test_recover_from_changelog_messages_empty(self, store_partition):
+        store_partition.recover_from_changelog_messages([], committed_offset=-1001)
+        assert store_partition.get_changelog_offset() is None
+
+    def test_recover_from_changelog_messages_wal_disabled(
+        self, store_partition_factory
+    ):
+        kafka_key = b"my_key"
+        changelog_msg = ConfluentKafkaMessageStub(
+            key=kafka_key + PREFIX_SEPARATOR + dumps("count"),
+            value=dumps(10),
+            headers=[(CHANGELOG_CF_MESSAGE_HEADER, b"default")],
+            offset=50,
+        )
+
+        with store_partition_factory(
+            options=RocksDBOptions(disable_wal_on_recovery=True)
+        ) as store_partition:
+            store_partition.recover_from_changelog_messages(
+                [changelog_msg], committed_offset=-1001
+            )
+            store_partition.complete_recovery()
+
+            with store_partition.begin() as tx:
+                assert tx.get("count", prefix=kafka_key) == 10
+            assert store_partition.get_changelog_offset() == 50
+
+
+class TestRocksDBStorePartitionValueCache:
+    def test_get_value_cached(self, store_partition_factory):
+        with store_partition_factory(
+            options=RocksDBOptions(value_cache_size=10)
+        ) as store_partition:
+            with store_partition.begin() as tx:
+                tx.set("key", {"a": 1}, prefix=b"__key__")
+
+            with store_partition.begin() as tx:
+                value1 = tx.get("key", prefix=b"__key__")
+                value2 = tx.get("key", prefix=b"__key__")
+                assert value1 == {"a": 1}
+                assert value1 is value2
+
+    def test_get_value_cache_disabled(self, store_partition):
+        with store_partition.begin() as tx:
+            tx.set("key", {"a": 1}, prefix=b"__key__")
+
+        with store_partition.begin() as tx:
+            assert tx.get("key", prefix=b"__key__") is not tx.get(
+                "key", prefix=b"__key__"
+            )
+
+    def test_get_value_cache_refreshed_on_write(self, store_partition_factory):
+        with store_partition_factory(
+            options=RocksDBOptions(value_cache_size=10)
+        ) as store_partition:
+            with store_partition.begin() as tx:
+                tx.set("key1", 1, prefix=b"__key__")
+                tx.set("key2", 2, prefix=b"__key__")
+
+            with store_partition.begin() as tx:
+                assert tx.get("key1", prefix=b"__key__") == 1
+                assert tx.get("key2", prefix=b"__key__") == 2
+
+            value = {"a": 10}
+            with store_partition.begin() as tx:
+                tx.set("key1", value, prefix=b"__key__")
+                tx.delete("key2", prefix=b"__key__")
+
+            with store_partition.begin() as tx:
+                with patch.object(
+                    store_partition, "get", wraps=store_partition.get
+                ) as get_mock:
+                    cached = tx.get("key1", prefix=b"__key__")
+                get_mock.assert_not_called()
+                assert cached == {"a": 10}
+                assert cached is not value
+                assert tx.get("key2", prefix=b"__key__") is None
+                assert not tx.exists("key2", prefix=b"__key__")
+
+    def test_get_value_cache_dropped_for_discarded_transaction(
+        self, store_partition_factory
+    ):
+        with store_partition_factory(
+            options=RocksDBOptions(value_cache_size=10)
+        ) as store_partition:
+            with store_partition.begin() as tx:
+                tx.set("key", {"c": 0}, prefix=b"__key__")
+
+            # Change the cached value in place, and discard the transaction
+            # without flushing it
+            tx = store_partition.begin()
+            value = tx.get("key", prefix=b"__key__")
+            value["c"] += 1
+            tx.set("key", value, prefix=b"__key__")
+
+            with store_partition.begin() as tx:
+                assert tx.get("key", prefix=b"__key__") == {"c": 0}
+
+    def test_get_value_cache_kept_for_flushed_read_only_transaction(
+        self, store_partition_factory
+    ):
+        with store_partition_factory(
+            options=RocksDBOptions(value_cache_size=10)
+        ) as store_partition:
+            with store_partition.begin() as tx:
+                tx.set("key", {"c": 0}, prefix=b"__key__")
+
+            with store_partition.begin() as tx:
+                value = tx.get("key", prefix=b"__key__")
+
+            with store_partition.begin() as tx:
+                assert tx.get("key", prefix=b"__key__") is value
+
+    def test_get_value_cache_evicts_least_recently_used(self, store_partition_factory):
+        with store_partition_factory(
+            options=RocksDBOptions(value_cache_size=2)
+        ) as store_partition:
+            with store_partition.begin() as tx:
+                for i in range(3):
+                    tx.set(f"key{i}", [i], prefix=b"__key__")
+
+            with store_partition.begin() as tx:
+                key0 = tx.get("key0", prefix=b"__key__")
+                tx.get("key1", prefix=b"__key__")
+                # Read "key0" again to make "key1" the least recently used one
+                assert tx.get("key0", prefix=b"__key__") is key0
+                tx.get("key2", prefix=b"__key__")
+
+                assert tx.get("key0", prefix=b"__key__") is key0
+                with patch.object(
+                    store_partition, "get", wraps=store_partition.get
+                ) as get_mock:
+                    assert tx.get("key1", prefix=b"__key__") == [1]
+                get_mock.assert_called_once()
+
+    def test_get_value_cache_invalidated_on_recovery(self, store_partition_factory):
+        kafka_key = b"my_key"
+        with store_partition_factory(
+            options=RocksDBOptions(value_cache_size=10)
+        ) as store_partition:
+            with store_partition.begin() as tx:
+                tx.set("count", 1, prefix=kafka_key)
+
+            with store_partition.begin() as tx:
+                assert tx.get("count", prefix=kafka_key) == 1
+
+            changelog_msg = ConfluentKafkaMessageStub(
+                key=kafka_key + PREFIX_SEPARATOR + dumps("count"),
+                value=dumps(10),
+                headers=[(CHANGELOG_CF_MESSAGE_HEADER, b"default")],
+                offset=50,
+            )
+            store_partition.recover_from_changelog_message(
+                changelog_msg, committed_offset=-1001
+            )
+
+            with store_partition.begin() as tx:
+                assert tx.get("count", prefix=kafka_key) == 10
@@ -224,8 +224,8 @@ class TestRecoveryManager:
         # Trigger a recovery
         recovery_manager.do_recovery()
 
-        # Check that consumer.poll() is not called
-        assert not consumer.poll.called
+        # Check that consumer.consume() is not called
+        assert not consumer.consume.called
 
 
 @pytest.mark.parametrize("store_type", SUPPORTED_STORES, indirect=True)
@@ -309,7 +309,7 @@ class TestRecoveryManagerRecover:
         Test that RecoveryManager.do_recovery():
          - resumes the recovering changelog partition
          - applies the 1 missing changelog recovery message to the StorePartition
-         - handles a None consumer poll to check for finished recovery (which it is)
+         - handles an empty consumer consume to check for finished recovery (which it is)
          - revokes the RecoveryPartition
          - unassigns the changelog partition
          - unpauses source topic partitions
@@ -338,8 +338,9 @@ class TestRecoveryManagerRecover:
 
         # Create a RecoveryManager
         consumer = MagicMock(spec_set=Consumer)
-        # note how the poll returns None, which signifies no more messages to recover
-        consumer.poll.side_effect = [changelog_message, None]
+        # note how the consume returns an empty list, which signifies no more
+        # messages to recover
+        consumer.consume.side_effect = [[changelog_message], []]
         consumer.assignment.return_value = assignment
         recovery_manager = recovery_manager_factory(
             consumer=consumer, topic_manager=topic_manager
@@ -347,7 +348,7 @@ class TestRecoveryManagerRecover:
 
         # Assign a partition that needs recovery
         consumer.get_watermark_offsets.return_value = (lowwater, highwater)
-        # this will get called after a "None" consumer poll result
+        # this will get called after an empty consumer consume result
         consumer.position.return_value = [
             ConfluentPartition(changelog_topic.name, 0, highwater)
         ]
@@ -364,7 +365,7 @@ class TestRecoveryManagerRecover:
         # Check that consumer first resumed the changelog topic partition
         consumer_resume_calls = consumer.resume.call_args_list
 
-        assert len(consumer.poll.call_args_list) == 2
+        assert len(consumer.consume.call_args_list) == 2
         assert consumer_resume_calls[0].args[0] == [
             ConfluentPartition(topic=changelog_topic.name, partition=0)
         ]
@@ -373,3 +374,64 @@ class TestRecoveryManagerRecover:
 
         # Check that RecoveryPartitions are unassigned
         assert not recovery_manager.partitions
+
+    def test_do_recovery_batch(
+        self, recovery_manager_factory, topic_manager_factory, store_partition
+    ):
+        """
+        Test that RecoveryManager.do_recovery() applies a batch of consumed
+        changelog messages at once and sets the changelog offset of the last one.
+        """
+        topic_name = "topic_name"
+        store_name = "default"
+        lowwater, highwater = 0, 10
+
+        topic_manager = topic_manager_factory()
+        topic_manager.topic(topic_name)
+        changelog_topic = topic_manager.changelog_topic(
+            topic_name=topic_name,
+            store_name=store_name,
+        )
+        changelog_messages = [
+            ConfluentKafkaMessageStub(
+                topic=changelog_topic.name,
+                partition=0,
+                offset=offset,
+                key=f"key{offset}".encode(),
+                value=b"value",
+                headers=[(CHANGELOG_CF_MESSAGE_HEADER, b"default")],
+            )
+            for offset in range(highwater)
+        ]
+
+        consumer = MagicMock(spec_set=Consumer)
+        consumer.consume.side_effect = [changelog_messages, []]
+        consumer.assignment.return_value = [0]
+        recovery_manager = recovery_manager_factory(
+            consumer=consumer, topic_manager=topic_manager
+        )
+
+        consumer.get_watermark_offsets.return_value = (lowwater, highwater)
+        consumer.position.return_value = [
+            ConfluentPartition(changelog_topic.name, 0, highwater)
+        ]
+        recovery_manager.assign_partition(
+            topic=topic_name,
+            partition=0,
+            committed_offset=-1001,
+            store_partitions={store_name: store_partition},
+        )
+
+        with patch.object(
+            store_partition,
+            "recover_from_changelog_messages",
+            wraps=store_partition.recover_from_changelog_messages,
+        ) as recover:
+            recovery_manager.do_recovery()
+
+        # The whole batch is applied with a single call
+        assert recover.call_count == 1
+        assert store_partition.get_changelog_offset() == highwater - 1
+        for offset in range(highwater):
+            assert store_partition.get(f"key{offset}".encode()) == b"value"
+        assert not recovery_manager.partitions
@@ -0,0 +1,130 @@
+from unittest.mock import MagicMock
+
+import pytest
+from confluent_kafka import OFFSET_BEGINNING, TopicPartition as ConfluentPartition
+
+from quixstreams.kafka import Consumer
+from quixstreams.models import TopicConfig
+from quixstreams.state.metadata import (
+    CHANGELOG_CF_MESSAGE_HEADER,
+    CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER,
+)
+from quixstreams.state.rocksdb import RocksDBStore
+from quixstreams.state.standby import StandbyManager
+from quixstreams.utils.json import dumps
+from tests.utils import ConfluentKafkaMessageStub
+
+
+@pytest.fixture()
+def standby_setup(topic_manager_factory, tmp_path):
+    topic_name, store_name = "topic", "default"
+    topic_manager = topic_manager_factory()
+    topic_manager.topic(
+        topic_name, config=TopicConfig(num_partitions=4, replication_factor=1)
+    )
+    changelog_topic = topic_manager.changelog_topic(
+        topic_name=topic_name, store_name=store_name
+    )
+
+    consumer = MagicMock(spec_set=Consumer)
+    metadata = MagicMock()
+    metadata.topics = {
+        changelog_topic.name: MagicMock(partitions={0: {}, 1: {}, 2: {}, 3: {}})
+    }
+    consumer.list_topics.return_value = metadata
+    consumer.consume.return_value = []
+
+    store = RocksDBStore(name=store_name, topic=topic_name, base_dir=str(tmp_path))
+    standby_manager = StandbyManager(consumer=consumer, topic_manager=topic_manager)
+    yield standby_manager, consumer, store, changelog_topic.name
+    standby_manager.close()
+    store.close()
+
+
+def _changelog_message(changelog_name, partition, offset, processed_offset):
+    return ConfluentKafkaMessageStub(
+        topic=changelog_name,
+        partition=partition,
+        offset=offset,
+        key=b"key",
+        value=dumps(offset),
+        headers=[
+            (CHANGELOG_CF_MESSAGE_HEADER, b"default"),
+            (CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER, dumps(processed_offset)),
+        ],
+    )
+
+
+class TestStandbyManager:
+    def test_update_replicates_unassigned_partitions(self, standby_setup):
+        standby_manager, consumer, store, changelog_name = standby_setup
+        store.assign_partition(0)
+
+        consumer.committed.return_value = [ConfluentPartition("topic", 1, 10)]
+        standby_manager.update({"topic": {"default": store}})
+
+        assert list(standby_manager.partitions) == [(changelog_name, 1)]
+        consumer.incremental_assign.assert_called_once_with(
+            [ConfluentPartition(changelog_name, 1, OFFSET_BEGINNING)]
+        )
+
+    def test_update_replicates_next_partitions_only(self, standby_setup):
+        standby_manager, consumer, store, changelog_name = standby_setup
+        stores = {"topic": {"default": store}}
+        store.assign_partition(0)
+        store.assign_partition(1)
+
+        consumer.committed.return_value = [ConfluentPartition("topic", 2, 10)]
+        standby_manager.update(stores)
+        assert list(standby_manager.partitions) == [(changelog_name, 2)]
+
+        # The replicated partitions follow the assignment
+        store.revoke_partition(0)
+        store.revoke_partition(1)
+        standby_manager.release(topic="topic", partition=3)
+        store.assign_partition(3)
+        standby_manager.request_reconcile()
+        standby_manager.update(stores)
+
+        assert list(standby_manager.partitions) == [(changelog_name, 0)]
+        consumer.incremental_unassign.assert_called_once_with(
+            [ConfluentPartition(changelog_name, 2)]
+        )
+
+    def test_update_applies_committed_changes_only(self, standby_setup):
+        standby_manager, consumer, store, changelog_name = standby_setup
+        store.assign_partition(0)
+        stores = {"topic": {"default": store}}
+
+        consumer.committed.return_value = [ConfluentPartition("topic", 1, 10)]
+        standby_manager.update(stores)
+
+        consumer.consume.return_value = [
+            _changelog_message(changelog_name, 1, offset=0, processed_offset=5),
+            _changelog_message(changelog_name, 1, offset=1, processed_offset=10),
+        ]
+        standby_manager.update(stores)
+
+        standby_partition = standby_manager.partitions[(changelog_name, 1)]
+        assert standby_partition.store_partition.get_changelog_offset() == 0
+        assert standby_partition.consume_offset == 1
+        assert standby_partition.paused
+        consumer.pause.assert_called_once_with(
+            [ConfluentPartition(changelog_name, 1, 1)]
+        )
+        consumer.seek.assert_called_once_with(ConfluentPartition(changelog_name, 1, 1))
+
+    def test_release_closes_standby_partition(self, standby_setup):
+        standby_manager, consumer, store, changelog_name = standby_setup
+        store.assign_partition(0)
+        consumer.committed.return_value = [ConfluentPartition("topic", 1, 10)]
+        standby_manager.update({"topic": {"default": store}})
+
+        standby_manager.release(topic="topic", partition=1)
+
+        assert not standby_manager.partitions
+        consumer.incremental_unassign.assert_called_once_with(
+            [ConfluentPartition(changelog_name, 1)]
+        )
+        # The partition is not locked by the standby anymore
+        store.assign_partition(1)
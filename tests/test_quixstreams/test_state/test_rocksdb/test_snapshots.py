@@ -0,0 +1,138 @@
+import pytest
+
+from quixstreams.state.rocksdb import (
+    RocksDBStore,
+    SnapshotManager,
+    FileSystemSnapshotStorage,
+)
+
+
+@pytest.fixture()
+def snapshot_storage(tmp_path):
+    return FileSystemSnapshotStorage(base_dir=tmp_path / "snapshots")
+
+
+@pytest.fixture()
+def snapshot_manager_factory(snapshot_storage, tmp_path):
+    def factory(interval: float = 0.0, keep_snapshots: int = 2) -> SnapshotManager:
+        return SnapshotManager(
+            storage=snapshot_storage,
+            local_dir=tmp_path / "local",
+            key_prefix="group",
+            interval=interval,
+            keep_snapshots=keep_snapshots,
+        )
+
+    return factory
+
+
+def _set_value(store: RocksDBStore, partition: int, value, changelog_offset: int):
+    tx = store.start_partition_transaction(partition)
+    tx.set(key="key", value=value, prefix=b"__key__")
+    tx.flush(processed_offset=changelog_offset, changelog_offset=changelog_offset)
+
+
+class TestFileSystemSnapshotStorage:
+    def test_upload_download_list_delete(self, snapshot_storage, tmp_path):
+        source = tmp_path / "source"
+        source.write_bytes(b"data")
+        snapshot_storage.upload("a/b/1", str(source))
+        snapshot_storage.upload("a/c/2", str(source))
+
+        assert sorted(snapshot_storage.list_keys("a/")) == ["a/b/1", "a/c/2"]
+        assert snapshot_storage.list_keys("a/b/") == ["a/b/1"]
+        assert snapshot_storage.list_keys("x/") == []
+
+        target = tmp_path / "target"
+        snapshot_storage.download("a/b/1", str(target))
+        assert target.read_bytes() == b"data"
+
+        snapshot_storage.delete("a/b/1")
+        snapshot_storage.delete("a/b/1")
+        assert snapshot_storage.list_keys("a/") == ["a/c/2"]
+
+
+class TestSnapshotManager:
+    def test_snapshot_and_restore(self, snapshot_manager_factory, tmp_path):
+        snapshot_manager = snapshot_manager_factory()
+        store = RocksDBStore(
+            name="default",
+            topic="topic",
+            base_dir=str(tmp_path / "node1"),
+            snapshot_manager=snapshot_manager,
+        )
+        store.assign_partition(0)
+        _set_value(store, 0, "value", changelog_offset=10)
+        store.snapshot_partitions()  # The first call starts the interval
+        store.snapshot_partitions()
+        snapshot_manager.close()
+        store.close()
+
+        # A store on another node restores the missing partition from the snapshot
+        restored_store = RocksDBStore(
+            name="default",
+            topic="topic",
+            base_dir=str(tmp_path / "node2"),
+            snapshot_manager=snapshot_manager_factory(),
+        )
+        with restored_store:
+            store_partition = restored_store.assign_partition(0)
+            assert store_partition.get_changelog_offset() == 10
+            tx = restored_store.start_partition_transaction(0)
+            assert tx.get("key", prefix=b"__key__") == "value"
+
+    def test_restore_no_snapshots(self, snapshot_manager_factory, tmp_path):
+        snapshot_manager = snapshot_manager_factory()
+        path = str(tmp_path / "partition")
+        assert snapshot_manager.restore("topic", "default", 0, path) is None
+
+    def test_snapshot_skipped_before_interval_and_without_changes(
+        self, snapshot_manager_factory, snapshot_storage, tmp_path
+    ):
+        snapshot_manager = snapshot_manager_factory(interval=3600)
+        store = RocksDBStore(
+            name="default",
+            topic="topic",
+            base_dir=str(tmp_path / "node1"),
+            snapshot_manager=snapshot_manager,
+        )
+        with store:
+            store.assign_partition(0)
+            _set_value(store, 0, "value", changelog_offset=10)
+            store.snapshot_partitions()
+            store.snapshot_partitions()
+            snapshot_manager.close()
+        assert snapshot_storage.list_keys("group/") == []
+
+    def test_old_snapshots_deleted(
+        self, snapshot_manager_factory, snapshot_storage, tmp_path
+    ):
+        snapshot_manager = snapshot_manager_factory(keep_snapshots=1)
+        store = RocksDBStore(
+            name="default",
+            topic="topic",
+            base_dir=str(tmp_path / "node1"),
+            snapshot_manager=snapshot_manager,
+        )
+        with store:
+            store.assign_partition(0)
+            store.snapshot_partitions()
+            for offset in (1, 2):
+                _set_value(store, 0, offset, changelog_offset=offset)
+                store.snapshot_partitions()
+                # Wait for the upload
+                snapshot_manager.close()
+
+        snapshot_key = snapshot_manager.snapshot_key("topic", "default", 0)
+        keys = snapshot_storage.list_keys("group/")
+        assert keys
+        assert all(key.startswith(f"{snapshot_key}/{2:020d}/") for key in keys)
+
+    def test_invalid_keep_snapshots(self, snapshot_storage, tmp_path):
+        with pytest.raises(ValueError):
+            SnapshotManager(
+                storage=snapshot_storage,
+                local_dir=tmp_path,
+                key_prefix="group",
+                keep_snapshots=0,
+            )
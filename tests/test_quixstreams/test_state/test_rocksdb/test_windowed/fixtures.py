@@ -16,12 +16,14 @@ def windowed_rocksdb_store_factory(tmp_path):
     def factory(
         topic: Optional[str] = None,
         name: str = "default",
+        options: Optional[RocksDBOptions] = None,
     ) -> WindowedRocksDBStore:
         topic = topic or str(uuid.uuid4())
         return WindowedRocksDBStore(
             topic=topic,
             name=name,
             base_dir=str(tmp_path),
+            options=options,
         )
 
     return factory
@@ -0,0 +1,278 @@
+from unittest.mock import patch
+
+from quixstreams.state.metadata import (
+    CHANGELOG_CF_MESSAGE_HEADER,
+    PREFIX_SEPARATOR,
+)
+from quixstreams.state.rocksdb import RocksDBOptions
+from quixstreams.state.rocksdb.windowed.metadata import (
+    LATEST_EXPIRED_WINDOW_CF_NAME,
+    LATEST_EXPIRED_WINDOW_TIMESTAMP_KEY,
+)
+from quixstreams.state.rocksdb.windowed.open_windows import OpenWindows
+from quixstreams.state.rocksdb.windowed.serialization import encode_window_key
+from quixstreams.state.rocksdb.windowed.transaction import (
+    WindowedRocksDBPartitionTransaction,
+)
+from quixstreams.utils.json import dumps
+from tests.utils import ConfluentKafkaMessageStub
+
+
+class TestOpenWindows:
+    def test_get_update_delete(self):
+        windows = OpenWindows()
+        assert windows.get(0, 10) is None
+        assert windows.get(0, 10, default=0) == 0
+
+        windows.update(0, 10, 1)
+        windows.update(0, 10, 2)
+        assert windows.get(0, 10) == 2
+        assert len(windows) == 1
+
+        windows.delete(0, 10)
+        assert windows.get(0, 10) is None
+        assert not windows
+
+    def test_expire(self):
+        windows = OpenWindows([((10, 20), 2), ((0, 10), 1)])
+        windows.update(20, 30, 3)
+
+        assert windows.expire(max_end_ms=9) == []
+        assert windows.expire(max_end_ms=20) == [((0, 10), 1), ((10, 20), 2)]
+        assert windows.expire(max_end_ms=20) == []
+        assert windows.get(20, 30) == 3
+
+    def test_expire_deleted_window_skipped(self):
+        windows = OpenWindows()
+        windows.update(0, 10, 1)
+        windows.delete(0, 10)
+        windows.update(0, 10, 2)
+
+        assert windows.expire(max_end_ms=10) == [((0, 10), 2)]
+        assert windows.expire(max_end_ms=10) == []
+
+    def test_get_range(self):
+        windows = OpenWindows([((20, 30), 3), ((0, 10), 1)])
+        windows.update(10, 20, 2)
+        windows.update(30, 40, 4)
+        windows.delete(30, 40)
+
+        assert windows.get_range(start_from_ms=-1, start_to_ms=100) == [
+            ((0, 10), 1),
+            ((10, 20), 2),
+            ((20, 30), 3),
+        ]
+        assert windows.get_range(start_from_ms=0, start_to_ms=20, limit=1) == [
+            ((10, 20), 2)
+        ]
+        assert windows.get_range(
+            start_from_ms=-1, start_to_ms=19, backwards=True, limit=1
+        ) == [((10, 20), 2)]
+        assert windows.get_range(start_from_ms=-1, start_to_ms=20, backwards=True) == [
+            ((20, 30), 3),
+            ((10, 20), 2),
+            ((0, 10), 1),
+        ]
+
+
+class TestWindowedRocksDBPartitionTransactionOpenWindows:
+    def test_open_windows_read_from_store_once(self, windowed_rocksdb_store_factory):
+        store = windowed_rocksdb_store_factory(
+            options=RocksDBOptions(open_windows_cache_size=10)
+        )
+        store.assign_partition(0)
+        prefix = b"__key__"
+        with store.start_partition_transaction(0) as tx:
+            tx.update_window(
+                start_ms=0, end_ms=10, value=1, timestamp_ms=2, prefix=prefix
+            )
+
+        store.revoke_partition(0)
+        store.assign_partition(0)
+
+        with patch.object(
+            WindowedRocksDBPartitionTransaction,
+            "_get_windows_from_store",
+            side_effect=WindowedRocksDBPartitionTransaction._get_windows_from_store,
+            autospec=True,
+        ) as get_windows_from_store:
+            for i in range(1, 10):
+                with store.start_partition_transaction(0) as tx:
+                    current = tx.get_window(start_ms=0, end_ms=10, prefix=prefix)
+                    assert current == i
+                    tx.update_window(
+                        start_ms=0,
+                        end_ms=10,
+                        value=current + 1,
+                        timestamp_ms=i,
+                        prefix=prefix,
+                    )
+                    assert not tx.expire_windows(duration_ms=10, prefix=prefix)
+
+        get_windows_from_store.assert_called_once()
+
+        with store.start_partition_transaction(0) as tx:
+            tx.update_window(
+                start_ms=10, end_ms=20, value=1, timestamp_ms=10, prefix=prefix
+            )
+            assert tx.expire_windows(duration_ms=10, prefix=prefix) == [((0, 10), 10)]
+
+        store.revoke_partition(0)
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            assert tx.get_window(start_ms=0, end_ms=10, prefix=prefix) is None
+            assert tx.get_window(start_ms=10, end_ms=20, prefix=prefix) == 1
+
+    def test_open_windows_of_discarded_transaction_not_cached(
+        self, windowed_rocksdb_store_factory
+    ):
+        store = windowed_rocksdb_store_factory(
+            options=RocksDBOptions(open_windows_cache_size=10)
+        )
+        store.assign_partition(0)
+        prefix = b"__key__"
+        with store.start_partition_transaction(0) as tx:
+            tx.update_window(
+                start_ms=0, end_ms=10, value=1, timestamp_ms=2, prefix=prefix
+            )
+
+        # Update and expire the windows, and discard the transaction
+        # without flushing it
+        tx = store.start_partition_transaction(0)
+        tx.update_window(start_ms=0, end_ms=10, value=2, timestamp_ms=3, prefix=prefix)
+        tx.update_window(
+            start_ms=20, end_ms=30, value=1, timestamp_ms=25, prefix=prefix
+        )
+        assert tx.expire_windows(duration_ms=10, prefix=prefix) == [((0, 10), 2)]
+
+        with store.start_partition_transaction(0) as tx:
+            assert tx.get_window(start_ms=0, end_ms=10, prefix=prefix) == 1
+            assert tx.get_window(start_ms=20, end_ms=30, prefix=prefix) is None
+
+    def test_window_index_cached_on_flush(self, windowed_rocksdb_store_factory):
+        store = windowed_rocksdb_store_factory(
+            options=RocksDBOptions(open_windows_cache_size=0)
+        )
+        store.assign_partition(0)
+        prefix = b"__key__"
+        index = object()
+        with store.start_partition_transaction(0) as tx:
+            assert tx.get_window_index(prefix=prefix) is None
+            tx.set_window_index(index, prefix=prefix)
+            assert tx.get_window_index(prefix=prefix) is index
+
+        with store.start_partition_transaction(0) as tx:
+            assert tx.get_window_index(prefix=prefix) is index
+
+    def test_window_index_of_discarded_transaction_not_cached(
+        self, windowed_rocksdb_store_factory
+    ):
+        store = windowed_rocksdb_store_factory()
+        store.assign_partition(0)
+        prefix = b"__key__"
+        index = object()
+        with store.start_partition_transaction(0) as tx:
+            tx.set_window_index(index, prefix=prefix)
+
+        # The transaction is discarded without flushing it
+        tx = store.start_partition_transaction(0)
+        assert tx.get_window_index(prefix=prefix) is index
+        tx.set_window_index(object(), prefix=prefix)
+
+        with store.start_partition_transaction(0) as tx:
+            assert tx.get_window_index(prefix=prefix) is None
+
+    def test_open_windows_cache_disabled(self, windowed_rocksdb_store_factory):
+        store = windowed_rocksdb_store_factory(
+            options=RocksDBOptions(open_windows_cache_size=0)
+        )
+        partition = store.assign_partition(0)
+        prefix = b"__key__"
+        with store.start_partition_transaction(0) as tx:
+            tx.update_window(
+                start_ms=0, end_ms=10, value=1, timestamp_ms=2, prefix=prefix
+            )
+        assert partition.get_open_windows(prefix) is None
+
+    def test_open_windows_cache_evicted(self, windowed_rocksdb_store_factory):
+        store = windowed_rocksdb_store_factory(
+            options=RocksDBOptions(open_windows_cache_size=1)
+        )
+        partition = store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            tx.update_window(
+                start_ms=0, end_ms=10, value=1, timestamp_ms=2, prefix=b"key1"
+            )
+            tx.update_window(
+                start_ms=0, end_ms=10, value=2, timestamp_ms=2, prefix=b"key2"
+            )
+            assert partition.get_open_windows(b"key1") is None
+            # The evicted windows are loaded again including
+            # the uncommitted updates
+            assert tx.get_window(start_ms=0, end_ms=10, prefix=b"key1") == 1
+            tx.update_window(
+                start_ms=10, end_ms=20, value=3, timestamp_ms=12, prefix=b"key1"
+            )
+            assert tx.expire_windows(duration_ms=10, prefix=b"key1") == [((0, 10), 1)]
+
+    def test_open_windows_cache_cleared_on_recovery(
+        self, windowed_rocksdb_store_factory
+    ):
+        store = windowed_rocksdb_store_factory(
+            options=RocksDBOptions(open_windows_cache_size=10)
+        )
+        partition = store.assign_partition(0)
+        prefix = b"__key__"
+        with store.start_partition_transaction(0) as tx:
+            tx.update_window(
+                start_ms=0, end_ms=10, value=1, timestamp_ms=2, prefix=prefix
+            )
+        assert partition.get_open_windows(prefix) is not None
+
+        changelog_msg = ConfluentKafkaMessageStub(
+            key=prefix + PREFIX_SEPARATOR + encode_window_key(0, 10),
+            value=dumps(5),
+            headers=[(CHANGELOG_CF_MESSAGE_HEADER, b"default")],
+            offset=50,
+        )
+        partition.recover_from_changelog_message(changelog_msg, committed_offset=-1001)
+        assert partition.get_open_windows(prefix) is None
+
+        with store.start_partition_transaction(0) as tx:
+            assert tx.get_window(start_ms=0, end_ms=10, prefix=prefix) == 5
+
+    def test_open_windows_respect_expiration_index(
+        self, windowed_rocksdb_store_factory
+    ):
+        store = windowed_rocksdb_store_factory(
+            options=RocksDBOptions(open_windows_cache_size=0)
+        )
+        store.assign_partition(0)
+        prefix = b"__key__"
+        with store.start_partition_transaction(0) as tx:
+            tx.update_window(
+                start_ms=0, end_ms=10, value=1, timestamp_ms=2, prefix=prefix
+            )
+            tx.update_window(
+                start_ms=10, end_ms=20, value=2, timestamp_ms=12, prefix=prefix
+            )
+            assert tx.expire_windows(duration_ms=10, prefix=prefix) == [((0, 10), 1)]
+        store.revoke_partition(0)
+
+        store = windowed_rocksdb_store_factory(
+            topic=store.topic, options=RocksDBOptions(open_windows_cache_size=10)
+        )
+        store.assign_partition(0)
+        with store.start_partition_transaction(0) as tx:
+            assert (
+                tx.get(
+                    key=LATEST_EXPIRED_WINDOW_TIMESTAMP_KEY,
+                    prefix=prefix,
+                    cf_name=LATEST_EXPIRED_WINDOW_CF_NAME,
+                )
+                == 0
+            )
+            tx.update_window(
+                start_ms=20, end_ms=30, value=3, timestamp_ms=22, prefix=prefix
+            )
+            assert tx.expire_windows(duration_ms=10, prefix=prefix) == [((10, 20), 2)]
@@ -4,10 +4,26 @@ from quixstreams.state.metadata import (
     CHANGELOG_CF_MESSAGE_HEADER,
     CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER,
 )
+from quixstreams.state.rocksdb import RocksDBOptions
 from quixstreams.state.rocksdb.windowed.serialization import encode_window_key
 from quixstreams.utils.json import dumps
 
 
+@pytest.fixture(params=[10000, 0], ids=["open-windows-cached", "no-cache"])
+def windowed_rocksdb_store_factory(request, windowed_rocksdb_store_factory):
+    """
+    Run the transaction tests both with and without the open windows cache
+    """
+
+    def factory(*args, **kwargs):
+        kwargs.setdefault(
+            "options", RocksDBOptions(open_windows_cache_size=request.param)
+        )
+        return windowed_rocksdb_store_factory(*args, **kwargs)
+
+    return factory
+
+
 class TestWindowedRocksDBPartitionTransaction:
     def test_update_window(self, windowed_rocksdb_store_factory):
         store = windowed_rocksdb_store_factory()
@@ -261,6 +277,68 @@ class TestWindowedRocksDBPartitionTransaction:
         assert expired[1] == ((10, 20), 1)
         assert expired[2] == ((20, 30), 1)
 
+    @pytest.mark.parametrize(
+        "backwards, limit, expected",
+        [
+            (False, None, [((0, 10), 1), ((20, 30), 3), ((30, 40), 4)]),
+            (False, 2, [((0, 10), 1), ((20, 30), 3)]),
+            (True, 2, [((30, 40), 4), ((20, 30), 3)]),
+            (True, 1, [((30, 40), 4)]),
+        ],
+    )
+    def test_get_windows_with_limit(
+        self, backwards, limit, expected, windowed_rocksdb_store_factory
+    ):
+        store = windowed_rocksdb_store_factory()
+        store.assign_partition(0)
+        prefix = b"__key__"
+        with store.start_partition_transaction(0) as tx:
+            for start, value in [(0, 1), (10, 2), (20, 3)]:
+                tx.update_window(
+                    start_ms=start,
+                    end_ms=start + 10,
+                    value=value,
+                    timestamp_ms=start,
+                    prefix=prefix,
+                )
+
+        with store.start_partition_transaction(0) as tx:
+            # Mix the stored windows with the updated and deleted ones
+            tx.delete_window(start_ms=10, end_ms=20, prefix=prefix)
+            tx.update_window(
+                start_ms=30, end_ms=40, value=4, timestamp_ms=30, prefix=prefix
+            )
+            tx.update_window(
+                start_ms=40, end_ms=50, value=5, timestamp_ms=40, prefix=prefix
+            )
+            windows = tx.get_windows(
+                start_from_ms=-1,
+                start_to_ms=30,
+                prefix=prefix,
+                backwards=backwards,
+                limit=limit,
+            )
+        assert windows == expected
+
+    def test_expire_windows_variable_length(self, windowed_rocksdb_store_factory):
+        store = windowed_rocksdb_store_factory()
+        store.assign_partition(0)
+        prefix = b"__key__"
+        with store.start_partition_transaction(0) as tx:
+            tx.update_window(
+                start_ms=0, end_ms=15, value=1, timestamp_ms=5, prefix=prefix
+            )
+            tx.update_window(
+                start_ms=20, end_ms=45, value=2, timestamp_ms=35, prefix=prefix
+            )
+
+        with store.start_partition_transaction(0) as tx:
+            # The second window starts before "latest - duration",
+            # but it's not closed yet
+            expired = tx.expire_windows(duration_ms=10, prefix=prefix)
+            assert expired == [((0, 15), 1)]
+            assert tx.get_window(start_ms=20, end_ms=45, prefix=prefix) == 2
+
     def test_set_latest_timestamp_transaction(self, windowed_rocksdb_store_factory):
         store = windowed_rocksdb_store_factory()
         partition = store.assign_partition(0)
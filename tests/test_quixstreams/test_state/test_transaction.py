@@ -12,7 +12,9 @@ from quixstreams.state.exceptions import (
     StateTransactionError,
     InvalidChangelogOffset,
 )
-from quixstreams.state.rocksdb import RocksDBOptions
+from quixstreams.state.manager import SUPPORTED_STORES
+from quixstreams.state.memory import MemoryStoreOptions
+from quixstreams.state.rocksdb import RocksDBOptions, RocksDBStore
 from quixstreams.state.metadata import (
     CHANGELOG_CF_MESSAGE_HEADER,
     CHANGELOG_PROCESSED_OFFSET_MESSAGE_HEADER,
@@ -53,6 +55,7 @@ def cache() -> PartitionTransactionCache:
     return PartitionTransactionCache()
 
 
+@pytest.mark.parametrize("store_type", SUPPORTED_STORES, indirect=True)
 class TestPartitionTransaction:
     def test_transaction_complete(self, store_partition):
         with store_partition.begin() as tx:
@@ -183,20 +186,51 @@ class TestPartitionTransaction:
             tx.delete("key", prefix=prefix)
             assert not tx.exists("key", prefix=prefix)
 
-    @pytest.mark.parametrize(
-        "key, value",
-        [
-            ("string", object()),
-            (object(), "string"),
-            ("string", datetime.now(timezone.utc)),
-            (datetime.now(timezone.utc), "string"),
-        ],
-    )
-    def test_set_serialization_error(self, key, value, store_partition):
+    @pytest.mark.parametrize("key", [object(), datetime.now(timezone.utc)])
+    def test_set_key_serialization_error(self, key, store_partition):
         prefix = b"__key__"
         with store_partition.begin() as tx:
             with pytest.raises(StateSerializationError):
-                tx.set(key, value, prefix=prefix)
+                tx.set(key, "string", prefix=prefix)
+
+    @pytest.mark.parametrize("value", [object(), datetime.now(timezone.utc)])
+    def test_set_value_serialization_error_on_prepare(self, value, store_partition):
+        prefix = b"__key__"
+        tx = store_partition.begin()
+        tx.set("string", value, prefix=prefix)
+        with pytest.raises(StateSerializationError):
+            tx.prepare(processed_offset=1)
+        assert tx.failed
+
+    def test_set_value_serialization_error_on_flush(self, store_partition):
+        prefix = b"__key__"
+        tx = store_partition.begin()
+        tx.set("string", object(), prefix=prefix)
+        with pytest.raises(StateSerializationError, match="__key__"):
+            tx.flush()
+        assert tx.failed
+
+    def test_set_get_returns_same_object(self, store_partition):
+        prefix = b"__key__"
+        value = {"count": 0}
+        with store_partition.begin() as tx:
+            tx.set("key", value, prefix=prefix)
+            assert tx.get("key", prefix=prefix) is value
+
+    def test_set_value_serialized_once(self, store_partition):
+        prefix = b"__key__"
+        tx = store_partition.begin()
+        with patch.object(tx, "_serialize_value", wraps=tx._serialize_value) as mock:
+            for i in range(100):
+                tx.set(
+                    "key", tx.get("key", prefix=prefix, default=0) + 1, prefix=prefix
+                )
+            tx.prepare(processed_offset=1)
+            tx.flush(processed_offset=1)
+        assert mock.call_count == 1
+
+        with store_partition.begin() as tx:
+            assert tx.get("key", prefix=prefix) == 100
 
     @pytest.mark.parametrize(
         "key", [object(), b"somebytes", datetime.now(timezone.utc)]
@@ -326,13 +360,16 @@ class TestPartitionTransaction:
         with store_partition.begin() as tx:
             assert tx.get("key", prefix=prefix) is None
 
-    def test_custom_dumps_loads(self, store_partition_factory):
+    def test_custom_dumps_loads(self, store_partition_factory, store_type):
         key = secrets.token_bytes(10)
         value = secrets.token_bytes(10)
         prefix = b"__key__"
+        options_type = (
+            RocksDBOptions if store_type == RocksDBStore else MemoryStoreOptions
+        )
 
         with store_partition_factory(
-            options=RocksDBOptions(loads=lambda v: v, dumps=lambda v: v)
+            options=options_type(loads=lambda v: v, dumps=lambda v: v)
         ) as db:
             with db.begin() as tx:
                 tx.set(key, value, prefix=prefix)
@@ -344,17 +381,19 @@ class TestPartitionTransaction:
         key = "key"
         value = {0: 1}
         prefix = b"__key__"
-        with store_partition.begin() as tx:
-            with pytest.raises(StateSerializationError):
-                tx.set(key, value, prefix=prefix)
+        tx = store_partition.begin()
+        tx.set(key, value, prefix=prefix)
+        with pytest.raises(StateSerializationError):
+            tx.flush()
 
     def test_set_datetime_fails(self, store_partition):
         key = "key"
         value = datetime.now(timezone.utc)
         prefix = b"__key__"
-        with store_partition.begin() as tx:
-            with pytest.raises(StateSerializationError):
-                tx.set(key, value, prefix=prefix)
+        tx = store_partition.begin()
+        tx.set(key, value, prefix=prefix)
+        with pytest.raises(StateSerializationError):
+            tx.flush()
 
     def test_set_get_with_column_family(self, store_partition):
         key = "key"
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+
+import pytest
+
+from quixstreams.utils.aio import (
+    get_event_loop,
+    run_coroutine,
+    set_event_loop,
+    to_sync,
+)
+
+
+class TestAio:
+    def test_run_coroutine_background_loop(self):
+        async def coro():
+            return threading.current_thread().name
+
+        assert run_coroutine(coro()) == "quixstreams-event-loop"
+        assert get_event_loop() is get_event_loop()
+
+    def test_run_coroutine_app_loop(self):
+        async def main():
+            loop = asyncio.get_running_loop()
+            set_event_loop(loop)
+            try:
+
+                async def coro():
+                    return asyncio.get_running_loop()
+
+                # Wait for the coroutine from another thread
+                return loop, await loop.run_in_executor(None, run_coroutine, coro())
+            finally:
+                set_event_loop(None)
+
+        loop, coro_loop = asyncio.run(main())
+        assert coro_loop is loop
+
+    def test_run_coroutine_from_loop_thread_fails(self):
+        async def main():
+            set_event_loop(asyncio.get_running_loop())
+            try:
+                run_coroutine(asyncio.sleep(0))
+            finally:
+                set_event_loop(None)
+
+        with pytest.raises(RuntimeError, match="Cannot wait for a coroutine"):
+            asyncio.run(main())
+
+    def test_to_sync(self):
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        func = to_sync(add)
+        assert func.__name__ == "add"
+        assert func(1, b=2) == 3
+
+    def test_to_sync_exception_propagated(self):
+        async def fail():
+            raise ValueError("test")
+
+        with pytest.raises(ValueError, match="test"):
+            to_sync(fail)()
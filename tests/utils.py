@@ -5,7 +5,7 @@ import threading
 
 from typing import Optional, Tuple, Union, List, Any
 
-from confluent_kafka import OFFSET_INVALID
+from confluent_kafka import OFFSET_INVALID, KafkaError
 
 from quixstreams.sinks import BatchingSink
 from quixstreams.sinks.base import SinkBatch
@@ -62,6 +62,7 @@ class ConfluentKafkaMessageStub:
         headers: Optional[List[Tuple[str, bytes]]] = None,
         latency: float = None,
         leader_epoch: int = None,
+        error: Optional[KafkaError] = None,
     ):
         self._topic = topic
         self._partition = partition
@@ -72,6 +73,10 @@ class ConfluentKafkaMessageStub:
         self._headers = headers
         self._latency = latency
         self._leader_epoch = leader_epoch
+        self._error = error
+
+    def error(self, *args, **kwargs) -> Optional[KafkaError]:
+        return self._error
 
     def headers(self, *args, **kwargs) -> Optional[List[Tuple[str, bytes]]]:
         return self._headers